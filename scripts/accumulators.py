@@ -0,0 +1,431 @@
+"""Mergeable streaming accumulators shared by the snapshot builders.
+
+Every accumulator folds values in with ``update``, combines with another
+accumulator of the same kind via ``merge`` and reports its result with
+``finalize``. Merging is associative and, where order matters (first-seen
+names, ties in :class:`TopK`), ``a.merge(b)`` treats ``b`` as holding the rows
+that followed ``a``'s. State built over partitions — worker chunks, seasons,
+incremental runs — therefore combines into what one pass would produce. Float
+totals (:class:`Sum`, :class:`Mean`) are added in a different order, so they
+match a single pass up to floating-point rounding; everything else is exact.
+
+:class:`Record` groups named accumulators so per-player state still reads like
+the dicts the builders used to keep, :class:`Keyed` holds one accumulator per
+key, and :class:`MergeableState` gives a builder whose attributes are all
+accumulators a field-by-field ``merge``.
+
+Factories handed to :class:`Keyed` must be module-level callables so the
+state can be pickled between processes.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generic, Hashable, Iterator, Protocol, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+A = TypeVar("A", bound="Accumulator")
+
+
+class Accumulator(Protocol):
+    def merge(self, other: Any) -> None: ...
+
+    def finalize(self) -> Any: ...
+
+
+@dataclass(slots=True)
+class Sum:
+    total: float = 0.0
+
+    def update(self, value: float) -> None:
+        self.total += value
+
+    def merge(self, other: Sum) -> None:
+        self.total += other.total
+
+    def finalize(self) -> float:
+        return self.total
+
+
+@dataclass(slots=True)
+class Count:
+    """Count rows; ``update(flag)`` adds ``bool(flag)`` so conditional counts need no branch."""
+
+    count: int = 0
+
+    def update(self, increment: int | bool = 1) -> None:
+        self.count += increment
+
+    def merge(self, other: Count) -> None:
+        self.count += other.count
+
+    def finalize(self) -> int:
+        return int(self.count)
+
+
+@dataclass(slots=True)
+class Mean:
+    """Average of the values seen; ``None`` values are skipped."""
+
+    total: float = 0.0
+    count: int = 0
+
+    def update(self, value: float | None) -> None:
+        if value is None:
+            return
+        self.total += value
+        self.count += 1
+
+    def merge(self, other: Mean) -> None:
+        self.total += other.total
+        self.count += other.count
+
+    def finalize(self) -> float | None:
+        return self.total / self.count if self.count else None
+
+
+@dataclass(slots=True)
+class Min:
+    value: Any = None
+
+    def update(self, value: Any) -> None:
+        if value is not None and (self.value is None or value < self.value):
+            self.value = value
+
+    def merge(self, other: Min) -> None:
+        self.update(other.value)
+
+    def finalize(self) -> Any:
+        return self.value
+
+
+@dataclass(slots=True)
+class Max:
+    value: Any = None
+
+    def update(self, value: Any) -> None:
+        if value is not None and (self.value is None or value > self.value):
+            self.value = value
+
+    def merge(self, other: Max) -> None:
+        self.update(other.value)
+
+    def finalize(self) -> Any:
+        return self.value
+
+
+@dataclass(slots=True)
+class FirstSeen:
+    """The first truthy value in row order, e.g. the first non-blank name."""
+
+    value: Any = ""
+
+    def update(self, value: Any) -> None:
+        if value and not self.value:
+            self.value = value
+
+    def merge(self, other: FirstSeen) -> None:
+        self.update(other.value)
+
+    def finalize(self) -> Any:
+        return self.value
+
+
+@dataclass(slots=True)
+class LastSeen:
+    """The most recent value passed to ``update`` (``None`` until then)."""
+
+    value: Any = None
+    seen: bool = False
+
+    def update(self, value: Any) -> None:
+        self.value = value
+        self.seen = True
+
+    def merge(self, other: LastSeen) -> None:
+        if other.seen:
+            self.update(other.value)
+
+    def finalize(self) -> Any:
+        return self.value
+
+
+@dataclass(slots=True)
+class FirstBy:
+    """The value attached to the smallest key (a date); the earliest row wins ties."""
+
+    key: Any = None
+    value: Any = None
+
+    def update(self, key: Any, value: Any) -> None:
+        if key is not None and (self.key is None or key < self.key):
+            self.key = key
+            self.value = value
+
+    def merge(self, other: FirstBy) -> None:
+        self.update(other.key, other.value)
+
+    def finalize(self) -> Any:
+        return self.value
+
+
+@dataclass(slots=True)
+class LastBy:
+    """The value attached to the largest key (a date); the earliest row wins ties."""
+
+    key: Any = None
+    value: Any = None
+
+    def update(self, key: Any, value: Any) -> None:
+        if key is not None and (self.key is None or key > self.key):
+            self.key = key
+            self.value = value
+
+    def merge(self, other: LastBy) -> None:
+        self.update(other.key, other.value)
+
+    def finalize(self) -> Any:
+        return self.value
+
+
+@dataclass(slots=True)
+class Tally:
+    counts: Counter = field(default_factory=Counter)
+
+    def update(self, item: Hashable, increment: int = 1) -> None:
+        self.counts[item] += increment
+
+    def merge(self, other: Tally) -> None:
+        self.counts.update(other.counts)
+
+    def finalize(self) -> Counter:
+        return self.counts
+
+
+@dataclass(slots=True)
+class SetUnion:
+    values: set = field(default_factory=set)
+
+    def update(self, value: Hashable) -> None:
+        self.values.add(value)
+
+    def merge(self, other: SetUnion) -> None:
+        self.values |= other.values
+
+    def finalize(self) -> set:
+        return self.values
+
+
+class _Descending:
+    """Invert the ordering of a tie-break value inside a heap rank."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.value == other.value
+
+    def __lt__(self, other: _Descending) -> bool:
+        return other.value < self.value
+
+    def __gt__(self, other: _Descending) -> bool:
+        return self.value < other.value
+
+    def __getstate__(self) -> Any:
+        return self.value
+
+    def __setstate__(self, value: Any) -> None:
+        self.value = value
+
+
+def _is_nan(key: Any) -> bool:
+    if isinstance(key, tuple):
+        return any(part != part for part in key)
+    return key != key
+
+
+# (key, tie-break, -arrival): unique, and larger means better.
+Rank = tuple[Any, Any, int]
+
+
+@dataclass(slots=True, eq=False)
+class TopK:
+    """The ``size`` items with the largest keys.
+
+    ``key`` may be a tuple to rank on several columns. Equal keys rank by
+    ``tiebreak(item)`` ascending, e.g. ``(gameDate, gameId)`` so the earlier
+    game comes first, and then by arrival. ``identity(item)`` deduplicates:
+    an item whose identity is already held only replaces it when it ranks
+    higher. NaN keys are ignored.
+
+    The heap root is the weakest entry held, so a full heap rejects most
+    items with one key comparison and accepts the rest in ``O(log size)``.
+    ``tiebreak`` and ``identity`` must be picklable (module-level functions
+    or :func:`operator.itemgetter`).
+    """
+
+    size: int
+    tiebreak: Callable[[Any], Any] | None = None
+    identity: Callable[[Any], Hashable] | None = None
+    heap: list[tuple[Rank, Any]] = field(default_factory=list)
+    held: dict[Hashable, Rank] = field(default_factory=dict)
+    seen: int = 0
+
+    def __eq__(self, other: object) -> bool:
+        # Heap layout depends on insertion order; compare the ranked entries.
+        return isinstance(other, TopK) and (self.size, self.seen, self._ranked()) == (
+            other.size,
+            other.seen,
+            other._ranked(),
+        )
+
+    def update(self, key: Any, item: Any) -> None:
+        order = self.seen
+        self.seen += 1
+        heap = self.heap
+        if len(heap) >= self.size and key < heap[0][0][0]:
+            return
+        if _is_nan(key):
+            return
+        tie = _Descending(self.tiebreak(item)) if self.tiebreak is not None else None
+        self._push((key, tie, -order), item)
+
+    def skip(self, count: int) -> None:
+        """Count ``count`` rows that cannot rank, keeping later arrivals' order as in one pass."""
+
+        self.seen += count
+
+    def _push(self, rank: Rank, item: Any) -> None:
+        heap = self.heap
+        full = len(heap) >= self.size
+        if full and rank < heap[0][0]:
+            return
+        identity = self.identity
+        if identity is not None:
+            ident = identity(item)
+            held = self.held.get(ident)
+            if held is not None:
+                if rank < held:
+                    return
+                # Rare: drop the weaker copy before inserting the stronger one.
+                heap.remove(next(entry for entry in heap if entry[0] == held))
+                heapq.heapify(heap)
+                full = False
+            self.held[ident] = rank
+        if not full:
+            heapq.heappush(heap, (rank, item))
+            return
+        _, evicted = heapq.heapreplace(heap, (rank, item))
+        if identity is not None:
+            del self.held[identity(evicted)]
+
+    def merge(self, other: TopK) -> None:
+        offset = self.seen
+        for (key, tie, negative_order), item in other.heap:
+            self._push((key, tie, negative_order - offset), item)
+        self.seen += other.seen
+
+    def _ranked(self) -> list[tuple[Rank, Any]]:
+        return sorted(self.heap, key=lambda entry: entry[0], reverse=True)
+
+    def finalize(self) -> list[Any]:
+        return [item for _, item in self._ranked()]
+
+
+class Record:
+    """Named accumulators updated together; ``finalize`` returns a plain dict."""
+
+    __slots__ = ("fields",)
+
+    def __init__(self, **fields: Any) -> None:
+        self.fields: dict[str, Any] = fields
+
+    def __getitem__(self, name: str) -> Any:
+        return self.fields[name]
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Record) and self.fields == other.fields
+
+    def __getstate__(self) -> dict[str, Any]:
+        return self.fields
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.fields = state
+
+    def update(self, **values: Any) -> None:
+        """Feed single-argument accumulators: ``record.update(points=31.0, games=1)``."""
+
+        fields = self.fields
+        for name, value in values.items():
+            fields[name].update(value)
+
+    def merge(self, other: Record) -> None:
+        for name, accumulator in self.fields.items():
+            accumulator.merge(other.fields[name])
+
+    def finalize(self) -> dict[str, Any]:
+        return {name: accumulator.finalize() for name, accumulator in self.fields.items()}
+
+
+class Keyed(Generic[K, A]):
+    """One accumulator per key, created on first access by ``factory``."""
+
+    __slots__ = ("factory", "entries")
+
+    def __init__(self, factory: Callable[[], A]) -> None:
+        self.factory = factory
+        self.entries: dict[K, A] = {}
+
+    def __getitem__(self, key: K) -> A:
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self.entries[key] = self.factory()
+        return entry
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.entries
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Keyed) and self.entries == other.entries
+
+    def __getstate__(self) -> tuple[Callable[[], A], dict[K, A]]:
+        return self.factory, self.entries
+
+    def __setstate__(self, state: tuple[Callable[[], A], dict[K, A]]) -> None:
+        self.factory, self.entries = state
+
+    def get(self, key: K) -> A | None:
+        return self.entries.get(key)
+
+    def items(self):
+        return self.entries.items()
+
+    def merge(self, other: Keyed[K, A]) -> None:
+        entries = self.entries
+        for key, entry in other.entries.items():
+            existing = entries.get(key)
+            if existing is None:
+                entries[key] = entry
+            else:
+                existing.merge(entry)
+
+    def finalize(self) -> dict[K, Any]:
+        return {key: entry.finalize() for key, entry in self.entries.items()}
+
+
+class MergeableState:
+    """Mixin: ``merge`` every attribute, which must all be accumulators."""
+
+    def merge(self, other: MergeableState) -> None:
+        for name, accumulator in vars(self).items():
+            accumulator.merge(getattr(other, name))
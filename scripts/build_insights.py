@@ -6,38 +6,91 @@ all of the datasets in the repository – including the compressed team and
 player statistics tables – and writes browser-friendly outputs to
 ``public/data``.
 
-The script intentionally avoids external Python dependencies so it can run on
-CI or a local workstation with nothing more than CPython, ``zipfile`` (from
-the standard library), and the ``7z`` command line utility that ships with the
-``p7zip-full`` package.  If the 7z binary is not available, a clear error
-message is raised describing the installation step.
+The only Python dependency is NumPy (``pip install -r requirements.txt``),
+which scores ``goat_system.json`` (see :mod:`scripts.goat_scoring`); the
+PlayerStatistics scan itself runs on plain CPython. Reading the archives also
+needs the ``7z`` command line utility that ships with the ``p7zip-full``
+package (or pre-extracted copies of the tables; see :mod:`scripts.sources`).
+If no decoder is available, a clear error message is raised describing the
+installation step.
 """
 
 from __future__ import annotations
 
-import atexit
+import argparse
 import csv
-import io
 import json
 import math
 import re
-import shutil
-import subprocess
-import tempfile
-import zipfile
+import sys
 from collections import Counter, defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
-from typing import Iterator
-
-try:  # Optional dependency used when the 7z CLI is unavailable.
-    import py7zr  # type: ignore
-except Exception:  # pragma: no cover - fallback only triggered when module missing
-    py7zr = None
-
+from typing import Any, Iterable, Mapping
 
 ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.accumulators import (  # noqa: E402
+    Count,
+    FirstSeen,
+    Keyed,
+    Max,
+    MergeableState,
+    Min,
+    Record,
+    SetUnion,
+    Sum,
+    Tally,
+    TopK,
+)
+from scripts.game_dimensions import (  # noqa: E402
+    FINALS,
+    PLAYOFF_PHASES,
+    game_phase,
+    season_from_date,
+    season_from_date_rule,
+    series_won,
+)
+from scripts.games_table import GameRecord, scan_games  # noqa: E402
+from scripts.goat_scoring import (  # noqa: E402
+    MATRIX_ROOT,
+    GoatMatrix,
+    add_rank_bands,
+    component_payload,
+    load_bdi_components,
+    save_goat_matrix,
+    score_players,
+)
+from scripts.json_output import write_json  # noqa: E402
+from scripts.player_stats_arrays import (  # noqa: E402
+    BACKENDS,
+    ColumnFrame,
+    Factorized,
+    Groups,
+    feed_top,
+    group_by,
+    group_count,
+    group_extreme,
+    group_first,
+    group_sum,
+    optional_ints,
+    top_candidates,
+)
+from scripts.player_stats_reader import (  # noqa: E402,F401 - re-exported for existing importers
+    PlayerStatisticsStreamError,
+    Projection,
+    iter_player_statistics_rows,
+    joined_category,
+    memoized,
+)
+from scripts.player_stats_scan import PlayerStatisticsScan, scan_player_statistics  # noqa: E402
+from scripts.player_stats_state import Refresh, open_refresh  # noqa: E402
+from scripts.team_games import TEAM_STATS_PATH, TeamGameRecord, load_team_games  # noqa: E402
+
 PUBLIC_DATA_DIR = ROOT / "public" / "data"
 
 # Some legacy player records report incorrect country information in the
@@ -48,8 +101,6 @@ PLAYER_COUNTRY_OVERRIDES = {
     "22": "Netherlands",  # Rik Smits
 }
 
-_TEMP_PLAYER_STATS_DIR: Path | None = None
-
 
 # ---------------------------------------------------------------------------
 # Utility helpers
@@ -86,63 +137,40 @@ def _to_bool(value: str | None) -> bool:
     return value in {"1", "true", "yes", "t"}
 
 
-def _year_from_date(raw: str | None) -> int | None:
-    if raw is None:
-        return None
-    raw = raw.strip()
-    if not raw:
-        return None
-    try:
-        return datetime.fromisoformat(raw.replace(" ", "T")).year
-    except ValueError:
-        return None
-
-
 def _decade_label(year: int) -> str:
     start = (year // 10) * 10
     return f"{start}s"
 
 
-def _timestamp() -> str:
-    return datetime.now(timezone.utc).isoformat()
+# Single-game leaderboards break ties on the earlier game, then the lower gameId,
+# so the order no longer depends on where a row sits in the source file.
+def _game_order(record: Mapping[str, Any]) -> tuple[str, str]:
+    return (record.get("date") or "", record.get("gameId") or "")
 
 
-def _ensure_output_dir() -> None:
-    PUBLIC_DATA_DIR.mkdir(parents=True, exist_ok=True)
+def _player_game_order(record: Mapping[str, Any]) -> tuple[str, str]:
+    return (record.get("gameDate") or "", record.get("gameId") or "")
 
 
-def _write_json(filename: str, payload: dict, *, indent: int | None = 2) -> None:
-    _ensure_output_dir()
-    path = PUBLIC_DATA_DIR / filename
-    with path.open("w", encoding="utf-8") as f:
-        if indent is None:
-            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
-        else:
-            json.dump(payload, f, indent=indent, ensure_ascii=False)
-        f.write("\n")
+_game_identity = itemgetter("gameId")
+_team_game_identity = itemgetter("gameId", "team")
+_player_game_identity = itemgetter("personId", "gameId")
 
 
-def _push_top(collection: list[tuple[float, dict]], key: float, item: dict, *, size: int) -> None:
-    """Maintain a bounded min-heap of the largest ``size`` elements."""
+def _game_leaders(identity: Any = _game_identity) -> TopK:
+    return TopK(12, tiebreak=_game_order, identity=identity)
 
-    if math.isnan(key):
-        return
-    if len(collection) < size:
-        collection.append((key, item))
-        if len(collection) == size:
-            collection.sort(key=lambda pair: pair[0])
-        return
 
-    if key <= collection[0][0]:
-        return
+def _player_game_leaders() -> TopK:
+    return TopK(12, tiebreak=_player_game_order, identity=_player_game_identity)
 
-    collection[0] = (key, item)
-    # Re-establish min ordering for the first element.
-    collection.sort(key=lambda pair: pair[0])
 
+def _timestamp() -> str:
+    return datetime.now(timezone.utc).isoformat()
 
-def _sorted_heap(heap: list[tuple[float, dict]], *, reverse: bool = True) -> list[dict]:
-    return [item for _, item in sorted(heap, key=lambda pair: pair[0], reverse=reverse)]
+
+def _write_json(filename: str, payload: dict, *, indent: int | None = 2) -> None:
+    write_json(PUBLIC_DATA_DIR / filename, payload, indent=indent)
 
 
 def _normalize_person_id(value: object) -> str | None:
@@ -491,156 +519,12 @@ def _load_finals_mvp_ledger() -> dict[str, dict[str, object]]:
     return ledger
 
 
-def _load_bdi_component_lookup() -> tuple[
-    dict[str, dict[str, float]],
-    dict[str, float],
-    dict[str, dict[str, object]],
-    str | None,
-]:
-    """Load component values from the BDI (Pantheon) feed for blending."""
-
-    path = PUBLIC_DATA_DIR / "goat_index.json"
-    component_keys = ("impact", "stage", "longevity", "versatility", "culture")
-
-    lookup: dict[str, dict[str, float]] = {}
-    maxima: dict[str, float] = {key: 0.0 for key in component_keys}
-    metadata: dict[str, dict[str, object]] = {}
-    generated_at: str | None = None
-
-    if not path.exists():
-        return lookup, maxima, metadata, generated_at
-
-    try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
-        return lookup, maxima, metadata, generated_at
-
-    generated_at = payload.get("generatedAt")
-
-    for entry in payload.get("players", []):
-        name = (entry.get("name") or "").strip()
-        if not name:
-            continue
-
-        name_key = _normalize_name_key(name)
-        metadata[name_key] = entry
-
-        components = entry.get("goatComponents") or {}
-        component_map: dict[str, float] = {}
-        for key in component_keys:
-            value = components.get(key)
-            if isinstance(value, (int, float)):
-                numeric_value = float(value)
-                component_map[key] = numeric_value
-                maxima[key] = max(maxima[key], numeric_value)
-
-        if component_map:
-            lookup[name_key] = component_map
-
-    return lookup, maxima, metadata, generated_at
-
-
 def _scale_component(value: float, ceiling: float, weight: float) -> float:
     if ceiling <= 0:
         return 0.0
     return round((value / ceiling) * weight, 2)
 
 
-class PlayerStatisticsStreamError(RuntimeError):
-    """Raised when the PlayerStatistics archive cannot be streamed."""
-
-
-def _cleanup_temp_dir() -> None:
-    global _TEMP_PLAYER_STATS_DIR
-    if _TEMP_PLAYER_STATS_DIR and _TEMP_PLAYER_STATS_DIR.exists():
-        shutil.rmtree(_TEMP_PLAYER_STATS_DIR, ignore_errors=True)
-    _TEMP_PLAYER_STATS_DIR = None
-
-
-def _ensure_player_statistics_csv() -> Path:
-    """Extract ``PlayerStatistics.csv`` to a temporary directory.
-
-    The helper caches the extraction for the lifetime of the process so the
-    heavy archive only needs to be unpacked once when the ``7z`` CLI is not
-    available.
-    """
-
-    global _TEMP_PLAYER_STATS_DIR
-    if _TEMP_PLAYER_STATS_DIR is not None and (_TEMP_PLAYER_STATS_DIR / "PlayerStatistics.csv").exists():
-        return _TEMP_PLAYER_STATS_DIR / "PlayerStatistics.csv"
-
-    if py7zr is None:
-        raise PlayerStatisticsStreamError(
-            "Unable to stream PlayerStatistics. Install the `p7zip-full` CLI or the `py7zr` Python package."
-        )
-
-    archive_path = ROOT / "PlayerStatistics.7z"
-    if not archive_path.exists():
-        raise PlayerStatisticsStreamError(
-            "PlayerStatistics.7z is missing. Ensure the archive is present before running the build script."
-        )
-
-    temp_dir = Path(tempfile.mkdtemp(prefix="playerstats_"))
-    with py7zr.SevenZipFile(archive_path, mode="r") as archive:
-        archive.extract(path=temp_dir, targets=["PlayerStatistics.csv"])
-
-    extracted_path = temp_dir / "PlayerStatistics.csv"
-    if not extracted_path.exists():
-        raise PlayerStatisticsStreamError("Failed to extract PlayerStatistics.csv from the archive using py7zr.")
-
-    _TEMP_PLAYER_STATS_DIR = temp_dir
-    atexit.register(_cleanup_temp_dir)
-    return extracted_path
-
-
-def iter_player_statistics_rows() -> Iterator[dict[str, str]]:
-    """Yield rows from ``PlayerStatistics.7z``.
-
-    The function prefers streaming via the ``7z`` CLI for speed. When the CLI
-    is unavailable, it falls back to extracting the CSV with ``py7zr``.
-    """
-
-    archive_path = ROOT / "PlayerStatistics.7z"
-    if not archive_path.exists():
-        raise PlayerStatisticsStreamError(
-            "PlayerStatistics.7z is missing. Ensure the archive is present before running the build script."
-        )
-
-    binary = None
-    for candidate in ("7zz", "7zr", "7z"):
-        if shutil.which(candidate):
-            binary = candidate
-            break
-
-    if binary is not None:
-        process = subprocess.Popen(
-            [binary, "x", "-so", str(archive_path), "PlayerStatistics.csv"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=False,
-        )
-
-        assert process.stdout is not None
-        with io.TextIOWrapper(process.stdout, encoding="utf-8", newline="") as handle:
-            reader = csv.DictReader(handle)
-            for row in reader:
-                yield row
-
-        stderr_output = process.stderr.read().decode("utf-8", errors="ignore") if process.stderr else ""
-        returncode = process.wait()
-        if returncode != 0:
-            raise PlayerStatisticsStreamError(
-                f"Failed to stream PlayerStatistics.csv from the 7z archive (exit code {returncode}).\n{stderr_output.strip()}"
-            )
-        return
-
-    csv_path = _ensure_player_statistics_csv()
-    with csv_path.open(newline="", encoding="utf-8") as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            yield row
-
-
 # ---------------------------------------------------------------------------
 # Players.csv snapshot
 
@@ -802,91 +686,90 @@ def build_players_overview() -> None:
 # Games.csv snapshot
 
 
-def build_games_snapshot() -> None:
-    path = ROOT / "Games.csv"
-    totals = Counter()
-    totals_by_type: Counter[str] = Counter()
-    games_by_decade: Counter[str] = Counter()
-    highest_scoring: list[tuple[float, dict]] = []
-    largest_margins: list[tuple[float, dict]] = []
-    attendance_leaders: list[tuple[float, dict]] = []
-    earliest_date: datetime | None = None
-    latest_date: datetime | None = None
+class HistoricGamesBuilder:
+    """Fold parsed ``Games.csv`` records into ``historic_games.json``."""
 
-    with path.open(newline="", encoding="utf-8") as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            totals["games"] += 1
-
-            game_type = row.get("gameType", "").strip() or "Unknown"
-            totals_by_type[game_type] += 1
-
-            home_score = _to_int(row.get("homeScore")) or 0
-            away_score = _to_int(row.get("awayScore")) or 0
-            total_points = home_score + away_score
-            margin = abs(home_score - away_score)
-            attendance = _to_int(row.get("attendance"))
-
-            date_raw = row.get("gameDate", "").strip()
-            game_date: datetime | None = None
-            if date_raw:
-                try:
-                    game_date = datetime.fromisoformat(date_raw.replace(" ", "T"))
-                except ValueError:
-                    game_date = None
-
-            if game_date is not None:
-                if earliest_date is None or game_date < earliest_date:
-                    earliest_date = game_date
-                if latest_date is None or game_date > latest_date:
-                    latest_date = game_date
-                games_by_decade[_decade_label(game_date.year)] += 1
-
-            record = {
-                "gameId": row.get("gameId"),
-                "date": date_raw or None,
-                "gameType": game_type,
-                "home": {
-                    "city": row.get("hometeamCity", "").strip(),
-                    "name": row.get("hometeamName", "").strip(),
-                    "score": home_score,
-                },
-                "away": {
-                    "city": row.get("awayteamCity", "").strip(),
-                    "name": row.get("awayteamName", "").strip(),
-                    "score": away_score,
-                },
-                "totalPoints": total_points,
-                "margin": margin,
-                "attendance": attendance,
-            }
+    def __init__(self) -> None:
+        self.games = 0
+        self.totals_by_type: Counter[str] = Counter()
+        self.games_by_decade: Counter[str] = Counter()
+        self.highest_scoring = _game_leaders()
+        self.largest_margins = _game_leaders()
+        self.attendance_leaders = _game_leaders()
+        self.earliest = Min()
+        self.latest = Max()
 
-            _push_top(highest_scoring, float(total_points), record, size=12)
-            _push_top(largest_margins, float(margin), record, size=12)
-            if attendance and attendance > 0:
-                _push_top(attendance_leaders, float(attendance), record, size=12)
+    def consume(self, record: GameRecord) -> None:
+        self.games += 1
 
-    payload = {
-        "generatedAt": _timestamp(),
-        "totals": {
-            "games": totals["games"],
-            "byType": [
-                {"gameType": game_type, "games": count}
-                for game_type, count in totals_by_type.most_common()
+        game_type = record.gameType or "Unknown"
+        self.totals_by_type[game_type] += 1
+
+        home_score = record.homeScore or 0
+        away_score = record.awayScore or 0
+        total_points = home_score + away_score
+        margin = abs(home_score - away_score)
+        attendance = record.attendance
+
+        if record.start is not None:
+            self.earliest.update(record.start)
+            self.latest.update(record.start)
+            self.games_by_decade[_decade_label(record.start.year)] += 1
+
+        summary = {
+            "gameId": record.gameId,
+            "date": record.gameDate or None,
+            "gameType": game_type,
+            "home": {
+                "city": record.hometeamCity,
+                "name": record.hometeamName,
+                "score": home_score,
+            },
+            "away": {
+                "city": record.awayteamCity,
+                "name": record.awayteamName,
+                "score": away_score,
+            },
+            "totalPoints": total_points,
+            "margin": margin,
+            "attendance": attendance,
+        }
+
+        self.highest_scoring.update(float(total_points), summary)
+        self.largest_margins.update(float(margin), summary)
+        if attendance and attendance > 0:
+            self.attendance_leaders.update(float(attendance), summary)
+
+    def payload(self) -> dict:
+        earliest_date = self.earliest.finalize()
+        latest_date = self.latest.finalize()
+        return {
+            "generatedAt": _timestamp(),
+            "totals": {
+                "games": self.games,
+                "byType": [
+                    {"gameType": game_type, "games": count}
+                    for game_type, count in self.totals_by_type.most_common()
+                ],
+                "firstGame": earliest_date.isoformat() if earliest_date else None,
+                "latestGame": latest_date.isoformat() if latest_date else None,
+            },
+            "gamesByDecade": [
+                {"decade": decade, "games": count}
+                for decade, count in sorted(self.games_by_decade.items(), key=lambda item: item[0])
             ],
-            "firstGame": earliest_date.isoformat() if earliest_date else None,
-            "latestGame": latest_date.isoformat() if latest_date else None,
-        },
-        "gamesByDecade": [
-            {"decade": decade, "games": count}
-            for decade, count in sorted(games_by_decade.items(), key=lambda item: item[0])
-        ],
-        "highestScoringGames": _sorted_heap(highest_scoring),
-        "largestMargins": _sorted_heap(largest_margins),
-        "attendanceLeaders": _sorted_heap(attendance_leaders),
-    }
+            "highestScoringGames": self.highest_scoring.finalize(),
+            "largestMargins": self.largest_margins.finalize(),
+            "attendanceLeaders": self.attendance_leaders.finalize(),
+        }
+
+
+def build_games_snapshot(records: Iterable[GameRecord] | None = None) -> None:
+    """Write ``historic_games.json`` from the shared ``Games.csv`` table."""
 
-    _write_json("historic_games.json", payload)
+    builder = HistoricGamesBuilder()
+    scan_games([builder], records)
+    _write_json("historic_games.json", builder.payload())
 
 
 # ---------------------------------------------------------------------------
@@ -894,87 +777,88 @@ def build_games_snapshot() -> None:
 
 
 @dataclass
-class TeamAggregate:
-    name: str
-    games: int = 0
-    wins: int = 0
-    losses: int = 0
-    points: float = 0.0
-    opponent_points: float = 0.0
-    assists: float = 0.0
-
-
-def build_team_performance_snapshot() -> None:
-    path = ROOT / "TeamStatistics.zip"
-    if not path.exists():
-        raise FileNotFoundError("TeamStatistics.zip is missing; cannot build team performance snapshot.")
+class TeamAggregate(MergeableState):
+    name: FirstSeen
+    games: Count = field(default_factory=Count)
+    wins: Count = field(default_factory=Count)
+    losses: Count = field(default_factory=Count)
+    points: Sum = field(default_factory=Sum)
+    opponent_points: Sum = field(default_factory=Sum)
+    assists: Sum = field(default_factory=Sum)
+
+
+def build_team_performance_snapshot(records: Iterable[TeamGameRecord] | None = None) -> None:
+    if records is None:
+        if not TEAM_STATS_PATH.exists():
+            raise FileNotFoundError(
+                "TeamStatistics.zip is missing; cannot build team performance snapshot."
+            )
+        records = load_team_games()
 
     team_totals: dict[str, TeamAggregate] = {}
-    scoring_highs: list[tuple[float, dict]] = []
-    margin_highs: list[tuple[float, dict]] = []
-    assist_highs: list[tuple[float, dict]] = []
-
-    with zipfile.ZipFile(path) as archive:
-        with archive.open("TeamStatistics.csv") as raw:
-            handle = io.TextIOWrapper(raw, encoding="utf-8", newline="")
-            reader = csv.DictReader(handle)
-            for row in reader:
-                team_id = row.get("teamId", "").strip()
-                team_name = f"{row.get('teamCity', '').strip()} {row.get('teamName', '').strip()}".strip()
-                if not team_name:
-                    team_name = team_id or "Unknown"
-
-                aggregate = team_totals.setdefault(team_id or team_name, TeamAggregate(name=team_name))
-                aggregate.games += 1
-                if row.get("win", "").strip() == "1":
-                    aggregate.wins += 1
-                else:
-                    aggregate.losses += 1
-
-                points = _to_float(row.get("teamScore")) or 0.0
-                opponent_points = _to_float(row.get("opponentScore")) or 0.0
-                assists = _to_float(row.get("assists")) or 0.0
-
-                aggregate.points += points
-                aggregate.opponent_points += opponent_points
-                aggregate.assists += assists
-
-                margin = points - opponent_points
-                record = {
-                    "gameId": row.get("gameId"),
-                    "date": row.get("gameDate"),
-                    "team": team_name,
-                    "opponent": f"{row.get('opponentTeamCity', '').strip()} {row.get('opponentTeamName', '').strip()}".strip(),
-                    "points": round(points, 1),
-                    "opponentPoints": round(opponent_points, 1),
-                    "margin": round(margin, 1),
-                    "assists": round(assists, 1),
-                    "gameType": row.get("gameType", "").strip() or None,
-                    "home": row.get("home", "").strip() == "1",
-                }
+    scoring_highs = _game_leaders(_team_game_identity)
+    margin_highs = _game_leaders(_team_game_identity)
+    assist_highs = _game_leaders(_team_game_identity)
+
+    for game in records:
+        team_id = game.teamId
+        team_name = game.team or team_id or "Unknown"
+
+        aggregate = team_totals.get(team_id or team_name)
+        if aggregate is None:
+            aggregate = team_totals[team_id or team_name] = TeamAggregate(name=FirstSeen(team_name))
+        aggregate.games.update()
+        aggregate.wins.update(game.win)
+        aggregate.losses.update(not game.win)
+
+        points = game.teamScore or 0.0
+        opponent_points = game.opponentScore or 0.0
+        assists = game.assists or 0.0
+
+        aggregate.points.update(points)
+        aggregate.opponent_points.update(opponent_points)
+        aggregate.assists.update(assists)
+
+        margin = points - opponent_points
+        record = {
+            "gameId": game.gameId,
+            "date": game.gameDate,
+            "team": team_name,
+            "opponent": game.opponent,
+            "points": round(points, 1),
+            "opponentPoints": round(opponent_points, 1),
+            "margin": round(margin, 1),
+            "assists": round(assists, 1),
+            "gameType": game.gameType or None,
+            "home": game.home,
+        }
 
-                _push_top(scoring_highs, points, record, size=12)
-                if margin > 0:
-                    _push_top(margin_highs, margin, record, size=12)
-                if assists > 0:
-                    _push_top(assist_highs, assists, record, size=12)
+        scoring_highs.update(points, record)
+        if margin > 0:
+            margin_highs.update(margin, record)
+        if assists > 0:
+            assist_highs.update(assists, record)
 
     win_pct_leaders = []
     for team_id, aggregate in team_totals.items():
-        if aggregate.games < 500:
+        games = aggregate.games.finalize()
+        if games < 500:
             continue
-        win_pct = aggregate.wins / aggregate.games if aggregate.games else 0.0
+        wins = aggregate.wins.finalize()
+        win_pct = wins / games if games else 0.0
         win_pct_leaders.append(
             {
                 "teamId": team_id,
-                "team": aggregate.name,
-                "games": aggregate.games,
-                "wins": aggregate.wins,
-                "losses": aggregate.losses,
+                "team": aggregate.name.finalize(),
+                "games": games,
+                "wins": wins,
+                "losses": aggregate.losses.finalize(),
                 "winPct": round(win_pct, 4),
-                "pointsPerGame": round(aggregate.points / aggregate.games, 2) if aggregate.games else 0.0,
-                "opponentPointsPerGame": round(aggregate.opponent_points / aggregate.games, 2) if aggregate.games else 0.0,
-                "assistsPerGame": round(aggregate.assists / aggregate.games, 2) if aggregate.games else 0.0,
+                "pointsPerGame": round(aggregate.points.finalize() / games, 2) if games else 0.0,
+                "opponentPointsPerGame": round(aggregate.opponent_points.finalize() / games, 2)
+                if games
+                else 0.0,
+                "assistsPerGame": round(aggregate.assists.finalize() / games, 2) if games else 0.0,
             }
         )
 
@@ -984,9 +868,9 @@ def build_team_performance_snapshot() -> None:
         "generatedAt": _timestamp(),
         "winPctLeaders": win_pct_leaders[:12],
         "singleGameHighs": {
-            "scoring": _sorted_heap(scoring_highs),
-            "margins": _sorted_heap(margin_highs),
-            "assists": _sorted_heap(assist_highs),
+            "scoring": scoring_highs.finalize(),
+            "margins": margin_highs.finalize(),
+            "assists": assist_highs.finalize(),
         },
     }
 
@@ -997,105 +881,283 @@ def build_team_performance_snapshot() -> None:
 # PlayerStatistics.7z snapshot
 
 
-def build_player_leaders_snapshot() -> None:
-    active_player_ids, active_player_source = _load_active_player_ids()
-    career_totals: dict[str, dict[str, object]] = {}
-    points_highs: list[tuple[float, dict]] = []
-    points_50_plus: dict[tuple[str | None, str], dict] = {}
-    assists_highs: list[tuple[float, dict]] = []
-    rebounds_highs: list[tuple[float, dict]] = []
-    total_rows = 0
-    earliest_season: int | None = None
-    latest_season: int | None = None
-
-    for row in iter_player_statistics_rows():
-        total_rows += 1
-        person_id = row.get("personId") or ""
-        if not person_id:
-            continue
+def _leader_career_record() -> Record:
+    return Record(
+        firstName=FirstSeen(),
+        lastName=FirstSeen(),
+        games=Count(),
+        points=Sum(),
+        assists=Sum(),
+        rebounds=Sum(),
+        minutes=Sum(),
+        wins=Count(),
+        losses=Count(),
+        gameTypes=Tally(),
+        teams=SetUnion(),
+        firstSeason=Min(),
+        lastSeason=Max(),
+    )
 
-        points = _to_float(row.get("points")) or 0.0
-        assists = _to_float(row.get("assists")) or 0.0
-        rebounds = _to_float(row.get("reboundsTotal")) or 0.0
-        minutes = _to_float(row.get("numMinutes")) or 0.0
-        win_flag = row.get("win", "").strip() == "1"
-        game_type = row.get("gameType", "").strip() or "Unknown"
-        game_date_raw = row.get("gameDate", "").strip()
-        season_year = _year_from_date(game_date_raw)
-        if season_year is not None:
-            if earliest_season is None or season_year < earliest_season:
-                earliest_season = season_year
-            if latest_season is None or season_year > latest_season:
-                latest_season = season_year
 
-        career = career_totals.setdefault(
-            person_id,
-            {
-                "personId": person_id,
-                "firstName": row.get("firstName", "").strip(),
-                "lastName": row.get("lastName", "").strip(),
-                "games": 0,
-                "points": 0.0,
-                "assists": 0.0,
-                "rebounds": 0.0,
-                "minutes": 0.0,
-                "wins": 0,
-                "losses": 0,
-                "gameTypes": Counter(),
-                "teams": set(),
-                "firstSeason": season_year,
-                "lastSeason": season_year,
-            },
-        )
+def _single_game_record(
+    person_id: str,
+    name: str,
+    game_id: str,
+    game_date: str,
+    team: str,
+    opponent: str,
+    game_type: str,
+    points: float,
+    assists: float,
+    rebounds: float,
+    minutes: float,
+) -> dict[str, Any]:
+    return {
+        "personId": person_id,
+        "name": name,
+        "gameId": game_id,
+        "gameDate": game_date or None,
+        "team": team or None,
+        "opponent": opponent or None,
+        "gameType": game_type,
+        "points": round(points, 1),
+        "assists": round(assists, 1),
+        "rebounds": round(rebounds, 1),
+        "minutes": round(minutes, 1),
+    }
 
-        if not career["firstName"] and row.get("firstName"):
-            career["firstName"] = row.get("firstName", "").strip()
-        if not career["lastName"] and row.get("lastName"):
-            career["lastName"] = row.get("lastName", "").strip()
-
-        career["games"] += 1
-        career["points"] += points
-        career["assists"] += assists
-        career["rebounds"] += rebounds
-        career["minutes"] += minutes
-        if win_flag:
-            career["wins"] += 1
-        else:
-            career["losses"] += 1
-        career["gameTypes"][game_type] += 1
 
-        team_name = f"{row.get('playerteamCity', '').strip()} {row.get('playerteamName', '').strip()}".strip()
-        if team_name:
-            career["teams"].add(team_name)
+class PlayerLeadersBuilder(MergeableState):
+    """Collect career totals and single-game highs for ``player_leaders.json``."""
 
-        if season_year is not None:
-            if career["firstSeason"] is None or season_year < career["firstSeason"]:
-                career["firstSeason"] = season_year
-            if career["lastSeason"] is None or season_year > career["lastSeason"]:
-                career["lastSeason"] = season_year
+    columns = Projection(
+        "LeadersRow",
+        {
+            "personId": "str",
+            "firstName": "category",
+            "lastName": "category",
+            "name": (("firstName", "lastName"), joined_category),
+            "gameId": "str",
+            "gameDate": "str",
+            "seasonYear": ("gameDate", season_from_date),
+            "gameType": "category",
+            "team": (("playerteamCity", "playerteamName"), joined_category),
+            "opponent": (("opponentteamCity", "opponentteamName"), joined_category),
+            "points": "float",
+            "assists": "float",
+            "reboundsTotal": "float",
+            "numMinutes": "float",
+            "win": "flag",
+        },
+    )
 
-        single_game_record = {
-            "personId": person_id,
-            "name": f"{row.get('firstName', '').strip()} {row.get('lastName', '').strip()}".strip(),
-            "gameId": row.get("gameId"),
-            "gameDate": game_date_raw or None,
-            "team": team_name or None,
-            "opponent": f"{row.get('opponentteamCity', '').strip()} {row.get('opponentteamName', '').strip()}".strip() or None,
-            "gameType": game_type,
-            "points": round(points, 1),
-            "assists": round(assists, 1),
-            "rebounds": round(rebounds, 1),
-            "minutes": round(minutes, 1),
-        }
+    def __init__(self) -> None:
+        self.career_totals: Keyed[str, Record] = Keyed(_leader_career_record)
+        self.points_highs = _player_game_leaders()
+        self.points_50_plus: Keyed[tuple[str | None, str], FirstSeen] = Keyed(FirstSeen)
+        self.assists_highs = _player_game_leaders()
+        self.rebounds_highs = _player_game_leaders()
+        self.total_rows = Count()
+        self.earliest_season = Min()
+        self.latest_season = Max()
+
+    def consume(self, row: Any) -> None:
+        self.total_rows.update()
+        person_id = row.personId
+        if not person_id:
+            return
+
+        points = row.points or 0.0
+        assists = row.assists or 0.0
+        rebounds = row.reboundsTotal or 0.0
+        minutes = row.numMinutes or 0.0
+        win_flag = row.win
+        game_type = row.gameType or "Unknown"
+        game_date_raw = row.gameDate
+        season_year = row.seasonYear
+        self.earliest_season.update(season_year)
+        self.latest_season.update(season_year)
+
+        team_name = row.team
+        career = self.career_totals[person_id]
+        career.update(
+            firstName=row.firstName,
+            lastName=row.lastName,
+            games=1,
+            points=points,
+            assists=assists,
+            rebounds=rebounds,
+            minutes=minutes,
+            wins=win_flag,
+            losses=not win_flag,
+            gameTypes=game_type,
+            firstSeason=season_year,
+            lastSeason=season_year,
+        )
+        if team_name:
+            career["teams"].update(team_name)
 
-        _push_top(points_highs, points, single_game_record, size=12)
-        _push_top(assists_highs, assists, single_game_record, size=12)
-        _push_top(rebounds_highs, rebounds, single_game_record, size=12)
+        single_game_record = _single_game_record(
+            person_id,
+            row.name,
+            row.gameId,
+            game_date_raw,
+            team_name,
+            row.opponent,
+            game_type,
+            points,
+            assists,
+            rebounds,
+            minutes,
+        )
+
+        self.points_highs.update(points, single_game_record)
+        self.assists_highs.update(assists, single_game_record)
+        self.rebounds_highs.update(rebounds, single_game_record)
 
         if points >= 50.0:
-            key = (single_game_record.get("gameId"), person_id)
-            if key not in points_50_plus:
-                points_50_plus[key] = single_game_record
+            self.points_50_plus[(row.gameId, person_id)].update(single_game_record)
+
+    def consume_frame(self, frame: ColumnFrame) -> None:
+        """Fold a whole :class:`~scripts.player_stats_arrays.ColumnFrame` (the numpy backend)."""
+
+        self.merge(_leaders_from_frame(frame))
+
+    def payload(self) -> dict:
+        return _player_leaders_payload(self)
+
+
+def _or_zero(value: float | None) -> float:
+    return value or 0.0
+
+
+def _person_rows(frame: ColumnFrame, projection: Projection) -> ColumnFrame:
+    """The rows with a ``personId``; the builders skip the rest."""
+
+    return frame.take(frame.field(projection, "personId").lookup(bool, bool))
+
+
+def _season_bounds(builder: Any, seasons: Any, valid: Any) -> None:
+    if valid.any():
+        builder.earliest_season.update(int(seasons[valid].min()))
+        builder.latest_season.update(int(seasons[valid].max()))
+
+
+def _grouped_sets(groups: Groups, field: Factorized, mask: Any) -> list[set]:
+    """Per group, the set of ``field`` values on ``mask`` rows, added in first-seen order."""
+
+    sets: list[set] = [set() for _ in range(groups.count)]
+    rows = mask.nonzero()[0]
+    if len(rows):
+        pairs = group_by(groups.ids[rows], field.codes[rows])
+        for row in rows[pairs.first].tolist():
+            sets[groups.ids[row]].add(field.values[field.codes[row]])
+    return sets
+
+
+def _grouped_first(groups: Groups, field: Factorized) -> list[Any]:
+    """Per group, the first truthy ``field`` value (``""`` when none), like :class:`FirstSeen`."""
+
+    rows = group_first(groups, field.lookup(bool, bool))
+    return [field.values[field.codes[row]] if row >= 0 else "" for row in rows]
+
+
+def _leaders_from_frame(frame: ColumnFrame) -> PlayerLeadersBuilder:
+    projection = PlayerLeadersBuilder.columns
+    builder = PlayerLeadersBuilder()
+    builder.total_rows.update(frame.length)
+    frame = _person_rows(frame, projection)
+    if not frame.length:
+        return builder
+
+    field = {name: frame.field(projection, name) for name in projection.fields}
+    people = field["personId"]
+    points = field["points"].lookup(_or_zero, float)
+    assists = field["assists"].lookup(_or_zero, float)
+    rebounds = field["reboundsTotal"].lookup(_or_zero, float)
+    minutes = field["numMinutes"].lookup(_or_zero, float)
+    wins = field["win"].lookup(bool, bool)
+    seasons, has_season = optional_ints(field["seasonYear"])
+    game_types = [value or "Unknown" for value in field["gameType"].values]
+    _season_bounds(builder, seasons, has_season)
+
+    groups = group_by(people.codes)
+    first_names = _grouped_first(groups, field["firstName"])
+    last_names = _grouped_first(groups, field["lastName"])
+    games = group_count(groups)
+    sums = [group_sum(groups, values) for values in (points, assists, rebounds, minutes)]
+    win_counts = group_count(groups, wins)
+    loss_counts = group_count(groups, ~wins)
+    first_seasons = group_extreme(groups, seasons, has_season, largest=False)
+    last_seasons = group_extreme(groups, seasons, has_season, largest=True)
+    teams = _grouped_sets(groups, field["team"], field["team"].lookup(bool, bool))
+    type_counts: list[Counter] = [Counter() for _ in range(groups.count)]
+    type_pairs = group_by(groups.ids, field["gameType"].codes)
+    for row, count in zip(type_pairs.first.tolist(), group_count(type_pairs), strict=True):
+        type_counts[groups.ids[row]][game_types[field["gameType"].codes[row]]] += count
+
+    for group, row in enumerate(groups.first.tolist()):
+        career = builder.career_totals[people.values[people.codes[row]]]
+        career["firstName"].value = first_names[group]
+        career["lastName"].value = last_names[group]
+        career["games"].count = games[group]
+        for name, totals in zip(("points", "assists", "rebounds", "minutes"), sums, strict=True):
+            career[name].total = totals[group]
+        career["wins"].count = win_counts[group]
+        career["losses"].count = loss_counts[group]
+        career["gameTypes"].counts = type_counts[group]
+        career["teams"].values = teams[group]
+        career["firstSeason"].value = first_seasons[group]
+        career["lastSeason"].value = last_seasons[group]
+
+    def value(name: str, row: int) -> Any:
+        return field[name].values[field[name].codes[row]]
+
+    def single_game(row: int) -> dict[str, Any]:
+        return _single_game_record(
+            value("personId", row),
+            value("name", row),
+            value("gameId", row),
+            value("gameDate", row),
+            value("team", row),
+            value("opponent", row),
+            game_types[field["gameType"].codes[row]],
+            float(points[row]),
+            float(assists[row]),
+            float(rebounds[row]),
+            float(minutes[row]),
+        )
+
+    def identities(rows: Any) -> Iterable[tuple[int, int]]:
+        return zip(people.codes[rows].tolist(), field["gameId"].codes[rows].tolist(), strict=True)
+
+    for top, keys in (
+        (builder.points_highs, points),
+        (builder.assists_highs, assists),
+        (builder.rebounds_highs, rebounds),
+    ):
+        candidates = top_candidates(keys, identities, top.size)
+        feed_top(top, candidates, keys, single_game, frame.length)
+    for row in (points >= 50.0).nonzero()[0].tolist():
+        builder.points_50_plus[(value("gameId", row), value("personId", row))].update(
+            single_game(row)
+        )
+    return builder
+
+
+def _player_leaders_payload(builder: PlayerLeadersBuilder) -> dict:
+    active_player_ids, active_player_source = _load_active_player_ids()
+    career_totals = {
+        person_id: {"personId": person_id, **career.finalize()}
+        for person_id, career in builder.career_totals.items()
+    }
+    points_highs = builder.points_highs.finalize()
+    points_50_plus = builder.points_50_plus.finalize()
+    assists_highs = builder.assists_highs.finalize()
+    rebounds_highs = builder.rebounds_highs.finalize()
+    total_rows = builder.total_rows.finalize()
+    earliest_season = builder.earliest_season.finalize()
+    latest_season = builder.latest_season.finalize()
 
     career_list = []
     for stats in career_totals.values():
@@ -1145,7 +1207,7 @@ def build_player_leaders_snapshot() -> None:
             "rebounds": career_rebounds,
         },
         "singleGameHighs": {
-            "points": _sorted_heap(points_highs),
+            "points": points_highs,
             "points50Plus": sorted(
                 points_50_plus.values(),
                 key=lambda record: (
@@ -1155,8 +1217,8 @@ def build_player_leaders_snapshot() -> None:
                 ),
                 reverse=True,
             ),
-            "assists": _sorted_heap(assists_highs),
-            "rebounds": _sorted_heap(rebounds_highs),
+            "assists": assists_highs,
+            "rebounds": rebounds_highs,
         },
     }
 
@@ -1176,117 +1238,257 @@ def build_player_leaders_snapshot() -> None:
             chase_payload["playersWithStats"] = len(active_career_list)
         payload["milestoneChase"] = chase_payload
 
-    _write_json("player_leaders.json", payload)
+    return payload
+
+
+def build_player_leaders_snapshot(
+    rows: Iterable[Mapping[str, str]] | None = None,
+    *,
+    jobs: int = 1,
+    incremental: bool = False,
+    backend: str = "python",
+) -> None:
+    refresh = open_refresh(
+        "player_leaders", PlayerLeadersBuilder, incremental=incremental, persist=rows is None
+    )
+    scan_player_statistics([refresh.consumer], rows, jobs=jobs, backend=backend)
+    _write_json("player_leaders.json", refresh.commit().payload())
 
 
 # ---------------------------------------------------------------------------
 # Player season insight snapshot
 
 
-def build_player_season_insights_snapshot() -> None:
-    season_player_totals: dict[tuple[str, int], dict[str, object]] = {}
-    player_meta: dict[str, dict[str, object]] = {}
-    triple_double_counts: Counter[str] = Counter()
-    triple_double_seasons: defaultdict[str, set[int]] = defaultdict(set)
-    season_totals: defaultdict[int, dict[str, float]] = defaultdict(
-        lambda: {"games": 0.0, "points": 0.0, "assists": 0.0, "rebounds": 0.0, "minutes": 0.0}
+def _season_player_record() -> Record:
+    return Record(
+        games=Count(),
+        points=Sum(),
+        assists=Sum(),
+        rebounds=Sum(),
+        minutes=Sum(),
+        teams=SetUnion(),
+        tripleDoubles=Count(),
     )
-    season_triple_counts: Counter[int] = Counter()
-    player_best_triple: dict[str, dict[str, object]] = {}
-    total_rows = 0
-    earliest_season: int | None = None
-    latest_season: int | None = None
 
-    for row in iter_player_statistics_rows():
-        total_rows += 1
-        person_id = row.get("personId") or ""
-        if not person_id:
-            continue
 
-        season_year = _year_from_date(row.get("gameDate"))
-        if season_year is None:
-            continue
+def _season_player_meta_record() -> Record:
+    return Record(
+        firstName=FirstSeen(),
+        lastName=FirstSeen(),
+        teams=SetUnion(),
+        firstSeason=Min(),
+        lastSeason=Max(),
+    )
 
-        if earliest_season is None or season_year < earliest_season:
-            earliest_season = season_year
-        if latest_season is None or season_year > latest_season:
-            latest_season = season_year
 
-        first_name = row.get("firstName", "").strip()
-        last_name = row.get("lastName", "").strip()
-        team_name = f"{row.get('playerteamCity', '').strip()} {row.get('playerteamName', '').strip()}".strip()
+def _season_totals_record() -> Record:
+    return Record(games=Sum(), points=Sum(), assists=Sum(), rebounds=Sum(), minutes=Sum())
 
-        meta = player_meta.setdefault(
-            person_id,
-            {
-                "personId": person_id,
-                "firstName": first_name,
-                "lastName": last_name,
-                "teams": set(),
-                "firstSeason": season_year,
-                "lastSeason": season_year,
-            },
-        )
-        if first_name and not meta.get("firstName"):
-            meta["firstName"] = first_name
-        if last_name and not meta.get("lastName"):
-            meta["lastName"] = last_name
 
-        if meta.get("firstSeason") is None or (isinstance(meta.get("firstSeason"), int) and season_year < meta["firstSeason"]):
-            meta["firstSeason"] = season_year
-        if meta.get("lastSeason") is None or (isinstance(meta.get("lastSeason"), int) and season_year > meta["lastSeason"]):
-            meta["lastSeason"] = season_year
+class PlayerSeasonInsightsBuilder(MergeableState):
+    """Collect per-player season totals for ``player_season_insights.json``."""
 
-        if team_name:
-            meta["teams"].add(team_name)
+    columns = Projection(
+        "SeasonInsightsRow",
+        {
+            "personId": "str",
+            "firstName": "category",
+            "lastName": "category",
+            "seasonYear": ("gameDate", season_from_date),
+            "team": (("playerteamCity", "playerteamName"), joined_category),
+            "points": "float",
+            "assists": "float",
+            "reboundsTotal": "float",
+            "steals": "float",
+            "blocks": "float",
+            "numMinutes": "float",
+        },
+    )
 
-        key = (person_id, season_year)
-        totals = season_player_totals.setdefault(
-            key,
-            {
-                "personId": person_id,
-                "season": season_year,
-                "games": 0,
-                "points": 0.0,
-                "assists": 0.0,
-                "rebounds": 0.0,
-                "minutes": 0.0,
-                "teams": set(),
-                "tripleDoubles": 0,
-            },
-        )
+    def __init__(self) -> None:
+        self.season_player_totals: Keyed[tuple[str, int], Record] = Keyed(_season_player_record)
+        self.player_meta: Keyed[str, Record] = Keyed(_season_player_meta_record)
+        self.triple_double_counts = Tally()
+        self.triple_double_seasons: Keyed[str, SetUnion] = Keyed(SetUnion)
+        self.season_totals: Keyed[int, Record] = Keyed(_season_totals_record)
+        self.season_triple_counts = Tally()
+        self.total_rows = Count()
+        self.earliest_season = Min()
+        self.latest_season = Max()
+
+    def consume(self, row: Any) -> None:
+        self.total_rows.update()
+        person_id = row.personId
+        if not person_id:
+            return
 
-        points = _to_float(row.get("points")) or 0.0
-        assists = _to_float(row.get("assists")) or 0.0
-        rebounds = _to_float(row.get("reboundsTotal")) or 0.0
-        steals = _to_float(row.get("steals")) or 0.0
-        blocks = _to_float(row.get("blocks")) or 0.0
-        minutes = _to_float(row.get("numMinutes")) or 0.0
-
-        totals["games"] = int(totals.get("games", 0)) + 1
-        totals["points"] = float(totals.get("points", 0.0)) + points
-        totals["assists"] = float(totals.get("assists", 0.0)) + assists
-        totals["rebounds"] = float(totals.get("rebounds", 0.0)) + rebounds
-        totals["minutes"] = float(totals.get("minutes", 0.0)) + minutes
+        season_year = row.seasonYear
+        if season_year is None:
+            return
+
+        self.earliest_season.update(season_year)
+        self.latest_season.update(season_year)
+
+        team_name = row.team
+
+        meta = self.player_meta[person_id]
+        meta.update(
+            firstName=row.firstName,
+            lastName=row.lastName,
+            firstSeason=season_year,
+            lastSeason=season_year,
+        )
         if team_name:
-            totals["teams"].add(team_name)
+            meta["teams"].update(team_name)
 
-        season_totals_entry = season_totals[season_year]
-        season_totals_entry["games"] += 1
-        season_totals_entry["points"] += points
-        season_totals_entry["assists"] += assists
-        season_totals_entry["rebounds"] += rebounds
-        season_totals_entry["minutes"] += minutes
+        points = row.points or 0.0
+        assists = row.assists or 0.0
+        rebounds = row.reboundsTotal or 0.0
+        steals = row.steals or 0.0
+        blocks = row.blocks or 0.0
+        minutes = row.numMinutes or 0.0
 
         categories_above_threshold = sum(
             1 for value in (points, assists, rebounds, steals, blocks) if value >= 10
         )
         triple_double = categories_above_threshold >= 3
+
+        totals = self.season_player_totals[(person_id, season_year)]
+        totals.update(
+            games=1,
+            points=points,
+            assists=assists,
+            rebounds=rebounds,
+            minutes=minutes,
+            tripleDoubles=triple_double,
+        )
+        if team_name:
+            totals["teams"].update(team_name)
+
+        self.season_totals[season_year].update(
+            games=1,
+            points=points,
+            assists=assists,
+            rebounds=rebounds,
+            minutes=minutes,
+        )
+
         if triple_double:
-            totals["tripleDoubles"] = int(totals.get("tripleDoubles", 0)) + 1
-            triple_double_counts[person_id] += 1
-            triple_double_seasons[person_id].add(season_year)
-            season_triple_counts[season_year] += 1
+            self.triple_double_counts.update(person_id)
+            self.triple_double_seasons[person_id].update(season_year)
+            self.season_triple_counts.update(season_year)
+
+    def consume_frame(self, frame: ColumnFrame) -> None:
+        """Fold a whole :class:`~scripts.player_stats_arrays.ColumnFrame` (the numpy backend)."""
+
+        self.merge(_season_insights_from_frame(frame))
+
+    def payload(self) -> dict:
+        return _player_season_insights_payload(self)
+
+
+def _season_insights_from_frame(frame: ColumnFrame) -> PlayerSeasonInsightsBuilder:
+    projection = PlayerSeasonInsightsBuilder.columns
+    builder = PlayerSeasonInsightsBuilder()
+    builder.total_rows.update(frame.length)
+    frame = _person_rows(frame, projection)
+    frame = frame.take(optional_ints(frame.field(projection, "seasonYear"))[1])
+    if not frame.length:
+        return builder
+
+    field = {name: frame.field(projection, name) for name in projection.fields}
+    people = field["personId"]
+    season_field = field["seasonYear"]
+    seasons, valid = optional_ints(season_field)
+    _season_bounds(builder, seasons, valid)
+    stats = {
+        name: field[column].lookup(_or_zero, float)
+        for name, column in (
+            ("points", "points"),
+            ("assists", "assists"),
+            ("rebounds", "reboundsTotal"),
+            ("minutes", "numMinutes"),
+        )
+    }
+    steals = field["steals"].lookup(_or_zero, float)
+    blocks = field["blocks"].lookup(_or_zero, float)
+    categories_above_threshold = sum(
+        (values >= 10).astype(int)
+        for values in (stats["points"], stats["assists"], stats["rebounds"], steals, blocks)
+    )
+    triple_double = categories_above_threshold >= 3
+    has_team = field["team"].lookup(bool, bool)
+
+    groups = group_by(people.codes)
+    first_names = _grouped_first(groups, field["firstName"])
+    last_names = _grouped_first(groups, field["lastName"])
+    first_seasons = group_extreme(groups, seasons, valid, largest=False)
+    last_seasons = group_extreme(groups, seasons, valid, largest=True)
+    teams = _grouped_sets(groups, field["team"], has_team)
+    for group, row in enumerate(groups.first.tolist()):
+        meta = builder.player_meta[people.values[people.codes[row]]]
+        meta["firstName"].value = first_names[group]
+        meta["lastName"].value = last_names[group]
+        meta["firstSeason"].value = first_seasons[group]
+        meta["lastSeason"].value = last_seasons[group]
+        meta["teams"].values = teams[group]
+
+    player_seasons = group_by(people.codes, season_field.codes)
+    games = group_count(player_seasons)
+    sums = {name: group_sum(player_seasons, values) for name, values in stats.items()}
+    triple_doubles = group_count(player_seasons, triple_double)
+    season_teams = _grouped_sets(player_seasons, field["team"], has_team)
+    for group, row in enumerate(player_seasons.first.tolist()):
+        totals = builder.season_player_totals[(people.values[people.codes[row]], int(seasons[row]))]
+        totals["games"].count = games[group]
+        for name, values in sums.items():
+            totals[name].total = values[group]
+        totals["teams"].values = season_teams[group]
+        totals["tripleDoubles"].count = triple_doubles[group]
+
+    by_season = group_by(season_field.codes)
+    season_games = group_sum(by_season, valid.astype(float))
+    season_sums = {name: group_sum(by_season, values) for name, values in stats.items()}
+    for group, row in enumerate(by_season.first.tolist()):
+        totals = builder.season_totals[int(seasons[row])]
+        totals["games"].total = season_games[group]
+        for name, values in season_sums.items():
+            totals[name].total = values[group]
+
+    triple_rows = triple_double.nonzero()[0]
+    if len(triple_rows):
+        triple_people = group_by(people.codes[triple_rows])
+        for row, count in zip(
+            triple_rows[triple_people.first].tolist(), group_count(triple_people), strict=True
+        ):
+            builder.triple_double_counts.update(people.values[people.codes[row]], count)
+        triple_pairs = group_by(people.codes[triple_rows], season_field.codes[triple_rows])
+        for row in triple_rows[triple_pairs.first].tolist():
+            builder.triple_double_seasons[people.values[people.codes[row]]].update(
+                int(seasons[row])
+            )
+        triple_seasons = group_by(season_field.codes[triple_rows])
+        for row, count in zip(
+            triple_rows[triple_seasons.first].tolist(), group_count(triple_seasons), strict=True
+        ):
+            builder.season_triple_counts.update(int(seasons[row]), count)
+    return builder
+
+
+def _player_season_insights_payload(builder: PlayerSeasonInsightsBuilder) -> dict:
+    season_player_totals = builder.season_player_totals.finalize()
+    player_meta = {
+        person_id: {"personId": person_id, **meta.finalize()}
+        for person_id, meta in builder.player_meta.items()
+    }
+    triple_double_counts = builder.triple_double_counts.finalize()
+    triple_double_seasons = builder.triple_double_seasons.finalize()
+    season_totals = builder.season_totals.finalize()
+    season_triple_counts = builder.season_triple_counts.finalize()
+    player_best_triple: dict[str, dict[str, object]] = {}
+    total_rows = builder.total_rows.finalize()
+    earliest_season = builder.earliest_season.finalize()
+    latest_season = builder.latest_season.finalize()
 
     season_records: list[dict[str, object]] = []
     for (person_id, season_year), totals in season_player_totals.items():
@@ -1447,361 +1649,488 @@ def build_player_season_insights_snapshot() -> None:
         "seasonTrends": season_trends,
     }
 
-    _write_json("player_season_insights.json", payload)
+    return payload
+
+
+def build_player_season_insights_snapshot(
+    rows: Iterable[Mapping[str, str]] | None = None,
+    *,
+    jobs: int = 1,
+    incremental: bool = False,
+    backend: str = "python",
+) -> None:
+    refresh = open_refresh(
+        "player_season_insights",
+        PlayerSeasonInsightsBuilder,
+        incremental=incremental,
+        persist=rows is None,
+    )
+    scan_player_statistics([refresh.consumer], rows, jobs=jobs, backend=backend)
+    builder = refresh.commit()
+    _write_json("player_season_insights.json", builder.payload())
 
 
 # ---------------------------------------------------------------------------
 
 
-def build_goat_system_snapshot() -> None:
-    """Generate a GOAT ranking row for every known player."""
+def _finals_season_record() -> Record:
+    # ``listed`` Finals games Games.csv knows (decided or not); ``titles`` of them whose
+    # decided series the player's side won.
+    return Record(wins=Count(), games=Count(), listed=Count(), titles=Count())
 
-    player_directory = _load_player_directory()
-    franchise_lookup = _load_franchise_lookup()
-    championship_overrides = _load_championship_overrides()
-    finals_mvp_lookup = _load_finals_mvp_ledger()
-    bdi_lookup, bdi_maxima, bdi_metadata, bdi_generated_at = _load_bdi_component_lookup()
 
-    career_totals: dict[str, dict[str, object]] = {}
-    earliest_season: int | None = None
-    latest_season: int | None = None
+_GOAT_SEASON_COUNTS = ("games", "wins", "playoffGames", "playoffWins", "finalsGames", "finalsWins")
+_GOAT_SEASON_SUMS = ("minutes", "points", "assists", "rebounds", "steals", "blocks")
 
-    for row in iter_player_statistics_rows():
-        person_id = (row.get("personId") or "").strip()
-        if not person_id:
-            continue
 
-        season_year = _year_from_date(row.get("gameDate"))
-        if season_year is not None:
-            if earliest_season is None or season_year < earliest_season:
-                earliest_season = season_year
-            if latest_season is None or season_year > latest_season:
-                latest_season = season_year
+def _goat_season_record() -> Record:
+    return Record(
+        games=Count(),
+        wins=Count(),
+        playoffGames=Count(),
+        playoffWins=Count(),
+        finalsGames=Count(),
+        finalsWins=Count(),
+        minutes=Sum(),
+        points=Sum(),
+        assists=Sum(),
+        rebounds=Sum(),
+        steals=Sum(),
+        blocks=Sum(),
+    )
 
-        totals = career_totals.setdefault(
-            person_id,
-            {
-                "personId": person_id,
-                "games": 0,
-                "points": 0.0,
-                "assists": 0.0,
-                "rebounds": 0.0,
-                "minutes": 0.0,
-                "steals": 0.0,
-                "blocks": 0.0,
-                "wins": 0,
-                "losses": 0,
-                "playoffGames": 0,
-                "playoffWins": 0,
-                "finalsGames": 0,
-                "finalsWins": 0,
-                "finalsSeasons": {},
-                "teams": set(),
-                "firstSeason": season_year,
-                "lastSeason": season_year,
-            },
-        )
 
-        totals["games"] = int(totals.get("games", 0)) + 1
-        points = _to_float(row.get("points")) or 0.0
-        assists = _to_float(row.get("assists")) or 0.0
-        rebounds = _to_float(row.get("reboundsTotal")) or 0.0
-        minutes = _to_float(row.get("numMinutes")) or 0.0
-        steals = _to_float(row.get("steals")) or 0.0
-        blocks = _to_float(row.get("blocks")) or 0.0
-
-        totals["points"] = float(totals.get("points", 0.0)) + points
-        totals["assists"] = float(totals.get("assists", 0.0)) + assists
-        totals["rebounds"] = float(totals.get("rebounds", 0.0)) + rebounds
-        totals["minutes"] = float(totals.get("minutes", 0.0)) + minutes
-        totals["steals"] = float(totals.get("steals", 0.0)) + steals
-        totals["blocks"] = float(totals.get("blocks", 0.0)) + blocks
-
-        win_flag = (row.get("win") or "").strip() == "1"
-        if win_flag:
-            totals["wins"] = int(totals.get("wins", 0)) + 1
-        else:
-            totals["losses"] = int(totals.get("losses", 0)) + 1
-
-        game_type = (row.get("gameType") or "").strip().lower()
-        if game_type == "playoffs":
-            totals["playoffGames"] = int(totals.get("playoffGames", 0)) + 1
-            if win_flag:
-                totals["playoffWins"] = int(totals.get("playoffWins", 0)) + 1
-
-        game_label = (row.get("gameLabel") or "").strip().lower()
-        is_nba_finals = "nba finals" in game_label
-        if is_nba_finals:
-            totals["finalsGames"] = int(totals.get("finalsGames", 0)) + 1
-            if win_flag:
-                totals["finalsWins"] = int(totals.get("finalsWins", 0)) + 1
-            if season_year is not None:
-                finals_seasons = totals.setdefault("finalsSeasons", {})
-                season_record = finals_seasons.setdefault(season_year, {"wins": 0, "games": 0})
-                season_record["games"] = int(season_record.get("games", 0)) + 1
-                if win_flag:
-                    season_record["wins"] = int(season_record.get("wins", 0)) + 1
-
-        team_name = f"{(row.get('playerteamCity') or '').strip()} {(row.get('playerteamName') or '').strip()}".strip()
-        if team_name:
-            totals.setdefault("teams", set()).add(team_name)
+def _goat_career_record() -> Record:
+    return Record(
+        games=Count(),
+        points=Sum(),
+        assists=Sum(),
+        rebounds=Sum(),
+        minutes=Sum(),
+        steals=Sum(),
+        blocks=Sum(),
+        wins=Count(),
+        losses=Count(),
+        playoffGames=Count(),
+        playoffWins=Count(),
+        finalsGames=Count(),
+        finalsWins=Count(),
+        finalsSeasons=Keyed(_finals_season_record),
+        teams=SetUnion(),
+        firstSeason=Min(),
+        lastSeason=Max(),
+    )
+
+
+class GoatSystemBuilder(MergeableState):
+    """Collect career totals and Finals records for ``goat_system.json``."""
+
+    columns = Projection(
+        "GoatSystemRow",
+        {
+            "personId": "str",
+            "seasonYear": ("gameDate", season_from_date),
+            "phase": (("gameId", "gameType", "gameLabel"), game_phase),
+            "seriesWon": (("gameId", "win"), series_won),
+            "team": (("playerteamCity", "playerteamName"), joined_category),
+            "points": "float",
+            "assists": "float",
+            "reboundsTotal": "float",
+            "numMinutes": "float",
+            "steals": "float",
+            "blocks": "float",
+            "win": "flag",
+        },
+    )
 
+    def __init__(self) -> None:
+        self.career_totals: Keyed[str, Record] = Keyed(_goat_career_record)
+        # The same counts per (personId, season), resampled by the rank-band bootstrap.
+        self.season_totals: Keyed[tuple[str, int], Record] = Keyed(_goat_season_record)
+        self.earliest_season = Min()
+        self.latest_season = Max()
+
+    def consume(self, row: Any) -> None:
+        person_id = row.personId
+        if not person_id:
+            return
+
+        season_year = row.seasonYear
+        self.earliest_season.update(season_year)
+        self.latest_season.update(season_year)
+
+        win_flag = row.win
+        is_playoffs = row.phase in PLAYOFF_PHASES
+        is_nba_finals = row.phase == FINALS
+
+        totals = self.career_totals[person_id]
+        totals.update(
+            games=1,
+            points=row.points or 0.0,
+            assists=row.assists or 0.0,
+            rebounds=row.reboundsTotal or 0.0,
+            minutes=row.numMinutes or 0.0,
+            steals=row.steals or 0.0,
+            blocks=row.blocks or 0.0,
+            wins=win_flag,
+            losses=not win_flag,
+            playoffGames=is_playoffs,
+            playoffWins=is_playoffs and win_flag,
+            finalsGames=is_nba_finals,
+            finalsWins=is_nba_finals and win_flag,
+            firstSeason=season_year,
+            lastSeason=season_year,
+        )
+        if is_nba_finals and season_year is not None:
+            won_series = row.seriesWon
+            totals["finalsSeasons"][season_year].update(
+                wins=win_flag,
+                games=1,
+                listed=won_series is not None,
+                titles=won_series is True,
+            )
         if season_year is not None:
-            if totals.get("firstSeason") is None or (
-                isinstance(totals.get("firstSeason"), int) and season_year < totals["firstSeason"]
-            ):
-                totals["firstSeason"] = season_year
-            if totals.get("lastSeason") is None or (
-                isinstance(totals.get("lastSeason"), int) and season_year > totals["lastSeason"]
-            ):
-                totals["lastSeason"] = season_year
-
-    component_keys = ("impact", "stage", "longevity", "versatility", "culture")
-    component_budget = {
-        "impact": 34.0,
-        "stage": 26.0,
-        "longevity": 20.0,
-        "versatility": 12.0,
-        "culture": 8.0,
+            self.season_totals[(person_id, season_year)].update(
+                games=1,
+                wins=win_flag,
+                playoffGames=is_playoffs,
+                playoffWins=is_playoffs and win_flag,
+                finalsGames=is_nba_finals,
+                finalsWins=is_nba_finals and win_flag,
+                minutes=row.numMinutes or 0.0,
+                points=row.points or 0.0,
+                assists=row.assists or 0.0,
+                rebounds=row.reboundsTotal or 0.0,
+                steals=row.steals or 0.0,
+                blocks=row.blocks or 0.0,
+            )
+
+        team_name = row.team
+        if team_name:
+            totals["teams"].update(team_name)
+
+    def consume_frame(self, frame: ColumnFrame) -> None:
+        """Fold a whole :class:`~scripts.player_stats_arrays.ColumnFrame` (the numpy backend)."""
+
+        self.merge(_goat_system_from_frame(frame))
+
+    def payload(
+        self, *, matrix_root: Path | None = None, rank_bands: int = 0, jobs: int = 1
+    ) -> dict:
+        return _goat_system_payload(self, matrix_root=matrix_root, rank_bands=rank_bands, jobs=jobs)
+
+
+def _goat_system_from_frame(frame: ColumnFrame) -> GoatSystemBuilder:
+    projection = GoatSystemBuilder.columns
+    builder = GoatSystemBuilder()
+    frame = _person_rows(frame, projection)
+    if not frame.length:
+        return builder
+
+    field = {name: frame.field(projection, name) for name in projection.fields}
+    people = field["personId"]
+    seasons, has_season = optional_ints(field["seasonYear"])
+    _season_bounds(builder, seasons, has_season)
+    wins = field["win"].lookup(bool, bool)
+    playoffs = field["phase"].lookup(lambda phase: phase in PLAYOFF_PHASES, bool)
+    finals = field["phase"].lookup(lambda phase: phase == FINALS, bool)
+
+    stats = {
+        name: field[column].lookup(_or_zero, float)
+        for name, column in (
+            ("points", "points"),
+            ("assists", "assists"),
+            ("rebounds", "reboundsTotal"),
+            ("minutes", "numMinutes"),
+            ("steals", "steals"),
+            ("blocks", "blocks"),
+        )
     }
-    blend_weights = {
-        "impact": (0.65, 0.35),
-        "stage": (0.6, 0.4),
-        "longevity": (0.7, 0.3),
-        "versatility": (0.55, 0.45),
-        "culture": (0.4, 0.6),
+    flags = {
+        "wins": wins,
+        "playoffGames": playoffs,
+        "playoffWins": playoffs & wins,
+        "finalsGames": finals,
+        "finalsWins": finals & wins,
     }
 
-    all_ids = set(player_directory.keys()) | set(career_totals.keys())
+    groups = group_by(people.codes)
+    sums = {name: group_sum(groups, column) for name, column in stats.items()}
+    counts = {
+        "games": group_count(groups),
+        "wins": group_count(groups, wins),
+        "losses": group_count(groups, ~wins),
+        **{name: group_count(groups, flag) for name, flag in flags.items() if name != "wins"},
+    }
+    first_seasons = group_extreme(groups, seasons, has_season, largest=False)
+    last_seasons = group_extreme(groups, seasons, has_season, largest=True)
+    teams = _grouped_sets(groups, field["team"], field["team"].lookup(bool, bool))
+    for group, row in enumerate(groups.first.tolist()):
+        totals = builder.career_totals[people.values[people.codes[row]]]
+        for name, values in counts.items():
+            totals[name].count = values[group]
+        for name, values in sums.items():
+            totals[name].total = values[group]
+        totals["teams"].values = teams[group]
+        totals["firstSeason"].value = first_seasons[group]
+        totals["lastSeason"].value = last_seasons[group]
+
+    finals_rows = (finals & has_season).nonzero()[0]
+    if len(finals_rows):
+        finals_seasons = group_by(people.codes[finals_rows], field["seasonYear"].codes[finals_rows])
+        finals_games = group_count(finals_seasons)
+        finals_wins = group_count(finals_seasons, wins[finals_rows])
+        listed = field["seriesWon"].lookup(lambda won: won is not None, bool)[finals_rows]
+        titles = field["seriesWon"].lookup(lambda won: won is True, bool)[finals_rows]
+        finals_listed = group_count(finals_seasons, listed)
+        finals_titles = group_count(finals_seasons, titles)
+        for group, row in enumerate(finals_rows[finals_seasons.first].tolist()):
+            record = builder.career_totals[people.values[people.codes[row]]]["finalsSeasons"][
+                int(seasons[row])
+            ]
+            record["wins"].count = finals_wins[group]
+            record["games"].count = finals_games[group]
+            record["listed"].count = finals_listed[group]
+            record["titles"].count = finals_titles[group]
+
+    season_rows = has_season.nonzero()[0]
+    if len(season_rows):
+        person_seasons = group_by(people.codes[season_rows], field["seasonYear"].codes[season_rows])
+        season_counts = {
+            "games": group_count(person_seasons),
+            **{
+                name: group_count(person_seasons, flag[season_rows]) for name, flag in flags.items()
+            },
+        }
+        season_sums = {
+            name: group_sum(person_seasons, column[season_rows]) for name, column in stats.items()
+        }
+        for group, row in enumerate(season_rows[person_seasons.first].tolist()):
+            record = builder.season_totals[(people.values[people.codes[row]], int(seasons[row]))]
+            for name, counted in season_counts.items():
+                record[name].count = counted[group]
+            for name, summed in season_sums.items():
+                record[name].total = summed[group]
+    return builder
+
+
+_UNKNOWN_GOAT_TOTALS = {
+    "games": 0,
+    "points": 0.0,
+    "assists": 0.0,
+    "rebounds": 0.0,
+    "minutes": 0.0,
+    "steals": 0.0,
+    "blocks": 0.0,
+    "wins": 0,
+    "losses": 0,
+    "playoffGames": 0,
+    "playoffWins": 0,
+    "finalsGames": 0,
+    "finalsWins": 0,
+    "finalsSeasons": {},
+    "teams": set(),
+}
 
-    raw_metrics: dict[str, dict[str, object]] = {}
 
-    for person_id in all_ids:
-        meta = player_directory.get(
-            person_id,
-            {
-                "personId": person_id,
-                "firstName": "",
-                "lastName": "",
-                "country": "",
-                "guard": False,
-                "forward": False,
-                "center": False,
-                "draftYear": None,
-                "draftNumber": None,
-            },
-        )
-        totals = career_totals.get(
-            person_id,
-            {
-                "games": 0,
-                "points": 0.0,
-                "assists": 0.0,
-                "rebounds": 0.0,
-                "minutes": 0.0,
-                "steals": 0.0,
-                "blocks": 0.0,
-                "wins": 0,
-                "losses": 0,
-                "playoffGames": 0,
-                "playoffWins": 0,
-                "finalsGames": 0,
-                "finalsWins": 0,
-                "finalsSeasons": {},
-                "teams": set(),
-                "firstSeason": meta.get("draftYear"),
-                "lastSeason": meta.get("draftYear"),
-            },
-        )
-        games = int(totals.get("games", 0))
-        wins = int(totals.get("wins", 0))
-        playoff_games = int(totals.get("playoffGames", 0))
-        playoff_wins = int(totals.get("playoffWins", 0))
-        minutes = float(totals.get("minutes", 0.0))
-        points = float(totals.get("points", 0.0))
-        assists = float(totals.get("assists", 0.0))
-        rebounds = float(totals.get("rebounds", 0.0))
-        steals = float(totals.get("steals", 0.0))
-        blocks = float(totals.get("blocks", 0.0))
-
-        production = 0.0
-        if games:
-            production = (points + 1.25 * assists + 1.1 * rebounds + 1.5 * (steals + blocks)) / games
-        impact_metric = production * (0.6 + (minutes / games if games else 0.0))
+def _goat_player_meta(player_directory: Mapping[str, dict], person_id: str) -> dict:
+    return player_directory.get(
+        person_id,
+        {
+            "personId": person_id,
+            "firstName": "",
+            "lastName": "",
+            "country": "",
+            "guard": False,
+            "forward": False,
+            "center": False,
+            "draftYear": None,
+            "draftNumber": None,
+        },
+    )
 
-        finals_games = int(totals.get("finalsGames", 0))
-        finals_wins = int(totals.get("finalsWins", 0))
-        finals_seasons = totals.get("finalsSeasons") or {}
-        championships = 0
-        for season_record in finals_seasons.values():
-            games_played = int(season_record.get("games", 0))
-            wins_recorded = int(season_record.get("wins", 0))
-            if games_played <= 0:
-                continue
-            closeout_target = 4 if games_played > 5 else 3
-            if wins_recorded >= closeout_target:
-                championships += 1
-
-        name_key = _normalize_name_key(f"{meta.get('firstName', '')} {meta.get('lastName', '')}")
-        finals_mvp_meta = finals_mvp_lookup.get(name_key, {})
-        finals_mvp_count = int(finals_mvp_meta.get("count", 0))
-        documented_championships = championships
-        override_championships = championship_overrides.get(name_key)
-        if override_championships and override_championships > championships:
-            championships = override_championships
-        missing_championships = max(0, championships - documented_championships)
-
-        finals_win_rate = (finals_wins / finals_games) if finals_games else 0.0
-        win_pct = wins / games if games else 0.0
-        playoff_win_pct = playoff_wins / playoff_games if playoff_games else 0.0
-
-        postseason_volume = math.sqrt(max(playoff_wins, 0)) * 35.0
-        playoff_run = math.sqrt(max(playoff_games, 0)) * 10.0
-        finals_volume = math.sqrt(max(finals_wins, 0)) * 55.0
-        finals_stage = math.sqrt(max(finals_games, 0)) * 20.0
-        championship_crown = math.sqrt(max(championships, 0)) * 110.0
-        legacy_crown = math.sqrt(max(missing_championships, 0)) * 90.0
-
-        finals_game_scale = math.sqrt(max(finals_games, 0)) / 10.0 if finals_games else 0.0
-        playoff_game_scale = math.sqrt(max(playoff_games, 0)) / 20.0 if playoff_games else 0.0
-
-        finals_efficiency = finals_win_rate * 220.0 * finals_game_scale
-        playoff_efficiency = playoff_win_pct * 200.0 * playoff_game_scale
-
-        finals_mvp_stage = 0.0
-        if finals_mvp_count > 0:
-            finals_mvp_stage = math.sqrt(finals_mvp_count) * 200.0 + finals_mvp_count * 110.0
-
-        stage_metric = (
-            postseason_volume
-            + playoff_run
-            + finals_volume
-            + finals_stage
-            + championship_crown
-            + legacy_crown
-            + missing_championships * 55.0
-            + finals_efficiency
-            + playoff_efficiency
-            + playoff_wins * 1.15
-            + playoff_games * 0.05
-            + wins * 0.02
-            + finals_mvp_stage
+
+def _goat_player_totals(career_totals: Mapping[str, dict], person_id: str, meta: Mapping) -> dict:
+    totals = career_totals.get(person_id)
+    if totals is None:
+        totals = {
+            **_UNKNOWN_GOAT_TOTALS,
+            "firstSeason": meta.get("draftYear"),
+            "lastSeason": meta.get("draftYear"),
+        }
+    return totals
+
+
+def _goat_name_key(meta: Mapping) -> str:
+    return _normalize_name_key(f"{meta.get('firstName', '')} {meta.get('lastName', '')}")
+
+
+def _goat_won_title(season_record: Mapping[str, Any]) -> bool:
+    """Whether a player won the title in a season of Finals games.
+
+    Games.csv series settle it exactly, and a listed series still in
+    progress is never a title. Only Finals games Games.csv does not list fall
+    back to whether the player's wins reach the closeout count.
+    """
+
+    if int(season_record.get("listed", 0)):
+        return int(season_record.get("titles", 0)) > 0
+    games_played = int(season_record.get("games", 0))
+    if games_played <= 0:
+        return False
+    closeout_target = 4 if games_played > 5 else 3
+    return int(season_record.get("wins", 0)) >= closeout_target
+
+
+def _goat_season_features(season_record: Mapping[str, Any], won_title: bool) -> list[float]:
+    """One :data:`~scripts.goat_scoring.SEASON_FEATURES` row for a player season."""
+
+    return [
+        *(int(season_record[name]) for name in _GOAT_SEASON_COUNTS),
+        int(won_title),
+        *(float(season_record[name]) for name in _GOAT_SEASON_SUMS),
+    ]
+
+
+def _goat_features(
+    totals: Mapping[str, Any],
+    meta: Mapping[str, Any],
+    championship_override: int | None,
+    finals_mvp_count: int,
+) -> list[float]:
+    """One :data:`~scripts.goat_scoring.FEATURES` row from a player's career totals."""
+
+    championships = sum(
+        _goat_won_title(season_record)
+        for season_record in (totals.get("finalsSeasons") or {}).values()
+    )
+    documented_championships = championships
+    if championship_override and championship_override > championships:
+        championships = championship_override
+
+    country = (meta.get("country") or "").strip()
+    international = bool(country) and country.upper() not in {"USA", "US", "UNITED STATES"}
+    draft_number = meta.get("draftNumber")
+    return [
+        int(totals.get("games", 0)),
+        int(totals.get("wins", 0)),
+        int(totals.get("playoffGames", 0)),
+        int(totals.get("playoffWins", 0)),
+        int(totals.get("finalsGames", 0)),
+        int(totals.get("finalsWins", 0)),
+        championships,
+        max(0, championships - documented_championships),
+        finals_mvp_count,
+        float(totals.get("minutes", 0.0)),
+        float(totals.get("points", 0.0)),
+        float(totals.get("assists", 0.0)),
+        float(totals.get("rebounds", 0.0)),
+        float(totals.get("steals", 0.0)),
+        float(totals.get("blocks", 0.0)),
+        sum(1 for flag in (meta.get("guard"), meta.get("forward"), meta.get("center")) if flag),
+        len(set(totals.get("teams", set()))),
+        international,
+        draft_number if isinstance(draft_number, int) else math.nan,
+    ]
+
+
+def _goat_matrix(
+    career_totals: Mapping[str, dict],
+    player_directory: Mapping[str, dict],
+    championship_overrides: Mapping[str, int],
+    finals_mvp_lookup: Mapping[str, dict],
+    season_totals: Mapping[tuple[str, int], dict] | None = None,
+) -> GoatMatrix:
+    """Gather the :class:`~scripts.goat_scoring.GoatMatrix` for every known player."""
+
+    player_seasons: dict[str, list[tuple[int, dict]]] = defaultdict(list)
+    for (person_id, season_year), record in (season_totals or {}).items():
+        player_seasons[person_id].append((season_year, record))
+
+    person_ids = sorted(set(player_directory) | set(career_totals))
+    name_keys = []
+    features = []
+    seasons = []
+    overrides = []
+    for person_id in person_ids:
+        meta = _goat_player_meta(player_directory, person_id)
+        totals = _goat_player_totals(career_totals, person_id, meta)
+        name_key = _goat_name_key(meta)
+        override = championship_overrides.get(name_key)
+        name_keys.append(name_key)
+        features.append(
+            _goat_features(
+                totals,
+                meta,
+                override,
+                int(finals_mvp_lookup.get(name_key, {}).get("count", 0)),
+            )
         )
-        if finals_games >= 20:
-            stage_metric += (finals_win_rate**2) * 180.0
-        finals_losses = max(0, finals_games - finals_wins)
-        if finals_losses:
-            stage_metric -= math.sqrt(finals_losses) * 40.0
-        if finals_games and finals_losses == 0 and championships >= 3:
-            stage_metric += 160.0
-
-        longevity_metric = minutes + games * 5.0
-
-        positions_count = sum(1 for flag in (meta.get("guard"), meta.get("forward"), meta.get("center")) if flag)
-        teams_set = set(totals.get("teams", set()))
-        teams_count = len(teams_set)
-        per_game_assists = assists / games if games else 0.0
-        per_game_rebounds = rebounds / games if games else 0.0
-        per_game_stocks = (steals + blocks) / games if games else 0.0
-        versatility_metric = (
-            positions_count * 40.0
-            + teams_count * 12.0
-            + per_game_assists * 18.0
-            + per_game_rebounds * 12.0
-            + per_game_stocks * 14.0
+        finals_seasons = totals.get("finalsSeasons") or {}
+        seasons.append(
+            [
+                _goat_season_features(
+                    record, _goat_won_title(finals_seasons.get(season_year) or {})
+                )
+                for season_year, record in sorted(
+                    player_seasons.get(person_id, []), key=lambda item: item[0]
+                )
+            ]
         )
+        overrides.append(override or 0)
+    return GoatMatrix.from_features(person_ids, name_keys, features, seasons, overrides)
+
+
+def _goat_system_payload(
+    builder: GoatSystemBuilder,
+    *,
+    matrix_root: Path | None = None,
+    rank_bands: int = 0,
+    jobs: int = 1,
+) -> dict:
+    """Score every known player from the collected career totals.
+
+    With ``matrix_root`` the scoring matrix is also saved there for
+    :mod:`scripts.goat_scoring` to rescore later. ``rank_bands`` > 0 adds
+    p5/p50/p95 ranks from that many Monte Carlo replicates.
+    """
 
-        country = (meta.get("country") or "").strip()
-        international_bonus = 30.0 if country and country.upper() not in {"USA", "US", "UNITED STATES"} else 0.0
-        draft_bonus = 0.0
-        draft_number = meta.get("draftNumber")
-        if isinstance(draft_number, int):
-            if draft_number <= 3:
-                draft_bonus = 12.0
-            elif draft_number <= 14:
-                draft_bonus = 8.0
-            elif draft_number <= 30:
-                draft_bonus = 4.0
-
-        culture_metric = (
-            championships * 55.0
-            + missing_championships * 25.0
-            + wins * 0.08
-            + playoff_wins * 0.35
-            + teams_count * 6.0
-            + international_bonus
-            + draft_bonus
-        )
-        if finals_mvp_count > 0:
-            culture_metric += finals_mvp_count * 50.0
-
-        raw_metrics[person_id] = {
-            "impact": impact_metric,
-            "stage": stage_metric,
-            "longevity": longevity_metric,
-            "versatility": versatility_metric,
-            "culture": culture_metric,
-            "games": games,
-            "wins": wins,
-            "playoffGames": playoff_games,
-            "playoffWins": playoff_wins,
-            "championships": championships,
-            "finalsWins": finals_wins,
-            "finalsMVPs": finals_mvp_count,
-            "winPct": win_pct,
-            "playoffWinPct": playoff_win_pct,
-            "firstSeason": totals.get("firstSeason"),
-            "lastSeason": totals.get("lastSeason"),
-            "points": points,
-            "assists": assists,
-            "rebounds": rebounds,
-            "teams": teams_set,
-            "meta": meta,
-            "nameKey": name_key,
-        }
+    player_directory = _load_player_directory()
+    franchise_lookup = _load_franchise_lookup()
+    bdi = load_bdi_components()
+    bdi_metadata, bdi_generated_at = bdi.entries, bdi.generated_at
+    career_totals = {
+        person_id: {"personId": person_id, **totals.finalize()}
+        for person_id, totals in builder.career_totals.items()
+    }
+    earliest_season = builder.earliest_season.finalize()
+    latest_season = builder.latest_season.finalize()
+
+    matrix = _goat_matrix(
+        career_totals,
+        player_directory,
+        _load_championship_overrides(),
+        _load_finals_mvp_ledger(),
+        {key: record.finalize() for key, record in builder.season_totals.items()},
+    )
+    if matrix_root is not None:
+        save_goat_matrix(matrix, matrix_root=matrix_root)
+    scored = score_players(matrix, bdi)
+    current_season = season_from_date_rule(datetime.now().date().isoformat())
+
+    players_payload: list[dict[str, object]] = [{} for _ in range(len(matrix))]
 
-    raw_maxima = {key: 0.0 for key in component_keys}
-    for metrics in raw_metrics.values():
-        for key in component_keys:
-            raw_maxima[key] = max(raw_maxima[key], float(metrics.get(key, 0.0)))
-
-    players_payload: list[dict[str, object]] = []
-
-    for person_id in all_ids:
-        metrics = raw_metrics[person_id]
-        meta = metrics["meta"]
-        name_key = metrics["nameKey"]
-        bdi_components = bdi_lookup.get(name_key)
-        bdi_entry = bdi_metadata.get(name_key, {})
-
-        components: dict[str, float] = {}
-        for key in component_keys:
-            budget = component_budget[key]
-            our_value = float(metrics.get(key, 0.0))
-            ceiling = raw_maxima.get(key, 0.0)
-            our_ratio = (our_value / ceiling) if ceiling else 0.0
-            our_ratio = max(0.0, min(1.0, our_ratio))
-
-            combined_ratio = our_ratio
-            blend = blend_weights.get(key, (1.0, 0.0))
-            if bdi_components and key in bdi_components:
-                bdi_value = bdi_components.get(key)
-                bdi_ceiling = bdi_maxima.get(key, 0.0)
-                if isinstance(bdi_value, (int, float)) and bdi_ceiling > 0:
-                    bdi_ratio = max(0.0, min(1.0, float(bdi_value) / bdi_ceiling))
-                    combined_ratio = blend[0] * our_ratio + blend[1] * bdi_ratio
-
-            combined_ratio = max(0.0, min(1.0, combined_ratio))
-            components[key] = round(budget * combined_ratio, 2)
-
-        goat_score = round(sum(components.values()), 1)
+    for row, person_id in enumerate(matrix.person_ids):
+        meta = _goat_player_meta(player_directory, person_id)
+        totals = _goat_player_totals(career_totals, person_id, meta)
+        bdi_entry = bdi_metadata.get(matrix.name_keys[row], {})
 
         first_name = (meta.get("firstName") or "").strip()
         last_name = (meta.get("lastName") or "").strip()
         display_name = f"{first_name} {last_name}".strip() or person_id
 
-        first_season = metrics.get("firstSeason")
-        last_season = metrics.get("lastSeason")
+        first_season = totals.get("firstSeason")
+        last_season = totals.get("lastSeason")
         if first_season is None and isinstance(meta.get("draftYear"), int):
             first_season = meta.get("draftYear")
         if last_season is None and isinstance(meta.get("draftYear"), int):
@@ -1822,20 +2151,21 @@ def build_goat_system_snapshot() -> None:
         franchises = sorted(
             {
                 franchise_lookup.get(team, team.split(" ")[-1] if team else "")
-                for team in metrics.get("teams", set())
+                for team in totals.get("teams", set())
                 if team
             }
         )
 
-        games = metrics["games"]
-        wins = metrics["wins"]
-        playoff_games = metrics["playoffGames"]
-        playoff_wins = metrics["playoffWins"]
+        games = int(totals.get("games", 0))
+        wins = int(totals.get("wins", 0))
+        playoff_games = int(totals.get("playoffGames", 0))
+        playoff_wins = int(totals.get("playoffWins", 0))
 
         if games:
             resume = (
-                f"{round(metrics['points']):,} pts · {round(metrics['assists']):,} ast · "
-                f"{round(metrics['rebounds']):,} reb in {games:,} games"
+                f"{round(float(totals.get('points', 0.0))):,} pts · "
+                f"{round(float(totals.get('assists', 0.0))):,} ast · "
+                f"{round(float(totals.get('rebounds', 0.0))):,} reb in {games:,} games"
             )
         else:
             resume = "Awaiting NBA impact"
@@ -1843,62 +2173,36 @@ def build_goat_system_snapshot() -> None:
         if bdi_resume:
             resume = f"{resume} · {bdi_resume}" if games else bdi_resume
 
-        if last_season and isinstance(last_season, int) and last_season >= (datetime.now().year - 1):
+        if last_season and isinstance(last_season, int) and last_season >= current_season - 1:
             status = "Active"
         elif games:
             status = "Legend"
         else:
             status = "Prospect"
 
-        bdi_tier = bdi_entry.get("tier")
-        if isinstance(bdi_tier, str) and bdi_tier.strip():
-            tier = bdi_tier.strip()
-        else:
-            if goat_score >= 92:
-                tier = "Pantheon"
-            elif goat_score >= 80:
-                tier = "Inner Circle"
-            elif goat_score >= 68:
-                tier = "All-Time Great"
-            elif goat_score >= 52:
-                tier = "Hall of Fame"
-            elif goat_score >= 36:
-                tier = "All-Star"
-            elif goat_score >= 22:
-                tier = "Starter"
-            elif goat_score >= 10:
-                tier = "Rotation"
-            else:
-                tier = "Reserve"
-
         delta = 0.0
         bdi_delta = bdi_entry.get("delta")
         if isinstance(bdi_delta, (int, float)):
             delta = float(bdi_delta)
 
-        players_payload.append(
-            {
-                "personId": person_id,
-                "rank": 0,
-                "name": display_name,
-                "goatScore": goat_score,
-                "tier": tier,
-                "status": status,
-                "careerSpan": career_span,
-                "primeWindow": prime_window,
-                "delta": delta,
-                "franchises": franchises,
-                "resume": resume,
-                "goatComponents": components,
-                "winPct": round(metrics["winPct"], 3) if games else 0.0,
-                "playoffWinPct": round(metrics["playoffWinPct"], 3) if playoff_games else 0.0,
-                "finalsMVPs": int(metrics.get("finalsMVPs", 0)),
-            }
-        )
-
-    players_payload.sort(key=lambda item: item["goatScore"], reverse=True)
-    for index, record in enumerate(players_payload, start=1):
-        record["rank"] = index
+        rank = int(scored.ranks[row])
+        players_payload[rank - 1] = {
+            "personId": person_id,
+            "rank": rank,
+            "name": display_name,
+            "goatScore": float(scored.scores[row]),
+            "tier": scored.tiers[row],
+            "status": status,
+            "careerSpan": career_span,
+            "primeWindow": prime_window,
+            "delta": delta,
+            "franchises": franchises,
+            "resume": resume,
+            "goatComponents": component_payload(scored.components[row]),
+            "winPct": round(wins / games, 3) if games else 0.0,
+            "playoffWinPct": round(playoff_wins / playoff_games, 3) if playoff_games else 0.0,
+            "finalsMVPs": int(matrix.feature("finalsMVPs")[row]),
+        }
 
     weights_payload = [
         {
@@ -2052,20 +2356,106 @@ def build_goat_system_snapshot() -> None:
 
     if bdi_generated_at:
         payload["sourceTimestamps"] = {"bdi": bdi_generated_at}
+    if rank_bands:
+        add_rank_bands(payload, matrix, bdi, rank_bands, jobs=jobs)
+
+    return payload
+
+
+def build_goat_system_snapshot(
+    rows: Iterable[Mapping[str, str]] | None = None,
+    *,
+    jobs: int = 1,
+    incremental: bool = False,
+    backend: str = "python",
+    rank_bands: int = 0,
+) -> None:
+    """Generate a GOAT ranking row for every known player."""
 
+    refresh = open_refresh(
+        "goat_system", GoatSystemBuilder, incremental=incremental, persist=rows is None
+    )
+    scan_player_statistics([refresh.consumer], rows, jobs=jobs, backend=backend)
+    payload = refresh.commit().payload(matrix_root=MATRIX_ROOT, rank_bands=rank_bands, jobs=jobs)
     _write_json("goat_system.json", payload, indent=None)
 
+
+def open_player_statistics_refreshes(*, incremental: bool = False) -> list[Refresh]:
+    """Leaders, season insights and GOAT refreshes, in :func:`write_player_statistics_snapshots` order."""
+
+    return [
+        open_refresh("player_leaders", PlayerLeadersBuilder, incremental=incremental),
+        open_refresh(
+            "player_season_insights", PlayerSeasonInsightsBuilder, incremental=incremental
+        ),
+        open_refresh("goat_system", GoatSystemBuilder, incremental=incremental),
+    ]
+
+
+def write_player_statistics_snapshots(
+    leaders: PlayerLeadersBuilder,
+    season_insights: PlayerSeasonInsightsBuilder,
+    goat_system: GoatSystemBuilder,
+    *,
+    rank_bands: int = 0,
+    jobs: int = 1,
+) -> None:
+    """Write the three snapshots fed by a shared PlayerStatistics scan."""
+
+    _write_json("player_leaders.json", leaders.payload())
+    _write_json("player_season_insights.json", season_insights.payload())
+    goat_payload = goat_system.payload(matrix_root=MATRIX_ROOT, rank_bands=rank_bands, jobs=jobs)
+    _write_json("goat_system.json", goat_payload, indent=None)
+
+
 # ---------------------------------------------------------------------------
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Parse PlayerStatistics in this many worker processes (0 = one per core).",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Fold only PlayerStatistics rows past the persisted watermark into the saved builder state.",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default="python",
+        help="Aggregate PlayerStatistics row by row, or with NumPy group-by reductions (needs numpy).",
+    )
+    parser.add_argument(
+        "--rank-bands",
+        type=int,
+        default=0,
+        metavar="REPLICATES",
+        help="Add p5/p50/p95 GOAT rank bands from this many Monte Carlo replicates (needs numpy).",
+    )
+    args = parser.parse_args(argv)
+
     build_players_overview()
     build_games_snapshot()
     build_team_performance_snapshot()
-    build_player_leaders_snapshot()
-    build_player_season_insights_snapshot()
-    build_goat_system_snapshot()
+
+    # One archive pass feeds every PlayerStatistics-derived snapshot.
+    scan = PlayerStatisticsScan()
+    refreshes = open_player_statistics_refreshes(incremental=args.incremental)
+    for refresh in refreshes:
+        scan.register(refresh.consumer)
+    scan.run(jobs=args.jobs, backend=args.backend)
+    write_player_statistics_snapshots(
+        *(refresh.commit() for refresh in refreshes), rank_bands=args.rank_bands, jobs=args.jobs
+    )
 
 
 if __name__ == "__main__":
-    main()
+    # Import through the package so persisted builder state names scripts.build_insights.
+    from scripts.build_insights import main as package_main
+
+    package_main()
@@ -19,26 +19,30 @@ from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
 try:
-    from scripts.build_insights import iter_player_statistics_rows
     from scripts.goat_metrics import (
         RECENT_SEASON_SPAN,
         RECENT_SEASON_START,
-        compute_recent_goat_scores,
+        RECENT_SEASON_YEARS,
+        RecentGoatAccumulator,
         format_season_span,
         format_season_window,
     )
+    from scripts.player_stats_index import load_player_game_index
+    from scripts.player_stats_scan import scan_player_statistics
 except ModuleNotFoundError:  # pragma: no cover - fallback for direct execution
     import sys
 
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-    from scripts.build_insights import iter_player_statistics_rows  # type: ignore
     from scripts.goat_metrics import (  # type: ignore
         RECENT_SEASON_SPAN,
         RECENT_SEASON_START,
-        compute_recent_goat_scores,
+        RECENT_SEASON_YEARS,
+        RecentGoatAccumulator,
         format_season_span,
         format_season_window,
     )
+    from scripts.player_stats_index import load_player_game_index  # type: ignore
+    from scripts.player_stats_scan import scan_player_statistics  # type: ignore
 
 ROOT = Path(__file__).resolve().parent.parent
 DEFAULT_ROSTER_SNAPSHOT = ROOT / "public" / "data" / "rosters.json"
@@ -1127,7 +1131,14 @@ def build_player_profiles(
     goat_index: Path = DEFAULT_GOAT_INDEX,
     league_directory: Path = DEFAULT_LEAGUE_DIRECTORY,
     season_end_year: int | None = None,
+    recent_goat_accumulator: RecentGoatAccumulator | None = None,
 ) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Assemble the profiles and recent GOAT payloads.
+
+    ``recent_goat_accumulator`` accepts an accumulator that was already fed by a shared
+    PlayerStatistics scan; without it the archive is streamed here.
+    """
+
     roster_lookup = _load_roster(players_csv)
     roster_index = _build_name_index(roster_lookup)
 
@@ -1188,9 +1199,23 @@ def build_player_profiles(
     teams = _load_team_lookup(team_histories)
     birthplaces = _load_birthplaces(birthplace_files)
     goat_by_id, goat_by_name = _load_goat_scores(goat_system, goat_index)
-    recent_goat = compute_recent_goat_scores(
-        iter_player_statistics_rows(), {player.person_id for player in players}
-    )
+    active_ids = {player.person_id for player in players}
+    if not active_ids:
+        recent_goat = {}
+    elif recent_goat_accumulator is not None:
+        recent_goat = recent_goat_accumulator.scores(active_ids)
+    else:
+        recent_goat_accumulator = RecentGoatAccumulator(active_ids)
+        player_index = load_player_game_index()
+        if player_index is not None:
+            # Seek straight to each active player's game log.
+            for person_id in active_ids:
+                for record in player_index.records(person_id, RecentGoatAccumulator.columns):
+                    recent_goat_accumulator.consume(record)
+        else:
+            # Only the recent seasons' shards are read when they are available.
+            scan_player_statistics([recent_goat_accumulator], seasons=RECENT_SEASON_YEARS)
+        recent_goat = recent_goat_accumulator.scores()
 
     profiles: list[dict[str, Any]] = []
     for player in players:
@@ -1314,6 +1339,22 @@ def build_player_profiles(
     return payload, recent_payload
 
 
+def write_player_profiles(
+    payload: dict[str, Any],
+    recent_payload: dict[str, Any],
+    *,
+    output: Path = DEFAULT_OUTPUT,
+    goat_recent_output: Path = DEFAULT_GOAT_RECENT_OUTPUT,
+) -> None:
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    if recent_payload:
+        goat_recent_output.parent.mkdir(parents=True, exist_ok=True)
+        goat_recent_output.write_text(
+            json.dumps(recent_payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+        )
+
+
 def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Build the player profiles atlas payload.")
     parser.add_argument(
@@ -1379,13 +1420,12 @@ def main(argv: list[str] | None = None) -> None:
         league_directory=args.league_directory,
         season_end_year=args.season_end_year,
     )
-    args.output.parent.mkdir(parents=True, exist_ok=True)
-    args.output.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
-    if recent_payload:
-        args.goat_recent_output.parent.mkdir(parents=True, exist_ok=True)
-        args.goat_recent_output.write_text(
-            json.dumps(recent_payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
-        )
+    write_player_profiles(
+        payload,
+        recent_payload,
+        output=args.output,
+        goat_recent_output=args.goat_recent_output,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Rebuild every PlayerStatistics-derived snapshot from one archive pass.
+
+The leaders, season insights, GOAT system, recent GOAT, rolling GOAT windows,
+history careers and scoring-average builders each register a consumer with a
+shared :class:`~scripts.player_stats_scan.PlayerStatisticsScan`, so
+``PlayerStatistics.7z`` is decompressed and parsed exactly once.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts import build_insights  # noqa: E402
+from scripts.build_player_profiles import build_player_profiles, write_player_profiles  # noqa: E402
+from scripts.data import build_player_scoring_averages  # noqa: E402
+from scripts.goat_metrics import RecentGoatAccumulator  # noqa: E402
+from scripts.goat_windows import SeasonTotalsAccumulator, build_goat_windows  # noqa: E402
+from scripts.history import build_player_careers  # noqa: E402
+from scripts.player_stats_arrays import BACKENDS  # noqa: E402
+from scripts.player_stats_reader import last_source  # noqa: E402
+from scripts.player_stats_scan import PlayerStatisticsScan  # noqa: E402
+from scripts.player_stats_state import open_refresh  # noqa: E402
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Rebuild every PlayerStatistics-derived snapshot in one pass."
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Parse PlayerStatistics in this many worker processes (0 = one per core).",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Restore the saved leaders, season insights, GOAT and career state and fold in only rows "
+            "past its watermark."
+        ),
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default="python",
+        help="Aggregate row by row, or with NumPy group-by reductions where a builder supports it.",
+    )
+    parser.add_argument(
+        "--rank-bands",
+        type=int,
+        default=0,
+        metavar="REPLICATES",
+        help="Add p5/p50/p95 GOAT rank bands from this many Monte Carlo replicates (needs numpy).",
+    )
+    args = parser.parse_args(argv)
+
+    scan = PlayerStatisticsScan()
+    refreshes = build_insights.open_player_statistics_refreshes(incremental=args.incremental)
+    careers_refresh = open_refresh(
+        "player_careers", build_player_careers.CareerAccumulator, incremental=args.incremental
+    )
+    for refresh in (*refreshes, careers_refresh):
+        scan.register(refresh.consumer)
+    # Recent GOAT, rolling GOAT windows and scoring averages are rebuilt from every row each run.
+    recent_goat = scan.register(RecentGoatAccumulator())
+    goat_windows = scan.register(SeasonTotalsAccumulator())
+    scoring = scan.register(build_player_scoring_averages.ScoringAveragesAccumulator())
+
+    try:
+        rows = scan.run(jobs=args.jobs, backend=args.backend)
+    except build_insights.PlayerStatisticsStreamError as exc:
+        raise SystemExit(str(exc)) from exc
+    print(f"Scanned {rows:,} player-game rows for {len(scan.consumers)} builders")
+    source = last_source()
+    if source is not None:
+        print(f"Read {source.summary()}")
+
+    # Profiles read goat_system.json, so it must land before they are assembled.
+    build_insights.write_player_statistics_snapshots(
+        *(refresh.commit() for refresh in refreshes), rank_bands=args.rank_bands, jobs=args.jobs
+    )
+
+    payload, recent_payload = build_player_profiles(recent_goat_accumulator=recent_goat)
+    write_player_profiles(payload, recent_payload)
+    build_goat_windows(goat_windows)
+    build_player_careers.build_player_careers(careers_refresh.commit())
+    build_player_scoring_averages.main(scoring)
+
+
+if __name__ == "__main__":
+    main()
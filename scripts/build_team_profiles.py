@@ -3,18 +3,22 @@
 from __future__ import annotations
 
 import csv
-import io
 import json
-import zipfile
-from collections import defaultdict
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Iterable
 
 ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.accumulators import Count, Keyed, Max, Mean, MergeableState, Min, Sum  # noqa: E402
+from scripts.team_games import TEAM_STATS_PATH, TeamGameRecord, load_team_games  # noqa: E402
+
 TEAM_HISTORIES = ROOT / "TeamHistories.csv"
-TEAM_STATS_ARCHIVE = ROOT / "TeamStatistics.zip"
+TEAM_STATS_ARCHIVE = TEAM_STATS_PATH
 PROFILES_PATH = ROOT / "public" / "data" / "team_profiles.json"
 CANONICAL_TEAMS = ROOT / "data" / "2025-26" / "canonical" / "teams.json"
 BDL_TEAMS_CACHE = ROOT / "data" / "cache" / "bdl" / "teams.json"
@@ -57,27 +61,25 @@ FRANCHISE_LEGACY: dict[str, dict[str, int]] = {
 
 
 @dataclass
-class TeamAggregate:
+class TeamAggregate(MergeableState):
     """Running totals for a franchise."""
 
-    games: int = 0
-    wins: int = 0
-    losses: int = 0
-    points: float = 0.0
-    opponent_points: float = 0.0
-    assists: float = 0.0
-    turnovers: float = 0.0
-    rebounds: float = 0.0
-    points_in_paint: float = 0.0
-    points_in_paint_games: int = 0
-    fast_break_points: float = 0.0
-    fast_break_games: int = 0
-    bench_points: float = 0.0
-    bench_points_games: int = 0
-    field_goal_pct_total: float = 0.0
-    field_goal_pct_games: int = 0
-    three_pct_total: float = 0.0
-    three_pct_games: int = 0
+    games: Count = field(default_factory=Count)
+    wins: Count = field(default_factory=Count)
+    losses: Count = field(default_factory=Count)
+    points: Sum = field(default_factory=Sum)
+    opponent_points: Sum = field(default_factory=Sum)
+    assists: Sum = field(default_factory=Sum)
+    turnovers: Sum = field(default_factory=Sum)
+    rebounds: Sum = field(default_factory=Sum)
+    points_in_paint: Mean = field(default_factory=Mean)
+    fast_break_points: Mean = field(default_factory=Mean)
+    bench_points: Mean = field(default_factory=Mean)
+    # Shooting percentages are made / attempted over the summed games, not a mean of per-game rates.
+    field_goals_made: Sum = field(default_factory=Sum)
+    field_goals_attempted: Sum = field(default_factory=Sum)
+    threes_made: Sum = field(default_factory=Sum)
+    threes_attempted: Sum = field(default_factory=Sum)
 
 
 def _load_existing_profiles(path: Path) -> dict:
@@ -164,26 +166,10 @@ def _active_team_lookup(path: Path, canonical_lookup: dict[str, str]) -> dict[st
     return lookup
 
 
-def _iter_team_statistics(path: Path) -> Iterable[dict[str, str]]:
+def _load_team_statistics(path: Path) -> list[TeamGameRecord]:
     if not path.exists():
         raise FileNotFoundError("TeamStatistics.zip is missing; cannot refresh team profiles.")
-    with zipfile.ZipFile(path) as archive:
-        with archive.open("TeamStatistics.csv") as raw:
-            reader = csv.DictReader(io.TextIOWrapper(raw, encoding="utf-8"))
-            for row in reader:
-                yield row
-
-
-def _float_or_none(value: str | None) -> float | None:
-    if value is None:
-        return None
-    value = value.strip()
-    if not value:
-        return None
-    try:
-        return float(value)
-    except ValueError:
-        return None
+    return load_team_games(path)
 
 
 def _safe_divide(numerator: float, denominator: float) -> float:
@@ -192,102 +178,90 @@ def _safe_divide(numerator: float, denominator: float) -> float:
     return numerator / denominator
 
 
-def _aggregate_team_metrics(team_lookup: dict[str, str]) -> tuple[dict[str, TeamAggregate], datetime | None, datetime | None]:
-    aggregates: dict[str, TeamAggregate] = defaultdict(TeamAggregate)
-    earliest: datetime | None = None
-    latest: datetime | None = None
+def _aggregate_team_metrics(
+    team_lookup: dict[str, str],
+    records: Iterable[TeamGameRecord] | None = None,
+) -> tuple[Keyed[str, TeamAggregate], datetime | None, datetime | None]:
+    aggregates: Keyed[str, TeamAggregate] = Keyed(TeamAggregate)
+    earliest = Min()
+    latest = Max()
 
-    for row in _iter_team_statistics(TEAM_STATS_ARCHIVE):
-        team_id = (row.get("teamId") or "").strip()
-        abbreviation = team_lookup.get(team_id)
+    if records is None:
+        records = _load_team_statistics(TEAM_STATS_ARCHIVE)
+    for game in records:
+        abbreviation = team_lookup.get(game.teamId)
         if not abbreviation:
             continue
 
         aggregate = aggregates[abbreviation]
-        aggregate.games += 1
-        if (row.get("win") or "").strip() == "1":
-            aggregate.wins += 1
-        else:
-            aggregate.losses += 1
-
-        if (value := _float_or_none(row.get("teamScore"))) is not None:
-            aggregate.points += value
-        if (value := _float_or_none(row.get("opponentScore"))) is not None:
-            aggregate.opponent_points += value
-        if (value := _float_or_none(row.get("assists"))) is not None:
-            aggregate.assists += value
-        if (value := _float_or_none(row.get("turnovers"))) is not None:
-            aggregate.turnovers += value
-        if (value := _float_or_none(row.get("reboundsTotal"))) is not None:
-            aggregate.rebounds += value
-
-        if (value := _float_or_none(row.get("pointsInThePaint"))) is not None:
-            aggregate.points_in_paint += value
-            aggregate.points_in_paint_games += 1
-        if (value := _float_or_none(row.get("pointsFastBreak"))) is not None:
-            aggregate.fast_break_points += value
-            aggregate.fast_break_games += 1
-        if (value := _float_or_none(row.get("benchPoints"))) is not None:
-            aggregate.bench_points += value
-            aggregate.bench_points_games += 1
-        if (value := _float_or_none(row.get("fieldGoalsPercentage"))) is not None and value > 0:
-            aggregate.field_goal_pct_total += value
-            aggregate.field_goal_pct_games += 1
-        if (value := _float_or_none(row.get("threePointersPercentage"))) is not None and value > 0:
-            aggregate.three_pct_total += value
-            aggregate.three_pct_games += 1
-
-        raw_date = (row.get("gameDate") or "").strip()
-        if raw_date:
-            try:
-                game_date = datetime.strptime(raw_date, "%Y-%m-%d %H:%M:%S")
-            except ValueError:
-                game_date = None
-            if game_date:
-                if earliest is None or game_date < earliest:
-                    earliest = game_date
-                if latest is None or game_date > latest:
-                    latest = game_date
-
-    return aggregates, earliest, latest
-
-
-def _update_profiles(data: dict, aggregates: dict[str, TeamAggregate]) -> None:
+        aggregate.games.update()
+        aggregate.wins.update(game.win)
+        aggregate.losses.update(not game.win)
+
+        for total, value in (
+            (aggregate.points, game.teamScore),
+            (aggregate.opponent_points, game.opponentScore),
+            (aggregate.assists, game.assists),
+            (aggregate.turnovers, game.turnovers),
+            (aggregate.rebounds, game.reboundsTotal),
+            (aggregate.field_goals_made, game.fieldGoalsMade),
+            (aggregate.field_goals_attempted, game.fieldGoalsAttempted),
+            (aggregate.threes_made, game.threePointersMade),
+            (aggregate.threes_attempted, game.threePointersAttempted),
+        ):
+            if value is not None:
+                total.update(value)
+
+        aggregate.points_in_paint.update(game.pointsInThePaint)
+        aggregate.fast_break_points.update(game.pointsFastBreak)
+        aggregate.bench_points.update(game.benchPoints)
+
+        earliest.update(game.start)
+        latest.update(game.start)
+
+    return aggregates, earliest.finalize(), latest.finalize()
+
+
+def _update_profiles(data: dict, aggregates: Keyed[str, TeamAggregate]) -> None:
     for team in data.get("teams", []):
         abbreviation = team.get("abbreviation")
         if not abbreviation:
             continue
         aggregate = aggregates.get(abbreviation)
-        if not aggregate or aggregate.games == 0:
+        if not aggregate or aggregate.games.finalize() == 0:
             continue
 
-        team["gamesSampled"] = aggregate.games
-        team["wins"] = aggregate.wins
-        team["losses"] = aggregate.losses
+        games = aggregate.games.finalize()
+        points = aggregate.points.finalize()
+        opponent_points = aggregate.opponent_points.finalize()
+        team["gamesSampled"] = games
+        team["wins"] = aggregate.wins.finalize()
+        team["losses"] = aggregate.losses.finalize()
 
         team["metrics"] = {
-            "winPct": round(_safe_divide(aggregate.wins, aggregate.games), 4),
-            "avgPointsFor": round(_safe_divide(aggregate.points, aggregate.games), 2),
-            "avgPointsAgainst": round(_safe_divide(aggregate.opponent_points, aggregate.games), 2),
-            "netMargin": round(_safe_divide(aggregate.points - aggregate.opponent_points, aggregate.games), 2),
+            "winPct": round(_safe_divide(aggregate.wins.finalize(), games), 4),
+            "avgPointsFor": round(_safe_divide(points, games), 2),
+            "avgPointsAgainst": round(_safe_divide(opponent_points, games), 2),
+            "netMargin": round(_safe_divide(points - opponent_points, games), 2),
             "fieldGoalPct": round(
-                _safe_divide(aggregate.field_goal_pct_total, aggregate.field_goal_pct_games), 4
+                _safe_divide(
+                    aggregate.field_goals_made.finalize(),
+                    aggregate.field_goals_attempted.finalize(),
+                ),
+                4,
             ),
             "threePointPct": round(
-                _safe_divide(aggregate.three_pct_total, aggregate.three_pct_games), 4
-            ),
-            "rebounds": round(_safe_divide(aggregate.rebounds, aggregate.games), 2),
-            "assists": round(_safe_divide(aggregate.assists, aggregate.games), 2),
-            "turnovers": round(_safe_divide(aggregate.turnovers, aggregate.games), 2),
-            "pointsInPaint": round(
-                _safe_divide(aggregate.points_in_paint, aggregate.points_in_paint_games), 2
-            ),
-            "fastBreakPoints": round(
-                _safe_divide(aggregate.fast_break_points, aggregate.fast_break_games), 2
-            ),
-            "benchPoints": round(
-                _safe_divide(aggregate.bench_points, aggregate.bench_points_games), 2
+                _safe_divide(
+                    aggregate.threes_made.finalize(), aggregate.threes_attempted.finalize()
+                ),
+                4,
             ),
+            "rebounds": round(_safe_divide(aggregate.rebounds.finalize(), games), 2),
+            "assists": round(_safe_divide(aggregate.assists.finalize(), games), 2),
+            "turnovers": round(_safe_divide(aggregate.turnovers.finalize(), games), 2),
+            "pointsInPaint": round(aggregate.points_in_paint.finalize() or 0.0, 2),
+            "fastBreakPoints": round(aggregate.fast_break_points.finalize() or 0.0, 2),
+            "benchPoints": round(aggregate.bench_points.finalize() or 0.0, 2),
         }
 
         legacy = FRANCHISE_LEGACY.get(abbreviation, {"titles": 0, "hall_of_famers": 0})
@@ -5,35 +5,23 @@ from __future__ import annotations
 
 import json
 import sys
-from collections import defaultdict
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Dict
+from typing import Any
 
 # Compute project root and enable first-party imports.
 ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(ROOT))
 
-from scripts.build_insights import (  # noqa: E402
-    PlayerStatisticsStreamError,
-    iter_player_statistics_rows,
-)
+from scripts.accumulators import FirstSeen, Keyed, MergeableState, Record, Sum  # noqa: E402
+from scripts.game_dimensions import REGULAR, game_phase, season_from_date  # noqa: E402
+from scripts.player_stats_reader import PlayerStatisticsStreamError, Projection  # noqa: E402
+from scripts.player_stats_scan import scan_player_statistics  # noqa: E402
 
 TARGET_SEASON_START = 2024
 OUTPUT_PATH = ROOT / "data" / "2025-26" / "canonical" / "player_scoring_averages.json"
 
 
-def _season_start_year(date_str: str | None) -> int | None:
-    if not date_str:
-        return None
-    try:
-        year = int(date_str[0:4])
-        month = int(date_str[5:7])
-    except (ValueError, IndexError):
-        return None
-    return year if month >= 10 else year - 1
-
-
 def _to_float(value: str | None) -> float:
     if value is None:
         return 0.0
@@ -43,44 +31,65 @@ def _to_float(value: str | None) -> float:
         return 0.0
 
 
-def main() -> None:
-    totals: Dict[str, Dict[str, object]] = defaultdict(
-        lambda: {"points": 0.0, "games": 0.0, "firstName": "", "lastName": ""}
+def _scoring_record() -> Record:
+    return Record(points=Sum(), games=Sum(), firstName=FirstSeen(), lastName=FirstSeen())
+
+
+class ScoringAveragesAccumulator(MergeableState):
+    """Collect regular-season scoring totals for :data:`TARGET_SEASON_START`."""
+
+    columns = Projection(
+        "ScoringAveragesRow",
+        {
+            "phase": (("gameId", "gameType", "gameLabel"), game_phase),
+            "seasonStart": ("gameDate", season_from_date),
+            "numMinutes": _to_float,
+            "personId": "str",
+            "points": _to_float,
+            "firstName": "str",
+            "lastName": "str",
+        },
     )
 
-    try:
-        rows = iter_player_statistics_rows()
-    except PlayerStatisticsStreamError as exc:  # pragma: no cover - defensive guard
-        # Preserve original cause for debugging (Ruff B904).
-        raise SystemExit(str(exc)) from exc
-
-    for row in rows:
-        game_type = (row.get("gameType") or "").strip().lower()
-        if game_type != "regular season":
-            continue
+    def __init__(self) -> None:
+        self.totals: Keyed[str, Record] = Keyed(_scoring_record)
 
-        season_start = _season_start_year((row.get("gameDate") or "").strip())
-        if season_start != TARGET_SEASON_START:
-            continue
+    def consume(self, row: Any) -> None:
+        if row.phase != REGULAR:
+            return
+
+        if row.seasonStart != TARGET_SEASON_START:
+            return
 
-        minutes = _to_float(row.get("numMinutes"))
+        minutes = row.numMinutes
         if minutes <= 0:
-            continue
+            return
 
-        player_id = (row.get("personId") or "").strip()
+        player_id = row.personId
         if not player_id:
-            continue
+            return
+
+        self.totals[player_id].update(
+            points=row.points,
+            games=1,
+            firstName=row.firstName,
+            lastName=row.lastName,
+        )
+
 
-        points = _to_float(row.get("points"))
-        bucket = totals[player_id]
-        bucket["points"] = float(bucket.get("points", 0.0)) + points
-        bucket["games"] = float(bucket.get("games", 0.0)) + 1
-        first_name = (row.get("firstName") or "").strip()
-        last_name = (row.get("lastName") or "").strip()
-        if first_name and not bucket.get("firstName"):
-            bucket["firstName"] = first_name
-        if last_name and not bucket.get("lastName"):
-            bucket["lastName"] = last_name
+def main(accumulator: ScoringAveragesAccumulator | None = None) -> None:
+    if accumulator is None:
+        accumulator = ScoringAveragesAccumulator()
+        try:
+            # Shards and ``seasonStart`` share the season_from_date rule, so the
+            # target season's shard holds every row the accumulator keeps.
+            scan_player_statistics(
+                [accumulator], seasons={TARGET_SEASON_START}, game_types={"Regular Season"}
+            )
+        except PlayerStatisticsStreamError as exc:  # pragma: no cover - defensive guard
+            # Preserve original cause for debugging (Ruff B904).
+            raise SystemExit(str(exc)) from exc
+    totals = accumulator.totals.finalize()
 
     players = []
     for player_id, bucket in totals.items():
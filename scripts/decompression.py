@@ -0,0 +1,319 @@
+"""Supervised streaming of an external decompressor such as ``7z x -so``.
+
+Reading ``7z`` stdout directly from the parsing thread makes decompression and
+CSV parsing take turns, and leaving ``stderr`` unread until the end lets a
+chatty decompressor fill that pipe and stall. :class:`SupervisedStream` runs
+the process with two helper threads:
+
+* a reader thread pulls large stdout blocks into a bounded queue, so the
+  decompressor keeps working while the consumer parses, and memory is capped
+  at ``queue_blocks * block_bytes``;
+* a drain thread empties ``stderr`` continuously, keeping its tail for error
+  messages.
+
+:class:`ProducerStream` wraps push-style decompressors (a library calling
+``write`` on a worker thread, such as ``py7zr``) in the same machinery.
+
+The consumer side is a raw binary stream (wrap it in :class:`io.BufferedReader`
+or :class:`io.TextIOWrapper`). It enforces an idle timeout (no output for too
+long) and an optional overall timeout, raises :class:`DecompressionError` on
+a non-zero exit, and records throughput counters in :class:`DecompressionStats`.
+"""
+
+from __future__ import annotations
+
+import io
+import queue
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Sequence
+
+DEFAULT_BLOCK_BYTES = 1 << 20
+DEFAULT_QUEUE_BLOCKS = 16
+DEFAULT_IDLE_TIMEOUT = 600.0
+_STDERR_TAIL_BYTES = 64 << 10
+_EOF = object()
+
+
+class DecompressionError(RuntimeError):
+    """Raised when the decompressor fails, stalls or exceeds its time budget."""
+
+
+@dataclass
+class DecompressionStats:
+    """Counters for one supervised stream.
+
+    ``consumer_wait`` is time the parser spent waiting for output (the
+    decompressor is the bottleneck); ``producer_wait`` is time the reader
+    thread spent waiting on a full queue (the parser is the bottleneck).
+    """
+
+    bytes_out: int = 0
+    blocks: int = 0
+    stderr_bytes: int = 0
+    consumer_wait: float = 0.0
+    producer_wait: float = 0.0
+    started: float = field(default_factory=time.monotonic)
+    finished: float | None = None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def megabytes_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.bytes_out / elapsed / 1e6 if elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.bytes_out / 1e6:,.1f} MB in {self.elapsed:.1f}s "
+            f"({self.megabytes_per_second:,.1f} MB/s; parser waited {self.consumer_wait:.1f}s, "
+            f"decompressor waited {self.producer_wait:.1f}s)"
+        )
+
+
+class _QueuedStream(io.RawIOBase):
+    """Consumer half shared by the supervised sources.
+
+    A producer thread calls :meth:`_put` with byte blocks, an exception or
+    ``_EOF``; the consumer reads them back with timeouts and counters.
+    Subclasses start the producer and implement :meth:`_finish` and
+    :meth:`_abort`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        block_bytes: int = DEFAULT_BLOCK_BYTES,
+        queue_blocks: int = DEFAULT_QUEUE_BLOCKS,
+        idle_timeout: float | None = DEFAULT_IDLE_TIMEOUT,
+        timeout: float | None = None,
+    ) -> None:
+        super().__init__()
+        self.name = name
+        self.block_bytes = block_bytes
+        self.idle_timeout = idle_timeout
+        self.stats = DecompressionStats()
+        self._deadline = self.stats.started + timeout if timeout is not None else None
+        self._timeout = timeout
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, queue_blocks))
+        self._stop = threading.Event()
+        self._block = memoryview(b"")
+        self._eof = False
+
+    def _put(self, item: object) -> None:
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+            finally:
+                self.stats.producer_wait += time.monotonic() - started
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._block:
+            if self._eof:
+                return 0
+            self._next_block()
+        size = min(len(buffer), len(self._block))
+        buffer[:size] = self._block[:size]
+        self._block = self._block[size:]
+        return size
+
+    def _wait_budget(self) -> tuple[float | None, str]:
+        budget, reason = self.idle_timeout, f"produced no output for {self.idle_timeout:g}s"
+        if self._deadline is not None:
+            remaining = self._deadline - time.monotonic()
+            if budget is None or remaining < budget:
+                budget, reason = max(0.0, remaining), f"exceeded its {self._timeout:g}s time limit"
+        return budget, reason
+
+    def _next_block(self) -> None:
+        budget, reason = self._wait_budget()
+        started = time.monotonic()
+        try:
+            item = self._queue.get(timeout=budget)
+        except queue.Empty:
+            self._abort()
+            raise DecompressionError(f"{self.name} {reason}") from None
+        finally:
+            self.stats.consumer_wait += time.monotonic() - started
+
+        if item is _EOF:
+            self._eof = True
+            self._finish()
+            self.stats.finished = time.monotonic()
+        elif isinstance(item, BaseException):
+            self._abort()
+            raise DecompressionError(f"Reading {self.name} output failed: {item}") from item
+        else:
+            self.stats.blocks += 1
+            self.stats.bytes_out += len(item)
+            self._block = memoryview(item)
+
+    def _finish(self) -> None:
+        """Called once the producer has delivered everything."""
+
+    def _abort(self) -> None:
+        self._stop.set()
+        if self.stats.finished is None:
+            self.stats.finished = time.monotonic()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self._abort()
+        super().close()
+
+
+class SupervisedStream(_QueuedStream):
+    """Raw stream over the stdout of ``command``, fed by a reader thread."""
+
+    def __init__(self, command: Sequence[str], **options: Any) -> None:
+        super().__init__(command[0], **options)
+        self.command = list(command)
+        self._stderr_tail = bytearray()
+        self._process = subprocess.Popen(
+            self.command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        self._reader = threading.Thread(target=self._pump, name="decompress-stdout", daemon=True)
+        self._drainer = threading.Thread(
+            target=self._drain_stderr, name="decompress-stderr", daemon=True
+        )
+        self._reader.start()
+        self._drainer.start()
+
+    def _pump(self) -> None:
+        stdout = self._process.stdout
+        assert stdout is not None
+        try:
+            while not self._stop.is_set():
+                block = stdout.read(self.block_bytes)
+                if not block:
+                    break
+                self._put(block)
+        except BaseException as exc:  # surfaced to the consumer thread
+            self._put(exc)
+        self._put(_EOF)
+
+    def _drain_stderr(self) -> None:
+        stderr = self._process.stderr
+        assert stderr is not None
+        for chunk in iter(lambda: stderr.read1(1 << 16), b""):
+            self.stats.stderr_bytes += len(chunk)
+            self._stderr_tail += chunk
+            del self._stderr_tail[:-_STDERR_TAIL_BYTES]
+
+    def stderr_tail(self) -> str:
+        return self._stderr_tail.decode("utf-8", errors="ignore")
+
+    def _finish(self) -> None:
+        try:
+            returncode = self._process.wait(timeout=self.idle_timeout)
+        except subprocess.TimeoutExpired:
+            self._abort()
+            raise DecompressionError(f"{self.name} did not exit after closing its output") from None
+        self._drainer.join()
+        if returncode != 0:
+            raise DecompressionError(
+                f"{self.name} exited with code {returncode}.\n{self.stderr_tail().strip()}"
+            )
+
+    def _abort(self) -> None:
+        super()._abort()
+        if self._process.poll() is None:
+            self._process.kill()
+        self._process.wait()
+
+    def close(self) -> None:
+        """Stop the decompressor (if still running) and release the pipes."""
+
+        if self.closed:
+            return
+        super().close()
+        self._reader.join(timeout=5)
+        self._drainer.join(timeout=5)
+        for pipe in (self._process.stdout, self._process.stderr):
+            if pipe is not None:
+                pipe.close()
+
+
+class _Stopped(Exception):
+    """Raised inside a producer callback once the consumer has gone away."""
+
+
+class ProducerStream(_QueuedStream):
+    """Raw stream fed by ``produce(write)`` running on a worker thread.
+
+    This adapts push-style decompressors (a library calling ``write`` with
+    decompressed bytes) to the same bounded, overlapped, timed stream as
+    :class:`SupervisedStream`. Small writes are coalesced into
+    ``block_bytes`` blocks and large ones are split into them, so at most
+    ``queue_blocks * block_bytes`` bytes wait in the queue; once the stream is
+    closed ``write`` raises so the producer unwinds.
+    """
+
+    def __init__(
+        self, produce: Callable[[Callable[[bytes], None]], None], *, name: str, **options: Any
+    ) -> None:
+        super().__init__(name, **options)
+        self._pending = bytearray()
+        self._thread = threading.Thread(
+            target=self._run, args=(produce,), name=f"decompress-{name}", daemon=True
+        )
+        self._thread.start()
+
+    def _write(self, data: bytes) -> None:
+        if self._stop.is_set():
+            raise _Stopped
+        view = memoryview(data)
+        if self._pending:
+            fill = self.block_bytes - len(self._pending)
+            self._pending += view[:fill]
+            view = view[fill:]
+            if len(self._pending) < self.block_bytes:
+                return
+            self._put_block(self._pending)
+            self._pending.clear()
+        # Large writes are split, so a queued block never exceeds block_bytes.
+        while len(view) >= self.block_bytes:
+            self._put_block(view[: self.block_bytes])
+            view = view[self.block_bytes :]
+        self._pending += view
+
+    def _put_block(self, block: bytes | bytearray | memoryview) -> None:
+        if self._stop.is_set():
+            raise _Stopped
+        # One copy per block: the producer may reuse its buffer once write returns.
+        self._put(bytes(block))
+
+    def _run(self, produce: Callable[[Callable[[bytes], None]], None]) -> None:
+        try:
+            produce(self._write)
+            if self._pending:
+                self._put(bytes(self._pending))
+                self._pending.clear()
+        except _Stopped:
+            return
+        except BaseException as exc:  # surfaced to the consumer thread
+            self._put(exc)
+            return
+        self._put(_EOF)
+
+    def _finish(self) -> None:
+        self._thread.join()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        super().close()
+        self._thread.join(timeout=5)
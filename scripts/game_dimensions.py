@@ -0,0 +1,351 @@
+"""Shared season and game-phase dimensions for the player-game builders.
+
+Every builder used to derive its own season from ``gameDate`` (calendar year,
+July cutoff, October cutoff) and its own phase from ``gameType`` /
+``gameLabel`` substrings, so the same game could land in different seasons
+across outputs. This module is the one definition they all consume:
+
+* :func:`season_from_date` maps a ``gameDate`` to its season start year.
+* :func:`game_phase` maps a game to one of :data:`PHASES`.
+
+Both read a table built once per process from the parsed ``Games.csv``
+records (:mod:`scripts.games_table`): the season of
+every game date (taken from the NBA ``gameId``, which encodes it, so the
+2019-20 bubble games played in August 2020 stay in 2019) and the phase of
+every ``gameId`` (from its ``gameType`` / ``gameLabel``). Dates and games the
+table does not cover fall back to the same rules applied to the row itself: a
+July cutoff for seasons, and the row's labels, then the ``gameId`` digits, for
+phases. Both lookups are memoized per distinct input, so the hot loops never
+reparse a date or rescan a label.
+
+The same pass reconstructs every playoff series (:class:`PlayoffSeries`):
+its round, teams, wins, winner and games. :func:`series_won` joins a
+player-game row to its series by ``gameId``, so title counts come from the
+series result instead of a player's Finals record.
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Collection, Iterable
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.games_table import GAMES_PATH, GameRecord, load_games  # noqa: E402
+from scripts.sources import SourceError  # noqa: E402
+
+SEASON_CUTOFF_MONTH = 7
+
+PRESEASON = "preseason"
+REGULAR = "regular"
+PLAY_IN = "play-in"
+PLAYOFFS = "playoffs"
+FINALS = "finals"
+ALL_STAR = "all-star"
+CUP = "cup"
+PHASES = (PRESEASON, REGULAR, PLAY_IN, PLAYOFFS, FINALS, ALL_STAR, CUP)
+PLAYOFF_PHASES = frozenset({PLAYOFFS, FINALS})
+POSTSEASON = frozenset({PLAY_IN, *PLAYOFF_PHASES})
+
+# Third digit of a ten-digit NBA game id ("0042300401"); the archives drop the
+# leading zeros, so ids read as eight digits ("42300401").
+_ID_PHASES = {"1": PRESEASON, "2": REGULAR, "3": ALL_STAR, "4": PLAYOFFS, "5": PLAY_IN, "6": CUP}
+_FINALS_ROUND = "4"
+# A best-of-seven series is over at four wins; shorter formats are only
+# trusted once a later season shows the playoffs finished.
+_CLINCH_WINS = 4
+
+
+@dataclass
+class PlayoffSeries:
+    """One playoff series rebuilt from its ``Games.csv`` games."""
+
+    season: int
+    round: int | None
+    finals: bool
+    teams: tuple[str, str]
+    names: tuple[str, str]
+    wins: list[int] = field(default_factory=lambda: [0, 0])
+    games: list[str] = field(default_factory=list)
+    winner: str | None = None
+
+
+@dataclass
+class GameDimensions:
+    """The ``Games.csv`` lookup tables (empty when the file is unavailable)."""
+
+    season_by_date: dict[str, int] = field(default_factory=dict)
+    phase_by_game: dict[str, str] = field(default_factory=dict)
+    dates_by_season: dict[int, tuple[str, str]] = field(default_factory=dict)
+    series: list[PlayoffSeries] = field(default_factory=list)
+    # gameId -> (series, teamId that won the game)
+    series_by_game: dict[str, tuple[PlayoffSeries, str]] = field(default_factory=dict)
+
+
+def season_from_date_rule(game_date: str) -> int | None:
+    """Season start year of ``YYYY-MM-DD...`` text by the July cutoff alone."""
+
+    try:
+        year = int(game_date[0:4])
+        month = int(game_date[5:7])
+    except (ValueError, IndexError):
+        return None
+    return year if month >= SEASON_CUTOFF_MONTH else year - 1
+
+
+def _normalized_game_id(game_id: str) -> str | None:
+    text = game_id.strip()
+    if len(text) == 10 and text.startswith("00"):
+        text = text[2:]
+    if len(text) != 8 or not text.isdigit():
+        return None
+    return text
+
+
+def season_from_game_id(game_id: str) -> int | None:
+    """Season start year encoded in an NBA ``gameId`` (``"22300001"`` -> 2023)."""
+
+    text = _normalized_game_id(game_id)
+    if text is None or text[0] not in _ID_PHASES:
+        return None
+    year = int(text[1:3])
+    return 1900 + year if year >= 46 else 2000 + year
+
+
+def phase_from_game_id(game_id: str) -> str | None:
+    """Phase encoded in an NBA ``gameId``; round four of the playoffs is the Finals."""
+
+    text = _normalized_game_id(game_id)
+    if text is None:
+        return None
+    phase = _ID_PHASES.get(text[0])
+    if phase == PLAYOFFS and text[5] == _FINALS_ROUND:
+        return FINALS
+    return phase
+
+
+def phase_from_labels(game_type: str, game_label: str = "") -> str | None:
+    """Phase named by a ``gameType`` / ``gameLabel`` pair, or ``None`` when unrecognized."""
+
+    label = game_type.strip().lower()
+    if "play-in" in label:
+        return PLAY_IN
+    if "playoff" in label:
+        return FINALS if "nba finals" in game_label.lower() else PLAYOFFS
+    if "regular" in label:
+        return REGULAR
+    if "preseason" in label:
+        return PRESEASON
+    if "all-star" in label:
+        return ALL_STAR
+    if "cup" in label or "tournament" in label:
+        return CUP
+    if "nba finals" in game_label.lower():
+        return FINALS
+    return None
+
+
+def playoff_round(game_id: str) -> int | None:
+    """Round (1-4) encoded in a playoff ``gameId`` (``"42300401"`` -> 4)."""
+
+    text = _normalized_game_id(game_id)
+    if text is None or _ID_PHASES.get(text[0]) != PLAYOFFS or not text[5].isdigit():
+        return None
+    return int(text[5]) or None
+
+
+def _game_winner(record: GameRecord) -> tuple[str, str, str] | None:
+    """``(winner, home, away)`` team ids of a played game, or ``None``."""
+
+    home, away = record.hometeamId, record.awayteamId
+    if not home or not away or home == away:
+        return None
+    winner = record.winner
+    if winner not in (home, away):
+        if record.homeScore is None or record.awayScore is None:
+            return None
+        if record.homeScore == record.awayScore:
+            return None
+        winner = home if record.homeScore > record.awayScore else away
+    return winner, home, away
+
+
+def _settle_series(dimensions: GameDimensions, game_dates: dict[str, str]) -> None:
+    """Order each series' games and name the winners of decided series."""
+
+    latest_season = max((series.season for series in dimensions.series), default=None)
+    for series in dimensions.series:
+        series.games.sort(key=lambda game_id: (game_dates.get(game_id, ""), game_id))
+        leader = 0 if series.wins[0] > series.wins[1] else 1
+        if series.wins[leader] == series.wins[1 - leader]:
+            continue
+        if series.wins[leader] >= _CLINCH_WINS or series.season != latest_season:
+            series.winner = series.teams[leader]
+    dimensions.series.sort(key=lambda series: (series.season, series.round or 0, series.teams))
+
+
+def build_game_dimensions(records: Iterable[GameRecord]) -> GameDimensions:
+    """Fold ``Games.csv`` records into :class:`GameDimensions`."""
+
+    dimensions = GameDimensions()
+    season_votes: dict[str, dict[int, int]] = {}
+    open_series: dict[tuple[int, str, str], PlayoffSeries] = {}
+    game_dates: dict[str, str] = {}
+    for record in records:
+        game_id = record.gameId
+        game_date = record.day
+        season = season_from_game_id(game_id) if game_id else None
+        if season is None:
+            season = season_from_date_rule(game_date)
+        if season is not None and game_date:
+            votes = season_votes.setdefault(game_date, {})
+            votes[season] = votes.get(season, 0) + 1
+        if game_id:
+            label = record.gameLabel
+            phase = phase_from_labels(record.gameType, label)
+            # Unlabelled playoff games only reveal the Finals through the id's round digit.
+            if phase is None or (phase == PLAYOFFS and not label):
+                phase = phase_from_game_id(game_id) or phase
+            if phase is not None:
+                dimensions.phase_by_game[game_id] = sys.intern(phase)
+            if phase in PLAYOFF_PHASES and season is not None:
+                _add_series_game(dimensions, open_series, game_dates, record, season, phase)
+
+    _settle_series(dimensions, game_dates)
+    for game_date, votes in season_votes.items():
+        season = max(votes, key=lambda candidate: (votes[candidate], -candidate))
+        dimensions.season_by_date[game_date] = season
+        first, last = dimensions.dates_by_season.get(season, (game_date, game_date))
+        dimensions.dates_by_season[season] = (min(first, game_date), max(last, game_date))
+    return dimensions
+
+
+def _add_series_game(
+    dimensions: GameDimensions,
+    open_series: dict[tuple[int, str, str], PlayoffSeries],
+    game_dates: dict[str, str],
+    record: GameRecord,
+    season: int,
+    phase: str,
+) -> None:
+    game_id = record.gameId
+    played = _game_winner(record)
+    if played is None or game_id in dimensions.series_by_game:
+        return
+    winner, home, away = played
+    names = {
+        record.hometeamId: f"{record.hometeamCity} {record.hometeamName}".strip(),
+        record.awayteamId: f"{record.awayteamCity} {record.awayteamName}".strip(),
+    }
+    teams = tuple(sorted((home, away)))
+    key = (season, *teams)
+    series = open_series.get(key)
+    if series is None:
+        series = open_series[key] = PlayoffSeries(
+            season,
+            playoff_round(game_id),
+            phase == FINALS,
+            teams,
+            (names[teams[0]], names[teams[1]]),
+        )
+        dimensions.series.append(series)
+    series.finals = series.finals or phase == FINALS
+    series.wins[teams.index(winner)] += 1
+    series.games.append(game_id)
+    game_dates[game_id] = record.gameDate
+    dimensions.series_by_game[game_id] = (series, winner)
+
+
+@lru_cache(maxsize=None)
+def load_game_dimensions() -> GameDimensions:
+    """Build the tables from :data:`GAMES_PATH` once per process."""
+
+    if not GAMES_PATH.exists():
+        return GameDimensions()
+    try:
+        return build_game_dimensions(load_games(GAMES_PATH))
+    except (OSError, SourceError):
+        return GameDimensions()
+
+
+def reset_game_dimensions() -> None:
+    """Forget the loaded tables and memoized lookups (after swapping :data:`GAMES_PATH`)."""
+
+    for cached in (load_game_dimensions, season_from_date, game_phase, series_won):
+        cached.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def season_from_date(game_date: str) -> int | None:
+    """Season start year of a ``gameDate``: the ``Games.csv`` season, else the July cutoff."""
+
+    day = game_date.strip()[:10]
+    if not day:
+        return None
+    season = load_game_dimensions().season_by_date.get(day)
+    return season if season is not None else season_from_date_rule(day)
+
+
+@lru_cache(maxsize=None)
+def game_phase(game_id: str, game_type: str = "", game_label: str = "") -> str | None:
+    """Phase of a game: the ``Games.csv`` phase, else its labels, else its ``gameId`` digits."""
+
+    phase = load_game_dimensions().phase_by_game.get(game_id.strip())
+    if phase is not None:
+        return phase
+    phase = phase_from_labels(game_type, game_label)
+    if phase is None or (phase == PLAYOFFS and not game_label.strip()):
+        phase = phase_from_game_id(game_id) or phase
+    return phase
+
+
+def playoff_series() -> list[PlayoffSeries]:
+    """Every playoff series ``Games.csv`` lists, by season and round."""
+
+    return load_game_dimensions().series
+
+
+@lru_cache(maxsize=None)
+def series_won(game_id: str, win: str) -> bool | None:
+    """Whether the side of a player-game row went on to win the game's playoff series.
+
+    ``win`` is the row's ``"1"``/``"0"`` game result, which names the team
+    (the game's winner or loser). ``False`` for a series ``Games.csv`` lists
+    but that is still undecided, and ``None`` only when ``Games.csv`` does not
+    list the game at all.
+    """
+
+    listed = load_game_dimensions().series_by_game.get(game_id.strip())
+    if listed is None or win.strip() not in ("0", "1"):
+        return None
+    series, game_winner = listed
+    if series.winner is None:
+        return False
+    return (win.strip() == "1") == (game_winner == series.winner)
+
+
+def season_date_bounds(seasons: Collection[int] | None) -> tuple[str | None, str | None]:
+    """``gameDate`` window ``[start, end)`` covering every game of ``seasons``.
+
+    Seasons the ``Games.csv`` table knows use their actual first and last
+    dates (the 2019-20 season ran into October 2020); others use the July
+    cutoff.
+    """
+
+    if not seasons:
+        return None, None
+    known = load_game_dimensions().dates_by_season
+    starts = [f"{season:04d}-07-01" for season in seasons]
+    ends = [f"{season + 1:04d}-07-01" for season in seasons]
+    for season in seasons:
+        if season in known:
+            first, last = known[season]
+            starts.append(first)
+            ends.append((date.fromisoformat(last) + timedelta(days=1)).isoformat())
+    return min(starts), max(ends)
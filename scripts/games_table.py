@@ -0,0 +1,154 @@
+"""Single-pass typed reader for the ``Games.csv`` schedule and results table.
+
+The audit (:mod:`scripts.phase1_pipeline`), the historic games snapshot
+(:mod:`scripts.build_insights`) and the season/phase/series dimensions
+(:mod:`scripts.game_dimensions`) each used to run ``csv.DictReader`` over the
+whole file and parse its dates with their own function. They now read one
+table of :class:`GameRecord` values:
+
+* every row is parsed once: ids and labels stripped, scores and attendance as
+  ints, ``gameDate`` as a ``datetime`` (``None`` when it does not parse);
+* the parsed table is memoized per process and saved as compact typed columns
+  under ``data/cache/games/<sha256>.pickle`` (see :mod:`scripts.table_cache`),
+  so a later process with the same ``Games.csv`` skips CSV parsing entirely;
+* a :class:`GamesScan` feeds the records to every registered consumer (any
+  object with ``consume(record)``), the way
+  :class:`~scripts.player_stats_scan.PlayerStatisticsScan` fans out player
+  rows.
+"""
+
+from __future__ import annotations
+
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Mapping, NamedTuple, Protocol, TypeVar
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.sources import locate_source  # noqa: E402
+from scripts.table_cache import TableSpec, load_table, parse_datetime, parse_int, read_table  # noqa: E402
+
+GAMES_PATH = locate_source("Games", ROOT / "Games.csv")
+GAMES_MEMBER = "Games.csv"
+CACHE_ROOT = ROOT / "data" / "cache" / "games"
+
+
+class GameRecord(NamedTuple):
+    """One ``Games.csv`` row, parsed."""
+
+    gameId: str
+    gameDate: str
+    start: datetime | None
+    gameType: str
+    gameLabel: str
+    hometeamId: str
+    hometeamCity: str
+    hometeamName: str
+    awayteamId: str
+    awayteamCity: str
+    awayteamName: str
+    homeScore: int | None
+    awayScore: int | None
+    winner: str
+    attendance: int | None
+
+    @property
+    def day(self) -> str:
+        """``YYYY-MM-DD`` part of :attr:`gameDate`."""
+
+        return self.gameDate[:10]
+
+
+_INT_FIELDS = ("homeScore", "awayScore", "attendance")
+
+
+def parse_game(row: Mapping[str, str | None]) -> GameRecord:
+    """Parse one ``csv.DictReader`` row into a :class:`GameRecord`."""
+
+    text = {name: (row.get(name) or "").strip() for name in GameRecord._fields if name != "start"}
+    for name in _INT_FIELDS:
+        text[name] = parse_int(text[name])
+    return GameRecord(start=parse_datetime(text["gameDate"]), **text)
+
+
+GAMES_TABLE = TableSpec(
+    "games",
+    GAMES_MEMBER,
+    GameRecord,
+    {
+        name: "datetime" if name == "start" else "int" if name in _INT_FIELDS else "str"
+        for name in GameRecord._fields
+    },
+    parse_game,
+)
+
+
+def read_games(path: Path = GAMES_PATH) -> list[GameRecord]:
+    """Parse ``path`` from CSV text, skipping every cache."""
+
+    return read_table(GAMES_TABLE, path)
+
+
+def load_games(path: Path = GAMES_PATH, *, cache_root: Path | None = None) -> list[GameRecord]:
+    """Every ``Games.csv`` record, parsed at most once per file hash.
+
+    Raises ``FileNotFoundError`` when ``path`` does not exist.
+    """
+
+    return load_table(GAMES_TABLE, path, cache_root=cache_root or CACHE_ROOT)
+
+
+# ---------------------------------------------------------------------------
+# Fan-out
+
+
+class GamesConsumer(Protocol):
+    def consume(self, record: GameRecord) -> None: ...
+
+
+ConsumerT = TypeVar("ConsumerT", bound=GamesConsumer)
+
+
+class GamesScan:
+    """Feed every registered consumer from one pass over the parsed games."""
+
+    def __init__(self) -> None:
+        self._consumers: list[GamesConsumer] = []
+
+    def register(self, consumer: ConsumerT) -> ConsumerT:
+        self._consumers.append(consumer)
+        return consumer
+
+    @property
+    def consumers(self) -> tuple[GamesConsumer, ...]:
+        return tuple(self._consumers)
+
+    def run(self, records: Iterable[GameRecord] | None = None, *, path: Path = GAMES_PATH) -> int:
+        """Dispatch ``records`` (``path``'s table by default); returns how many were read."""
+
+        if records is None:
+            records = load_games(path)
+        consumes = [consumer.consume for consumer in self._consumers]
+        count = 0
+        for record in records:
+            for consume in consumes:
+                consume(record)
+            count += 1
+        return count
+
+
+def scan_games(
+    consumers: Iterable[GamesConsumer],
+    records: Iterable[GameRecord] | None = None,
+    *,
+    path: Path = GAMES_PATH,
+) -> int:
+    """Run a one-off :class:`GamesScan` over ``consumers``."""
+
+    scan = GamesScan()
+    for consumer in consumers:
+        scan.register(consumer)
+    return scan.run(records, path=path)
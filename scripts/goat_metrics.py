@@ -6,6 +6,10 @@ import math
 from datetime import datetime
 from typing import Any, Collection, Iterable, Mapping
 
+from scripts.accumulators import Count, Keyed, LastBy, Record, SetUnion, Sum
+from scripts.game_dimensions import season_from_date
+from scripts.player_stats_reader import Projection, memoized
+
 RECENT_SEASON_START = 2022
 RECENT_SEASON_SPAN = 3  # 2022-23 through 2024-25
 RECENT_SEASON_YEARS = {
@@ -57,16 +61,6 @@ def _parse_game_date(value: str | None) -> datetime | None:
     return None
 
 
-def _season_year_from_date(value: str | None) -> int | None:
-    parsed = _parse_game_date(value)
-    if not parsed:
-        return None
-    anchor_year = parsed.year
-    if parsed.month >= 7:
-        return anchor_year
-    return anchor_year - 1
-
-
 def format_season_label(start_year: int) -> str:
     end_year = start_year + 1
     return f"{start_year}-{str(end_year)[-2:]}"
@@ -98,69 +92,142 @@ def format_season_window(start_year: int, span: int) -> str:
     return f"{format_season_label(start_year)} to {format_season_label(end_year)}"
 
 
+def _recent_goat_record() -> Record:
+    return Record(
+        games=Count(),
+        wins=Count(),
+        minutes=Sum(),
+        points=Sum(),
+        assists=Sum(),
+        rebounds=Sum(),
+        steals=Sum(),
+        blocks=Sum(),
+        plus_minus=Sum(),
+        seasons=SetUnion(),
+        last_game=LastBy(),
+    )
+
+
+def _recent_bucket(record: Record) -> dict[str, Any]:
+    """Flatten a recent-window record into the bucket shape the scorer fills in."""
+
+    bucket = record.finalize()
+    last_game = record["last_game"]
+    bucket["seasons"] = set(bucket["seasons"])
+    bucket["last_game"] = last_game.key
+    bucket["team_name"], bucket["team_city"] = last_game.value or (None, None)
+    return bucket
+
+
+def _normalize_ids(active_ids: Collection[str]) -> set[str]:
+    return {str(person_id).strip() for person_id in active_ids if str(person_id).strip()}
+
+
+class RecentGoatAccumulator:
+    """Collect recent-window totals so the scores can share an archive scan.
+
+    When ``active_ids`` is omitted every player is tracked and the active pool
+    is supplied to :meth:`scores` instead, which lets the consumer be
+    registered before the roster inputs have been resolved.
+    """
+
+    columns = Projection(
+        "RecentGoatRow",
+        {
+            "personId": "str",
+            "seasonYear": ("gameDate", season_from_date),
+            "gameDate": memoized(_parse_game_date),
+            "playerteamName": "str",
+            "playerteamCity": "str",
+            "win": "flag",
+            "numMinutes": _parse_float,
+            "points": _parse_float,
+            "assists": _parse_float,
+            "reboundsTotal": _parse_float,
+            "steals": _parse_float,
+            "blocks": _parse_float,
+            "plusMinusPoints": _parse_float,
+        },
+    )
+
+    def __init__(self, active_ids: Collection[str] | None = None) -> None:
+        self._tracked = _normalize_ids(active_ids) if active_ids is not None else None
+        self.aggregates: Keyed[str, Record] = Keyed(_recent_goat_record)
+
+    def consume(self, row: Any) -> None:
+        person_id = row.personId
+        if not person_id:
+            return
+        if self._tracked is not None and person_id not in self._tracked:
+            return
+
+        season_year = row.seasonYear
+        if season_year not in RECENT_SEASON_YEARS:
+            return
+
+        minutes = row.numMinutes or 0.0
+        if minutes <= 0:
+            return
+
+        bucket = self.aggregates[person_id]
+        bucket.update(
+            games=1,
+            wins=row.win,
+            minutes=minutes,
+            points=row.points or 0.0,
+            assists=row.assists or 0.0,
+            rebounds=row.reboundsTotal or 0.0,
+            steals=row.steals or 0.0,
+            blocks=row.blocks or 0.0,
+            plus_minus=row.plusMinusPoints or 0.0,
+            seasons=season_year,
+        )
+        bucket["last_game"].update(
+            row.gameDate, (row.playerteamName or None, row.playerteamCity or None)
+        )
+
+    def merge(self, other: RecentGoatAccumulator) -> None:
+        """Fold in an accumulator that consumed the rows following this one's."""
+
+        self.aggregates.merge(other.aggregates)
+
+    def scores(self, active_ids: Collection[str] | None = None) -> dict[str, dict[str, Any]]:
+        """Score the active pool from the collected totals."""
+
+        if active_ids is not None:
+            normalized_ids = _normalize_ids(active_ids)
+        elif self._tracked is not None:
+            normalized_ids = self._tracked
+        else:
+            normalized_ids = set(self.aggregates)
+        return _score_recent_aggregates(
+            {
+                person_id: _recent_bucket(self.aggregates.get(person_id) or _recent_goat_record())
+                for person_id in normalized_ids
+            }
+        )
+
+
 def compute_recent_goat_scores(
     rows: Iterable[Mapping[str, Any]],
     active_ids: Collection[str],
 ) -> dict[str, dict[str, Any]]:
     """Aggregate last-three-season GOAT scores for the provided players."""
 
-    normalized_ids = {str(person_id).strip() for person_id in active_ids if str(person_id).strip()}
+    normalized_ids = _normalize_ids(active_ids)
     if not normalized_ids:
         return {}
 
-    aggregates: dict[str, dict[str, Any]] = {
-        person_id: {
-            "games": 0,
-            "wins": 0,
-            "minutes": 0.0,
-            "points": 0.0,
-            "assists": 0.0,
-            "rebounds": 0.0,
-            "steals": 0.0,
-            "blocks": 0.0,
-            "plus_minus": 0.0,
-            "seasons": set(),
-            "last_game": None,
-            "team_name": None,
-            "team_city": None,
-        }
-        for person_id in normalized_ids
-    }
-
+    accumulator = RecentGoatAccumulator(normalized_ids)
+    to_record = accumulator.columns.from_mapping
     for row in rows:
-        person_raw = row.get("personId")
-        person_id = str(person_raw).strip() if person_raw is not None else ""
-        if person_id not in aggregates:
-            continue
+        accumulator.consume(to_record(row))
+    return accumulator.scores()
 
-        season_year = _season_year_from_date(row.get("gameDate"))
-        if season_year not in RECENT_SEASON_YEARS:
-            continue
-
-        minutes = _parse_float(row.get("numMinutes")) or 0.0
-        if minutes <= 0:
-            continue
 
-        bucket = aggregates[person_id]
-        bucket["games"] += 1
-        if (row.get("win") or "").strip() == "1":
-            bucket["wins"] += 1
-        bucket["minutes"] += minutes
-        bucket["points"] += _parse_float(row.get("points")) or 0.0
-        bucket["assists"] += _parse_float(row.get("assists")) or 0.0
-        bucket["rebounds"] += _parse_float(row.get("reboundsTotal")) or 0.0
-        bucket["steals"] += _parse_float(row.get("steals")) or 0.0
-        bucket["blocks"] += _parse_float(row.get("blocks")) or 0.0
-        bucket["plus_minus"] += _parse_float(row.get("plusMinusPoints")) or 0.0
-        bucket["seasons"].add(season_year)
-
-        game_date = _parse_game_date(row.get("gameDate"))
-        if game_date is not None:
-            last_game = bucket.get("last_game")
-            if last_game is None or game_date > last_game:
-                bucket["last_game"] = game_date
-                bucket["team_name"] = (row.get("playerteamName") or "").strip() or None
-                bucket["team_city"] = (row.get("playerteamCity") or "").strip() or None
+def _score_recent_aggregates(aggregates: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    if not aggregates:
+        return {}
 
     component_maxima = {key: 0.0 for key in RECENT_COMPONENT_WEIGHTS}
     for bucket in aggregates.values():
@@ -0,0 +1,836 @@
+"""Vectorized GOAT scoring over a persisted players × components matrix.
+
+``goat_system.json`` scores every known player (about 6,500 and growing) on
+five components. Aggregating the game logs is the expensive part; turning
+career totals into scores is a handful of formulas per player. This module
+keeps the two apart:
+
+* :class:`GoatMatrix` holds one row per player: the career inputs
+  (:data:`FEATURES`) gathered by
+  :class:`~scripts.build_insights.GoatSystemBuilder` and the raw component
+  metrics :func:`raw_components` derives from them, both as float arrays.
+* :func:`score_goat_matrix` normalizes the raw metrics against the field,
+  blends in the BDI (Pantheon) feed, applies the component budgets and ranks
+  and tiers everyone with array operations, in milliseconds.
+
+The matrix is written next to the other caches, so a BDI feed update or a
+budget change can be rescored without touching ``PlayerStatistics``::
+
+    python scripts/goat_scoring.py   # rewrite goat_system.json scores in place
+
+:func:`reweight_goat_scores` scores a whole batch of alternative budgets and
+blend weights (:class:`GoatWeights`) in one pass and reports rank changes
+between them, for editorial what-if experiments::
+
+    python scripts/goat_scoring.py --what-if weightings.json
+
+Layout::
+
+    data/cache/goat_system/
+        matrix.npz   personIds, nameKeys, features, raw (and their column names)
+
+NumPy is required here, unlike in the scan itself; it is the one runtime
+dependency listed in ``requirements.txt``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Mapping, NamedTuple, Sequence
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.json_output import write_json  # noqa: E402
+from scripts.numpy_support import np, numpy_guard  # noqa: E402
+
+MATRIX_ROOT = ROOT / "data" / "cache" / "goat_system"
+MATRIX_VERSION = 2
+BDI_PATH = ROOT / "public" / "data" / "goat_index.json"
+GOAT_SYSTEM_PATH = ROOT / "public" / "data" / "goat_system.json"
+
+COMPONENT_KEYS = ("impact", "stage", "longevity", "versatility", "culture")
+COMPONENT_BUDGET = {
+    "impact": 34.0,
+    "stage": 26.0,
+    "longevity": 20.0,
+    "versatility": 12.0,
+    "culture": 8.0,
+}
+# (our share, BDI share) for players the BDI feed covers.
+BLEND_WEIGHTS = {
+    "impact": (0.65, 0.35),
+    "stage": (0.6, 0.4),
+    "longevity": (0.7, 0.3),
+    "versatility": (0.55, 0.45),
+    "culture": (0.4, 0.6),
+}
+
+# Career inputs per player, in matrix column order. ``draftNumber`` is NaN when unknown.
+FEATURES = (
+    "games",
+    "wins",
+    "playoffGames",
+    "playoffWins",
+    "finalsGames",
+    "finalsWins",
+    "championships",
+    "missingChampionships",
+    "finalsMVPs",
+    "minutes",
+    "points",
+    "assists",
+    "rebounds",
+    "steals",
+    "blocks",
+    "positions",
+    "teams",
+    "international",
+    "draftNumber",
+)
+_COLUMN = {name: index for index, name in enumerate(FEATURES)}
+
+# Additive per-season inputs the rank-band bootstrap resamples; ``championships``
+# counts the titles the game logs document (before any override).
+SEASON_FEATURES = (
+    "games",
+    "wins",
+    "playoffGames",
+    "playoffWins",
+    "finalsGames",
+    "finalsWins",
+    "championships",
+    "minutes",
+    "points",
+    "assists",
+    "rebounds",
+    "steals",
+    "blocks",
+)
+_SEASON_COLUMNS = [_COLUMN[name] for name in SEASON_FEATURES]
+
+# Rank bands: replicate percentiles, Dirichlet concentration around the published
+# budget shares, and the standard deviation of the jitter on our blend share.
+BAND_PERCENTILES = (5, 50, 95)
+WEIGHT_CONCENTRATION = 200.0
+BLEND_JITTER = 0.05
+_BAND_CHUNK = 10
+
+# Lower score bounds, ascending; anything under the first is a Reserve.
+TIERS = (
+    (10.0, "Rotation"),
+    (22.0, "Starter"),
+    (36.0, "All-Star"),
+    (52.0, "Hall of Fame"),
+    (68.0, "All-Time Great"),
+    (80.0, "Inner Circle"),
+    (92.0, "Pantheon"),
+)
+BASE_TIER = "Reserve"
+
+
+require_numpy = numpy_guard("GOAT scoring")
+
+
+def _normalize_name_key(value: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", value.lower())
+
+
+class BdiFeed(NamedTuple):
+    """The BDI (Pantheon) feed keyed by normalized player name."""
+
+    components: dict[str, dict[str, float]]
+    maxima: dict[str, float]
+    entries: dict[str, dict[str, object]]
+    generated_at: str | None
+
+
+def load_bdi_components(path: Path = BDI_PATH) -> BdiFeed:
+    """Load component values from the BDI (Pantheon) feed for blending."""
+
+    lookup: dict[str, dict[str, float]] = {}
+    maxima: dict[str, float] = {key: 0.0 for key in COMPONENT_KEYS}
+    metadata: dict[str, dict[str, object]] = {}
+    generated_at: str | None = None
+
+    if not path.exists():
+        return BdiFeed(lookup, maxima, metadata, generated_at)
+
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return BdiFeed(lookup, maxima, metadata, generated_at)
+
+    generated_at = payload.get("generatedAt")
+
+    for entry in payload.get("players", []):
+        name = (entry.get("name") or "").strip()
+        if not name:
+            continue
+
+        name_key = _normalize_name_key(name)
+        metadata[name_key] = entry
+
+        components = entry.get("goatComponents") or {}
+        component_map: dict[str, float] = {}
+        for key in COMPONENT_KEYS:
+            value = components.get(key)
+            if isinstance(value, (int, float)):
+                numeric_value = float(value)
+                component_map[key] = numeric_value
+                maxima[key] = max(maxima[key], numeric_value)
+
+        if component_map:
+            lookup[name_key] = component_map
+
+    return BdiFeed(lookup, maxima, metadata, generated_at)
+
+
+@dataclass
+class GoatMatrix:
+    """Career inputs and raw component metrics, one row per player.
+
+    ``seasons`` holds each player's :data:`SEASON_FEATURES` per season, grouped
+    by player in matrix order (``season_players`` gives the row), and
+    ``championship_overrides`` the documented title count overrides (0 for
+    none); both feed the rank-band bootstrap.
+    """
+
+    person_ids: list[str]
+    name_keys: list[str]
+    features: Any  # float64 (players, len(FEATURES))
+    raw: Any  # float64 (players, len(COMPONENT_KEYS))
+    seasons: Any  # float64 (player seasons, len(SEASON_FEATURES))
+    season_players: Any  # int64 (player seasons,)
+    championship_overrides: Any  # float64 (players,)
+
+    @classmethod
+    def from_features(
+        cls,
+        person_ids: Sequence[str],
+        name_keys: Sequence[str],
+        features: Sequence[Sequence[float]],
+        seasons: Sequence[Sequence[Sequence[float]]] | None = None,
+        championship_overrides: Sequence[float] | None = None,
+    ) -> GoatMatrix:
+        require_numpy()
+        table = np.array(features, dtype=np.float64).reshape(len(person_ids), len(FEATURES))
+        seasons = seasons or [()] * len(person_ids)
+        season_rows = [row for player in seasons for row in player]
+        return cls(
+            list(person_ids),
+            list(name_keys),
+            table,
+            raw_components(table),
+            np.array(season_rows, dtype=np.float64).reshape(len(season_rows), len(SEASON_FEATURES)),
+            np.repeat(np.arange(len(person_ids)), [len(player) for player in seasons]),
+            np.array(championship_overrides or [0.0] * len(person_ids), dtype=np.float64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.person_ids)
+
+    def feature(self, name: str) -> Any:
+        return self.features[..., _COLUMN[name]]
+
+
+def raw_components(features: Any) -> Any:
+    """Raw impact, stage, longevity, versatility and culture metrics per feature row.
+
+    ``features`` may carry leading batch axes (``(..., players, FEATURES)``);
+    the result has the same leading shape with :data:`COMPONENT_KEYS` last.
+    """
+
+    require_numpy()
+    column = {name: features[..., index] for name, index in _COLUMN.items()}
+    games = column["games"]
+    wins = column["wins"]
+    playoff_games = column["playoffGames"]
+    playoff_wins = column["playoffWins"]
+    finals_games = column["finalsGames"]
+    finals_wins = column["finalsWins"]
+    championships = column["championships"]
+    missing = column["missingChampionships"]
+    finals_mvps = column["finalsMVPs"]
+    minutes = column["minutes"]
+    assists = column["assists"]
+    rebounds = column["rebounds"]
+    stocks = column["steals"] + column["blocks"]
+    teams = column["teams"]
+
+    played = games > 0
+    per_game = np.where(played, games, 1.0)
+    production = np.where(
+        played, (column["points"] + 1.25 * assists + 1.1 * rebounds + 1.5 * stocks) / per_game, 0.0
+    )
+    impact = production * (0.6 + np.where(played, minutes / per_game, 0.0))
+
+    finals_win_rate = np.where(finals_games > 0, finals_wins / np.maximum(finals_games, 1.0), 0.0)
+    playoff_win_pct = np.where(
+        playoff_games > 0, playoff_wins / np.maximum(playoff_games, 1.0), 0.0
+    )
+    finals_game_scale = np.sqrt(np.maximum(finals_games, 0.0)) / 10.0
+    playoff_game_scale = np.sqrt(np.maximum(playoff_games, 0.0)) / 20.0
+    finals_mvp_stage = np.where(
+        finals_mvps > 0, np.sqrt(np.maximum(finals_mvps, 0.0)) * 200.0 + finals_mvps * 110.0, 0.0
+    )
+    stage = (
+        np.sqrt(np.maximum(playoff_wins, 0.0)) * 35.0
+        + np.sqrt(np.maximum(playoff_games, 0.0)) * 10.0
+        + np.sqrt(np.maximum(finals_wins, 0.0)) * 55.0
+        + np.sqrt(np.maximum(finals_games, 0.0)) * 20.0
+        + np.sqrt(np.maximum(championships, 0.0)) * 110.0
+        + np.sqrt(np.maximum(missing, 0.0)) * 90.0
+        + missing * 55.0
+        + finals_win_rate * 220.0 * finals_game_scale
+        + playoff_win_pct * 200.0 * playoff_game_scale
+        + playoff_wins * 1.15
+        + playoff_games * 0.05
+        + wins * 0.02
+        + finals_mvp_stage
+    )
+    stage = stage + np.where(finals_games >= 20, (finals_win_rate**2) * 180.0, 0.0)
+    finals_losses = np.maximum(0.0, finals_games - finals_wins)
+    stage = stage - np.sqrt(finals_losses) * 40.0
+    stage = stage + np.where(
+        (finals_games > 0) & (finals_losses == 0) & (championships >= 3), 160.0, 0.0
+    )
+
+    longevity = minutes + games * 5.0
+
+    versatility = (
+        column["positions"] * 40.0
+        + teams * 12.0
+        + np.where(played, assists / per_game, 0.0) * 18.0
+        + np.where(played, rebounds / per_game, 0.0) * 12.0
+        + np.where(played, stocks / per_game, 0.0) * 14.0
+    )
+
+    draft_number = column["draftNumber"]
+    draft_bonus = np.select(
+        [draft_number <= 3, draft_number <= 14, draft_number <= 30], [12.0, 8.0, 4.0], 0.0
+    )
+    culture = (
+        championships * 55.0
+        + missing * 25.0
+        + wins * 0.08
+        + playoff_wins * 0.35
+        + teams * 6.0
+        + column["international"] * 30.0
+        + draft_bonus
+    )
+    culture = culture + np.where(finals_mvps > 0, finals_mvps * 50.0, 0.0)
+
+    return np.stack([impact, stage, longevity, versatility, culture], axis=-1)
+
+
+def bdi_ratios(name_keys: Sequence[str], feed: BdiFeed) -> Any:
+    """``(players, components)`` BDI value over the feed maximum, NaN where the feed has none."""
+
+    require_numpy()
+    ratios = np.full((len(name_keys), len(COMPONENT_KEYS)), np.nan)
+    for row, name_key in enumerate(name_keys):
+        components = feed.components.get(name_key)
+        if not components:
+            continue
+        for column, key in enumerate(COMPONENT_KEYS):
+            value = components.get(key)
+            ceiling = feed.maxima.get(key, 0.0)
+            if isinstance(value, (int, float)) and ceiling > 0:
+                ratios[row, column] = max(0.0, min(1.0, float(value) / ceiling))
+    return ratios
+
+
+def bdi_tiers(name_keys: Sequence[str], feed: BdiFeed) -> Any:
+    """Editorial tiers from the BDI feed per player, ``""`` where it sets none."""
+
+    require_numpy()
+    tiers = []
+    for name_key in name_keys:
+        tier = feed.entries.get(name_key, {}).get("tier")
+        tiers.append(tier.strip() if isinstance(tier, str) else "")
+    return np.array(tiers, dtype=object)
+
+
+def weight_arrays(
+    budget: Mapping[str, float] = COMPONENT_BUDGET,
+    blend: Mapping[str, tuple[float, float]] = BLEND_WEIGHTS,
+) -> tuple[Any, Any]:
+    """Budget ``(components,)`` and blend ``(components, 2)`` arrays in :data:`COMPONENT_KEYS` order."""
+
+    require_numpy()
+    return (
+        np.array([float(budget[key]) for key in COMPONENT_KEYS]),
+        np.array([blend.get(key, (1.0, 0.0)) for key in COMPONENT_KEYS], dtype=np.float64),
+    )
+
+
+class GoatScores(NamedTuple):
+    """Scores for every matrix row; weight-batch axes, if any, lead."""
+
+    components: Any  # (..., players, components), rounded to 2 places
+    scores: Any  # (..., players), rounded to 1 place
+    ranks: Any  # (..., players), 1 = best; ties keep matrix order
+    tiers: Any  # (..., players) object array of tier names
+
+
+def score_goat_matrix(
+    raw: Any, bdi: Any, budget: Any, blend: Any, tier_overrides: Any = None
+) -> GoatScores:
+    """Normalize, blend, budget, rank and tier ``raw`` component metrics.
+
+    Each raw column is scaled by its maximum over the field and clipped to
+    ``[0, 1]`` (``raw`` may carry leading axes too, each normalized on its
+    own); where ``bdi`` has a ratio, it is blended in as
+    ``blend[:, 0] * ours + blend[:, 1] * bdi``. ``budget`` and ``blend`` may
+    carry leading axes (one row per weight set) to score many weightings at
+    once.
+    """
+
+    require_numpy()
+    ceiling = raw.max(axis=-2, initial=0.0)[..., np.newaxis, :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ours = np.clip(np.where(ceiling > 0, raw / ceiling, 0.0), 0.0, 1.0)
+    ours_share = blend[..., np.newaxis, :, 0]
+    bdi_share = blend[..., np.newaxis, :, 1]
+    combined = np.where(np.isnan(bdi), ours, ours_share * ours + bdi_share * bdi)
+    components = np.round(budget[..., np.newaxis, :] * np.clip(combined, 0.0, 1.0), 2)
+
+    total = components[..., 0]
+    for column in range(1, components.shape[-1]):
+        total = total + components[..., column]
+    scores = np.round(total, 1)
+
+    order = np.argsort(-scores, axis=-1, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, scores.shape[-1] + 1), axis=-1)
+
+    bounds = np.array([bound for bound, _ in TIERS])
+    names = np.array([BASE_TIER, *(name for _, name in TIERS)], dtype=object)
+    tiers = names[np.searchsorted(bounds, scores, side="right")]
+    if tier_overrides is not None:
+        tiers = np.where(tier_overrides != "", tier_overrides, tiers)
+    return GoatScores(components, scores, ranks, tiers)
+
+
+def score_players(matrix: GoatMatrix, feed: BdiFeed) -> GoatScores:
+    """Score ``matrix`` with the published budgets and blend weights."""
+
+    budget, blend = weight_arrays()
+    return score_goat_matrix(
+        matrix.raw,
+        bdi_ratios(matrix.name_keys, feed),
+        budget,
+        blend,
+        bdi_tiers(matrix.name_keys, feed),
+    )
+
+
+def component_payload(components: Any) -> dict[str, float]:
+    """One player's component row as the ``goatComponents`` mapping."""
+
+    return dict(zip(COMPONENT_KEYS, components.tolist(), strict=True))
+
+
+def save_goat_matrix(matrix: GoatMatrix, *, matrix_root: Path = MATRIX_ROOT) -> Path:
+    matrix_root.mkdir(parents=True, exist_ok=True)
+    path = matrix_root / "matrix.npz"
+    temp_path = matrix_root / f".matrix.tmp-{os.getpid()}.npz"
+    np.savez(
+        temp_path,
+        version=np.array(MATRIX_VERSION),
+        personIds=np.array(matrix.person_ids, dtype=str),
+        nameKeys=np.array(matrix.name_keys, dtype=str),
+        featureNames=np.array(FEATURES),
+        componentNames=np.array(COMPONENT_KEYS),
+        features=matrix.features,
+        raw=matrix.raw,
+        seasonFeatureNames=np.array(SEASON_FEATURES),
+        seasons=matrix.seasons,
+        seasonPlayers=matrix.season_players,
+        championshipOverrides=matrix.championship_overrides,
+    )
+    os.replace(temp_path, path)
+    return path
+
+
+def load_goat_matrix(*, matrix_root: Path = MATRIX_ROOT) -> GoatMatrix | None:
+    """The matrix from the last GOAT build, or ``None`` if missing or written by another layout."""
+
+    require_numpy()
+    path = matrix_root / "matrix.npz"
+    if not path.exists():
+        return None
+    with np.load(path, allow_pickle=False) as stored:
+        if (
+            int(stored["version"]) != MATRIX_VERSION
+            or tuple(stored["featureNames"].tolist()) != FEATURES
+            or tuple(stored["componentNames"].tolist()) != COMPONENT_KEYS
+            or tuple(stored["seasonFeatureNames"].tolist()) != SEASON_FEATURES
+        ):
+            return None
+        return GoatMatrix(
+            stored["personIds"].tolist(),
+            stored["nameKeys"].tolist(),
+            stored["features"],
+            stored["raw"],
+            stored["seasons"],
+            stored["seasonPlayers"],
+            stored["championshipOverrides"],
+        )
+
+
+def rescore_goat_system(payload: dict, matrix: GoatMatrix, feed: BdiFeed) -> dict:
+    """Refresh ``goatScore``, ``goatComponents``, ``tier`` and ``rank`` in a ``goat_system.json`` payload."""
+
+    scored = score_players(matrix, feed)
+    rows = {person_id: row for row, person_id in enumerate(matrix.person_ids)}
+    players = []
+    for entry in payload.get("players", []):
+        row = rows.get(str(entry.get("personId")))
+        if row is None:
+            continue
+        entry["goatScore"] = float(scored.scores[row])
+        entry["goatComponents"] = component_payload(scored.components[row])
+        entry["tier"] = scored.tiers[row]
+        entry["rank"] = int(scored.ranks[row])
+        # Bands from an earlier run no longer describe these scores.
+        entry.pop("rankBand", None)
+        players.append(entry)
+    players.sort(key=lambda entry: entry["rank"])
+    payload["players"] = players
+    payload.pop("uncertainty", None)
+    payload.setdefault("coverage", {})["players"] = len(players)
+    if feed.generated_at:
+        payload.setdefault("sourceTimestamps", {})["bdi"] = feed.generated_at
+    return payload
+
+
+def resample_features(matrix: GoatMatrix, rng: Any, replicates: int) -> Any:
+    """``(replicates, players, FEATURES)`` inputs with each player's seasons bootstrapped.
+
+    Every player draws as many seasons as they played, with replacement, and
+    the additive inputs are re-summed from the draw. Rows without a season
+    (no game date) stay in every replicate. Titles are recounted from the
+    drawn seasons before overrides are applied again. Positions, teams,
+    Finals MVPs and draft inputs are career facts and do not move.
+    """
+
+    players = len(matrix)
+    counts = np.bincount(matrix.season_players, minlength=players)
+    starts = np.zeros(players, dtype=np.int64)
+    np.cumsum(counts[:-1], out=starts[1:])
+    played = np.flatnonzero(counts)
+
+    season_sums = np.zeros((players, len(SEASON_FEATURES)))
+    if len(played):
+        season_sums[played] = np.add.reduceat(matrix.seasons, starts[played], axis=0)
+    remainder = matrix.features[:, _SEASON_COLUMNS] - season_sums
+    titles = SEASON_FEATURES.index("championships")
+    remainder[:, titles] = 0.0
+
+    owner = matrix.season_players
+    picks = starts[owner] + (rng.random((replicates, len(owner))) * counts[owner]).astype(np.int64)
+    drawn = np.zeros((replicates, players, len(SEASON_FEATURES)))
+    if len(played):
+        drawn[:, played] = np.add.reduceat(matrix.seasons[picks], starts[played], axis=1)
+    additive = remainder + drawn
+
+    features = np.repeat(matrix.features[np.newaxis], replicates, axis=0)
+    features[..., _SEASON_COLUMNS] = additive
+    documented = additive[..., titles]
+    overrides = matrix.championship_overrides
+    championships = np.where(overrides > documented, overrides, documented)
+    features[..., _COLUMN["championships"]] = championships
+    features[..., _COLUMN["missingChampionships"]] = championships - documented
+    return features
+
+
+def perturb_weights(rng: Any, replicates: int) -> tuple[Any, Any]:
+    """Budgets drawn around the published shares (same total) and jittered blend shares."""
+
+    budget, blend = weight_arrays()
+    total = budget.sum()
+    budgets = total * rng.dirichlet(WEIGHT_CONCENTRATION * budget / total, size=replicates)
+    ours = np.clip(
+        blend[:, 0] + rng.normal(0.0, BLEND_JITTER, (replicates, len(COMPONENT_KEYS))), 0.0, 1.0
+    )
+    return budgets, np.stack([ours, 1.0 - ours], axis=-1)
+
+
+def replicate_ranks(matrix: GoatMatrix, bdi: Any, seed: Any, replicates: int) -> Any:
+    """``(replicates, players)`` ranks under resampled seasons and perturbed weights."""
+
+    rng = np.random.default_rng(seed)
+    features = resample_features(matrix, rng, replicates)
+    budgets, blends = perturb_weights(rng, replicates)
+    scored = score_goat_matrix(raw_components(features), bdi, budgets, blends)
+    return scored.ranks.astype(np.int32)
+
+
+_band_matrix: GoatMatrix | None = None
+_band_bdi: Any = None
+
+
+def _init_band_worker(matrix: GoatMatrix, bdi: Any) -> None:
+    global _band_matrix, _band_bdi
+    _band_matrix = matrix
+    _band_bdi = bdi
+
+
+def _band_chunk(seed: Any, replicates: int) -> Any:
+    assert _band_matrix is not None
+    return replicate_ranks(_band_matrix, _band_bdi, seed, replicates)
+
+
+def rank_bands(
+    matrix: GoatMatrix, feed: BdiFeed, replicates: int, *, jobs: int = 1, seed: int = 0
+) -> Any:
+    """``(players, len(BAND_PERCENTILES))`` rank percentiles over ``replicates`` Monte Carlo runs.
+
+    Replicates are scored in batches of array math; ``jobs > 1`` spreads the
+    batches over worker processes (``0`` = every core). Each batch has its own
+    seed spawned from ``seed``, so the bands do not depend on ``jobs``.
+    """
+
+    require_numpy()
+    if replicates < 1:
+        raise ValueError(f"Rank bands need at least one replicate, not {replicates}")
+    bdi = bdi_ratios(matrix.name_keys, feed)
+    sizes = [min(_BAND_CHUNK, replicates - start) for start in range(0, replicates, _BAND_CHUNK)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(sizes) == 1:
+        ranks = [
+            replicate_ranks(matrix, bdi, chunk_seed, size)
+            for chunk_seed, size in zip(seeds, sizes, strict=True)
+        ]
+    else:
+        with ProcessPoolExecutor(
+            jobs, initializer=_init_band_worker, initargs=(matrix, bdi)
+        ) as pool:
+            ranks = list(pool.map(_band_chunk, seeds, sizes))
+    return np.percentile(
+        np.concatenate(ranks), BAND_PERCENTILES, axis=0, method="inverted_cdf"
+    ).T.astype(np.int64)
+
+
+def add_rank_bands(
+    payload: dict,
+    matrix: GoatMatrix,
+    feed: BdiFeed,
+    replicates: int,
+    *,
+    jobs: int = 1,
+    seed: int = 0,
+) -> dict:
+    """Attach a ``rankBand`` (p5/p50/p95) to every player in a ``goat_system.json`` payload."""
+
+    bands = rank_bands(matrix, feed, replicates, jobs=jobs, seed=seed)
+    rows = {person_id: row for row, person_id in enumerate(matrix.person_ids)}
+    labels = [f"p{percentile}" for percentile in BAND_PERCENTILES]
+    for entry in payload.get("players", []):
+        row = rows.get(str(entry.get("personId")))
+        if row is not None:
+            entry["rankBand"] = dict(zip(labels, bands[row].tolist(), strict=True))
+    payload["uncertainty"] = {
+        "method": "Season bootstrap per player with perturbed component weights",
+        "replicates": replicates,
+        "seed": seed,
+        "percentiles": list(BAND_PERCENTILES),
+        "weightConcentration": WEIGHT_CONCENTRATION,
+        "blendJitter": BLEND_JITTER,
+    }
+    return payload
+
+
+@dataclass(frozen=True)
+class GoatWeights:
+    """An editorial weighting: budgets and blends left out keep the published values."""
+
+    name: str = "published"
+    budget: Mapping[str, float] = field(default_factory=dict)
+    blend: Mapping[str, tuple[float, float]] = field(default_factory=dict)
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any], default_name: str = "") -> GoatWeights:
+        """Read ``{"name": ..., "budget": {...}, "blend": {key: [ours, bdi]}}``."""
+
+        return cls(
+            str(data.get("name") or default_name),
+            {key: float(value) for key, value in (data.get("budget") or {}).items()},
+            {
+                key: (float(ours), float(bdi))
+                for key, (ours, bdi) in (data.get("blend") or {}).items()
+            },
+        )
+
+    def arrays(self) -> tuple[Any, Any]:
+        unknown = sorted((set(self.budget) | set(self.blend)) - set(COMPONENT_KEYS))
+        if unknown:
+            raise ValueError(f"Unknown GOAT components in {self.name!r}: {', '.join(unknown)}")
+        return weight_arrays({**COMPONENT_BUDGET, **self.budget}, {**BLEND_WEIGHTS, **self.blend})
+
+
+@dataclass
+class Reweighting:
+    """Scores of every player under a batch of weightings (one row per weighting)."""
+
+    names: list[str]
+    person_ids: list[str]
+    scores: Any  # (weightings, players)
+    ranks: Any
+    tiers: Any
+
+    def rank_diffs(self, baseline: int = 0) -> Any:
+        """Places gained under each weighting relative to ``baseline``; positive moved up."""
+
+        return self.ranks[baseline] - self.ranks
+
+    def movers(self, index: int, *, baseline: int = 0, limit: int = 10) -> list[dict[str, Any]]:
+        """The ``limit`` biggest rank changes under weighting ``index``, largest first."""
+
+        diffs = self.rank_diffs(baseline)[index]
+        order = np.argsort(-np.abs(diffs), kind="stable")[:limit]
+        return [
+            {
+                "personId": self.person_ids[row],
+                "rank": int(self.ranks[index, row]),
+                "baselineRank": int(self.ranks[baseline, row]),
+                "change": int(diffs[row]),
+                "goatScore": float(self.scores[index, row]),
+                "tier": self.tiers[index, row],
+            }
+            for row in order.tolist()
+            if diffs[row]
+        ]
+
+
+def reweight_goat_scores(
+    weightings: Sequence[GoatWeights],
+    *,
+    matrix: GoatMatrix | None = None,
+    feed: BdiFeed | None = None,
+) -> Reweighting:
+    """Recompute ``goatScore``, ``rank`` and ``tier`` for every player under each weighting.
+
+    All weightings are scored in one batch over the cached matrix (by default
+    the one saved by the last GOAT build) and the BDI feed, so trying dozens
+    of budgets costs milliseconds rather than a ``PlayerStatistics`` rescan.
+    """
+
+    require_numpy()
+    if not weightings:
+        raise ValueError("reweight_goat_scores needs at least one weighting")
+    if matrix is None:
+        matrix = load_goat_matrix()
+        if matrix is None:
+            raise FileNotFoundError("No GOAT matrix cached; run scripts/build_insights.py first")
+    if feed is None:
+        feed = load_bdi_components()
+    budgets, blends = zip(*(weights.arrays() for weights in weightings), strict=True)
+    scored = score_goat_matrix(
+        matrix.raw,
+        bdi_ratios(matrix.name_keys, feed),
+        np.stack(budgets),
+        np.stack(blends),
+        bdi_tiers(matrix.name_keys, feed),
+    )
+    return Reweighting(
+        [weights.name for weights in weightings],
+        matrix.person_ids,
+        scored.scores,
+        scored.ranks,
+        scored.tiers,
+    )
+
+
+def load_weightings(path: Path) -> list[GoatWeights]:
+    """Weightings from a JSON list (or ``{"weightings": [...]}``) of :meth:`GoatWeights.from_mapping` objects."""
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if isinstance(data, Mapping):
+        data = data.get("weightings") or []
+    return [
+        GoatWeights.from_mapping(entry, default_name=f"weighting {index}")
+        for index, entry in enumerate(data, start=1)
+    ]
+
+
+def _print_what_if(result: Reweighting, names: Mapping[str, str], limit: int) -> None:
+    for index, name in enumerate(result.names[1:], start=1):
+        diffs = result.rank_diffs()[index]
+        moved = int(np.count_nonzero(diffs))
+        print(f"{name}: {moved:,} players change rank")
+        for mover in result.movers(index, limit=limit):
+            label = names.get(mover["personId"]) or mover["personId"]
+            print(
+                f"  {mover['baselineRank']:>5} → {mover['rank']:<5} {mover['change']:+d}  {label}"
+                f"  ({mover['goatScore']:.1f}, {mover['tier']})"
+            )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Rescore goat_system.json from the persisted GOAT matrix and the current BDI feed."
+    )
+    parser.add_argument("--goat-system", type=Path, default=GOAT_SYSTEM_PATH)
+    parser.add_argument(
+        "--what-if",
+        type=Path,
+        metavar="WEIGHTINGS_JSON",
+        help="Compare these weightings against the published one instead of rescoring.",
+    )
+    parser.add_argument(
+        "--limit", type=int, default=10, help="Biggest movers listed per weighting."
+    )
+    parser.add_argument(
+        "--rank-bands",
+        type=int,
+        default=0,
+        metavar="REPLICATES",
+        help="Also add p5/p50/p95 rank bands from this many Monte Carlo replicates.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Score rank-band replicates in this many worker processes (0 = one per core).",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the rank-band replicates.")
+    args = parser.parse_args(argv)
+
+    require_numpy()
+    matrix = load_goat_matrix()
+    if matrix is None:
+        raise SystemExit("No GOAT matrix cached; run scripts/build_insights.py first")
+    payload = json.loads(args.goat_system.read_text(encoding="utf-8"))
+    if args.what_if is not None:
+        try:
+            weightings = [GoatWeights(), *load_weightings(args.what_if)]
+            result = reweight_goat_scores(weightings, matrix=matrix)
+        except ValueError as exc:
+            raise SystemExit(str(exc)) from exc
+        names = {
+            str(entry.get("personId")): entry.get("name") for entry in payload.get("players", [])
+        }
+        _print_what_if(result, names, args.limit)
+        return
+    feed = load_bdi_components()
+    payload = rescore_goat_system(payload, matrix, feed)
+    if args.rank_bands:
+        add_rank_bands(payload, matrix, feed, args.rank_bands, jobs=args.jobs, seed=args.seed)
+    write_json(args.goat_system, payload, indent=None)
+    print(f"Rescored {len(payload['players']):,} players from {len(matrix):,} matrix rows")
+
+
+if __name__ == "__main__":
+    main()
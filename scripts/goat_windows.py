@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""Rolling-window GOAT scores for every N-season window in history.
+
+``goat_recent.json`` scores one fixed window (the last three seasons) for the
+active pool, and every call rescans the rows it needs. This builder keeps
+per-player, per-season totals instead and turns them into prefix sums along
+the season axis. Totals for every window of any span are then one
+subtraction, ``prefix[:, start + span] - prefix[:, start]``, for all players
+and all windows at once. The production, impact and availability scores
+follow with array math.
+
+Scores use the recent GOAT formula (:mod:`scripts.goat_metrics`): per-36
+production and plus-minus impact, scaled down for small samples, plus
+availability against an ``82 × span`` game season. Each window is normalized
+against everyone who played in it. The window ending in 2024 with span 3
+therefore matches ``goat_recent.json`` over the full player pool, and the
+same call answers questions like "recent GOAT as of 2016" or "best three-year
+peak for every player"::
+
+    windows = accumulator.totals().scores(3)   # a fed SeasonTotalsAccumulator
+    windows.leaderboard(end_season=2016)
+
+Outputs:
+
+* ``public/data/goat_windows.json``: the leaderboard of every window, for
+  each span.
+* ``public/data/goat_peaks.json``: each player's best window for each span.
+
+Seasons are start years, as in :mod:`scripts.game_dimensions`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Sequence
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.accumulators import Count, FirstSeen, Keyed, MergeableState, Record, Sum  # noqa: E402
+from scripts.game_dimensions import season_from_date  # noqa: E402
+from scripts.goat_metrics import (  # noqa: E402
+    RECENT_COMPONENT_WEIGHTS,
+    RECENT_MIN_GAMES,
+    RECENT_MIN_MINUTES,
+    format_season_window,
+)
+from scripts.json_output import write_json  # noqa: E402
+from scripts.numpy_support import np, numpy_guard  # noqa: E402
+from scripts.player_stats_reader import PlayerStatisticsStreamError, Projection  # noqa: E402
+from scripts.player_stats_scan import scan_player_statistics  # noqa: E402
+
+WINDOWS_OUTPUT_PATH = ROOT / "public" / "data" / "goat_windows.json"
+PEAKS_OUTPUT_PATH = ROOT / "public" / "data" / "goat_peaks.json"
+DEFAULT_SPANS = (1, 3, 5)
+LEADERBOARD_SIZE = 25
+GAMES_PER_SEASON = 82
+METRIC = "Rolling GOAT index"
+
+# Season-total columns, in array order.
+STATS = (
+    "games",
+    "wins",
+    "minutes",
+    "points",
+    "assists",
+    "rebounds",
+    "steals",
+    "blocks",
+    "plusMinus",
+)
+_STAT = {name: index for index, name in enumerate(STATS)}
+
+
+# Scoring needs NumPy; collecting the totals does not.
+require_numpy = numpy_guard("Rolling GOAT windows")
+
+
+def _season_record() -> Record:
+    return Record(
+        games=Count(),
+        wins=Count(),
+        minutes=Sum(),
+        points=Sum(),
+        assists=Sum(),
+        rebounds=Sum(),
+        steals=Sum(),
+        blocks=Sum(),
+        plusMinus=Sum(),
+    )
+
+
+def _name_record() -> Record:
+    return Record(firstName=FirstSeen(), lastName=FirstSeen())
+
+
+class SeasonTotalsAccumulator(MergeableState):
+    """Collect per-player, per-season totals for :class:`SeasonTotals`.
+
+    Like the recent GOAT window, only rows with minutes played count.
+    """
+
+    columns = Projection(
+        "GoatWindowRow",
+        {
+            "personId": "str",
+            "firstName": "category",
+            "lastName": "category",
+            "seasonYear": ("gameDate", season_from_date),
+            "win": "flag",
+            "numMinutes": "float",
+            "points": "float",
+            "assists": "float",
+            "reboundsTotal": "float",
+            "steals": "float",
+            "blocks": "float",
+            "plusMinusPoints": "float",
+        },
+    )
+
+    def __init__(self) -> None:
+        self.seasons: Keyed[tuple[str, int], Record] = Keyed(_season_record)
+        self.names: Keyed[str, Record] = Keyed(_name_record)
+
+    def consume(self, row: Any) -> None:
+        person_id = row.personId
+        season_year = row.seasonYear
+        if not person_id or season_year is None:
+            return
+
+        minutes = row.numMinutes or 0.0
+        if minutes <= 0:
+            return
+
+        self.seasons[(person_id, season_year)].update(
+            games=1,
+            wins=row.win,
+            minutes=minutes,
+            points=row.points or 0.0,
+            assists=row.assists or 0.0,
+            rebounds=row.reboundsTotal or 0.0,
+            steals=row.steals or 0.0,
+            blocks=row.blocks or 0.0,
+            plusMinus=row.plusMinusPoints or 0.0,
+        )
+        self.names[person_id].update(firstName=row.firstName, lastName=row.lastName)
+
+    def totals(self) -> SeasonTotals:
+        require_numpy()
+        person_ids = sorted({person_id for person_id, _ in self.seasons})
+        seasons = [season for _, season in self.seasons]
+        first_season = min(seasons, default=0)
+        season_count = max(seasons, default=-1) - first_season + 1
+        rows = {person_id: row for row, person_id in enumerate(person_ids)}
+        values = np.zeros((len(person_ids), season_count, len(STATS)))
+        for (person_id, season), record in self.seasons.items():
+            values[rows[person_id], season - first_season] = [
+                record[name].finalize() for name in STATS
+            ]
+        names = []
+        for person_id in person_ids:
+            name = self.names[person_id].finalize()
+            names.append(f"{name['firstName']} {name['lastName']}".strip() or person_id)
+        return SeasonTotals(person_ids, names, first_season, values)
+
+
+@dataclass
+class SeasonTotals:
+    """``values[player, season - first_season, stat]`` in :data:`STATS` order."""
+
+    person_ids: list[str]
+    names: list[str]
+    first_season: int
+    values: Any
+
+    @property
+    def season_count(self) -> int:
+        return self.values.shape[1]
+
+    def prefix(self) -> Any:
+        """Cumulative totals with a leading zero season: ``prefix[:, s]`` sums seasons before ``s``."""
+
+        prefix = np.zeros((len(self.person_ids), self.season_count + 1, len(STATS)))
+        np.cumsum(self.values, axis=1, out=prefix[:, 1:])
+        return prefix
+
+    def window_totals(self, span: int, prefix: Any = None) -> Any:
+        """``(players, windows, stats)`` totals for every ``span``-season window."""
+
+        if span < 1:
+            raise ValueError(f"Window span must be at least one season, not {span}")
+        if prefix is None:
+            prefix = self.prefix()
+        return prefix[:, span:] - prefix[:, :-span]
+
+    def scores(self, span: int, prefix: Any = None) -> WindowScores:
+        totals = self.window_totals(span, prefix)
+        scores, components = score_windows(totals, span)
+        played = totals[..., _STAT["games"]] > 0
+        starts = np.arange(totals.shape[1]) + self.first_season
+        return WindowScores(
+            span,
+            starts,
+            self.person_ids,
+            self.names,
+            totals,
+            components,
+            scores,
+            _rank(scores, played),
+        )
+
+
+def score_windows(totals: Any, span: int) -> tuple[Any, Any]:
+    """Rolling GOAT scores and components for ``(players, windows, stats)`` totals.
+
+    Mirrors the recent GOAT scorer in :mod:`scripts.goat_metrics`, with the
+    season length scaled to ``span`` seasons and the component maxima taken
+    per window.
+    """
+
+    require_numpy()
+    stat = {name: totals[..., index] for name, index in _STAT.items()}
+    games = stat["games"]
+    minutes = stat["minutes"]
+    played = minutes > 0
+    per_minute = np.where(played, minutes, 1.0)
+    per36 = {
+        name: np.where(played, (values / per_minute) * 36.0, 0.0)
+        for name, values in (
+            ("points", stat["points"]),
+            ("assists", stat["assists"]),
+            ("rebounds", stat["rebounds"]),
+            ("stocks", stat["steals"] + stat["blocks"]),
+        )
+    }
+    max_games = GAMES_PER_SEASON * span
+    availability = (
+        np.minimum(games / max_games, 1.0) + np.minimum(minutes / (max_games * 36.0), 1.0)
+    ) / 2.0
+    plus_minus = np.where(games > 0, stat["plusMinus"] / np.maximum(games, 1.0), 0.0)
+    candidates = [np.ones_like(games)]
+    if RECENT_MIN_GAMES > 0:
+        candidates.append(games / RECENT_MIN_GAMES)
+    if RECENT_MIN_MINUTES > 0:
+        candidates.append(minutes / RECENT_MIN_MINUTES)
+    sample_scale = np.maximum(0.0, np.minimum.reduce(candidates))
+
+    production = (
+        np.maximum(
+            per36["points"]
+            + 1.5 * per36["assists"]
+            + 1.1 * per36["rebounds"]
+            + 3.0 * per36["stocks"],
+            0.0,
+        )
+        * sample_scale
+    )
+    components = {
+        "production": np.where(played, production, 0.0),
+        "impact": np.where(played, np.maximum(plus_minus, 0.0) * sample_scale, 0.0),
+        "availability": np.where(played, availability, 0.0),
+    }
+
+    total = np.zeros(games.shape)
+    for key, weight in RECENT_COMPONENT_WEIGHTS.items():
+        value = components[key]
+        ceiling = value.max(axis=0, initial=0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            total = total + np.where(ceiling > 0, (value / ceiling) * weight, 0.0)
+    return np.round(total, 1), components
+
+
+def _rank(scores: Any, played: Any) -> Any:
+    """Per-window ranks (1 = best, ties in player order); 0 for players absent from a window."""
+
+    order = np.argsort(np.where(played, -scores, np.inf), axis=0, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, scores.shape[0] + 1)[:, np.newaxis], axis=0)
+    return np.where(played, ranks, 0)
+
+
+@dataclass
+class WindowScores:
+    """Scores of every player in every ``span``-season window; windows start at ``starts``."""
+
+    span: int
+    starts: Any
+    person_ids: list[str]
+    names: list[str]
+    totals: Any  # (players, windows, stats)
+    components: dict[str, Any]  # name -> (players, windows)
+    scores: Any  # (players, windows)
+    ranks: Any  # (players, windows); 0 where the player did not play
+
+    def window(self, *, start: int | None = None, end_season: int | None = None) -> int:
+        """Column of the window starting at ``start`` or ending with ``end_season``."""
+
+        if start is None:
+            if end_season is None:
+                raise ValueError("Pass start or end_season")
+            start = end_season - self.span + 1
+        column = start - int(self.starts[0]) if len(self.starts) else -1
+        if not 0 <= column < len(self.starts):
+            raise ValueError(f"No {self.span}-season window starts in {start}")
+        return column
+
+    def entry(self, row: int, column: int) -> dict[str, Any]:
+        totals = self.totals[row, column]
+        return {
+            "rank": int(self.ranks[row, column]),
+            "personId": self.person_ids[row],
+            "name": self.names[row],
+            "score": float(self.scores[row, column]),
+            "games": int(totals[_STAT["games"]]),
+            "wins": int(totals[_STAT["wins"]]),
+            "points": int(round(totals[_STAT["points"]])),
+            "assists": int(round(totals[_STAT["assists"]])),
+            "rebounds": int(round(totals[_STAT["rebounds"]])),
+        }
+
+    def leaderboard(
+        self,
+        *,
+        start: int | None = None,
+        end_season: int | None = None,
+        limit: int = LEADERBOARD_SIZE,
+    ) -> list[dict[str, Any]]:
+        column = self.window(start=start, end_season=end_season)
+        ranks = self.ranks[:, column]
+        ranked = np.flatnonzero(ranks)
+        ranked = ranked[np.argsort(ranks[ranked], kind="stable")]
+        if limit > 0:
+            ranked = ranked[:limit]
+        return [self.entry(row, column) for row in ranked.tolist()]
+
+    def peaks(self) -> Any:
+        """Per player, the window column with the best score (earliest on ties)."""
+
+        return np.argmax(np.where(self.ranks > 0, self.scores, -np.inf), axis=1)
+
+    def label(self, column: int) -> str:
+        return format_season_window(int(self.starts[column]), self.span)
+
+
+def _timestamp() -> str:
+    return datetime.now(UTC).isoformat(timespec="seconds")
+
+
+def build_window_payloads(
+    totals: SeasonTotals,
+    spans: Sequence[int] = DEFAULT_SPANS,
+    *,
+    limit: int = LEADERBOARD_SIZE,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """The ``goat_windows.json`` and ``goat_peaks.json`` payloads."""
+
+    require_numpy()
+    prefix = totals.prefix()
+    generated_at = _timestamp()
+    windows_payload: dict[str, Any] = {
+        "generatedAt": generated_at,
+        "metric": METRIC,
+        "weights": RECENT_COMPONENT_WEIGHTS,
+        "spans": [],
+    }
+    peaks: dict[str, dict[str, Any]] = {
+        person_id: {"name": name, "peaks": []}
+        for person_id, name in zip(totals.person_ids, totals.names, strict=True)
+    }
+    for span in spans:
+        if span > totals.season_count:
+            continue
+        scored = totals.scores(span, prefix)
+        windows = []
+        for column, start in enumerate(scored.starts.tolist()):
+            windows.append(
+                {
+                    "start": start,
+                    "end": start + span - 1,
+                    "label": scored.label(column),
+                    "players": int(np.count_nonzero(scored.ranks[:, column])),
+                    "leaders": scored.leaderboard(start=start, limit=limit),
+                }
+            )
+        windows_payload["spans"].append({"span": span, "windows": windows})
+
+        for row, column in enumerate(scored.peaks().tolist()):
+            if not scored.ranks[row, column]:
+                continue
+            entry = scored.entry(row, column)
+            peaks[scored.person_ids[row]]["peaks"].append(
+                {
+                    "span": span,
+                    "start": int(scored.starts[column]),
+                    "label": scored.label(column),
+                    "score": entry["score"],
+                    "rank": entry["rank"],
+                    "games": entry["games"],
+                }
+            )
+
+    peaks_payload = {
+        "generatedAt": generated_at,
+        "metric": METRIC,
+        "spans": [entry["span"] for entry in windows_payload["spans"]],
+        "players": peaks,
+    }
+    return windows_payload, peaks_payload
+
+
+def build_goat_windows(
+    accumulator: SeasonTotalsAccumulator | None = None,
+    *,
+    spans: Sequence[int] = DEFAULT_SPANS,
+    limit: int = LEADERBOARD_SIZE,
+) -> None:
+    """Write both rolling-window payloads, scanning PlayerStatistics unless ``accumulator`` was fed."""
+
+    if accumulator is None:
+        accumulator = SeasonTotalsAccumulator()
+        try:
+            scan_player_statistics([accumulator])
+        except PlayerStatisticsStreamError as exc:
+            raise SystemExit(str(exc)) from exc
+    windows_payload, peaks_payload = build_window_payloads(accumulator.totals(), spans, limit=limit)
+    write_json(WINDOWS_OUTPUT_PATH, windows_payload, indent=None)
+    write_json(PEAKS_OUTPUT_PATH, peaks_payload, indent=None)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Build rolling-window GOAT leaderboards and peaks."
+    )
+    parser.add_argument(
+        "--span",
+        type=int,
+        action="append",
+        help=f"Window length in seasons; repeat for several (default: {', '.join(map(str, DEFAULT_SPANS))}).",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=LEADERBOARD_SIZE,
+        help="Players per window leaderboard (0 = all).",
+    )
+    args = parser.parse_args(argv)
+    spans = sorted(set(args.span or DEFAULT_SPANS))
+    if spans[0] < 1:
+        parser.error("--span must be at least 1")
+    build_goat_windows(spans=spans, limit=args.limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -26,85 +26,95 @@ Each entry mirrors the payload returned by ``fetchCareerStats`` in
 
 from __future__ import annotations
 
+import argparse
 import csv
 import json
 import re
 import sys
 import unicodedata
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable
+from typing import Any
 
 ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from scripts.accumulators import Count, Keyed, LastSeen, MergeableState, Record, SetUnion, Sum  # noqa: E402
+from scripts.game_dimensions import POSTSEASON, REGULAR, game_phase, season_from_date  # noqa: E402
+from scripts.player_stats_index import get_player_games  # noqa: E402
+from scripts.player_stats_reader import PlayerStatisticsStreamError, Projection  # noqa: E402
+from scripts.player_stats_scan import scan_player_statistics  # noqa: E402
+from scripts.player_stats_state import open_refresh  # noqa: E402
+
 OUTPUT_PATH = ROOT / "public" / "data" / "history" / "player_careers.json"
 PLAYERS_CSV = ROOT / "Players.csv"
 BDL_INDEX_PATH = ROOT / "public" / "data" / "history" / "players.index.json"
 
 
 @dataclass
-class Totals:
-    games: int = 0
-    minutes: float = 0.0
-    points: float = 0.0
-    rebounds: float = 0.0
-    assists: float = 0.0
-    steals: float = 0.0
-    blocks: float = 0.0
-    turnovers: float = 0.0
-    fouls: float = 0.0
-    fgm: float = 0.0
-    fga: float = 0.0
-    fg3m: float = 0.0
-    fg3a: float = 0.0
-    ftm: float = 0.0
-    fta: float = 0.0
-    oreb: float = 0.0
-    dreb: float = 0.0
-
-    def add_game(self, row: dict[str, str]) -> None:
-        self.games += 1
-        self.minutes += _parse_minutes(row.get("numMinutes"))
-        self.points += _to_float(row.get("points"))
-        self.rebounds += _to_float(row.get("reboundsTotal"))
-        self.assists += _to_float(row.get("assists"))
-        self.steals += _to_float(row.get("steals"))
-        self.blocks += _to_float(row.get("blocks"))
-        self.turnovers += _to_float(row.get("turnovers"))
-        self.fouls += _to_float(row.get("foulsPersonal"))
-        self.fgm += _to_float(row.get("fieldGoalsMade"))
-        self.fga += _to_float(row.get("fieldGoalsAttempted"))
-        self.fg3m += _to_float(row.get("threePointersMade"))
-        self.fg3a += _to_float(row.get("threePointersAttempted"))
-        self.ftm += _to_float(row.get("freeThrowsMade"))
-        self.fta += _to_float(row.get("freeThrowsAttempted"))
-        self.oreb += _to_float(row.get("reboundsOffensive"))
-        self.dreb += _to_float(row.get("reboundsDefensive"))
+class Totals(MergeableState):
+    games: Count = field(default_factory=Count)
+    minutes: Sum = field(default_factory=Sum)
+    points: Sum = field(default_factory=Sum)
+    rebounds: Sum = field(default_factory=Sum)
+    assists: Sum = field(default_factory=Sum)
+    steals: Sum = field(default_factory=Sum)
+    blocks: Sum = field(default_factory=Sum)
+    turnovers: Sum = field(default_factory=Sum)
+    fouls: Sum = field(default_factory=Sum)
+    fgm: Sum = field(default_factory=Sum)
+    fga: Sum = field(default_factory=Sum)
+    fg3m: Sum = field(default_factory=Sum)
+    fg3a: Sum = field(default_factory=Sum)
+    ftm: Sum = field(default_factory=Sum)
+    fta: Sum = field(default_factory=Sum)
+    oreb: Sum = field(default_factory=Sum)
+    dreb: Sum = field(default_factory=Sum)
+
+    def add_game(self, row: Any) -> None:
+        self.games.update()
+        self.minutes.update(row.numMinutes)
+        self.points.update(row.points)
+        self.rebounds.update(row.reboundsTotal)
+        self.assists.update(row.assists)
+        self.steals.update(row.steals)
+        self.blocks.update(row.blocks)
+        self.turnovers.update(row.turnovers)
+        self.fouls.update(row.foulsPersonal)
+        self.fgm.update(row.fieldGoalsMade)
+        self.fga.update(row.fieldGoalsAttempted)
+        self.fg3m.update(row.threePointersMade)
+        self.fg3a.update(row.threePointersAttempted)
+        self.ftm.update(row.freeThrowsMade)
+        self.fta.update(row.freeThrowsAttempted)
+        self.oreb.update(row.reboundsOffensive)
+        self.dreb.update(row.reboundsDefensive)
 
     def serialise(self) -> dict[str, int]:
-        return {
-            "games": int(self.games),
-            "minutes": int(round(self.minutes)),
-            "points": int(round(self.points)),
-            "rebounds": int(round(self.rebounds)),
-            "assists": int(round(self.assists)),
-            "steals": int(round(self.steals)),
-            "blocks": int(round(self.blocks)),
-            "turnovers": int(round(self.turnovers)),
-            "fouls": int(round(self.fouls)),
-            "fgm": int(round(self.fgm)),
-            "fga": int(round(self.fga)),
-            "fg3m": int(round(self.fg3m)),
-            "fg3a": int(round(self.fg3a)),
-            "ftm": int(round(self.ftm)),
-            "fta": int(round(self.fta)),
-            "oreb": int(round(self.oreb)),
-            "dreb": int(round(self.dreb)),
-        }
+        payload = {"games": self.games.finalize()}
+        for name in (
+            "minutes",
+            "points",
+            "rebounds",
+            "assists",
+            "steals",
+            "blocks",
+            "turnovers",
+            "fouls",
+            "fgm",
+            "fga",
+            "fg3m",
+            "fg3a",
+            "ftm",
+            "fta",
+            "oreb",
+            "dreb",
+        ):
+            payload[name] = int(round(getattr(self, name).finalize()))
+        return payload
 
 
 @dataclass
@@ -129,7 +139,7 @@ class CareerRecord:
     postseason_seasons: list[int]
 
     def regular_games(self) -> int:
-        return self.regular.games
+        return self.regular.games.finalize()
 
     def to_payload(self) -> dict[str, dict[str, object]]:
         return {
@@ -182,32 +192,11 @@ def _parse_minutes(value: str | None) -> float:
     return mins * 60.0 + secs
 
 
-def _classify_game(game_type: str | None) -> str | None:
-    if game_type is None:
-        return None
-    label = game_type.strip().lower()
-    if not label:
-        return None
-    if "playoff" in label or "play-in" in label:
-        return "postseason"
-    if "regular" in label:
-        return "regular"
-    return None
+_CAREER_SEGMENTS = {**{phase: "postseason" for phase in POSTSEASON}, REGULAR: "regular"}
 
 
-def _season_from_date(raw: str | None) -> int | None:
-    if raw is None:
-        return None
-    text = raw.strip()
-    if not text:
-        return None
-    try:
-        timestamp = datetime.fromisoformat(text.replace(" ", "T"))
-    except ValueError:
-        return None
-    year = timestamp.year
-    month = timestamp.month
-    return year if month >= 7 else year - 1
+def _career_segment(game_id: str, game_type: str, game_label: str) -> str | None:
+    return _CAREER_SEGMENTS.get(game_phase(game_id, game_type, game_label))
 
 
 def _normalize_name(value: str | None) -> str:
@@ -267,16 +256,33 @@ def _parse_height_inches(value: str | None) -> int | None:
         return None
 
 
-def _iter_rows() -> Iterable[dict[str, str]]:
-    from scripts.build_insights import (
-        PlayerStatisticsStreamError,
-        iter_player_statistics_rows,
-    )
-
+def _scan_archive(*, incremental: bool = False) -> CareerAccumulator:
+    refresh = open_refresh("player_careers", CareerAccumulator, incremental=incremental)
     try:
-        yield from iter_player_statistics_rows()
+        scan_player_statistics([refresh.consumer])
     except PlayerStatisticsStreamError as error:
         raise SystemExit(str(error)) from error
+    return refresh.commit()
+
+
+def player_career(person_id: str) -> dict[str, object]:
+    """Career payload for one player, read from the per-player index instead of a scan."""
+
+    accumulator = CareerAccumulator()
+    for record in get_player_games(person_id, CareerAccumulator.columns):
+        accumulator.consume(record)
+    person_id = str(person_id).strip()
+    if person_id not in accumulator.players:
+        return {}
+    segments = accumulator.players[person_id]
+    season_sets = accumulator.season_sets[person_id]
+    return {
+        phase: {
+            "totals": segments[phase].serialise(),
+            "seasons": sorted(season_sets[phase].finalize()),
+        }
+        for phase in ("regular", "postseason")
+    }
 
 
 def _load_stats_metadata() -> tuple[dict[str, PlayerMeta], dict[str, list[str]]]:
@@ -386,36 +392,85 @@ def _score_candidate(bdl: BdlPlayer, meta: PlayerMeta) -> int:
     return score
 
 
-def build_player_careers() -> None:
-    stats_meta, stats_by_name = _load_stats_metadata()
+def _phase_totals_record() -> Record:
+    return Record(regular=Totals(), postseason=Totals())
+
+
+def _phase_seasons_record() -> Record:
+    return Record(regular=SetUnion(), postseason=SetUnion())
+
+
+class CareerAccumulator(MergeableState):
+    """Fold player-game rows into regular-season and postseason totals."""
+
+    columns = Projection(
+        "CareerRow",
+        {
+            "personId": "str",
+            "firstName": "str",
+            "lastName": "str",
+            "phase": (("gameId", "gameType", "gameLabel"), _career_segment),
+            "season": ("gameDate", season_from_date),
+            "numMinutes": _parse_minutes,
+            "points": _to_float,
+            "reboundsTotal": _to_float,
+            "assists": _to_float,
+            "steals": _to_float,
+            "blocks": _to_float,
+            "turnovers": _to_float,
+            "foulsPersonal": _to_float,
+            "fieldGoalsMade": _to_float,
+            "fieldGoalsAttempted": _to_float,
+            "threePointersMade": _to_float,
+            "threePointersAttempted": _to_float,
+            "freeThrowsMade": _to_float,
+            "freeThrowsAttempted": _to_float,
+            "reboundsOffensive": _to_float,
+            "reboundsDefensive": _to_float,
+        },
+    )
+
+    def __init__(self) -> None:
+        self.players: Keyed[str, Record] = Keyed(_phase_totals_record)
+        self.season_sets: Keyed[str, Record] = Keyed(_phase_seasons_record)
+        self.fallback_names: Keyed[str, LastSeen] = Keyed(LastSeen)
+        self.row_count = Count()
 
-    players: dict[str, dict[str, Totals]] = defaultdict(lambda: {
-        "regular": Totals(),
-        "postseason": Totals(),
-    })
-    season_sets: dict[str, dict[str, set[int]]] = defaultdict(lambda: {
-        "regular": set(),
-        "postseason": set(),
-    })
-    fallback_names: dict[str, tuple[str, str]] = {}
-
-    row_count = 0
-    for row in _iter_rows():
-        row_count += 1
-        person_id = (row.get("personId") or "").strip()
+    def consume(self, row: Any) -> None:
+        self.row_count.update()
+        person_id = row.personId
         if not person_id:
-            continue
-        phase = _classify_game(row.get("gameType"))
+            return
+        phase = row.phase
         if phase is None:
-            continue
-        season = _season_from_date(row.get("gameDate"))
-        players[person_id][phase].add_game(row)
+            return
+        season = row.season
+        self.players[person_id][phase].add_game(row)
         if season is not None:
-            season_sets[person_id][phase].add(season)
-        first = (row.get("firstName") or "").strip()
-        last = (row.get("lastName") or "").strip()
+            self.season_sets[person_id][phase].update(season)
+        first = row.firstName
+        last = row.lastName
         if first or last:
-            fallback_names[person_id] = (first, last)
+            self.fallback_names[person_id].update((first, last))
+
+
+def build_player_careers(
+    accumulator: CareerAccumulator | None = None, *, incremental: bool = False
+) -> None:
+    """Write ``player_careers.json``; scans the archive unless ``accumulator`` is pre-filled.
+
+    ``incremental`` restores the persisted career state and folds in only the
+    rows past its watermark (see :mod:`scripts.player_stats_state`).
+    """
+
+    stats_meta, stats_by_name = _load_stats_metadata()
+
+    if accumulator is None:
+        accumulator = _scan_archive(incremental=incremental)
+    players = accumulator.players
+    season_sets = accumulator.season_sets
+    fallback_names = accumulator.fallback_names.finalize()
+    row_count = accumulator.row_count.finalize()
 
     records: dict[str, CareerRecord] = {}
     for person_id, segments in players.items():
@@ -433,8 +488,8 @@ def build_player_careers() -> None:
                 height_inches=None,
                 weight_lb=None,
             )
-        regular_seasons = sorted(season_sets[person_id]["regular"])
-        postseason_seasons = sorted(season_sets[person_id]["postseason"])
+        regular_seasons = sorted(season_sets[person_id]["regular"].finalize())
+        postseason_seasons = sorted(season_sets[person_id]["postseason"].finalize())
         records[person_id] = CareerRecord(
             person_id=person_id,
             meta=meta,
@@ -514,5 +569,27 @@ def build_player_careers() -> None:
     )
 
 
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Generate cached career totals for the history explorer."
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Fold only PlayerStatistics rows past the persisted watermark into the saved career state.",
+    )
+    parser.add_argument(
+        "--player", help="Print one personId's career totals from the per-player index."
+    )
+    args = parser.parse_args(argv)
+    if args.player:
+        print(json.dumps(player_career(args.player), indent=2))
+        return
+    build_player_careers(incremental=args.incremental)
+
+
 if __name__ == "__main__":
-    build_player_careers()
+    # Import through the package so persisted state names scripts.history.build_player_careers.
+    from scripts.history.build_player_careers import main as package_main
+
+    package_main()
@@ -0,0 +1,26 @@
+"""Shared writer for the ``public/data`` JSON snapshots.
+
+Every builder that publishes a snapshot goes through :func:`write_json`, so
+regenerating a file from any entry point (for example ``goat_system.json``
+from ``build_insights.py`` or from ``goat_scoring.py``) yields the same bytes:
+UTF-8 without ASCII escaping, either two-space indented or compact, and a
+trailing newline.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+
+def write_json(path: Path, payload: Any, *, indent: int | None = 2) -> None:
+    """Write ``payload`` to ``path``; ``indent=None`` writes compact separators."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as handle:
+        if indent is None:
+            json.dump(payload, handle, ensure_ascii=False, separators=(",", ":"))
+        else:
+            json.dump(payload, handle, indent=indent, ensure_ascii=False)
+        handle.write("\n")
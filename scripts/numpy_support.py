@@ -0,0 +1,28 @@
+"""The one place that imports NumPy for the array stages.
+
+The PlayerStatistics scan runs on plain CPython; GOAT scoring, rolling GOAT
+windows, team ratings and the ``--backend numpy`` scan are array math. Those
+modules take ``np`` from here (``None`` when NumPy is missing, so they still
+import) and build their guard with :func:`numpy_guard`.
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+try:
+    import numpy as np
+except ImportError:  # the pure-Python scan must keep importing without it
+    np = None
+
+INSTALL_HINT = "install it with pip install -r requirements.txt"
+
+
+def numpy_guard(feature: str, hint: str = INSTALL_HINT) -> Callable[[], None]:
+    """A ``require_numpy()`` that raises ``RuntimeError`` naming ``feature`` when NumPy is missing."""
+
+    def require_numpy() -> None:
+        if np is None:
+            raise RuntimeError(f"{feature} needs NumPy; {hint}")
+
+    return require_numpy
@@ -22,6 +22,11 @@ from pathlib import Path
 from typing import Any, Iterable
 
 ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.games_table import GameRecord, scan_games  # noqa: E402
+
 PUBLIC_DATA_DIR = ROOT / "public" / "data"
 DEFAULT_SEASON = "2024"
 DEFAULT_PLAYERS_FEED = "https://data.nba.com/data/v2015/json/mobile_teams/nba/{season}/players/playerlist.json"
@@ -267,44 +272,46 @@ def _summarize_team_histories(histories: dict[str, list[TeamEra]]) -> dict[str,
     return {"teamCount": len(histories), "eraCount": eras, "abbrevTrimmed": trimmed_abbrev}
 
 
-def _summarize_games_table() -> dict[str, Any]:
-    path = ROOT / "Games.csv"
-    seen_ids: set[str] = set()
-    duplicates: list[str] = []
-    invalid_dates: list[str] = []
-    seasons: dict[str, int] = defaultdict(int)
-    game_types: dict[str, int] = defaultdict(int)
-    with path.open("r", encoding="utf-8", newline="") as fh:
-        reader = csv.DictReader(fh)
-        for row in reader:
-            game_id = _clean_str(row.get("gameId"))
-            if not game_id:
-                continue
-            if game_id in seen_ids and len(duplicates) < 20:
-                duplicates.append(game_id)
-            seen_ids.add(game_id)
-            game_type = _clean_str(row.get("gameType")) or "Unknown"
-            game_types[game_type] += 1
-            raw_date = _clean_str(row.get("gameDate"))
-            if not raw_date:
-                invalid_dates.append(game_id)
-                continue
-            try:
-                dt = datetime.strptime(raw_date, "%Y-%m-%d %H:%M:%S")
-            except ValueError:
-                invalid_dates.append(game_id)
-                continue
-            seasons[_season_label(dt)] += 1
-    return {
-        "rowCount": len(seen_ids),
-        "duplicateIds": duplicates,
-        "invalidDateCount": len(invalid_dates),
-        "invalidDateSamples": invalid_dates[:10],
-        "seasonBreakdown": sorted(
-            ("%s" % season, count) for season, count in seasons.items()
-        ),
-        "gameTypeBreakdown": dict(sorted(game_types.items())),
-    }
+class GamesAudit:
+    """Audit counts over the parsed ``Games.csv`` records."""
+
+    def __init__(self) -> None:
+        self.seen_ids: set[str] = set()
+        self.duplicates: list[str] = []
+        self.invalid_dates: list[str] = []
+        self.seasons: dict[str, int] = defaultdict(int)
+        self.game_types: dict[str, int] = defaultdict(int)
+
+    def consume(self, record: GameRecord) -> None:
+        game_id = record.gameId
+        if not game_id:
+            return
+        if game_id in self.seen_ids and len(self.duplicates) < 20:
+            self.duplicates.append(game_id)
+        self.seen_ids.add(game_id)
+        self.game_types[record.gameType or "Unknown"] += 1
+        if record.start is None:
+            self.invalid_dates.append(game_id)
+            return
+        self.seasons[_season_label(record.start)] += 1
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "rowCount": len(self.seen_ids),
+            "duplicateIds": self.duplicates,
+            "invalidDateCount": len(self.invalid_dates),
+            "invalidDateSamples": self.invalid_dates[:10],
+            "seasonBreakdown": sorted(
+                ("%s" % season, count) for season, count in self.seasons.items()
+            ),
+            "gameTypeBreakdown": dict(sorted(self.game_types.items())),
+        }
+
+
+def _summarize_games_table(records: Iterable[GameRecord] | None = None) -> dict[str, Any]:
+    audit = GamesAudit()
+    scan_games([audit], records)
+    return audit.summary()
 
 
 def _positions_from_sources(official: dict[str, Any] | None, roster: dict[str, Any] | None) -> list[str]:
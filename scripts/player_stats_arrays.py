@@ -0,0 +1,380 @@
+"""Optional NumPy backend: ``PlayerStatistics`` columns as arrays and grouped reductions.
+
+The pure-Python scan hands every builder one typed record per player-game row
+and each builder folds it into dicts of accumulators, so a rebuild costs
+millions of Python-level updates. With NumPy installed, a
+:class:`~scripts.player_stats_scan.PlayerStatisticsScan` run with
+``backend="numpy"`` instead loads the projected columns once as a
+:class:`ColumnFrame` and passes it to each consumer's ``consume_frame``, which
+computes its totals with grouped reductions (:func:`numpy.bincount`,
+``ufunc.at``) and fills the same accumulators the row path would.
+
+Every column is *factorized*: one integer code per row plus the list of
+distinct texts. Projection converters therefore run once per distinct value
+rather than once per row, and their results are exactly the values the row
+path sees. Groups are numbered in order of first appearance and sums are
+accumulated sequentially in row order, so dict order, tie-breaks and float
+rounding — and hence the JSON written from the state — match the row path
+byte for byte.
+
+The column cache (see :mod:`scripts.player_stats_cache`) is read straight into
+arrays; without one the rows are streamed and factorized on the fly.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Mapping, NamedTuple, Sequence
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.numpy_support import np, numpy_guard  # noqa: E402
+from scripts.player_stats_cache import (  # noqa: E402
+    ARCHIVE_PATH,
+    PlayerStatisticsColumns,
+    load_player_statistics_cache,
+)
+from scripts.player_stats_reader import Projection, open_player_statistics  # noqa: E402
+from scripts.player_stats_shards import ShardFilter, load_shard_manifest, shard_season  # noqa: E402
+
+BACKENDS = ("python", "numpy")
+_RECORD_BATCH = 65536
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+require_numpy = numpy_guard("The numpy backend", "install it or use --backend python")
+
+
+class Factorized(NamedTuple):
+    """A column or derived field: ``values[codes[row]]`` is the value of each row."""
+
+    codes: Any  # numpy int64 array
+    values: list
+
+    def lookup(self, convert: Callable[[Any], Any], dtype: Any) -> Any:
+        """Per-row array of ``convert(value)``, evaluated once per distinct value."""
+
+        table = np.array([convert(value) for value in self.values], dtype=dtype)
+        if not len(table):
+            return np.zeros(len(self.codes), dtype=dtype)
+        return table[self.codes]
+
+
+def _dense(codes: Any, texts: list) -> Factorized:
+    """Re-code ``codes`` so equal values share one code (converters may merge texts)."""
+
+    positions: dict[Any, int] = {}
+    remap = np.empty(len(texts), dtype=np.int64)
+    values: list = []
+    for code, value in enumerate(texts):
+        position = positions.get(value)
+        if position is None:
+            position = positions[value] = len(values)
+            values.append(value)
+        remap[code] = position
+    if len(values) == len(texts):
+        return Factorized(codes, values)
+    return Factorized(remap[codes] if len(remap) else codes, values)
+
+
+def _factorize_numbers(numbers: Any, to_text: Callable[[Any], str]) -> Factorized:
+    uniques, codes = np.unique(numbers, return_inverse=True)
+    return Factorized(
+        codes.astype(np.int64, copy=False), [to_text(value) for value in uniques.tolist()]
+    )
+
+
+class ColumnFrame:
+    """Factorized ``PlayerStatistics`` columns for ``length`` rows, in source order."""
+
+    def __init__(self, length: int, columns: Mapping[str, Factorized]) -> None:
+        self.length = length
+        self._columns = dict(columns)
+        self._derived: dict[tuple, Factorized] = {}
+
+    def __len__(self) -> int:
+        return self.length
+
+    @classmethod
+    def from_cache(cls, cache: PlayerStatisticsColumns, names: Iterable[str]) -> ColumnFrame:
+        """Copy ``names`` out of the memory-mapped column cache."""
+
+        columns: dict[str, Factorized] = {}
+        available = set(cache.header)
+        for name in dict.fromkeys(names):
+            if name not in available:
+                continue
+            kind = cache.column_type(name)
+            to_text = cache.value_text(name)
+            raw = np.asarray(cache.column(name))
+            if kind == "str":
+                columns[name] = Factorized(raw.astype(np.int64), list(cache.dictionary(name)))
+            elif kind == "int":
+                columns[name] = _factorize_numbers(raw.astype(np.int64), to_text)
+            else:
+                # Factorize the bit patterns so -0.0 and 0.0 keep their own texts.
+                bits = _factorize_numbers(raw.view(np.int64).copy(), int)
+                floats = np.array(bits.values, dtype=np.int64).view(np.float64).tolist()
+                columns[name] = Factorized(bits.codes, [to_text(value) for value in floats])
+            del raw
+        return cls(cache.rows, columns)
+
+    @classmethod
+    def from_values(
+        cls, header: Sequence[str], rows: Iterable[Sequence[str]], names: Iterable[str]
+    ) -> ColumnFrame:
+        """Factorize ``csv.reader`` rows laid out as ``header`` while streaming them."""
+
+        positions = {name: index for index, name in enumerate(header)}
+        wanted = [name for name in dict.fromkeys(names) if name in positions]
+        lookups: list[dict[str, int]] = [{} for _ in wanted]
+        codes = [array("q") for _ in wanted]
+        slots = [
+            (positions[name], lookup, out)
+            for name, lookup, out in zip(wanted, lookups, codes, strict=True)
+        ]
+        length = 0
+        for values in rows:
+            length += 1
+            width = len(values)
+            for index, lookup, out in slots:
+                text = values[index] if index < width else ""  # ragged line: pad like DictReader
+                code = lookup.get(text)
+                if code is None:
+                    code = lookup[text] = len(lookup)
+                out.append(code)
+        return cls(
+            length,
+            {
+                name: Factorized(np.frombuffer(out, dtype=np.int64).copy(), list(lookup))
+                for name, lookup, out in zip(wanted, lookups, codes, strict=True)
+            },
+        )
+
+    @classmethod
+    def from_mappings(cls, rows: Iterable[Mapping[str, Any]], names: Iterable[str]) -> ColumnFrame:
+        """Factorize ``DictReader``-style mappings, converting values like ``Projection.from_mapping``."""
+
+        wanted = list(dict.fromkeys(names))
+        texts = (
+            ["" if (value := row.get(name)) is None else str(value) for name in wanted]
+            for row in rows
+        )
+        return cls.from_values(wanted, texts, wanted)
+
+    def column(self, name: str) -> Factorized:
+        """The raw texts of ``name``; a column the source lacks reads as blank."""
+
+        column = self._columns.get(name)
+        if column is None:
+            column = self._columns[name] = Factorized(np.zeros(self.length, dtype=np.int64), [""])
+        return column
+
+    def derive(self, sources: Sequence[str], converter: Callable[..., Any]) -> Factorized:
+        """``converter`` applied to the texts of ``sources``, once per distinct combination."""
+
+        key = (tuple(sources), converter)
+        derived = self._derived.get(key)
+        if derived is not None:
+            return derived
+        parts = [self.column(name) for name in sources]
+        if len(parts) == 1:
+            codes = parts[0].codes
+            combos = [(text,) for text in parts[0].values]
+        else:
+            combined = np.zeros(self.length, dtype=np.int64)
+            for part in parts:
+                combined = combined * len(part.values) + part.codes
+            uniques, codes = np.unique(combined, return_inverse=True)
+            codes = codes.astype(np.int64, copy=False)
+            combos = []
+            for packed in uniques.tolist():
+                texts = []
+                for part in reversed(parts):
+                    packed, code = divmod(packed, len(part.values))
+                    texts.append(part.values[code])
+                combos.append(tuple(reversed(texts)))
+        derived = self._derived[key] = _dense(codes, [converter(*texts) for texts in combos])
+        return derived
+
+    def field(self, projection: Projection, name: str) -> Factorized:
+        """The values ``projection`` gives field ``name`` on every row."""
+
+        return self.derive(*projection.source(name))
+
+    def take(self, rows: Any) -> ColumnFrame:
+        """The frame restricted to ``rows`` (a boolean mask or row indices), in order."""
+
+        if rows.dtype == bool:
+            rows = np.flatnonzero(rows)
+        return ColumnFrame(
+            len(rows),
+            {
+                name: Factorized(column.codes[rows], column.values)
+                for name, column in self._columns.items()
+            },
+        )
+
+    def records(self, projection: Projection) -> Iterator[tuple]:
+        """Yield ``projection`` records row by row, for consumers without ``consume_frame``."""
+
+        make = projection.record_type._make
+        fields = [self.field(projection, name) for name in projection.fields]
+        for start in range(0, self.length, _RECORD_BATCH):
+            stop = start + _RECORD_BATCH
+            columns = [
+                map(field.values.__getitem__, field.codes[start:stop].tolist()) for field in fields
+            ]
+            yield from map(make, zip(*columns, strict=True))
+
+    def mask(self, keep: ShardFilter) -> Any:
+        """Rows matching ``keep``, evaluated like :meth:`ShardFilter.predicate`."""
+
+        pairs = self.derive(
+            ("gameDate", "gameType"),
+            lambda game_date, game_type: keep.matches(shard_season(game_date.strip()), game_type),
+        )
+        return pairs.lookup(bool, bool)
+
+
+def load_frame(
+    names: Iterable[str],
+    rows: Iterable[Mapping[str, Any]] | None = None,
+    *,
+    keep: ShardFilter | None = None,
+    archive_path: Path = ARCHIVE_PATH,
+) -> ColumnFrame:
+    """Load ``names`` for the rows a pure-Python scan with the same arguments would read."""
+
+    require_numpy()
+    names = list(dict.fromkeys(names))
+    if rows is not None:
+        frame = ColumnFrame.from_mappings(rows, [*names, "gameDate", "gameType"] if keep else names)
+        return frame if keep is None else frame.take(frame.mask(keep))
+    # Current shards reorder rows by season file; read them the way the row path does.
+    if keep is None or load_shard_manifest(archive_path) is None:
+        cache = load_player_statistics_cache(archive_path)
+        if cache is not None:
+            with cache:
+                frame = ColumnFrame.from_cache(
+                    cache, [*names, "gameDate", "gameType"] if keep else names
+                )
+            return frame if keep is None else frame.take(frame.mask(keep))
+    seasons = keep.seasons if keep is not None else None
+    game_types = keep.game_types if keep is not None else None
+    with open_player_statistics(names, seasons=seasons, game_types=game_types) as (header, values):
+        return ColumnFrame.from_values(header, values, names)
+
+
+# ---------------------------------------------------------------------------
+# Grouped reductions
+
+
+class Groups(NamedTuple):
+    """Row -> group ids numbered by first appearance, like keys inserted into a dict."""
+
+    ids: Any  # group id per row
+    first: Any  # first row of each group
+    count: int
+
+
+def group_by(*keys: Any) -> Groups:
+    """Group rows by one or more integer key arrays (e.g. :class:`Factorized` codes)."""
+
+    combined = keys[0].astype(np.int64, copy=False)
+    for key in keys[1:]:
+        span = int(key.max()) + 1 if len(key) else 1
+        combined = combined * span + key
+    if not len(combined):
+        return Groups(combined, combined, 0)
+    _, first, inverse = np.unique(combined, return_index=True, return_inverse=True)
+    order = np.argsort(first, kind="stable")
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    return Groups(rank[inverse.reshape(-1)], first[order], len(order))
+
+
+def group_sum(groups: Groups, weights: Any) -> list[float]:
+    """Per-group ``0.0 + w0 + w1 + ...`` in row order, as Python floats."""
+
+    return np.bincount(groups.ids, weights=weights, minlength=groups.count).tolist()
+
+
+def group_count(groups: Groups, mask: Any = None) -> list[int]:
+    ids = groups.ids if mask is None else groups.ids[mask]
+    return np.bincount(ids, minlength=groups.count).tolist()
+
+
+def group_first(groups: Groups, mask: Any) -> list[int]:
+    """First row of each group where ``mask`` holds, or ``-1``."""
+
+    rows = np.flatnonzero(mask)
+    first = np.full(groups.count, -1, dtype=np.int64)
+    ids, positions = np.unique(groups.ids[rows], return_index=True)
+    first[ids] = rows[positions]
+    return first.tolist()
+
+
+def group_extreme(groups: Groups, values: Any, valid: Any, *, largest: bool) -> list[Any]:
+    """Per-group min (or max) of ``values`` over ``valid`` rows, ``None`` for groups without any."""
+
+    ids = groups.ids[valid]
+    picked = values[valid]
+    fill = np.iinfo(np.int64).min if largest else np.iinfo(np.int64).max
+    out = np.full(groups.count, fill, dtype=np.int64)
+    (np.maximum if largest else np.minimum).at(out, ids, picked)
+    seen = np.bincount(ids, minlength=groups.count) > 0
+    return [
+        int(value) if hit else None for value, hit in zip(out.tolist(), seen.tolist(), strict=True)
+    ]
+
+
+def optional_ints(field: Factorized) -> tuple[Any, Any]:
+    """``(values, valid)`` arrays of an ``int | None`` field such as a season."""
+
+    valid = field.lookup(lambda value: value is not None, bool)
+    values = field.lookup(lambda value: 0 if value is None else value, np.int64)
+    return values, valid
+
+
+def top_candidates(keys: Any, identities: Callable[[Any], Iterable], size: int) -> Any:
+    """Rows, in order, that can reach a :class:`~scripts.accumulators.TopK` of ``size``.
+
+    Takes every row whose key reaches the ``k``-th largest, widening ``k``
+    until those rows hold ``size`` distinct identities (``identities(rows)``).
+    NaN keys never rank and are left out.
+    """
+
+    finite = np.flatnonzero(~np.isnan(keys))
+    if not len(finite):
+        return finite
+    ranked = np.sort(keys[finite])[::-1]
+    k = size
+    while True:
+        threshold = ranked[min(k, len(ranked)) - 1]
+        rows = finite[keys[finite] >= threshold]
+        if k >= len(ranked) or len(set(identities(rows))) >= size:
+            return rows
+        k *= 2
+
+
+def feed_top(top: Any, rows: Any, keys: Any, item: Callable[[int], Any], length: int) -> None:
+    """Offer ``rows`` to ``top`` (a :class:`~scripts.accumulators.TopK`) as a pass over ``length`` rows would.
+
+    ``item(row)`` builds the entry for a candidate row; skipped rows still
+    count towards arrival order.
+    """
+
+    position = 0
+    for row in rows.tolist():
+        top.skip(row - position)
+        top.update(float(keys[row]), item(row))
+        position = row + 1
+    top.skip(length - position)
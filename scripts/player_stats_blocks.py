@@ -0,0 +1,359 @@
+"""Seekable block-compressed re-pack of the ``PlayerStatistics`` player-game table.
+
+``PlayerStatistics.7z`` is a solid archive: it can only be decoded front to
+back on one core, even when a builder wants a handful of seasons. This module
+re-packs the rows into independently compressed blocks of ``block_rows`` rows
+(stdlib ``gzip`` or ``xz`` members), with an index of where each block starts
+and which ``gameDate`` range it covers. Readers can then
+
+* decode blocks in parallel worker processes, and
+* skip every block whose date range misses the requested window.
+
+Layout::
+
+    data/cache/player_statistics_blocks/<sha256>/
+        blocks.bin    compressed blocks back to back (CSV lines, no header)
+        index.json    header, codec, and per block: offset, length, rows,
+                      minGameDate / maxGameDate (``null`` when undated)
+
+Rows keep their archive order (so the stream stays byte-for-byte comparable
+with the other readers); a block's date range is therefore only as tight as
+that order. Blocks are keyed by the archive checksum like the column cache, and
+:func:`scripts.player_stats_reader.open_player_statistics` reads them instead
+of the archive when they are current.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import gzip
+import io
+import json
+import lzma
+import os
+import shutil
+import sys
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Sequence
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.game_dimensions import season_date_bounds  # noqa: E402,F401 - re-exported for readers
+from scripts.player_stats_cache import ARCHIVE_PATH, archive_checksum  # noqa: E402
+
+BLOCK_ROOT = ROOT / "data" / "cache" / "player_statistics_blocks"
+BLOCK_VERSION = 1
+DEFAULT_BLOCK_ROWS = 65536
+DEFAULT_CODEC = "gzip"
+DEFAULT_DECODE_JOBS = min(4, os.cpu_count() or 1)
+
+_COMPRESS = {
+    "gzip": lambda data: gzip.compress(data, compresslevel=6, mtime=0),
+    "xz": lambda data: lzma.compress(data, preset=6),
+}
+_DECOMPRESS = {"gzip": gzip.decompress, "xz": lzma.decompress}
+
+
+class BlockIndex:
+    """The committed block store of one archive checksum."""
+
+    def __init__(self, directory: Path, manifest: dict) -> None:
+        self.directory = directory
+        self.header: list[str] = list(manifest["header"])
+        self.codec: str = manifest["codec"]
+        self.rows: int = int(manifest["rows"])
+        self.blocks: list[dict[str, Any]] = manifest["blocks"]
+
+    @property
+    def path(self) -> Path:
+        return self.directory / "blocks.bin"
+
+    def select(self, start: str | None = None, end: str | None = None) -> list[dict[str, Any]]:
+        """Blocks that may hold rows with ``start <= gameDate < end`` (all blocks when unbounded)."""
+
+        if start is None and end is None:
+            return list(self.blocks)
+        return [
+            block
+            for block in self.blocks
+            if block["maxGameDate"] is not None
+            and (start is None or block["maxGameDate"] >= start)
+            and (end is None or block["minGameDate"] < end)
+        ]
+
+
+def block_directory(checksum: str, block_root: Path = BLOCK_ROOT) -> Path:
+    return block_root / checksum
+
+
+def load_block_index(
+    archive_path: Path = ARCHIVE_PATH, *, block_root: Path = BLOCK_ROOT
+) -> BlockIndex | None:
+    """Open the current block store for ``archive_path``, or return ``None`` when stale."""
+
+    checksum = archive_checksum(archive_path)
+    if not checksum:
+        return None
+    directory = block_directory(checksum, block_root)
+    try:
+        manifest = json.loads((directory / "index.json").read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if manifest.get("version") != BLOCK_VERSION or manifest.get("sha256") != checksum:
+        return None
+    if manifest.get("codec") not in _DECOMPRESS:
+        return None
+    return BlockIndex(directory, manifest)
+
+
+# ---------------------------------------------------------------------------
+# Reading
+
+
+def decode_block(path: Path, codec: str, offset: int, length: int) -> bytes:
+    """Decompress one block to its CSV bytes; runs in worker processes."""
+
+    with path.open("rb") as handle:
+        handle.seek(offset)
+        data = handle.read(length)
+    return _DECOMPRESS[codec](data)
+
+
+def _decode_in_order(
+    executor: Executor, index: BlockIndex, blocks: Sequence[dict[str, Any]], ahead: int
+) -> Iterator[bytes]:
+    """Decode ``blocks`` in ``executor`` keeping at most ``ahead`` in flight, yielding in order."""
+
+    pending: deque = deque()
+    queued = iter(blocks)
+    for block in queued:
+        pending.append(
+            executor.submit(decode_block, index.path, index.codec, block["offset"], block["length"])
+        )
+        if len(pending) >= ahead:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def iter_block_bytes(
+    index: BlockIndex,
+    *,
+    start: str | None = None,
+    end: str | None = None,
+    jobs: int = DEFAULT_DECODE_JOBS,
+) -> Iterator[bytes]:
+    """Yield the decoded CSV bytes of the blocks overlapping ``[start, end)``, in file order.
+
+    Each chunk holds whole lines. ``jobs > 1`` decodes blocks in that many
+    worker processes with a bounded read-ahead.
+    """
+
+    blocks = index.select(start, end)
+    if jobs <= 1 or len(blocks) <= 1:
+        for block in blocks:
+            yield decode_block(index.path, index.codec, block["offset"], block["length"])
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from _decode_in_order(executor, index, blocks, ahead=2 * jobs)
+
+
+def _date_predicate(header: Sequence[str], start: str | None, end: str | None):
+    date_index = header.index("gameDate")
+
+    def keep(values: Sequence[str]) -> bool:
+        game_date = values[date_index].strip() if date_index < len(values) else ""
+        if not game_date:
+            return False
+        return (start is None or game_date >= start) and (end is None or game_date < end)
+
+    return keep
+
+
+def iter_block_rows(
+    index: BlockIndex,
+    *,
+    start: str | None = None,
+    end: str | None = None,
+    jobs: int = DEFAULT_DECODE_JOBS,
+) -> Iterator[Sequence[str]]:
+    """Yield ``csv.reader`` rows, restricted to ``start <= gameDate < end`` when bounded.
+
+    Whole blocks outside the window are never decoded; rows of the edge
+    blocks are filtered exactly. Undated rows only appear in unbounded reads.
+    """
+
+    chunks = iter_block_bytes(index, start=start, end=end, jobs=jobs)
+    rows: Iterator[Sequence[str]] = (
+        values
+        for chunk in chunks
+        for values in csv.reader(io.StringIO(chunk.decode("utf-8"), newline=""))
+    )
+    if start is None and end is None:
+        yield from rows
+    else:
+        yield from filter(_date_predicate(index.header, start, end), rows)
+
+
+@contextmanager
+def open_blocks(
+    index: BlockIndex,
+    *,
+    start: str | None = None,
+    end: str | None = None,
+    jobs: int = DEFAULT_DECODE_JOBS,
+) -> Iterator[tuple[list[str], Iterator[Sequence[str]]]]:
+    """Yield the header and rows of ``index`` like :func:`~scripts.player_stats_reader.open_player_statistics`."""
+
+    rows = iter_block_rows(index, start=start, end=end, jobs=jobs)
+    try:
+        yield list(index.header), rows
+    finally:
+        rows.close()
+
+
+# ---------------------------------------------------------------------------
+# Writing
+
+
+def _csv_bytes(rows: Iterable[Sequence[str]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def write_player_statistics_blocks(
+    header: Sequence[str],
+    rows: Iterable[Sequence[str]],
+    checksum: str,
+    *,
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+    codec: str = DEFAULT_CODEC,
+    block_root: Path = BLOCK_ROOT,
+) -> Path:
+    """Compress ``rows`` into blocks of ``block_rows`` rows and publish the store atomically."""
+
+    if codec not in _COMPRESS:
+        raise ValueError(f"Unknown block codec {codec!r}; expected one of {sorted(_COMPRESS)}")
+    header = list(header)
+    date_index = header.index("gameDate") if "gameDate" in header else None
+    compress = _COMPRESS[codec]
+
+    final_dir = block_directory(checksum, block_root)
+    work_dir = block_root / f".{checksum}.tmp-{os.getpid()}"
+    shutil.rmtree(work_dir, ignore_errors=True)
+    work_dir.mkdir(parents=True)
+    blocks: list[dict[str, Any]] = []
+    total = 0
+    try:
+        with (work_dir / "blocks.bin").open("wb") as output:
+
+            def flush(buffer: list[Sequence[str]]) -> None:
+                dates = [
+                    values[date_index].strip()
+                    for values in buffer
+                    if date_index is not None
+                    and date_index < len(values)
+                    and values[date_index].strip()
+                ]
+                data = compress(_csv_bytes(buffer))
+                blocks.append(
+                    {
+                        "offset": output.tell(),
+                        "length": len(data),
+                        "rows": len(buffer),
+                        "minGameDate": min(dates) if dates else None,
+                        "maxGameDate": max(dates) if dates else None,
+                    }
+                )
+                output.write(data)
+                buffer.clear()
+
+            buffer: list[Sequence[str]] = []
+            for values in rows:
+                buffer.append(values)
+                total += 1
+                if len(buffer) >= block_rows:
+                    flush(buffer)
+            if buffer:
+                flush(buffer)
+
+        manifest = {
+            "version": BLOCK_VERSION,
+            "sha256": checksum,
+            "header": header,
+            "codec": codec,
+            "rows": total,
+            "blockRows": block_rows,
+            "blocks": blocks,
+        }
+        (work_dir / "index.json").write_text(
+            json.dumps(manifest, indent=1) + "\n", encoding="utf-8"
+        )
+        shutil.rmtree(final_dir, ignore_errors=True)
+        os.replace(work_dir, final_dir)
+    except BaseException:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        raise
+    return final_dir
+
+
+def build_player_statistics_blocks(
+    *,
+    force: bool = False,
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+    codec: str = DEFAULT_CODEC,
+    archive_path: Path = ARCHIVE_PATH,
+    block_root: Path = BLOCK_ROOT,
+) -> BlockIndex:
+    """Re-pack ``PlayerStatistics`` into seekable blocks (once per checksum)."""
+
+    from scripts.player_stats_reader import PlayerStatisticsStreamError, open_player_statistics
+
+    if not force:
+        existing = load_block_index(archive_path, block_root=block_root)
+        if existing is not None:
+            return existing
+    checksum = archive_checksum(archive_path)
+    if not checksum:
+        raise PlayerStatisticsStreamError(
+            "PlayerStatistics.7z is missing. Ensure the archive is present before re-packing it."
+        )
+    with open_player_statistics(archive_path=archive_path) as (header, rows):
+        write_player_statistics_blocks(
+            header, rows, checksum, block_rows=block_rows, codec=codec, block_root=block_root
+        )
+    index = load_block_index(archive_path, block_root=block_root)
+    assert index is not None
+    return index
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Re-pack PlayerStatistics into seekable compressed blocks."
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Rebuild even when a current block store exists."
+    )
+    parser.add_argument(
+        "--block-rows", type=int, default=DEFAULT_BLOCK_ROWS, help="Rows per compressed block."
+    )
+    parser.add_argument("--codec", choices=sorted(_COMPRESS), default=DEFAULT_CODEC)
+    args = parser.parse_args(argv)
+    index = build_player_statistics_blocks(
+        force=args.force, block_rows=args.block_rows, codec=args.codec
+    )
+    print(
+        f"Packed {index.rows:,} rows into {len(index.blocks):,} {index.codec} blocks at",
+        index.directory.relative_to(ROOT),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,507 @@
+"""Persistent column-per-file cache of the ``PlayerStatistics`` player-game table.
+
+Decompressing ``PlayerStatistics.7z`` and running every row through
+``csv.DictReader`` takes minutes, which makes iterating on downstream builders
+(GOAT weights in particular) painfully slow. The first full archive stream
+now tees its rows into a typed columnar cache under
+``data/cache/player_statistics/<sha256>/``; later runs read the cache instead.
+
+Layout of a cache directory::
+
+    manifest.json        header, row count and per-column type/file metadata
+    col_000.i64          int columns   -> native int64 array (blank = sentinel)
+    col_001.f64          float columns -> native float64 array (blank = NaN)
+    col_002.codes        str columns   -> native uint32 dictionary codes
+    col_002.dict.json    str columns   -> JSON list mapping code -> text
+
+Every file is a raw array so it can be memory-mapped and cast with
+``memoryview.cast`` without a parse step. Column types are inferred from the
+distinct values so that reconstructed text is byte-identical to the CSV: a
+column is only stored as ``int``/``float`` when every value round-trips
+through ``str(int(value))``/``repr(float(value))``.
+
+The cache is keyed by the SHA-256 of the archive's own bytes (hashed once
+per process and file version) and additionally checks the archive size, so a
+refreshed extract never reads stale columns. ``SHA256SUMS.txt`` is only a
+cross-check.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import mmap
+import os
+import shutil
+import sys
+import warnings
+from array import array
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Mapping, Sequence
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.sources import locate_source  # noqa: E402
+
+ARCHIVE_PATH = locate_source("PlayerStatistics", ROOT / "PlayerStatistics.7z")
+CHECKSUMS_PATH = ROOT / "SHA256SUMS.txt"
+CACHE_ROOT = ROOT / "data" / "cache" / "player_statistics"
+
+CACHE_VERSION = 1
+INT_NULL = -(2**63)
+_FLUSH_ROWS = 65536
+_TYPECODES = {"int": "q", "float": "d", "str": "I"}
+_SUFFIXES = {"int": ".i64", "float": ".f64", "str": ".codes"}
+
+
+# ---------------------------------------------------------------------------
+# Checksums
+
+
+def _read_checksum_manifest(path: Path = CHECKSUMS_PATH) -> dict[str, str]:
+    checksums: dict[str, str] = {}
+    if not path.exists():
+        return checksums
+    for line in path.read_text(encoding="utf-8").splitlines():
+        parts = line.split()
+        if len(parts) >= 2:
+            checksums[parts[-1].lstrip("*")] = parts[0].lower()
+    return checksums
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _fingerprint_directory(path: Path) -> str:
+    """Digest of an extracted or sharded source directory's file names, sizes and mtimes."""
+
+    digest = hashlib.sha256()
+    for file in sorted(entry for entry in path.rglob("*") if entry.is_file()):
+        stat = file.stat()
+        digest.update(f"{file.relative_to(path)}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=64)
+def _hash_file_version(path: str, size: int, mtime_ns: int) -> str:
+    return _hash_file(Path(path))
+
+
+def content_checksum(path: Path) -> str:
+    """SHA-256 of ``path``'s bytes (or its listing fingerprint for a directory).
+
+    This never trusts ``SHA256SUMS.txt``, so it follows a source that was
+    replaced without refreshing the manifest. A file is hashed once per
+    ``(path, size, mtime)``; repeated calls only cost a ``stat``.
+    """
+
+    if path.is_dir():
+        return _fingerprint_directory(path)
+    stat = path.stat()
+    return _hash_file_version(str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+
+
+def archive_checksum(archive_path: Path = ARCHIVE_PATH) -> str | None:
+    """Return :func:`content_checksum` of ``archive_path``, or ``None`` when it is missing.
+
+    Every PlayerStatistics cache is keyed by this. A ``SHA256SUMS.txt`` entry
+    that disagrees with the file is reported rather than used.
+    """
+
+    if not archive_path.exists():
+        return None
+    checksum = content_checksum(archive_path)
+    if not archive_path.is_dir():
+        recorded = _read_checksum_manifest(archive_path.parent / CHECKSUMS_PATH.name)
+        listed = recorded.get(archive_path.name)
+        if listed and listed != checksum:
+            warnings.warn(
+                f"{CHECKSUMS_PATH.name} lists {listed} for {archive_path.name}, but the file "
+                f"hashes to {checksum}; keying caches by the file's own hash",
+                stacklevel=2,
+            )
+    return checksum
+
+
+def cache_directory(checksum: str, cache_root: Path = CACHE_ROOT) -> Path:
+    return cache_root / checksum
+
+
+# ---------------------------------------------------------------------------
+# Type inference
+
+
+def _infer_column_type(values: Sequence[str]) -> str:
+    kind = "int"
+    for value in values:
+        if value == "":
+            continue
+        if kind == "int":
+            try:
+                number = int(value)
+                if str(number) == value and abs(number) < 2**63 - 1:
+                    continue
+            except ValueError:
+                pass
+            kind = "float"
+        try:
+            number = float(value)
+        except ValueError:
+            return "str"
+        if not math.isfinite(number) or repr(number) != value:
+            return "str"
+    return kind
+
+
+def _int_text(value: int) -> str:
+    return "" if value == INT_NULL else str(value)
+
+
+def _float_text(value: float) -> str:
+    return "" if value != value else repr(value)
+
+
+# ---------------------------------------------------------------------------
+# Writer
+
+
+class PlayerStatisticsCacheWriter:
+    """Dictionary-encode rows to disk, then settle each column's final type.
+
+    Rows are first written as uint32 codes per column so memory stays bounded
+    by the number of distinct values; :meth:`commit` converts numeric columns
+    to typed arrays and atomically publishes the directory.
+    """
+
+    def __init__(
+        self, checksum: str, *, archive_size: int | None = None, cache_root: Path = CACHE_ROOT
+    ) -> None:
+        self.checksum = checksum
+        self.archive_size = archive_size
+        self.final_dir = cache_directory(checksum, cache_root)
+        self.work_dir = cache_root / f".{checksum}.tmp-{os.getpid()}"
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+        self.work_dir.mkdir(parents=True)
+        self.header: list[str] | None = None
+        self.rows = 0
+        self._dictionaries: list[dict[str, int]] = []
+        self._buffers: list[array] = []
+        self._handles: list = []
+
+    def start(self, header: Sequence[str]) -> None:
+        self.header = list(header)
+        self._dictionaries = [{} for _ in self.header]
+        self._buffers = [array("I") for _ in self.header]
+        self._handles = [
+            (self.work_dir / f"col_{index:03d}.raw").open("wb") for index in range(len(self.header))
+        ]
+
+    def add(self, row: Mapping[str, str | None]) -> None:
+        if self.header is None:
+            self.start(list(row.keys()))
+        self.add_values([row.get(name) or "" for name in self.header])
+
+    def add_values(self, values: Sequence[str]) -> None:
+        """Append one row given in :attr:`header` order (after :meth:`start`)."""
+
+        width = len(self._buffers)
+        if len(values) != width:  # ragged CSV line: pad or trim like csv.DictReader
+            values = [*values[:width], *([""] * (width - len(values)))]
+        for value, dictionary, buffer in zip(
+            values, self._dictionaries, self._buffers, strict=True
+        ):
+            code = dictionary.get(value)
+            if code is None:
+                code = dictionary[value] = len(dictionary)
+            buffer.append(code)
+        self.rows += 1
+        if self.rows % _FLUSH_ROWS == 0:
+            self._flush()
+
+    def _flush(self) -> None:
+        for buffer, handle in zip(self._buffers, self._handles, strict=True):
+            buffer.tofile(handle)
+            del buffer[:]
+
+    def commit(self) -> Path:
+        self._flush()
+        for handle in self._handles:
+            handle.close()
+
+        columns: list[dict[str, object]] = []
+        for index, (name, dictionary) in enumerate(
+            zip(self.header or [], self._dictionaries, strict=True)
+        ):
+            values = list(dictionary)
+            kind = _infer_column_type(values)
+            raw_path = self.work_dir / f"col_{index:03d}.raw"
+            data_name = f"col_{index:03d}{_SUFFIXES[kind]}"
+            entry: dict[str, object] = {"name": name, "type": kind, "file": data_name}
+            if kind == "str":
+                raw_path.rename(self.work_dir / data_name)
+                dict_name = f"col_{index:03d}.dict.json"
+                (self.work_dir / dict_name).write_text(
+                    json.dumps(values, ensure_ascii=False), encoding="utf-8"
+                )
+                entry["dictionary"] = dict_name
+                entry["distinct"] = len(values)
+            else:
+                if kind == "int":
+                    lookup = [INT_NULL if value == "" else int(value) for value in values]
+                else:
+                    lookup = [math.nan if value == "" else float(value) for value in values]
+                self._convert_codes(raw_path, self.work_dir / data_name, lookup, _TYPECODES[kind])
+                raw_path.unlink()
+            columns.append(entry)
+
+        manifest = {
+            "version": CACHE_VERSION,
+            "archive": ARCHIVE_PATH.name,
+            "sha256": self.checksum,
+            "archiveSize": self.archive_size,
+            "byteorder": sys.byteorder,
+            "rows": self.rows,
+            "header": self.header or [],
+            "columns": columns,
+        }
+        (self.work_dir / "manifest.json").write_text(
+            json.dumps(manifest, indent=2) + "\n", encoding="utf-8"
+        )
+
+        shutil.rmtree(self.final_dir, ignore_errors=True)
+        self.work_dir.rename(self.final_dir)
+        return self.final_dir
+
+    @staticmethod
+    def _convert_codes(source: Path, target: Path, lookup: list, typecode: str) -> None:
+        with source.open("rb") as reader, target.open("wb") as writer:
+            while True:
+                codes = array("I")
+                try:
+                    codes.fromfile(reader, _FLUSH_ROWS)
+                except EOFError:
+                    pass
+                if not codes:
+                    break
+                array(typecode, map(lookup.__getitem__, codes)).tofile(writer)
+
+    def abort(self) -> None:
+        for handle in self._handles:
+            handle.close()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+
+def tee_into_cache(
+    rows: Iterable[Mapping[str, str]],
+    checksum: str,
+    *,
+    archive_size: int | None = None,
+    cache_root: Path = CACHE_ROOT,
+) -> Iterator[Mapping[str, str]]:
+    """Yield ``rows`` unchanged while recording them into the column cache.
+
+    The cache is only published when the stream is exhausted; an abandoned or
+    failing iteration discards the partial directory.
+    """
+
+    writer = PlayerStatisticsCacheWriter(checksum, archive_size=archive_size, cache_root=cache_root)
+    yield from _tee(rows, writer, writer.add)
+
+
+def tee_values_into_cache(
+    header: Sequence[str],
+    rows: Iterable[Sequence[str]],
+    checksum: str,
+    *,
+    archive_size: int | None = None,
+    cache_root: Path = CACHE_ROOT,
+) -> Iterator[Sequence[str]]:
+    """Like :func:`tee_into_cache` for ``csv.reader`` style value lists."""
+
+    writer = PlayerStatisticsCacheWriter(checksum, archive_size=archive_size, cache_root=cache_root)
+    writer.start(header)
+    yield from _tee(rows, writer, writer.add_values)
+
+
+def _tee(
+    rows: Iterable, writer: PlayerStatisticsCacheWriter, record: Callable[[object], None]
+) -> Iterator:
+    completed = False
+    try:
+        for row in rows:
+            record(row)
+            yield row
+        completed = True
+    finally:
+        if completed:
+            writer.commit()
+        else:
+            writer.abort()
+
+
+# ---------------------------------------------------------------------------
+# Reader
+
+
+class PlayerStatisticsColumns:
+    """Memory-mapped view over a committed cache directory."""
+
+    def __init__(self, directory: Path, manifest: dict) -> None:
+        self.directory = directory
+        self.manifest = manifest
+        self.rows: int = int(manifest["rows"])
+        self.header: list[str] = list(manifest["header"])
+        self._specs = {entry["name"]: entry for entry in manifest["columns"]}
+        self._maps: list[mmap.mmap] = []
+        self._views: dict[str, memoryview] = {}
+        self._dictionaries: dict[str, list[str]] = {}
+
+    def __enter__(self) -> PlayerStatisticsColumns:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def column_type(self, name: str) -> str:
+        return str(self._specs[name]["type"])
+
+    def column(self, name: str) -> Sequence:
+        """Return the raw typed column (codes for dictionary-encoded strings)."""
+
+        view = self._views.get(name)
+        if view is not None:
+            return view
+        spec = self._specs[name]
+        typecode = _TYPECODES[str(spec["type"])]
+        path = self.directory / str(spec["file"])
+        if self.rows == 0:
+            view = memoryview(array(typecode))
+        else:
+            with path.open("rb") as handle:
+                mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps.append(mapped)
+            view = memoryview(mapped).cast(typecode)
+        self._views[name] = view
+        return view
+
+    def dictionary(self, name: str) -> list[str]:
+        values = self._dictionaries.get(name)
+        if values is None:
+            spec = self._specs[name]
+            values = json.loads(
+                (self.directory / str(spec["dictionary"])).read_text(encoding="utf-8")
+            )
+            self._dictionaries[name] = values
+        return values
+
+    def value_text(self, name: str) -> Callable[[Any], str]:
+        """Return the function turning one raw value of ``name`` back into its CSV text."""
+
+        kind = self.column_type(name)
+        if kind == "str":
+            return self.dictionary(name).__getitem__
+        return _int_text if kind == "int" else _float_text
+
+    def text_column(self, name: str) -> Iterator[str]:
+        """Iterate a column as the original CSV text."""
+
+        return map(self.value_text(name), self.column(name))
+
+    def iter_values(self, columns: Sequence[str] | None = None) -> Iterator[tuple[str, ...]]:
+        """Yield ``csv.reader``-style rows holding only ``columns`` (all by default)."""
+
+        names = list(columns) if columns is not None else self.header
+        if not names:
+            return iter([()] * self.rows)
+        return zip(*(self.text_column(name) for name in names), strict=True)
+
+    def iter_rows(self, columns: Sequence[str] | None = None) -> Iterator[dict[str, str]]:
+        names = list(columns) if columns is not None else self.header
+        for values in self.iter_values(names):
+            yield dict(zip(names, values, strict=True))
+
+    def close(self) -> None:
+        for view in self._views.values():
+            view.release()
+        self._views.clear()
+        for mapped in self._maps:
+            mapped.close()
+        self._maps.clear()
+
+
+def load_player_statistics_cache(
+    archive_path: Path = ARCHIVE_PATH,
+    *,
+    cache_root: Path = CACHE_ROOT,
+) -> PlayerStatisticsColumns | None:
+    """Open the cache for ``archive_path`` or return ``None`` when it is stale."""
+
+    checksum = archive_checksum(archive_path)
+    if not checksum:
+        return None
+    directory = cache_directory(checksum, cache_root)
+    manifest_path = directory / "manifest.json"
+    if not manifest_path.exists():
+        return None
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if manifest.get("version") != CACHE_VERSION or manifest.get("sha256") != checksum:
+        return None
+    if manifest.get("byteorder") != sys.byteorder:
+        return None
+    expected_size = manifest.get("archiveSize")
+    if (
+        archive_path.exists()
+        and expected_size is not None
+        and archive_path.stat().st_size != expected_size
+    ):
+        return None
+    return PlayerStatisticsColumns(directory, manifest)
+
+
+def build_player_statistics_cache(*, force: bool = False) -> Path:
+    """Convert ``PlayerStatistics.7z`` into the column cache (once per checksum)."""
+
+    from scripts.player_stats_reader import PlayerStatisticsStreamError, iter_player_statistics_rows
+
+    if not force:
+        existing = load_player_statistics_cache()
+        if existing is not None:
+            return existing.directory
+    if not ARCHIVE_PATH.exists():
+        raise PlayerStatisticsStreamError(
+            "PlayerStatistics.7z is missing. Ensure the archive is present before building the cache."
+        )
+
+    checksum = archive_checksum(ARCHIVE_PATH)
+    assert checksum is not None
+    rows = iter_player_statistics_rows(use_cache=False)
+    for _ in tee_into_cache(rows, checksum, archive_size=ARCHIVE_PATH.stat().st_size):
+        pass
+    return cache_directory(checksum)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Build the PlayerStatistics column cache.")
+    parser.add_argument(
+        "--force", action="store_true", help="Rebuild even when a valid cache exists."
+    )
+    args = parser.parse_args(argv)
+    directory = build_player_statistics_cache(force=args.force)
+    print("PlayerStatistics column cache ready at", directory.relative_to(ROOT))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""Player-ordered ``PlayerStatistics`` store with a per-player offset index.
+
+Reading one player's game log used to mean streaming the whole archive, which
+makes checking a single GOAT score or career line slow. This module rewrites
+the table once with every player's rows stored contiguously (ordered by
+``gameDate`` then ``gameId``) and records where each player's block starts,
+so :func:`get_player_games` is one seek and one read.
+
+Layout::
+
+    data/cache/player_statistics_players/<sha256>/
+        games.csv    header line, then one contiguous block per player
+        index.json   header, row count and personId -> [offset, length, rows]
+
+The store is keyed by the archive checksum like the column cache and the
+season shards, so a refreshed extract is re-indexed instead of served stale.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+import os
+import shutil
+import sys
+import zlib
+from itertools import groupby
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.player_stats_cache import ARCHIVE_PATH, archive_checksum  # noqa: E402
+
+INDEX_ROOT = ROOT / "data" / "cache" / "player_statistics_players"
+INDEX_VERSION = 1
+_BUCKETS = 64
+
+_loaded: dict[Path, PlayerGameIndex] = {}
+
+
+class PlayerGameIndex:
+    """Random access to one player's rows in a committed store directory."""
+
+    def __init__(self, directory: Path, manifest: dict) -> None:
+        self.directory = directory
+        self.header: list[str] = list(manifest["header"])
+        self.rows: int = int(manifest["rows"])
+        self.players: dict[str, list[int]] = manifest["players"]
+
+    def __contains__(self, person_id: object) -> bool:
+        return person_id in self.players
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def values(self, person_id: str) -> list[list[str]]:
+        """Return ``csv.reader`` rows for ``person_id`` (empty when unknown)."""
+
+        location = self.players.get(str(person_id).strip())
+        if location is None:
+            return []
+        offset, length, _rows = location
+        with (self.directory / "games.csv").open("rb") as handle:
+            handle.seek(offset)
+            text = handle.read(length).decode("utf-8")
+        return list(csv.reader(io.StringIO(text, newline="")))
+
+    def games(self, person_id: str) -> list[dict[str, str]]:
+        header = self.header
+        return [dict(zip(header, values, strict=False)) for values in self.values(person_id)]
+
+    def records(self, person_id: str, projection: Any) -> list[tuple]:
+        """Return ``person_id``'s rows as ``projection`` records."""
+
+        return list(map(projection.reader(self.header), self.values(person_id)))
+
+
+def index_directory(checksum: str, index_root: Path = INDEX_ROOT) -> Path:
+    return index_root / checksum
+
+
+def load_player_game_index(
+    archive_path: Path = ARCHIVE_PATH, *, index_root: Path = INDEX_ROOT
+) -> PlayerGameIndex | None:
+    """Open the current player index for ``archive_path``, or return ``None`` when stale."""
+
+    checksum = archive_checksum(archive_path)
+    if not checksum:
+        return None
+    directory = index_directory(checksum, index_root)
+    cached = _loaded.get(directory)
+    if cached is not None:
+        return cached
+    try:
+        manifest = json.loads((directory / "index.json").read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if manifest.get("version") != INDEX_VERSION or manifest.get("sha256") != checksum:
+        return None
+    index = _loaded[directory] = PlayerGameIndex(directory, manifest)
+    return index
+
+
+def _bucket(person_id: str) -> int:
+    return zlib.crc32(person_id.encode("utf-8")) % _BUCKETS
+
+
+def _csv_bytes(rows: Iterable[Sequence[str]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def write_player_game_index(
+    header: Sequence[str],
+    rows: Iterable[Sequence[str]],
+    checksum: str,
+    *,
+    index_root: Path = INDEX_ROOT,
+) -> Path:
+    """Group ``rows`` by ``personId`` into ``games.csv`` and publish the offset index.
+
+    Rows are first spread over hash buckets on disk so only one bucket is held
+    in memory while it is sorted.
+    """
+
+    header = list(header)
+    positions = {name: index for index, name in enumerate(header)}
+    person_index = positions["personId"]
+    date_index = positions.get("gameDate")
+    game_index = positions.get("gameId")
+    width = len(header)
+
+    final_dir = index_directory(checksum, index_root)
+    work_dir = index_root / f".{checksum}.tmp-{os.getpid()}"
+    shutil.rmtree(work_dir, ignore_errors=True)
+    (work_dir / "buckets").mkdir(parents=True)
+    try:
+        handles = [
+            (work_dir / "buckets" / f"{bucket:02d}.csv").open("w", newline="", encoding="utf-8")
+            for bucket in range(_BUCKETS)
+        ]
+        writers = [csv.writer(handle, lineterminator="\n") for handle in handles]
+        total = 0
+        try:
+            for values in rows:
+                if len(values) != width:  # ragged CSV line: pad or trim like csv.DictReader
+                    values = [*values[:width], *([""] * (width - len(values)))]
+                person_id = values[person_index].strip()
+                if not person_id:
+                    continue
+                writers[_bucket(person_id)].writerow(values)
+                total += 1
+        finally:
+            for handle in handles:
+                handle.close()
+
+        def order(values: Sequence[str]) -> tuple[str, str, str]:
+            return (
+                values[person_index].strip(),
+                values[date_index] if date_index is not None else "",
+                values[game_index] if game_index is not None else "",
+            )
+
+        players: dict[str, list[int]] = {}
+        with (work_dir / "games.csv").open("wb") as output:
+            output.write(_csv_bytes([header]))
+            for bucket in range(_BUCKETS):
+                path = work_dir / "buckets" / f"{bucket:02d}.csv"
+                with path.open(newline="", encoding="utf-8") as handle:
+                    bucket_rows = sorted(csv.reader(handle), key=order)
+                path.unlink()
+                for person_id, group in groupby(
+                    bucket_rows, key=lambda values: values[person_index].strip()
+                ):
+                    block_rows = list(group)
+                    block = _csv_bytes(block_rows)
+                    players[person_id] = [output.tell(), len(block), len(block_rows)]
+                    output.write(block)
+        (work_dir / "buckets").rmdir()
+
+        manifest = {
+            "version": INDEX_VERSION,
+            "sha256": checksum,
+            "header": header,
+            "rows": total,
+            "order": "personId, then gameDate and gameId",
+            "players": players,
+        }
+        (work_dir / "index.json").write_text(
+            json.dumps(manifest, separators=(",", ":")) + "\n", encoding="utf-8"
+        )
+        shutil.rmtree(final_dir, ignore_errors=True)
+        _loaded.pop(final_dir, None)
+        os.replace(work_dir, final_dir)
+    except BaseException:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        raise
+    return final_dir
+
+
+def build_player_game_index(
+    *,
+    force: bool = False,
+    archive_path: Path = ARCHIVE_PATH,
+    index_root: Path = INDEX_ROOT,
+) -> PlayerGameIndex:
+    """Build the player-ordered store for ``archive_path`` (once per checksum)."""
+
+    from scripts.player_stats_reader import PlayerStatisticsStreamError, open_player_statistics
+
+    if not force:
+        existing = load_player_game_index(archive_path, index_root=index_root)
+        if existing is not None:
+            return existing
+    checksum = archive_checksum(archive_path)
+    if not checksum:
+        raise PlayerStatisticsStreamError(
+            "PlayerStatistics.7z is missing. Ensure the archive is present before building the player index."
+        )
+    with open_player_statistics(archive_path=archive_path) as (header, rows):
+        write_player_game_index(header, rows, checksum, index_root=index_root)
+    index = load_player_game_index(archive_path, index_root=index_root)
+    assert index is not None
+    return index
+
+
+def get_player_games(
+    person_id: str,
+    projection: Any = None,
+    *,
+    archive_path: Path = ARCHIVE_PATH,
+    index_root: Path = INDEX_ROOT,
+) -> list[Any]:
+    """Return every game of ``person_id`` ordered by date, without scanning the table.
+
+    Rows are ``DictReader``-style mappings, or ``projection`` records when a
+    :class:`~scripts.player_stats_reader.Projection` is given. The index is
+    built on first use.
+    """
+
+    index = load_player_game_index(archive_path, index_root=index_root)
+    if index is None:
+        index = build_player_game_index(archive_path=archive_path, index_root=index_root)
+    if projection is not None:
+        return index.records(person_id, projection)
+    return index.games(person_id)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Build the per-player PlayerStatistics index.")
+    parser.add_argument(
+        "--force", action="store_true", help="Rebuild even when a current index exists."
+    )
+    parser.add_argument(
+        "--player", help="Print this personId's game log as CSV instead of a summary."
+    )
+    args = parser.parse_args(argv)
+    index = build_player_game_index(force=args.force)
+    if args.player:
+        writer = csv.writer(sys.stdout, lineterminator="\n")
+        writer.writerow(index.header)
+        writer.writerows(index.values(args.player))
+        return
+    print(
+        f"Indexed {index.rows:,} rows for {len(index):,} players at",
+        index.directory.relative_to(ROOT),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,576 @@
+"""Typed, column-projected access to the ``PlayerStatistics`` player-game rows.
+
+Builders used to receive one ``dict[str, str]`` per row holding all ~35
+columns and then re-parse the handful of values they needed. A
+:class:`Projection` instead declares the columns a consumer reads and how each
+is converted; rows are parsed with :func:`csv.reader`, the declared columns are
+picked by header position and the converted values land in a compact
+``namedtuple`` record.
+
+:func:`open_player_statistics` is the single place that knows how to reach the
+rows: the column cache when it is current, otherwise a stream of the source
+(``PlayerStatistics.7z`` or any input :mod:`scripts.sources` accepts).
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import sys
+from collections import namedtuple
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache
+from itertools import compress, repeat
+from pathlib import Path
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+    TextIO,
+    Union,
+)
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.decompression import DecompressionStats  # noqa: E402
+from scripts.player_stats_blocks import (  # noqa: E402
+    iter_block_bytes,
+    load_block_index,
+    open_blocks,
+    season_date_bounds,
+)
+from scripts.player_stats_cache import (  # noqa: E402
+    ARCHIVE_PATH,
+    INT_NULL,
+    PlayerStatisticsColumns,
+    archive_checksum,
+    load_player_statistics_cache,
+    tee_values_into_cache,
+)
+from scripts.player_stats_shards import ShardFilter, load_shard_manifest, open_shards  # noqa: E402
+from scripts.sources import SourceError, SourceRead, last_source_read, open_source  # noqa: E402
+
+DEFAULT_CHUNK_BYTES = 8 << 20
+
+MEMBER = "PlayerStatistics.csv"
+
+
+class PlayerStatisticsStreamError(RuntimeError):
+    """Raised when the PlayerStatistics archive cannot be streamed."""
+
+
+# ---------------------------------------------------------------------------
+# Column converters
+
+
+def _text(value: str) -> str:
+    return value.strip()
+
+
+def _lower(value: str) -> str:
+    return value.strip().lower()
+
+
+def _float(value: str) -> float | None:
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _int(value: str) -> int | None:
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        return int(float(value))
+    except (OverflowError, ValueError):
+        return None
+
+
+def _flag(value: str) -> bool:
+    return value.strip() == "1"
+
+
+# Low-cardinality text (names, teams, game types) is interned: every distinct
+# raw text maps to one canonical string shared by all rows and columns, so the
+# hot loops hash and group pre-built objects instead of fresh per-row copies.
+_CATEGORIES: dict[str, str] = {}
+_LOWER_CATEGORIES: dict[str, str] = {}
+
+
+def _category(value: str) -> str:
+    try:
+        return _CATEGORIES[value]
+    except KeyError:
+        canonical = _CATEGORIES[value] = sys.intern(value.strip())
+        return canonical
+
+
+def _category_lower(value: str) -> str:
+    try:
+        return _LOWER_CATEGORIES[value]
+    except KeyError:
+        canonical = _LOWER_CATEGORIES[value] = sys.intern(value.strip().lower())
+        return canonical
+
+
+@lru_cache(maxsize=None)
+def joined_category(first: str, second: str) -> str:
+    """Interned ``"first second"`` (each part stripped), e.g. a team city and name."""
+
+    return sys.intern(f"{first.strip()} {second.strip()}".strip())
+
+
+CONVERTERS: dict[str, Callable[[str], Any]] = {
+    "str": _text,
+    "lower": _lower,
+    "category": _category,
+    "category_lower": _category_lower,
+    "float": _float,
+    "int": _int,
+    "flag": _flag,
+}
+
+ColumnType = Union[str, Callable[..., Any]]
+FieldSpec = Union[ColumnType, tuple[Union[str, tuple[str, ...]], ColumnType]]
+
+
+def memoized(converter: Callable[[str], Any]) -> Callable[[str], Any]:
+    """Cache ``converter`` per distinct text, for low-cardinality columns such as ``gameDate``."""
+
+    return lru_cache(maxsize=None)(converter)
+
+
+class Projection:
+    """The typed subset of PlayerStatistics columns a consumer reads.
+
+    ``fields`` maps each record field to a converter: a name from
+    :data:`CONVERTERS`, any callable taking the raw text, or a
+    ``(column, converter)`` pair when the field is derived from a column under
+    another name (``"season": ("gameDate", season_from_date)``). A field may
+    also combine several columns, ``"team": (("playerteamCity",
+    "playerteamName"), joined_category)``, in which case the converter takes
+    one text per column. Columns missing from a source read as blank text.
+
+    The ``category`` kinds intern repeated text (see :func:`_category`); use
+    them for names, teams and game types, not for ids or dates.
+    """
+
+    def __init__(self, name: str, fields: Mapping[str, FieldSpec]) -> None:
+        sources: list[tuple[str, ...]] = []
+        converters: list[Callable[..., Any]] = []
+        for field, spec in fields.items():
+            column, kind = spec if isinstance(spec, tuple) else (field, spec)
+            if isinstance(kind, str):
+                try:
+                    converter = CONVERTERS[kind]
+                except KeyError:
+                    raise ValueError(f"Unknown column type {kind!r} for field {field!r}") from None
+            else:
+                converter = kind
+            sources.append((column,) if isinstance(column, str) else tuple(column))
+            converters.append(converter)
+
+        self.record_type = namedtuple(name, list(fields))
+        self.fields: tuple[str, ...] = self.record_type._fields
+        self.columns: tuple[str, ...] = tuple(dict.fromkeys(c for group in sources for c in group))
+        self._specs = dict(fields)
+        self._sources = tuple(sources)
+        self._converters = tuple(converters)
+
+    def source(self, field: str) -> tuple[tuple[str, ...], Callable[..., Any]]:
+        """The columns field ``field`` is read from and the converter applied to them."""
+
+        index = self.fields.index(field)
+        return self._sources[index], self._converters[index]
+
+    def extend(self, fields: Mapping[str, FieldSpec]) -> Projection:
+        """Return a projection with ``fields`` appended to this one's."""
+
+        return Projection(self.record_type.__name__, {**self._specs, **fields})
+
+    def reader(self, header: Sequence[str]) -> Callable[[Sequence[str]], tuple]:
+        """Return a function turning one ``csv.reader`` row laid out as ``header`` into a record.
+
+        The function is compiled for this header (like :func:`collections.namedtuple`
+        builds its methods), so each row costs one call with direct indexing and
+        no per-field dispatch. Missing columns become blank-text literals.
+        """
+
+        positions = {name: index for index, name in enumerate(header)}
+        namespace: dict[str, Any] = {"make": tuple.__new__, "record_type": self.record_type}
+        arguments: list[str] = []
+        width = 0
+        for number, (group, converter) in enumerate(
+            zip(self._sources, self._converters, strict=True)
+        ):
+            texts = []
+            for column in group:
+                index = positions.get(column)
+                texts.append('""' if index is None else f"values[{index}]")
+                width = max(width, 0 if index is None else index + 1)
+            namespace[f"convert_{number}"] = converter
+            arguments.append(f"convert_{number}({', '.join(texts)})")
+
+        source = (
+            "def read(values):\n"
+            "    try:\n"
+            f"        return make(record_type, ({', '.join(arguments)},))\n"
+            "    except IndexError:\n"
+            f"        if len(values) >= {width}:\n"
+            "            raise\n"
+            "        # ragged line: pad like csv.DictReader does\n"
+            f"        return read([*values, *[''] * ({width} - len(values))])\n"
+        )
+        exec(compile(source, f"<{self.record_type.__name__} reader>", "exec"), namespace)
+        return namespace["read"]
+
+    def cache_records(self, cache: PlayerStatisticsColumns) -> Iterator[tuple]:
+        """Records for every row of the column ``cache``, straight from its typed values.
+
+        Dictionary-coded text is converted once per distinct value and the
+        numeric converters read the int/float columns directly, so no row is
+        turned back into CSV text and parsed again. The records equal what
+        :meth:`reader` builds from the same rows.
+        """
+
+        available = set(cache.header)
+        fields = [
+            _cached_field(cache, group, converter, available)
+            for group, converter in zip(self._sources, self._converters, strict=True)
+        ]
+        return map(self.record_type._make, zip(*fields, strict=True))
+
+    def from_mapping(self, row: Mapping[str, Any]) -> tuple:
+        """Convert a ``DictReader``-style mapping, for callers that already hold rows."""
+
+        values = []
+        for group, converter in zip(self._sources, self._converters, strict=True):
+            texts = [row.get(column) for column in group]
+            values.append(converter(*("" if text is None else str(text) for text in texts)))
+        return tuple.__new__(self.record_type, values)
+
+
+def _cached_int(value: int) -> int | None:
+    if value == INT_NULL:
+        return None
+    # ``_int`` goes through float(); only integers beyond 2**53 can differ.
+    return value if -(2**53) <= value <= 2**53 else int(float(value))
+
+
+def _cached_int_as_float(value: int) -> float | None:
+    return None if value == INT_NULL else float(value)
+
+
+def _cached_int_flag(value: int) -> bool:
+    return value == 1
+
+
+def _cached_float(value: float) -> float | None:
+    return None if value != value else value
+
+
+def _cached_float_as_int(value: float) -> int | None:
+    return None if value != value else int(value)
+
+
+# (cache column type, converter) -> the same conversion applied to the raw value.
+_CACHED_NUMERIC: dict[tuple[str, Callable[..., Any]], Callable[[Any], Any]] = {
+    ("int", _int): _cached_int,
+    ("int", _float): _cached_int_as_float,
+    ("int", _flag): _cached_int_flag,
+    ("float", _float): _cached_float,
+    ("float", _int): _cached_float_as_int,
+}
+
+
+def _cached_field(
+    cache: PlayerStatisticsColumns,
+    group: tuple[str, ...],
+    converter: Callable[..., Any],
+    available: set[str],
+) -> Iterator[Any]:
+    """One field's converted values for every cached row."""
+
+    if not any(column in available for column in group):
+        return repeat(converter(*[""] * len(group)), cache.rows)
+    if len(group) > 1 or group[0] not in available:
+        texts = [
+            cache.text_column(column) if column in available else repeat("", cache.rows)
+            for column in group
+        ]
+        return map(converter, *texts)
+    column = group[0]
+    kind = cache.column_type(column)
+    values = cache.column(column)
+    if kind == "str":
+        converted = [converter(text) for text in cache.dictionary(column)]
+        return map(converted.__getitem__, values)
+    numeric = _CACHED_NUMERIC.get((kind, converter))
+    if numeric is not None:
+        return map(numeric, values)
+    return map(converter, map(cache.value_text(column), values))
+
+
+# ---------------------------------------------------------------------------
+# Archive access
+
+
+@contextmanager
+def _open_archive_bytes(archive_path: Path) -> Iterator[BinaryIO]:
+    """Open the decompressed ``PlayerStatistics.csv`` bytes of any supported source.
+
+    ``archive_path`` may be the ``.7z`` archive or any other input accepted by
+    :func:`scripts.sources.open_source`; the decoder is chosen there.
+    """
+
+    try:
+        with open_source(archive_path, MEMBER) as handle:
+            yield handle
+    except SourceError as exc:
+        raise PlayerStatisticsStreamError(str(exc)) from exc
+
+
+def last_source() -> SourceRead | None:
+    """How ``PlayerStatistics.csv`` was last read from its source in this process."""
+
+    return last_source_read(MEMBER)
+
+
+def last_decompression_stats() -> DecompressionStats | None:
+    """Throughput counters of the most recent archive stream, if one ran in this process."""
+
+    read = last_source()
+    return read.stats if read is not None else None
+
+
+@contextmanager
+def _open_archive_csv(archive_path: Path) -> Iterator[TextIO]:
+    with _open_archive_bytes(archive_path) as raw:
+        with io.TextIOWrapper(raw, encoding="utf-8", newline="") as handle:
+            yield handle
+
+
+def shard_filter(
+    seasons: Collection[int] | None = None, game_types: Collection[str] | None = None
+) -> ShardFilter | None:
+    """Return the :class:`ShardFilter` for these filters, or ``None`` when unfiltered."""
+
+    if seasons is None and game_types is None:
+        return None
+    return ShardFilter(seasons, game_types)
+
+
+@contextmanager
+def open_player_statistics(
+    columns: Iterable[str] | None = None,
+    *,
+    use_cache: bool = True,
+    archive_path: Path = ARCHIVE_PATH,
+    seasons: Collection[int] | None = None,
+    game_types: Collection[str] | None = None,
+) -> Iterator[tuple[list[str], Iterator[Sequence[str]]]]:
+    """Yield ``(header, rows)`` where each row is a sequence of CSV text laid out as ``header``.
+
+    ``columns`` is a hint: the column cache only materialises the requested
+    columns, while the archive stream always carries the full header. A valid
+    column cache (see :mod:`scripts.player_stats_cache`) is read in preference
+    to the archive; otherwise the 7z stream is recorded into the cache for the
+    next run.
+
+    ``seasons`` (start years, July cutoff) and ``game_types`` keep only the
+    matching rows. Current season shards (see :mod:`scripts.player_stats_shards`)
+    are then read instead, so only the matching files are opened. Without a
+    column cache, current seekable blocks (see :mod:`scripts.player_stats_blocks`)
+    replace the archive stream and skip the blocks outside the seasons.
+    """
+
+    keep = shard_filter(seasons, game_types)
+    if keep is not None and use_cache:
+        manifest = load_shard_manifest(archive_path)
+        if manifest is not None:
+            with open_shards(manifest, keep) as opened:
+                yield opened
+            return
+    if keep is not None and columns is not None:
+        columns = [*columns, "gameDate", "gameType"]
+
+    if use_cache:
+        cached = load_player_statistics_cache(archive_path)
+        if cached is not None:
+            with cached:
+                if columns is None:
+                    names = list(cached.header)
+                else:
+                    available = set(cached.header)
+                    names = [name for name in dict.fromkeys(columns) if name in available]
+                values = cached.iter_values(names)
+                yield names, values if keep is None else filter(keep.predicate(names), values)
+            return
+
+    if not archive_path.exists():
+        raise PlayerStatisticsStreamError(
+            "PlayerStatistics.7z is missing. Ensure the archive is present before running the build script."
+        )
+
+    blocks = load_block_index(archive_path) if use_cache else None
+    start, end = season_date_bounds(keep.seasons if keep is not None else None)
+    if blocks is not None and (start or end):
+        # Pruned block reads skip rows, so they are not recorded into the cache.
+        with open_blocks(blocks, start=start, end=end) as (header, rows):
+            yield header, filter(keep.predicate(header), rows)
+        return
+
+    rows: Iterator[Sequence[str]]
+    with ExitStack() as stack:
+        if blocks is not None:
+            header, rows = stack.enter_context(open_blocks(blocks))
+        else:
+            reader = csv.reader(stack.enter_context(_open_archive_csv(archive_path)))
+            header = next(reader, [])
+            rows = reader
+        checksum = archive_checksum(archive_path) if use_cache else None
+        if checksum and header:
+            # Every row is recorded into the cache; filters apply after the tee.
+            rows = tee_values_into_cache(
+                header, rows, checksum, archive_size=archive_path.stat().st_size
+            )
+        try:
+            yield header, rows if keep is None else filter(keep.predicate(header), rows)
+        finally:
+            close = getattr(rows, "close", None)
+            if close is not None:
+                close()
+
+
+def player_statistics_cache_available(archive_path: Path = ARCHIVE_PATH) -> bool:
+    """Whether :func:`open_player_statistics` would read the column cache."""
+
+    cached = load_player_statistics_cache(archive_path)
+    if cached is None:
+        return False
+    cached.close()
+    return True
+
+
+@contextmanager
+def open_cached_records(
+    projections: Sequence[Projection],
+    *,
+    archive_path: Path = ARCHIVE_PATH,
+    seasons: Collection[int] | None = None,
+    game_types: Collection[str] | None = None,
+) -> Iterator[list[Iterator[tuple]] | None]:
+    """Yield one stream of typed records per projection, read from the column cache.
+
+    Yields ``None`` when :func:`open_player_statistics` would not read the
+    column cache: it is missing or stale, or a filtered read has current
+    season shards. The streams come from :meth:`Projection.cache_records` and
+    line up row for row; ``seasons`` and ``game_types`` filter as they do there.
+    """
+
+    keep = shard_filter(seasons, game_types)
+    if keep is not None and load_shard_manifest(archive_path) is not None:
+        yield None
+        return
+    cached = load_player_statistics_cache(archive_path)
+    if cached is None:
+        yield None
+        return
+    with cached:
+        streams = [projection.cache_records(cached) for projection in projections]
+        if keep is not None:
+            names = [name for name in ("gameDate", "gameType") if name in cached.header]
+            mask = list(map(keep.predicate(names), cached.iter_values(names)))
+            streams = [compress(stream, mask) for stream in streams]
+        yield streams
+
+
+@contextmanager
+def open_player_statistics_chunks(
+    *,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    archive_path: Path = ARCHIVE_PATH,
+) -> Iterator[tuple[list[str], Iterator[bytes]]]:
+    """Yield the header and newline-aligned chunks of the decompressed CSV bytes.
+
+    Each chunk holds whole lines and can be parsed independently, e.g. in a
+    worker process. PlayerStatistics.csv never quotes a line break inside a
+    field, so splitting on newlines is safe. Current seekable blocks (see
+    :mod:`scripts.player_stats_blocks`) are decoded in parallel and yielded
+    one per chunk; otherwise the archive is streamed directly. This path
+    neither reads nor writes the column cache.
+    """
+
+    if not archive_path.exists():
+        raise PlayerStatisticsStreamError(
+            "PlayerStatistics.7z is missing. Ensure the archive is present before running the build script."
+        )
+
+    blocks = load_block_index(archive_path)
+    if blocks is not None:
+        chunks = iter_block_bytes(blocks)
+        try:
+            yield list(blocks.header), chunks
+        finally:
+            chunks.close()
+        return
+
+    with _open_archive_bytes(archive_path) as stream:
+        header = next(csv.reader([stream.readline().decode("utf-8")]), [])
+        yield header, _iter_line_chunks(stream, chunk_bytes)
+
+
+def _iter_line_chunks(stream: BinaryIO, chunk_bytes: int) -> Iterator[bytes]:
+    while True:
+        chunk = stream.read(chunk_bytes)
+        if not chunk:
+            return
+        if not chunk.endswith(b"\n"):
+            chunk += stream.readline()
+        yield chunk
+
+
+def iter_player_statistics_rows(
+    *,
+    use_cache: bool = True,
+    seasons: Collection[int] | None = None,
+    game_types: Collection[str] | None = None,
+) -> Iterator[dict[str, str]]:
+    """Yield rows from ``PlayerStatistics.7z`` as ``DictReader``-style mappings.
+
+    ``seasons``/``game_types`` filter as in :func:`open_player_statistics`.
+    """
+
+    with open_player_statistics(use_cache=use_cache, seasons=seasons, game_types=game_types) as (
+        header,
+        rows,
+    ):
+        for values in rows:
+            yield dict(zip(header, values, strict=False))
+
+
+def iter_player_statistics_records(
+    projection: Projection,
+    *,
+    use_cache: bool = True,
+    seasons: Collection[int] | None = None,
+    game_types: Collection[str] | None = None,
+) -> Iterator[tuple]:
+    """Yield ``projection`` records for every (matching) PlayerStatistics row."""
+
+    with open_player_statistics(
+        projection.columns, use_cache=use_cache, seasons=seasons, game_types=game_types
+    ) as (header, rows):
+        yield from map(projection.reader(header), rows)
@@ -0,0 +1,302 @@
+"""Single-pass fan-out over the ``PlayerStatistics`` player-game rows.
+
+Decompressing and parsing ``PlayerStatistics.7z`` dominates the nightly
+rebuild, so builders no longer stream the archive themselves. Each builder
+exposes a consumer object with a ``consume(row)`` method, registers it with a
+:class:`PlayerStatisticsScan`, and every registered consumer is fed from one
+decode-and-parse pass.
+
+Consumers that declare a ``columns`` :class:`~scripts.player_stats_reader.Projection`
+receive typed records holding only those columns; consumers without one still
+receive ``DictReader``-style mappings.
+
+With ``jobs > 1`` the decompressed CSV is cut into newline-aligned chunks that
+worker processes parse into their own copies of the consumers. The main process
+folds each partial consumer back in chunk order with ``merge(other)``. Float
+sums then add per-chunk partials, so they can differ from a single pass in
+the last bits.
+
+``backend="numpy"`` loads the projected columns once as a
+:class:`~scripts.player_stats_arrays.ColumnFrame` instead. Consumers with a
+``consume_frame(frame)`` method fold it with grouped array reductions; the
+others receive the same typed records, rebuilt from the frame.
+"""
+
+from __future__ import annotations
+
+import copy
+import csv
+import io
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Collection, Iterable, Mapping, Protocol, Sequence, TypeVar
+
+from scripts.player_stats_arrays import BACKENDS, ColumnFrame, load_frame
+from scripts.player_stats_reader import (
+    Projection,
+    open_cached_records,
+    open_player_statistics,
+    open_player_statistics_chunks,
+    player_statistics_cache_available,
+    shard_filter,
+)
+from scripts.player_stats_shards import ShardFilter, load_shard_manifest
+
+Handler = tuple[Callable[[Any], Any] | None, Callable[[Any], None]]
+
+
+class PlayerStatisticsConsumer(Protocol):
+    """Anything that can fold a single player-game row into its running state."""
+
+    def consume(self, row: Any) -> None: ...
+
+
+ConsumerT = TypeVar("ConsumerT", bound=PlayerStatisticsConsumer)
+
+
+def _projection(consumer: PlayerStatisticsConsumer) -> Projection | None:
+    projection = getattr(consumer, "columns", None)
+    return projection if isinstance(projection, Projection) else None
+
+
+class PlayerStatisticsScan:
+    """Feed every registered consumer from a single pass over the rows."""
+
+    def __init__(self) -> None:
+        self._consumers: list[PlayerStatisticsConsumer] = []
+        self.rows_scanned = 0
+
+    def register(self, consumer: ConsumerT) -> ConsumerT:
+        self._consumers.append(consumer)
+        return consumer
+
+    @property
+    def consumers(self) -> tuple[PlayerStatisticsConsumer, ...]:
+        return tuple(self._consumers)
+
+    def columns(self) -> list[str] | None:
+        """Union of the projected columns, or ``None`` when a consumer needs full rows."""
+
+        names: dict[str, None] = {}
+        for consumer in self._consumers:
+            projection = _projection(consumer)
+            if projection is None:
+                return None
+            names.update(dict.fromkeys(projection.columns))
+        return list(names)
+
+    def run(
+        self,
+        rows: Iterable[Mapping[str, Any]] | None = None,
+        *,
+        jobs: int = 1,
+        seasons: Collection[int] | None = None,
+        game_types: Collection[str] | None = None,
+        backend: str = "python",
+    ) -> int:
+        """Stream ``rows`` (the archive by default) into every consumer.
+
+        ``jobs > 1`` parses the archive in that many worker processes; every
+        consumer must then implement ``merge`` and must not have consumed rows
+        yet, because the workers start from copies of it. A current column
+        cache is always read in-process, since it skips CSV parsing entirely.
+        ``jobs=0`` uses every core.
+
+        ``seasons`` (start years, July cutoff) and ``game_types`` restrict the
+        scan to matching rows, reading only the matching season shards when
+        they are current; see :mod:`scripts.player_stats_shards`.
+
+        ``backend="numpy"`` (see :mod:`scripts.player_stats_arrays`) reads the
+        rows in-process as one column frame; ``jobs`` is then ignored and
+        every consumer must declare a ``columns`` projection.
+
+        Returns the number of rows read so callers can report coverage without
+        registering a dedicated counter.
+        """
+
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown scan backend {backend!r}; expected one of {BACKENDS}")
+        keep = shard_filter(seasons, game_types)
+        if backend == "numpy":
+            count = self._run_frame(rows, keep)
+        elif rows is not None:
+            if keep is not None:
+                rows = filter(keep.matches_mapping, rows)
+            handlers = [
+                (_mapping_reader(consumer), consumer.consume) for consumer in self._consumers
+            ]
+            count = _feed(rows, handlers)
+        elif jobs != 1 and not self._read_in_process(keep):
+            count = self._run_parallel(jobs or os.cpu_count() or 1, keep)
+        else:
+            cached = self._run_cached(seasons, game_types)
+            if cached is not None:
+                count = cached
+            else:
+                with open_player_statistics(
+                    self.columns(), seasons=seasons, game_types=game_types
+                ) as (
+                    header,
+                    values,
+                ):
+                    handlers = [
+                        (_values_reader(consumer, header), consumer.consume)
+                        for consumer in self._consumers
+                    ]
+                    count = _feed(values, handlers)
+        self.rows_scanned += count
+        return count
+
+    def _run_frame(self, rows: Iterable[Mapping[str, Any]] | None, keep: ShardFilter | None) -> int:
+        names = self.columns()
+        if names is None:
+            raise TypeError(
+                "The numpy backend needs every consumer to declare a columns projection"
+            )
+        frame = load_frame(names, rows, keep=keep)
+        for consumer in self._consumers:
+            _feed_frame(frame, consumer)
+        return frame.length
+
+    def _run_cached(
+        self, seasons: Collection[int] | None, game_types: Collection[str] | None
+    ) -> int | None:
+        """Feed typed records straight from the column cache; ``None`` when the cache is not used.
+
+        Every consumer needs a projection; see :func:`open_cached_records`.
+        """
+
+        projections = [_projection(consumer) for consumer in self._consumers]
+        if not projections or None in projections:
+            return None
+        with open_cached_records(projections, seasons=seasons, game_types=game_types) as streams:
+            if streams is None:
+                return None
+            consumes = [consumer.consume for consumer in self._consumers]
+            count = 0
+            for records in zip(*streams, strict=True):
+                count += 1
+                for consume, record in zip(consumes, records, strict=True):
+                    consume(record)
+        return count
+
+    @staticmethod
+    def _read_in_process(keep: ShardFilter | None) -> bool:
+        # Shards and the column cache skip CSV parsing; workers would only add overhead.
+        if keep is not None and load_shard_manifest() is not None:
+            return True
+        return player_statistics_cache_available()
+
+    def _run_parallel(self, jobs: int, keep: ShardFilter | None = None) -> int:
+        for consumer in self._consumers:
+            if not callable(getattr(consumer, "merge", None)):
+                raise TypeError(
+                    f"{type(consumer).__name__} has no merge(), so it cannot be scanned with jobs > 1"
+                )
+
+        count = 0
+        pending: deque[Future] = deque()
+
+        def fold(future: Future) -> None:
+            nonlocal count
+            rows, partials = future.result()
+            count += rows
+            for consumer, partial in zip(self._consumers, partials, strict=True):
+                consumer.merge(partial)
+
+        with open_player_statistics_chunks() as (header, chunks):
+            prototypes = copy.deepcopy(self._consumers)
+            with ProcessPoolExecutor(
+                jobs, initializer=_init_worker, initargs=(prototypes, header, keep)
+            ) as pool:
+                for chunk in chunks:
+                    pending.append(pool.submit(_scan_chunk, chunk))
+                    # Bound the decompressed bytes held in flight.
+                    if len(pending) >= 2 * jobs:
+                        fold(pending.popleft())
+                while pending:
+                    fold(pending.popleft())
+        return count
+
+
+def _mapping_reader(
+    consumer: PlayerStatisticsConsumer,
+) -> Callable[[Mapping[str, Any]], Any] | None:
+    projection = _projection(consumer)
+    return projection.from_mapping if projection is not None else None
+
+
+def _values_reader(
+    consumer: PlayerStatisticsConsumer, header: list[str]
+) -> Callable[[Sequence[str]], Any]:
+    projection = _projection(consumer)
+    if projection is not None:
+        return projection.reader(header)
+    return lambda values: dict(zip(header, values, strict=False))
+
+
+def _feed_frame(frame: ColumnFrame, consumer: PlayerStatisticsConsumer) -> None:
+    consume_frame = getattr(consumer, "consume_frame", None)
+    if callable(consume_frame):
+        consume_frame(frame)
+        return
+    projection = _projection(consumer)
+    assert projection is not None
+    consume = consumer.consume
+    for record in frame.records(projection):
+        consume(record)
+
+
+def _feed(rows: Iterable[Any], handlers: list[Handler]) -> int:
+    count = 0
+    for row in rows:
+        count += 1
+        for read, handle in handlers:
+            handle(row if read is None else read(row))
+    return count
+
+
+def scan_player_statistics(
+    consumers: Iterable[PlayerStatisticsConsumer],
+    rows: Iterable[Mapping[str, Any]] | None = None,
+    *,
+    jobs: int = 1,
+    seasons: Collection[int] | None = None,
+    game_types: Collection[str] | None = None,
+    backend: str = "python",
+) -> int:
+    """Convenience wrapper that registers ``consumers`` and runs one scan."""
+
+    scan = PlayerStatisticsScan()
+    for consumer in consumers:
+        scan.register(consumer)
+    return scan.run(rows, jobs=jobs, seasons=seasons, game_types=game_types, backend=backend)
+
+
+# ---------------------------------------------------------------------------
+# Worker processes
+
+_worker_prototypes: list[PlayerStatisticsConsumer] = []
+_worker_readers: list[Callable[[Sequence[str]], Any]] = []
+_worker_keep: Callable[[Sequence[str]], bool] | None = None
+
+
+def _init_worker(
+    prototypes: list[PlayerStatisticsConsumer], header: list[str], keep: ShardFilter | None = None
+) -> None:
+    global _worker_prototypes, _worker_readers, _worker_keep
+    _worker_prototypes = prototypes
+    _worker_readers = [_values_reader(consumer, header) for consumer in prototypes]
+    _worker_keep = keep.predicate(header) if keep is not None else None
+
+
+def _scan_chunk(chunk: bytes) -> tuple[int, list[PlayerStatisticsConsumer]]:
+    consumers = copy.deepcopy(_worker_prototypes)
+    handlers = [
+        (read, consumer.consume) for read, consumer in zip(_worker_readers, consumers, strict=True)
+    ]
+    rows: Iterable[Sequence[str]] = csv.reader(io.StringIO(chunk.decode("utf-8"), newline=""))
+    if _worker_keep is not None:
+        rows = filter(_worker_keep, rows)
+    return _feed(rows, handlers), consumers
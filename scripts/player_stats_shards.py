@@ -0,0 +1,300 @@
+"""Season/gameType shards of the ``PlayerStatistics`` player-game table.
+
+The recent-window builders (2024-25 scoring averages, the three-season recent
+GOAT scores) read a sliver of the 1946-present table, yet a full scan decodes
+every row. This module writes the rows once as one CSV per season and game
+type, plus a manifest, so a season/gameType filter opens only the matching
+files.
+
+Layout::
+
+    data/cache/player_statistics_shards/<sha256>/
+        manifest.json                   header, season rule and per-shard rows
+        season=2024/regular-season.csv  header line + that shard's rows
+        season=unknown/...              rows without a parseable gameDate
+
+Seasons are keyed by start year as :mod:`scripts.game_dimensions` assigns
+them (a July cutoff, except where ``Games.csv`` says otherwise), so a shard
+holds exactly the rows the builders count in that season. Shards are keyed by the
+archive checksum like the column cache, so a refreshed extract never serves
+stale shards; :func:`scripts.player_stats_reader.open_player_statistics` falls
+back to filtering the full stream when no current shards exist.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import re
+import shutil
+import sys
+from contextlib import ExitStack, contextmanager
+from itertools import chain
+from pathlib import Path
+from typing import Any, Callable, Collection, Iterable, Iterator, Mapping, Sequence
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.game_dimensions import season_from_date  # noqa: E402
+from scripts.player_stats_cache import ARCHIVE_PATH, archive_checksum  # noqa: E402
+
+SHARD_ROOT = ROOT / "data" / "cache" / "player_statistics_shards"
+SHARD_VERSION = 2
+UNKNOWN_SEASON = "unknown"
+_FLUSH_ROWS = 8192
+
+
+def shard_season(game_date: str) -> int | None:
+    """Season start year of a ``gameDate`` text (see :func:`scripts.game_dimensions.season_from_date`)."""
+
+    return season_from_date(game_date)
+
+
+def _slug(game_type: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", game_type.lower()).strip("-") or "unknown"
+
+
+class ShardFilter:
+    """Season/gameType filter applied to shard entries or, without shards, to raw rows.
+
+    ``seasons`` are start years (see :func:`shard_season`); ``game_types``
+    match case-insensitively. ``None`` leaves that dimension unfiltered.
+    """
+
+    def __init__(
+        self, seasons: Collection[int] | None = None, game_types: Collection[str] | None = None
+    ) -> None:
+        self.seasons = frozenset(seasons) if seasons is not None else None
+        self.game_types = (
+            frozenset(value.strip().casefold() for value in game_types)
+            if game_types is not None
+            else None
+        )
+
+    def matches(self, season: int | None, game_type: str) -> bool:
+        if self.seasons is not None and season not in self.seasons:
+            return False
+        return self.game_types is None or game_type.strip().casefold() in self.game_types
+
+    def matches_mapping(self, row: Mapping[str, Any]) -> bool:
+        return self.matches(
+            shard_season((row.get("gameDate") or "").strip()), str(row.get("gameType") or "")
+        )
+
+    def predicate(self, header: Sequence[str]) -> Callable[[Sequence[str]], bool]:
+        """Return a test for ``csv.reader`` rows laid out as ``header``."""
+
+        positions = {name: index for index, name in enumerate(header)}
+        date_index = positions.get("gameDate")
+        type_index = positions.get("gameType")
+        matches = self.matches
+
+        def keep(values: Sequence[str]) -> bool:
+            game_date = (
+                values[date_index].strip()
+                if date_index is not None and date_index < len(values)
+                else ""
+            )
+            game_type = (
+                values[type_index] if type_index is not None and type_index < len(values) else ""
+            )
+            return matches(shard_season(game_date), game_type)
+
+        return keep
+
+
+def shard_directory(checksum: str, shard_root: Path = SHARD_ROOT) -> Path:
+    return shard_root / checksum
+
+
+def load_shard_manifest(
+    archive_path: Path = ARCHIVE_PATH, *, shard_root: Path = SHARD_ROOT
+) -> dict | None:
+    """Return the manifest of the current shards for ``archive_path``, or ``None`` when stale."""
+
+    checksum = archive_checksum(archive_path)
+    if not checksum:
+        return None
+    directory = shard_directory(checksum, shard_root)
+    try:
+        manifest = json.loads((directory / "manifest.json").read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if manifest.get("version") != SHARD_VERSION or manifest.get("sha256") != checksum:
+        return None
+    manifest["directory"] = str(directory)
+    return manifest
+
+
+def select_shards(manifest: Mapping[str, Any], shard_filter: ShardFilter) -> list[Path]:
+    directory = Path(manifest["directory"])
+    return [
+        directory / entry["path"]
+        for entry in manifest["shards"]
+        if shard_filter.matches(entry["season"], entry["gameType"])
+    ]
+
+
+@contextmanager
+def open_shards(
+    manifest: Mapping[str, Any], shard_filter: ShardFilter
+) -> Iterator[tuple[list[str], Iterator[Sequence[str]]]]:
+    """Yield the header and the ``csv.reader`` rows of the shards matching ``shard_filter``."""
+
+    with ExitStack() as stack:
+
+        def rows(path: Path) -> Iterator[Sequence[str]]:
+            handle = stack.enter_context(path.open(newline="", encoding="utf-8"))
+            reader = csv.reader(handle)
+            next(reader, None)
+            yield from reader
+            handle.close()
+
+        paths = select_shards(manifest, shard_filter)
+        yield list(manifest["header"]), chain.from_iterable(map(rows, paths))
+
+
+class _ShardWriter:
+    """Buffer rows per ``(season, gameType slug)`` and append them to the shard files."""
+
+    def __init__(self, directory: Path, header: list[str]) -> None:
+        self.directory = directory
+        self.header = header
+        self.buffers: dict[tuple[int | None, str], list[Sequence[str]]] = {}
+        self.counts: dict[tuple[int | None, str], int] = {}
+        self.game_types: dict[str, str] = {}
+
+    def path(self, key: tuple[int | None, str]) -> str:
+        season, slug = key
+        return f"season={UNKNOWN_SEASON if season is None else season}/{slug}.csv"
+
+    def add(self, season: int | None, game_type: str, values: Sequence[str]) -> None:
+        slug = _slug(game_type)
+        key = (season, slug)
+        buffer = self.buffers.get(key)
+        if buffer is None:
+            buffer = self.buffers[key] = []
+            self.counts[key] = 0
+            self.game_types.setdefault(slug, game_type)
+        buffer.append(values)
+        if len(buffer) >= _FLUSH_ROWS:
+            self.flush(key)
+
+    def flush(self, key: tuple[int | None, str]) -> None:
+        buffer = self.buffers[key]
+        if not buffer:
+            return
+        path = self.directory / self.path(key)
+        new = not path.exists()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle, lineterminator="\n")
+            if new:
+                writer.writerow(self.header)
+            writer.writerows(buffer)
+        self.counts[key] += len(buffer)
+        buffer.clear()
+
+    def close(self) -> list[dict[str, Any]]:
+        for key in self.buffers:
+            self.flush(key)
+        ordered = sorted(self.counts, key=lambda key: (key[0] is None, key[0] or 0, key[1]))
+        return [
+            {
+                "season": key[0],
+                "gameType": self.game_types[key[1]],
+                "path": self.path(key),
+                "rows": self.counts[key],
+            }
+            for key in ordered
+        ]
+
+
+def write_player_statistics_shards(
+    header: Sequence[str],
+    rows: Iterable[Sequence[str]],
+    checksum: str,
+    *,
+    shard_root: Path = SHARD_ROOT,
+) -> Path:
+    """Route ``rows`` into per-season/gameType CSV shards and publish them atomically."""
+
+    header = list(header)
+    positions = {name: index for index, name in enumerate(header)}
+    date_index = positions.get("gameDate")
+    type_index = positions.get("gameType")
+    width = len(header)
+
+    final_dir = shard_directory(checksum, shard_root)
+    work_dir = shard_root / f".{checksum}.tmp-{os.getpid()}"
+    shutil.rmtree(work_dir, ignore_errors=True)
+    work_dir.mkdir(parents=True)
+    writer = _ShardWriter(work_dir, header)
+    total = 0
+    try:
+        for values in rows:
+            if len(values) != width:  # ragged CSV line: pad or trim like csv.DictReader
+                values = [*values[:width], *([""] * (width - len(values)))]
+            game_date = values[date_index].strip() if date_index is not None else ""
+            game_type = values[type_index].strip() if type_index is not None else ""
+            writer.add(shard_season(game_date), game_type or "Unknown", values)
+            total += 1
+        shards = writer.close()
+        manifest = {
+            "version": SHARD_VERSION,
+            "sha256": checksum,
+            "header": header,
+            "rows": total,
+            "seasonRule": "start year from Games.csv; July cutoff for dates it does not list",
+            "shards": shards,
+        }
+        (work_dir / "manifest.json").write_text(
+            json.dumps(manifest, indent=2) + "\n", encoding="utf-8"
+        )
+        shutil.rmtree(final_dir, ignore_errors=True)
+        os.replace(work_dir, final_dir)
+    except BaseException:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        raise
+    return final_dir
+
+
+def build_player_statistics_shards(
+    *,
+    force: bool = False,
+    archive_path: Path = ARCHIVE_PATH,
+    shard_root: Path = SHARD_ROOT,
+) -> Path:
+    """Shard ``PlayerStatistics`` by season and game type (once per checksum)."""
+
+    from scripts.player_stats_reader import PlayerStatisticsStreamError, open_player_statistics
+
+    if not force:
+        manifest = load_shard_manifest(archive_path, shard_root=shard_root)
+        if manifest is not None:
+            return Path(manifest["directory"])
+    checksum = archive_checksum(archive_path)
+    if not checksum:
+        raise PlayerStatisticsStreamError(
+            "PlayerStatistics.7z is missing. Ensure the archive is present before building the shards."
+        )
+    with open_player_statistics(archive_path=archive_path) as (header, rows):
+        return write_player_statistics_shards(header, rows, checksum, shard_root=shard_root)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Shard PlayerStatistics by season and game type.")
+    parser.add_argument(
+        "--force", action="store_true", help="Rebuild even when current shards exist."
+    )
+    args = parser.parse_args(argv)
+    directory = build_player_statistics_shards(force=args.force)
+    print("PlayerStatistics shards ready at", directory.relative_to(ROOT))
+
+
+if __name__ == "__main__":
+    main()
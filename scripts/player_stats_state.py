@@ -0,0 +1,210 @@
+"""Persisted builder state for incremental ``PlayerStatistics`` refreshes.
+
+In season only a few hundred player-game rows land per day, yet a full
+rebuild re-folds every row since 1946. Each builder's accumulators are
+pickled under ``data/cache/player_statistics_state/<name>.pickle`` together
+with a watermark: the largest ``(gameDate, gameId)`` folded in so far. An
+incremental refresh restores that state, feeds a fresh builder only the rows
+past the watermark, and merges it into the restored one. The accumulator
+``merge`` contract makes the result match a full pass (float sums up to
+rounding) as long as the source only gains rows; corrections to already-folded games need a full run,
+which also rewrites the baseline.
+
+Usage::
+
+    refresh = open_refresh("player_leaders", PlayerLeadersBuilder, incremental=True)
+    scan_player_statistics([refresh.consumer])
+    builder = refresh.commit()
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Generic, TypeVar
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.accumulators import Max  # noqa: E402
+from scripts.player_stats_reader import Projection  # noqa: E402
+
+STATE_ROOT = ROOT / "data" / "cache" / "player_statistics_state"
+STATE_VERSION = 3
+
+Watermark = tuple[str, str]
+BuilderT = TypeVar("BuilderT")
+
+
+def _watermark(game_date: str, game_id: str) -> Watermark:
+    return game_date.strip(), game_id.strip()
+
+
+_WATERMARK_FIELDS = {"watermarkDate": ("gameDate", "str"), "watermarkGameId": ("gameId", "str")}
+
+
+class Watermarked:
+    """Feed ``consumer`` only the rows past ``since`` and track the newest row seen."""
+
+    def __init__(self, consumer: Any, since: Watermark | None = None) -> None:
+        self.consumer = consumer
+        self.since = since
+        self.latest = Max()
+        self._attach()
+
+    def _attach(self) -> None:
+        projection = getattr(self.consumer, "columns", None)
+        if isinstance(projection, Projection):
+            self.columns = projection.extend(_WATERMARK_FIELDS)
+        if callable(getattr(self.consumer, "consume_frame", None)):
+            self.consume_frame = self._consume_frame
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The extended projection's record type is built at runtime and cannot be
+        # pickled into worker processes; rebuild it from the consumer instead.
+        state = dict(vars(self))
+        state.pop("columns", None)
+        state.pop("consume_frame", None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        vars(self).update(state)
+        self._attach()
+
+    def consume(self, row: Any) -> None:
+        if isinstance(row, tuple):
+            mark = (row.watermarkDate, row.watermarkGameId)
+        else:
+            mark = ((row.get("gameDate") or "").strip(), (row.get("gameId") or "").strip())
+        if self.since is not None and mark <= self.since:
+            return
+        self.latest.update(mark)
+        self.consumer.consume(row)
+
+    def _consume_frame(self, frame: Any) -> None:
+        """:meth:`consume` for a :class:`~scripts.player_stats_arrays.ColumnFrame`."""
+
+        marks = frame.derive(("gameDate", "gameId"), _watermark)
+        if self.since is not None:
+            since = self.since
+            frame = frame.take(marks.lookup(lambda mark: mark > since, bool))
+            marks = frame.derive(("gameDate", "gameId"), _watermark)
+        if frame.length:
+            self.latest.update(max(marks.values[code] for code in set(marks.codes.tolist())))
+        self.consumer.consume_frame(frame)
+
+    def merge(self, other: Watermarked) -> None:
+        self.consumer.merge(other.consumer)
+        self.latest.merge(other.latest)
+
+    def watermark(self) -> Watermark | None:
+        latest = self.latest.finalize()
+        if self.since is None or (latest is not None and latest > self.since):
+            return latest
+        return self.since
+
+
+@dataclass
+class Refresh(Generic[BuilderT]):
+    """One builder's refresh: restored ``base`` state plus the scan ``consumer`` for newer rows."""
+
+    name: str
+    base: BuilderT | None
+    consumer: Watermarked
+    persist: bool
+    state_root: Path = STATE_ROOT
+
+    def commit(self) -> BuilderT:
+        """Fold the scanned rows into the restored state, persist it and return the builder."""
+
+        builder = self.consumer.consumer
+        if self.base is not None:
+            self.base.merge(builder)
+            builder = self.base
+        if self.persist:
+            save_state(self.name, builder, self.consumer.watermark(), state_root=self.state_root)
+        return builder
+
+
+def _state_path(name: str, state_root: Path) -> Path:
+    return state_root / f"{name}.pickle"
+
+
+def load_state(
+    name: str, builder_type: type, *, state_root: Path = STATE_ROOT
+) -> tuple[Any, Watermark] | None:
+    """Return the persisted ``(builder, watermark)`` for ``name``, or ``None`` when unusable."""
+
+    path = _state_path(name, state_root)
+    if not path.exists():
+        return None
+    try:
+        with path.open("rb") as handle:
+            state = pickle.load(handle)
+    except (
+        OSError,
+        EOFError,
+        pickle.UnpicklingError,
+        AttributeError,
+        ImportError,
+        TypeError,
+    ) as exc:
+        print(f"Ignoring unreadable {path.name} ({exc}); running a full refresh")
+        return None
+    if (
+        not isinstance(state, dict)
+        or state.get("version") != STATE_VERSION
+        or not isinstance(state.get("builder"), builder_type)
+        or state.get("watermark") is None
+    ):
+        return None
+    return state["builder"], tuple(state["watermark"])
+
+
+def save_state(
+    name: str, builder: Any, watermark: Watermark | None, *, state_root: Path = STATE_ROOT
+) -> None:
+    if watermark is None:
+        return
+    if type(builder).__module__ == "__main__":
+        raise RuntimeError(
+            f"{type(builder).__name__} must be imported from its package module to persist state"
+        )
+    state_root.mkdir(parents=True, exist_ok=True)
+    path = _state_path(name, state_root)
+    temp_path = path.with_suffix(".tmp")
+    with temp_path.open("wb") as handle:
+        pickle.dump(
+            {"version": STATE_VERSION, "watermark": watermark, "builder": builder},
+            handle,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    os.replace(temp_path, path)
+
+
+def open_refresh(
+    name: str,
+    factory: Callable[[], BuilderT],
+    *,
+    incremental: bool = False,
+    persist: bool = True,
+    state_root: Path = STATE_ROOT,
+) -> Refresh[BuilderT]:
+    """Prepare ``name`` for a scan.
+
+    With ``incremental`` the persisted state is restored and only rows past its
+    watermark reach the new builder; without usable state this degrades to a
+    full pass. ``persist`` saves the merged state on :meth:`Refresh.commit`, so
+    full runs refresh the baseline for the next incremental one.
+    """
+
+    builder = factory()
+    restored = load_state(name, type(builder), state_root=state_root) if incremental else None
+    if restored is None:
+        return Refresh(name, None, Watermarked(builder), persist, state_root)
+    base, since = restored
+    return Refresh(name, base, Watermarked(builder, since), persist, state_root)
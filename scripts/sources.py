@@ -0,0 +1,423 @@
+"""Source adapters for the raw dataset tables (``PlayerStatistics``, ``TeamStatistics``).
+
+The builders used to hard-code one container per table: the ``7z`` CLI or
+``py7zr`` for ``PlayerStatistics.7z`` and :mod:`zipfile` for
+``TeamStatistics.zip``. :func:`open_source` instead accepts any of
+
+* a ``.7z`` or ``.zip`` archive holding ``<stem>.csv``;
+* a plain ``.csv``, ``.csv.gz`` or ``.csv.xz`` file;
+* an extracted directory holding ``<stem>.csv``;
+* a sharded directory of ``*.csv`` files sharing one header (read in path
+  order, repeated headers dropped).
+
+It picks the fastest decoder available for that input and records the choice
+in a :class:`SourceRead` (see :func:`last_source_read`). Compressed inputs are
+decoded on a worker thread behind a bounded queue (see
+:mod:`scripts.decompression`), so inflating overlaps CSV parsing.
+
+:func:`locate_source` finds a table by stem. It checks every directory on
+``DATASET_SEARCH_PATH`` (``os.pathsep``-separated) before the repository root,
+and within a directory it prefers the cheapest input to decode: extracted
+directory, ``.csv``, ``.csv.gz``, ``.csv.xz``, ``.zip``, then ``.7z``. Build
+hosts with pre-extracted copies only need to set the variable.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import lzma
+import os
+import shutil
+import sys
+import zipfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator, TextIO
+
+try:  # Optional dependency used when the 7z CLI is unavailable.
+    import py7zr  # type: ignore
+except Exception:  # pragma: no cover - fallback only triggered when module missing
+    py7zr = None
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.decompression import (  # noqa: E402
+    DEFAULT_BLOCK_BYTES,
+    DecompressionError,
+    DecompressionStats,
+    ProducerStream,
+    SupervisedStream,
+)
+
+SEARCH_PATH_ENV = "DATASET_SEARCH_PATH"
+EXTRACT_ROOT = ROOT / "data" / "cache" / "extracted"
+
+# Cheapest to decode first.
+_CANDIDATE_SUFFIXES = ("", ".csv", ".csv.gz", ".csv.xz", ".zip", ".7z")
+_SEVEN_ZIP_BINARIES = ("7zz", "7zr", "7z")
+
+_last_reads: dict[str, SourceRead] = {}
+
+
+class SourceError(RuntimeError):
+    """Raised when a dataset source is missing, unrecognised or cannot be decoded."""
+
+
+@dataclass
+class SourceRead:
+    """How one table was read: the input ``path``, its ``kind`` and the ``decoder`` used."""
+
+    path: Path
+    kind: str
+    decoder: str
+    stats: DecompressionStats | None = None
+
+    def summary(self) -> str:
+        text = f"{self.path.name} ({self.kind}) via {self.decoder}"
+        if self.stats is not None:
+            text += f": {self.stats.summary()}"
+        return text
+
+
+def search_directories() -> list[Path]:
+    """Directories :func:`locate_source` checks, in order."""
+
+    configured = os.environ.get(SEARCH_PATH_ENV, "")
+    directories = [Path(entry).expanduser() for entry in configured.split(os.pathsep) if entry]
+    return [*directories, ROOT]
+
+
+def locate_source(stem: str, default: Path | None = None) -> Path:
+    """Return the preferred existing input for table ``stem`` (e.g. ``"TeamStatistics"``).
+
+    Falls back to ``default`` (or ``ROOT / stem``) when nothing is found, so
+    callers still get a path for their "missing archive" error messages.
+    """
+
+    for directory in search_directories():
+        for suffix in _CANDIDATE_SUFFIXES:
+            candidate = directory / f"{stem}{suffix}"
+            if candidate.is_file() if suffix else candidate.is_dir():
+                return candidate
+    return default if default is not None else ROOT / stem
+
+
+def source_kind(path: Path, member: str | None = None) -> str:
+    """Classify ``path`` as ``7z``, ``zip``, ``csv``, ``csv.gz``, ``csv.xz``, ``directory`` or ``sharded``.
+
+    A directory is ``directory`` when it holds ``member`` and ``sharded`` otherwise.
+    """
+
+    if path.is_dir():
+        return "directory" if member and (path / member).is_file() else "sharded"
+    name = path.name.lower()
+    for kind in ("csv.gz", "csv.xz", "csv", "zip", "7z"):
+        if name.endswith(f".{kind}"):
+            return kind
+    raise SourceError(f"Unrecognised dataset source: {path}")
+
+
+def last_source_read(member: str) -> SourceRead | None:
+    """The :class:`SourceRead` of the most recent :func:`open_source` of ``member`` in this process."""
+
+    return _last_reads.get(member)
+
+
+@contextmanager
+def open_source(path: Path, member: str) -> Iterator[BinaryIO]:
+    """Open the decompressed bytes of CSV table ``member`` (e.g. ``"TeamStatistics.csv"``) in ``path``."""
+
+    if not path.exists():
+        raise SourceError(
+            f"{path.name} is missing. Ensure the dataset is present before running the build."
+        )
+    kind = source_kind(path, member)
+    try:
+        with _OPENERS[kind](path, member) as (decoder, stream):
+            stats = getattr(getattr(stream, "raw", stream), "stats", None)
+            _last_reads[member] = SourceRead(path, kind, decoder, stats)
+            yield stream
+    except DecompressionError as exc:
+        raise SourceError(f"Failed to read {member} from {path.name}: {exc}") from exc
+
+
+@contextmanager
+def open_source_text(path: Path, member: str) -> Iterator[TextIO]:
+    """:func:`open_source` decoded as UTF-8 text for :mod:`csv`."""
+
+    with open_source(path, member) as raw:
+        with io.TextIOWrapper(raw, encoding="utf-8", newline="") as handle:
+            yield handle
+
+
+def _buffered(stream: io.RawIOBase) -> io.BufferedReader:
+    return io.BufferedReader(stream, buffer_size=DEFAULT_BLOCK_BYTES)
+
+
+def _threaded(name: str, open_file: Callable[[], BinaryIO]) -> io.BufferedReader:
+    """Decode ``open_file()`` on a worker thread; zlib and lzma release the GIL while inflating."""
+
+    def produce(write: Callable[[bytes], None]) -> None:
+        with open_file() as handle:
+            for block in iter(lambda: handle.read(DEFAULT_BLOCK_BYTES), b""):
+                write(block)
+
+    return _buffered(ProducerStream(produce, name=name))
+
+
+# ---------------------------------------------------------------------------
+# Plain, gzip and xz files
+
+
+@contextmanager
+def _open_csv(path: Path, member: str) -> Iterator[tuple[str, BinaryIO]]:
+    with path.open("rb") as handle:
+        yield "file", handle
+
+
+@contextmanager
+def _open_gzip(path: Path, member: str) -> Iterator[tuple[str, BinaryIO]]:
+    with _threaded("gzip", lambda: gzip.open(path, "rb")) as stream:
+        yield "gzip", stream
+
+
+@contextmanager
+def _open_xz(path: Path, member: str) -> Iterator[tuple[str, BinaryIO]]:
+    with _threaded("lzma", lambda: lzma.open(path, "rb")) as stream:
+        yield "lzma", stream
+
+
+# ---------------------------------------------------------------------------
+# Directories
+
+
+@contextmanager
+def _open_directory(path: Path, member: str) -> Iterator[tuple[str, BinaryIO]]:
+    with (path / member).open("rb") as handle:
+        yield "file", handle
+
+
+def _shard_files(directory: Path) -> list[Path]:
+    return sorted(path for path in directory.rglob("*.csv") if not path.name.startswith("."))
+
+
+class _ConcatenatedCsv(io.RawIOBase):
+    """Raw stream over several CSV files with the same header, emitting the header once."""
+
+    def __init__(self, paths: list[Path]) -> None:
+        super().__init__()
+        self._paths = iter(paths)
+        self._header: bytes | None = None
+        self._handle: BinaryIO | None = None
+
+    def readable(self) -> bool:
+        return True
+
+    def _advance(self) -> bool:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        path = next(self._paths, None)
+        if path is None:
+            return False
+        handle = path.open("rb")
+        header = handle.readline()
+        if self._header is None:
+            self._header = header
+            handle.seek(0)
+        elif header.rstrip(b"\r\n") != self._header.rstrip(b"\r\n"):
+            handle.close()
+            raise SourceError(f"{path} does not share the header of the first shard.")
+        self._handle = handle
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._handle is None and not self._advance():
+            return 0
+        while True:
+            size = self._handle.readinto(buffer)
+            if size or not self._advance():
+                return size
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        super().close()
+
+
+@contextmanager
+def _open_sharded(path: Path, member: str) -> Iterator[tuple[str, BinaryIO]]:
+    paths = _shard_files(path)
+    if not paths:
+        raise SourceError(f"{path} holds neither {member} nor CSV shards.")
+    with _buffered(_ConcatenatedCsv(paths)) as stream:
+        yield "shards", stream
+
+
+# ---------------------------------------------------------------------------
+# Zip archives
+
+
+def _zip_member(archive: zipfile.ZipFile, member: str, path: Path) -> str:
+    names = archive.namelist()
+    if member in names:
+        return member
+    matches = [name for name in names if Path(name).name == member]
+    if len(matches) == 1:
+        return matches[0]
+    raise SourceError(f"{path.name} does not contain {member}.")
+
+
+@contextmanager
+def _open_zip(path: Path, member: str) -> Iterator[tuple[str, BinaryIO]]:
+    with zipfile.ZipFile(path) as archive:
+        name = _zip_member(archive, member, path)  # fail fast in the calling thread
+
+    def open_member() -> BinaryIO:
+        # The archive file stays open until the member handle is closed.
+        with zipfile.ZipFile(path) as archive:
+            return archive.open(name)
+
+    with _threaded("zipfile", open_member) as stream:
+        yield "zipfile", stream
+
+
+# ---------------------------------------------------------------------------
+# 7z archives
+
+
+def _extraction_key(path: Path) -> str:
+    from scripts.player_stats_cache import archive_checksum
+
+    checksum = archive_checksum(path)
+    if checksum:
+        return checksum
+    stat = path.stat()
+    return f"unverified-{stat.st_size}-{stat.st_mtime_ns}"
+
+
+def extract_member(path: Path, member: str, *, extract_root: Path = EXTRACT_ROOT) -> Path:
+    """Extract ``member`` of 7z archive ``path`` once per archive checksum and return its path.
+
+    Used with ``py7zr`` releases that cannot stream a member. The extraction is
+    written to a private directory and renamed into place, so concurrent
+    processes either reuse a complete file or extract their own copy, and later
+    runs skip the unpacking entirely.
+    """
+
+    final_dir = extract_root / _extraction_key(path)
+    extracted_path = final_dir / member
+    if extracted_path.exists():
+        return extracted_path
+    if py7zr is None:
+        raise SourceError(
+            f"Unable to read {path.name}. Install the `p7zip-full` CLI or the `py7zr` Python package."
+        )
+
+    work_dir = extract_root / f".{final_dir.name}.tmp-{os.getpid()}"
+    shutil.rmtree(work_dir, ignore_errors=True)
+    work_dir.mkdir(parents=True)
+    try:
+        with py7zr.SevenZipFile(path, mode="r") as archive:
+            archive.extract(path=work_dir, targets=[member])
+        if not (work_dir / member).exists():
+            raise SourceError(f"Failed to extract {member} from {path.name} using py7zr.")
+        try:
+            os.replace(work_dir, final_dir)
+        except OSError:  # another process published the same extraction first
+            if not extracted_path.exists():
+                raise
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return extracted_path
+
+
+def _seven_zip_binary() -> str | None:
+    for candidate in _SEVEN_ZIP_BINARIES:
+        if shutil.which(candidate):
+            return candidate
+    return None
+
+
+def _py7zr_can_stream() -> bool:
+    """Whether the installed ``py7zr`` accepts a writer factory (0.22 and later)."""
+
+    return py7zr is not None and hasattr(getattr(py7zr, "io", None), "WriterFactory")
+
+
+def _py7zr_producer(path: Path, member: str) -> Callable[[Callable[[bytes], None]], None]:
+    """Return a :class:`~scripts.decompression.ProducerStream` producer for ``member``.
+
+    ``py7zr`` pushes decompressed bytes into the ``Py7zIO`` objects its writer
+    factory hands out; ours forwards them to the stream instead of a file.
+    """
+
+    from py7zr.io import Py7zIO, WriterFactory  # type: ignore
+
+    class _Forward(Py7zIO):
+        def __init__(self, write: Callable[[bytes], None] | None) -> None:
+            self._write = write
+            self._size = 0
+
+        def write(self, data: bytes) -> int:
+            if self._write is not None:
+                self._write(data)
+            self._size += len(data)
+            return len(data)
+
+        def read(self, size: int | None = None) -> bytes:
+            return b""
+
+        def seek(self, offset: int, whence: int = 0) -> int:
+            return self._size
+
+        def flush(self) -> None:
+            return None
+
+        def size(self) -> int:
+            return self._size
+
+    class _Factory(WriterFactory):
+        def __init__(self, write: Callable[[bytes], None]) -> None:
+            self._write = write
+
+        def create(self, filename: str) -> Py7zIO:
+            return _Forward(self._write if Path(filename).name == member else None)
+
+    def produce(write: Callable[[bytes], None]) -> None:
+        with py7zr.SevenZipFile(path, mode="r") as archive:
+            archive.extract(targets=[member], factory=_Factory(write))
+
+    return produce
+
+
+@contextmanager
+def _open_7z(path: Path, member: str) -> Iterator[tuple[str, BinaryIO]]:
+    """Prefer the 7z CLI, then streaming ``py7zr``, then a persistent ``py7zr`` extraction."""
+
+    binary = _seven_zip_binary()
+    if binary is not None:
+        with _buffered(SupervisedStream([binary, "x", "-so", str(path), member])) as stream:
+            yield binary, stream
+    elif _py7zr_can_stream():
+        with _buffered(ProducerStream(_py7zr_producer(path, member), name="py7zr")) as stream:
+            yield "py7zr", stream
+    else:
+        with extract_member(path, member).open("rb") as handle:
+            yield "py7zr-extract", handle
+
+
+_OPENERS: dict[str, Callable[[Path, str], object]] = {
+    "7z": _open_7z,
+    "zip": _open_zip,
+    "csv": _open_csv,
+    "csv.gz": _open_gzip,
+    "csv.xz": _open_xz,
+    "directory": _open_directory,
+    "sharded": _open_sharded,
+}
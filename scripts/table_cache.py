@@ -0,0 +1,229 @@
+"""Parsed-once, cached typed tables for the small CSV sources.
+
+``Games.csv`` (:mod:`scripts.games_table`) and ``TeamStatistics``
+(:mod:`scripts.team_games`) are read by several builders, each of which used
+to run ``csv.DictReader`` over the whole file and convert the same columns
+again. A :class:`TableSpec` describes how one such source becomes a list of
+typed ``NamedTuple`` records; :func:`load_table` parses it once per file hash
+(the SHA-256 of the source's own bytes, not its ``SHA256SUMS.txt`` entry, so
+a replaced file is always re-read):
+
+* loaded tables are memoized per process;
+* otherwise ``<cache_root>/<sha256>.pickle`` holds the records as typed
+  columns (dictionary codes for text, int64 with a null sentinel, float64
+  with NaN, int8 flags, datetimes as int64 seconds), so a later process skips
+  CSV parsing entirely;
+* only a miss decodes the source and parses the CSV, then saves the columns.
+
+The cache checks the table version and field list, so changing a record
+layout never reads stale columns.
+"""
+
+from __future__ import annotations
+
+import csv
+import math
+import os
+import pickle
+import sys
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Mapping
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.player_stats_cache import INT_NULL, content_checksum  # noqa: E402
+from scripts.sources import open_source_text  # noqa: E402
+
+KINDS = ("str", "int", "float", "flag", "datetime")
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """How one CSV source becomes typed records.
+
+    ``kinds`` gives the storage kind (one of :data:`KINDS`) of every field of
+    ``record``; ``parse`` turns a ``csv.DictReader`` row into a record.
+    """
+
+    name: str
+    member: str
+    record: Any  # a NamedTuple type
+    kinds: Mapping[str, str]
+    parse: Callable[[Mapping[str, str | None]], Any]
+    version: int = 1
+
+    def __post_init__(self) -> None:
+        if tuple(self.kinds) != tuple(self.record._fields):
+            raise ValueError(f"{self.name} kinds must list the record fields in order")
+        unknown = set(self.kinds.values()) - set(KINDS)
+        if unknown:
+            raise ValueError(f"{self.name} has unknown column kinds {sorted(unknown)}")
+
+
+def parse_datetime(text: str) -> datetime | None:
+    """Naive ``datetime`` of ISO date text (``"2024-05-06 19:30:00"``), else ``None``."""
+
+    if not text:
+        return None
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    return parsed.replace(tzinfo=None)
+
+
+def parse_int(value: str) -> int | None:
+    if not value:
+        return None
+    try:
+        return int(float(value))
+    except (OverflowError, ValueError):
+        return None
+
+
+def parse_float(value: str) -> float | None:
+    if not value:
+        return None
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    return number if math.isfinite(number) else None
+
+
+# ---------------------------------------------------------------------------
+# Columns
+
+
+def encode_columns(spec: TableSpec, records: list) -> dict[str, Any]:
+    columns: dict[str, Any] = {}
+    for index, (name, kind) in enumerate(spec.kinds.items()):
+        values = [record[index] for record in records]
+        if kind == "str":
+            dictionary: dict[str, int] = {}
+            codes = array("I", (dictionary.setdefault(value, len(dictionary)) for value in values))
+            columns[name] = (list(dictionary), codes)
+        elif kind == "int":
+            columns[name] = array("q", (INT_NULL if value is None else value for value in values))
+        elif kind == "float":
+            columns[name] = array("d", (math.nan if value is None else value for value in values))
+        elif kind == "flag":
+            columns[name] = array("b", map(bool, values))
+        else:
+            seconds = (
+                INT_NULL if value is None else (value - _EPOCH) // timedelta(seconds=1)
+                for value in values
+            )
+            columns[name] = array("q", seconds)
+    return columns
+
+
+def decode_columns(spec: TableSpec, columns: Mapping[str, Any]) -> list:
+    decoded = []
+    for name, kind in spec.kinds.items():
+        column = columns[name]
+        if kind == "str":
+            values, codes = column
+            decoded.append(list(map(values.__getitem__, codes)))
+        elif kind == "int":
+            decoded.append([None if value == INT_NULL else value for value in column])
+        elif kind == "float":
+            decoded.append([None if value != value else value for value in column])
+        elif kind == "flag":
+            decoded.append(list(map(bool, column)))
+        else:
+            decoded.append(
+                [
+                    None if value == INT_NULL else _EPOCH + timedelta(seconds=value)
+                    for value in column
+                ]
+            )
+    return list(map(spec.record._make, zip(*decoded, strict=True)))
+
+
+# ---------------------------------------------------------------------------
+# Loading
+
+
+def cache_path(checksum: str, cache_root: Path) -> Path:
+    return cache_root / f"{checksum}.pickle"
+
+
+def _read_cache(spec: TableSpec, path: Path, checksum: str) -> list | None:
+    try:
+        with path.open("rb") as handle:
+            stored = pickle.load(handle)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+    if (
+        not isinstance(stored, dict)
+        or stored.get("table") != spec.name
+        or stored.get("version") != spec.version
+        or stored.get("sha256") != checksum
+        or stored.get("kinds") != dict(spec.kinds)
+    ):
+        return None
+    return decode_columns(spec, stored["columns"])
+
+
+def _write_cache(spec: TableSpec, path: Path, checksum: str, records: list) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.tmp-{os.getpid()}")
+    stored = {
+        "table": spec.name,
+        "version": spec.version,
+        "sha256": checksum,
+        "kinds": dict(spec.kinds),
+        "rows": len(records),
+        "columns": encode_columns(spec, records),
+    }
+    with temp_path.open("wb") as handle:
+        pickle.dump(stored, handle, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, path)
+
+
+_LOADED: dict[str, tuple[Path, str, list]] = {}
+
+
+def read_table(spec: TableSpec, path: Path) -> list:
+    """Parse ``path`` from CSV text, skipping every cache."""
+
+    with open_source_text(path, spec.member) as handle:
+        return [spec.parse(row) for row in csv.DictReader(handle)]
+
+
+def load_table(spec: TableSpec, path: Path, *, cache_root: Path) -> list:
+    """Every record of ``path``, parsed at most once per file hash.
+
+    Raises ``FileNotFoundError`` when ``path`` does not exist.
+    """
+
+    if not path.exists():
+        raise FileNotFoundError(path)
+    checksum = content_checksum(path)
+    loaded = _LOADED.get(spec.name)
+    if loaded is not None and loaded[:2] == (path, checksum):
+        return loaded[2]
+    cached = cache_path(checksum, cache_root)
+    records = _read_cache(spec, cached, checksum)
+    if records is None:
+        records = read_table(spec, path)
+        try:
+            _write_cache(spec, cached, checksum, records)
+        except OSError:
+            pass
+    _LOADED[spec.name] = (path, checksum, records)
+    return records
+
+
+def forget_tables() -> None:
+    """Drop the per-process memo (the on-disk caches stay)."""
+
+    _LOADED.clear()
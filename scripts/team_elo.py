@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""Chronological team Elo ratings over every ``Games.csv`` game.
+
+Each game moves the two teams' ratings by
+
+    K * margin_multiplier * (result - expected)
+
+where ``expected`` is the home side's pre-game win probability,
+``1 / (1 + 10 ** (-(home + HOME_ADVANTAGE - away) / 400))``, and the margin
+multiplier grows with the winning margin but shrinks for expected blowouts
+(the FiveThirtyEight NBA Elo form). Ratings carry over between seasons: a
+team's first game of a season pulls its rating a quarter of the way back to
+the league mean. Preseason and All-Star games are not rated.
+
+The whole model is an :class:`EloState` that is pickled under
+``data/cache/team_elo/state.pickle`` with a watermark: the largest
+``(start, gameId)`` rated so far. ``--incremental`` restores that state and
+rates only the games past the watermark, so an in-season refresh costs the
+new games rather than a replay of every game since 1946. A game inserted
+before the watermark, or a corrected score, needs a full run, which also
+rewrites the state.
+
+Output: ``public/data/team_elo.json`` with every rated game (both pre-game
+ratings and the home win probability) and one rating timeline per team.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import pickle
+import sys
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Iterable
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.game_dimensions import (  # noqa: E402
+    ALL_STAR,
+    PRESEASON,
+    game_phase,
+    season_from_date_rule,
+    season_from_game_id,
+)
+from scripts.games_table import GAMES_PATH, GameRecord, load_games  # noqa: E402
+from scripts.json_output import write_json  # noqa: E402
+
+OUTPUT_PATH = ROOT / "public" / "data" / "team_elo.json"
+STATE_PATH = ROOT / "data" / "cache" / "team_elo" / "state.pickle"
+STATE_VERSION = 1
+
+INITIAL_RATING = 1500.0
+K_FACTOR = 20.0
+HOME_ADVANTAGE = 100.0
+# Share of a team's distance from the mean kept into the next season.
+SEASON_CARRYOVER = 0.75
+UNRATED_PHASES = frozenset({PRESEASON, ALL_STAR})
+
+Watermark = tuple[str, str]
+
+
+def win_probability(rating: float, opponent: float, advantage: float = 0.0) -> float:
+    """Chance that a ``rating`` side beats ``opponent`` given an ``advantage`` in Elo points."""
+
+    return 1.0 / (1.0 + 10.0 ** (-(rating + advantage - opponent) / 400.0))
+
+
+def margin_multiplier(margin: int, winner_edge: float) -> float:
+    """Scale a result by its margin, damped when the winner was already favored by ``winner_edge``."""
+
+    return (abs(margin) + 3.0) ** 0.8 / (7.5 + 0.006 * winner_edge)
+
+
+@dataclass(frozen=True)
+class RatedGame:
+    """One rated game with the ratings both sides brought into it."""
+
+    gameId: str
+    date: str
+    season: int
+    phase: str | None
+    homeTeamId: str
+    awayTeamId: str
+    homeRating: float
+    awayRating: float
+    homeWinProbability: float
+    homeScore: int
+    awayScore: int
+
+
+@dataclass
+class TeamTimeline:
+    """A team's current rating and its rating after every game it played."""
+
+    team: str
+    rating: float = INITIAL_RATING
+    season: int | None = None
+    history: list[tuple[str, str, float]] = field(default_factory=list)
+
+
+@dataclass
+class EloState:
+    """Everything the model has rated up to ``watermark``."""
+
+    k_factor: float = K_FACTOR
+    home_advantage: float = HOME_ADVANTAGE
+    carryover: float = SEASON_CARRYOVER
+    teams: dict[str, TeamTimeline] = field(default_factory=dict)
+    games: list[RatedGame] = field(default_factory=list)
+    watermark: Watermark | None = None
+
+    def parameters(self) -> tuple[float, float, float]:
+        return self.k_factor, self.home_advantage, self.carryover
+
+    def _timeline(self, team_id: str, name: str, season: int) -> TeamTimeline:
+        timeline = self.teams.get(team_id)
+        if timeline is None:
+            timeline = self.teams[team_id] = TeamTimeline(name)
+        elif timeline.season is not None and season > timeline.season:
+            timeline.rating = INITIAL_RATING + self.carryover * (timeline.rating - INITIAL_RATING)
+        if name:
+            timeline.team = name
+        timeline.season = season
+        return timeline
+
+    def rate(self, record: GameRecord, season: int, phase: str | None) -> RatedGame:
+        """Apply one finished game and return it with its pre-game ratings."""
+
+        home = self._timeline(
+            record.hometeamId, f"{record.hometeamCity} {record.hometeamName}".strip(), season
+        )
+        away = self._timeline(
+            record.awayteamId, f"{record.awayteamCity} {record.awayteamName}".strip(), season
+        )
+        expected = win_probability(home.rating, away.rating, self.home_advantage)
+        margin = record.homeScore - record.awayScore
+        edge = home.rating + self.home_advantage - away.rating
+        multiplier = margin_multiplier(margin, edge if margin > 0 else -edge)
+        shift = self.k_factor * multiplier * ((1.0 if margin > 0 else 0.0) - expected)
+        game = RatedGame(
+            gameId=record.gameId,
+            date=record.day,
+            season=season,
+            phase=phase,
+            homeTeamId=record.hometeamId,
+            awayTeamId=record.awayteamId,
+            homeRating=home.rating,
+            awayRating=away.rating,
+            homeWinProbability=expected,
+            homeScore=record.homeScore,
+            awayScore=record.awayScore,
+        )
+        home.rating += shift
+        away.rating -= shift
+        home.history.append((record.day, record.gameId, home.rating))
+        away.history.append((record.day, record.gameId, away.rating))
+        self.games.append(game)
+        return game
+
+
+def _watermark(record: GameRecord) -> Watermark | None:
+    if record.start is None:
+        return None
+    return record.start.isoformat(sep=" "), record.gameId
+
+
+def _ratable(record: GameRecord) -> bool:
+    return bool(
+        record.hometeamId
+        and record.awayteamId
+        and record.hometeamId != record.awayteamId
+        and record.homeScore is not None
+        and record.awayScore is not None
+        and record.homeScore != record.awayScore
+    )
+
+
+def update_ratings(state: EloState, records: Iterable[GameRecord]) -> int:
+    """Rate the finished games of ``records`` past ``state.watermark`` in date order.
+
+    Returns how many games were rated.
+    """
+
+    since = state.watermark
+    pending: list[tuple[Watermark, GameRecord]] = []
+    for record in records:
+        mark = _watermark(record)
+        if mark is None or (since is not None and mark <= since) or not _ratable(record):
+            continue
+        pending.append((mark, record))
+    pending.sort(key=lambda item: item[0])
+
+    rated = 0
+    seen: set[str] = set()
+    for mark, record in pending:
+        if record.gameId in seen:
+            continue
+        seen.add(record.gameId)
+        phase = game_phase(record.gameId, record.gameType, record.gameLabel)
+        if phase in UNRATED_PHASES:
+            continue
+        season = season_from_game_id(record.gameId)
+        if season is None:
+            season = season_from_date_rule(record.day)
+        if season is None:
+            continue
+        state.rate(record, season, phase)
+        state.watermark = mark
+        rated += 1
+    return rated
+
+
+def load_state(path: Path = STATE_PATH, *, expected: EloState | None = None) -> EloState | None:
+    """The persisted state, or ``None`` when missing, unreadable or built with other parameters."""
+
+    if not path.exists():
+        return None
+    try:
+        with path.open("rb") as handle:
+            saved = pickle.load(handle)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError) as exc:
+        print(f"Ignoring unreadable {path.name} ({exc}); replaying every game")
+        return None
+    if not isinstance(saved, dict) or saved.get("version") != STATE_VERSION:
+        return None
+    state = saved.get("state")
+    if not isinstance(state, EloState):
+        return None
+    if expected is not None and state.parameters() != expected.parameters():
+        return None
+    return state
+
+
+def save_state(state: EloState, path: Path = STATE_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(".tmp")
+    with temp_path.open("wb") as handle:
+        pickle.dump(
+            {"version": STATE_VERSION, "state": state}, handle, protocol=pickle.HIGHEST_PROTOCOL
+        )
+    os.replace(temp_path, path)
+
+
+def elo_payload(state: EloState) -> dict[str, Any]:
+    """The ``team_elo.json`` payload for everything ``state`` has rated."""
+
+    teams = []
+    for team_id, timeline in state.teams.items():
+        peak = max(timeline.history, key=lambda point: point[2], default=None)
+        teams.append(
+            {
+                "teamId": team_id,
+                "team": timeline.team,
+                "rating": round(timeline.rating, 1),
+                "season": timeline.season,
+                "games": len(timeline.history),
+                "peak": {"date": peak[0], "gameId": peak[1], "rating": round(peak[2], 1)}
+                if peak
+                else None,
+                "history": [
+                    {"date": day, "gameId": game_id, "rating": round(rating, 1)}
+                    for day, game_id, rating in timeline.history
+                ],
+            }
+        )
+    teams.sort(key=lambda entry: (-(entry["season"] or 0), -entry["rating"], entry["teamId"]))
+    return {
+        "generatedAt": datetime.now(UTC).isoformat(),
+        "model": {
+            "initialRating": INITIAL_RATING,
+            "kFactor": state.k_factor,
+            "homeAdvantage": state.home_advantage,
+            "seasonCarryover": state.carryover,
+        },
+        "lastGame": state.watermark[0] if state.watermark else None,
+        "games": [
+            {
+                "gameId": game.gameId,
+                "date": game.date,
+                "season": game.season,
+                "phase": game.phase,
+                "homeTeamId": game.homeTeamId,
+                "awayTeamId": game.awayTeamId,
+                "homeRating": round(game.homeRating, 1),
+                "awayRating": round(game.awayRating, 1),
+                "homeWinProbability": round(game.homeWinProbability, 4),
+                "homeWon": game.homeScore > game.awayScore,
+            }
+            for game in state.games
+        ],
+        "teams": teams,
+    }
+
+
+def build_team_elo(
+    records: Iterable[GameRecord] | None = None,
+    *,
+    incremental: bool = False,
+    state_path: Path = STATE_PATH,
+    output_path: Path = OUTPUT_PATH,
+) -> tuple[EloState, int]:
+    """Rate ``records`` (``Games.csv`` by default), persist the state and write the payload.
+
+    With ``incremental`` the persisted state is restored and only newer games
+    are rated; without usable state this degrades to a full replay. Returns
+    the state and how many games this run rated.
+    """
+
+    if records is None:
+        if not GAMES_PATH.exists():
+            raise FileNotFoundError("Games.csv is missing; cannot build team Elo ratings.")
+        records = load_games()
+    fresh = EloState()
+    state = (load_state(state_path, expected=fresh) if incremental else None) or fresh
+    rated = update_ratings(state, records)
+    save_state(state, state_path)
+    write_json(output_path, elo_payload(state), indent=None)
+    return state, rated
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Build chronological team Elo ratings.")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Restore the saved ratings and rate only games after the last one rated.",
+    )
+    args = parser.parse_args(argv)
+    # Run through the package module so the pickled state names
+    # ``scripts.team_elo`` classes rather than ``__main__`` ones.
+    from scripts import team_elo
+
+    state, rated = team_elo.build_team_elo(incremental=args.incremental)
+    print(f"Rated {rated:,} games; {len(state.games):,} games across {len(state.teams)} teams")
+
+
+if __name__ == "__main__":
+    main()
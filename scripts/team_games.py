@@ -0,0 +1,163 @@
+"""Typed team-game fact table parsed once from ``TeamStatistics``.
+
+``build_insights.build_team_performance_snapshot`` and
+``build_team_profiles._aggregate_team_metrics`` each used to open
+``TeamStatistics.zip`` and run ``csv.DictReader`` over every row. Both now
+aggregate one list of :class:`TeamGameRecord` values: one row per team per
+game, with ``teamId``, ``gameId``, the parsed date, the season, ``home`` and
+``win`` flags, and every numeric box column as a float (``None`` when blank).
+
+The table is cached as typed columns under
+``data/cache/team_games/<sha256>.pickle`` (see :mod:`scripts.table_cache`), so
+a refresh against the same archive skips the zip decode and CSV parsing.
+:func:`group_team_games` buckets the rows per team and season.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections import defaultdict, namedtuple
+from pathlib import Path
+from typing import Iterable, Mapping
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.game_dimensions import season_from_date_rule, season_from_game_id  # noqa: E402
+from scripts.sources import locate_source  # noqa: E402
+from scripts.table_cache import (  # noqa: E402
+    TableSpec,
+    load_table,
+    parse_datetime,
+    parse_float,
+    read_table,
+)
+
+TEAM_STATS_PATH = locate_source("TeamStatistics", ROOT / "TeamStatistics.zip")
+TEAM_STATS_MEMBER = "TeamStatistics.csv"
+CACHE_ROOT = ROOT / "data" / "cache" / "team_games"
+
+IDENTITY_FIELDS = {
+    "teamId": "str",
+    "gameId": "str",
+    "gameDate": "str",
+    "start": "datetime",
+    "season": "int",
+    "home": "flag",
+    "win": "flag",
+    "gameType": "str",
+    "teamCity": "str",
+    "teamName": "str",
+    "opponentTeamId": "str",
+    "opponentTeamCity": "str",
+    "opponentTeamName": "str",
+}
+BOX_COLUMNS = (
+    "teamScore",
+    "opponentScore",
+    "assists",
+    "blocks",
+    "steals",
+    "fieldGoalsAttempted",
+    "fieldGoalsMade",
+    "fieldGoalsPercentage",
+    "threePointersAttempted",
+    "threePointersMade",
+    "threePointersPercentage",
+    "freeThrowsAttempted",
+    "freeThrowsMade",
+    "freeThrowsPercentage",
+    "reboundsDefensive",
+    "reboundsOffensive",
+    "reboundsTotal",
+    "foulsPersonal",
+    "turnovers",
+    "plusMinusPoints",
+    "numMinutes",
+    "q1Points",
+    "q2Points",
+    "q3Points",
+    "q4Points",
+    "benchPoints",
+    "biggestLead",
+    "biggestScoringRun",
+    "leadChanges",
+    "pointsFastBreak",
+    "pointsFromTurnovers",
+    "pointsInThePaint",
+    "pointsSecondChance",
+    "timesTied",
+    "timeoutsRemaining",
+    "seasonWins",
+    "seasonLosses",
+)
+
+
+class TeamGameRecord(namedtuple("TeamGameRecord", [*IDENTITY_FIELDS, *BOX_COLUMNS])):
+    """One team's side of one game."""
+
+    __slots__ = ()
+
+    @property
+    def team(self) -> str:
+        return f"{self.teamCity} {self.teamName}".strip()
+
+    @property
+    def opponent(self) -> str:
+        return f"{self.opponentTeamCity} {self.opponentTeamName}".strip()
+
+
+def parse_team_game(row: Mapping[str, str | None]) -> TeamGameRecord:
+    """Parse one ``csv.DictReader`` row into a :class:`TeamGameRecord`."""
+
+    text = {name: (row.get(name) or "").strip() for name in IDENTITY_FIELDS}
+    game_date = text["gameDate"]
+    season = season_from_game_id(text["gameId"]) if text["gameId"] else None
+    return TeamGameRecord(
+        **{
+            **text,
+            "start": parse_datetime(game_date),
+            "season": season if season is not None else season_from_date_rule(game_date),
+            "home": text["home"] == "1",
+            "win": text["win"] == "1",
+        },
+        **{name: parse_float((row.get(name) or "").strip()) for name in BOX_COLUMNS},
+    )
+
+
+TEAM_GAMES_TABLE = TableSpec(
+    "team_games",
+    TEAM_STATS_MEMBER,
+    TeamGameRecord,
+    {**IDENTITY_FIELDS, **dict.fromkeys(BOX_COLUMNS, "float")},
+    parse_team_game,
+)
+
+
+def read_team_games(path: Path = TEAM_STATS_PATH) -> list[TeamGameRecord]:
+    """Parse ``path`` from CSV text, skipping every cache."""
+
+    return read_table(TEAM_GAMES_TABLE, path)
+
+
+def load_team_games(
+    path: Path = TEAM_STATS_PATH, *, cache_root: Path | None = None
+) -> list[TeamGameRecord]:
+    """Every team-game row, parsed at most once per archive hash.
+
+    Raises ``FileNotFoundError`` when ``path`` does not exist.
+    """
+
+    return load_table(TEAM_GAMES_TABLE, path, cache_root=cache_root or CACHE_ROOT)
+
+
+def group_team_games(
+    records: Iterable[TeamGameRecord], *, by_season: bool = True
+) -> dict[tuple[str, int | None], list[TeamGameRecord]]:
+    """Rows per ``(teamId, season)`` (season ``None`` for all seasons when not ``by_season``)."""
+
+    groups: dict[tuple[str, int | None], list[TeamGameRecord]] = defaultdict(list)
+    for record in records:
+        groups[(record.teamId, record.season if by_season else None)].append(record)
+    return dict(groups)
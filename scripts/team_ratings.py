@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""Per-team-season efficiency ratings from the TeamStatistics fact table.
+
+``team_profiles.json`` only carries all-time franchise averages, and
+``build_pace_pressure.ts`` re-derives possessions from raw games. This stage
+rates every team season from the shared team-game table
+(:mod:`scripts.team_games`) in one grouped pass:
+
+1. each team-game row is joined to its opponent's row of the same game;
+2. the box components (team and opponent) are summed per ``(teamId, season)``
+   with one :func:`numpy.bincount` per column;
+3. every rate is computed from those sums, never by averaging per-game rates.
+
+Possessions use the Basketball-Reference team estimate, averaged over both
+sides::
+
+    FGA + 0.4 * FTA - 1.07 * ORB / (ORB + opp DRB) * (FGA - FGM) + TOV
+
+Pace is possessions per 48 minutes, offensive/defensive rating are points
+per 100 possessions, and the shooting, turnover and rebound rates follow the
+usual eFG%, TS%, TOV%, ORB% and DRB% definitions. Games whose opponent row is
+missing still count toward the record but not toward the ratings.
+
+Output: ``public/data/team_season_ratings.json``, one entry per team season
+(regular-season games by default) plus league totals per season.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Collection, Sequence
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.game_dimensions import PHASES, REGULAR, game_phase  # noqa: E402
+from scripts.goat_metrics import format_season_label  # noqa: E402
+from scripts.json_output import write_json  # noqa: E402
+from scripts.numpy_support import np, numpy_guard  # noqa: E402
+from scripts.team_games import TEAM_STATS_PATH, TeamGameRecord, load_team_games  # noqa: E402
+
+OUTPUT_PATH = ROOT / "public" / "data" / "team_season_ratings.json"
+DEFAULT_PHASES = (REGULAR,)
+# Team minutes in a regulation game, used when a row does not report them.
+REGULATION_MINUTES = 240.0
+
+POSSESSION_FORMULA = "0.5 * (team + opponent) of FGA + 0.4*FTA - 1.07*ORB%*(FGA-FGM) + TOV"
+
+# Summed per team season, for the team and (prefixed ``opp``) for its opponents.
+COMPONENTS = {
+    "points": "teamScore",
+    "fgm": "fieldGoalsMade",
+    "fga": "fieldGoalsAttempted",
+    "fg3m": "threePointersMade",
+    "fg3a": "threePointersAttempted",
+    "ftm": "freeThrowsMade",
+    "fta": "freeThrowsAttempted",
+    "orb": "reboundsOffensive",
+    "drb": "reboundsDefensive",
+    "tov": "turnovers",
+    "ast": "assists",
+}
+
+
+require_numpy = numpy_guard("Team ratings")
+
+
+def _column(rows: Sequence[TeamGameRecord], name: str) -> Any:
+    values = np.array([getattr(row, name) for row in rows], dtype=np.float64)
+    return np.nan_to_num(values, nan=0.0)
+
+
+def _ratio(numerator: Any, denominator: Any) -> Any:
+    """Elementwise ``numerator / denominator``, NaN where the denominator is not positive."""
+
+    result = np.full(np.shape(denominator), np.nan)
+    np.divide(numerator, denominator, out=result, where=denominator > 0)
+    return result
+
+
+def _possessions(sums: dict[str, Any], side: str, other: str) -> Any:
+    orb_share = _ratio(sums[f"{side}orb"], sums[f"{side}orb"] + sums[f"{other}drb"])
+    misses = sums[f"{side}fga"] - sums[f"{side}fgm"]
+    return (
+        sums[f"{side}fga"]
+        + 0.4 * sums[f"{side}fta"]
+        - 1.07 * np.nan_to_num(orb_share) * misses
+        + sums[f"{side}tov"]
+    )
+
+
+def rate_components(sums: dict[str, Any]) -> dict[str, Any]:
+    """Ratings arrays from summed components (team keys bare, opponent keys ``opp``-prefixed)."""
+
+    possessions = 0.5 * (_possessions(sums, "", "opp") + _possessions(sums, "opp", ""))
+    shots = sums["fga"] + 0.44 * sums["fta"]
+    offensive = 100 * _ratio(sums["points"], possessions)
+    defensive = 100 * _ratio(sums["opppoints"], possessions)
+    return {
+        "possessions": possessions,
+        "pace": 48 * _ratio(possessions, sums["minutes"] / 5),
+        "offensiveRating": offensive,
+        "defensiveRating": defensive,
+        "netRating": offensive - defensive,
+        "fieldGoalPct": _ratio(sums["fgm"], sums["fga"]),
+        "threePointPct": _ratio(sums["fg3m"], sums["fg3a"]),
+        "freeThrowPct": _ratio(sums["ftm"], sums["fta"]),
+        "effectiveFieldGoalPct": _ratio(sums["fgm"] + 0.5 * sums["fg3m"], sums["fga"]),
+        "trueShootingPct": _ratio(sums["points"], 2 * shots),
+        "turnoverPct": _ratio(sums["tov"], shots + sums["tov"]),
+        "offensiveReboundPct": _ratio(sums["orb"], sums["orb"] + sums["oppdrb"]),
+        "defensiveReboundPct": _ratio(sums["drb"], sums["drb"] + sums["opporb"]),
+        "assistRate": _ratio(sums["ast"], sums["fgm"]),
+    }
+
+
+_ROUNDING = {
+    "possessions": 1,
+    "pace": 2,
+    "offensiveRating": 2,
+    "defensiveRating": 2,
+    "netRating": 2,
+}
+
+
+def _rounded(ratings: dict[str, Any], index: int) -> dict[str, float | None]:
+    entry = {}
+    for name, values in ratings.items():
+        value = float(values[index])
+        entry[name] = round(value, _ROUNDING.get(name, 4)) if value == value else None
+    return entry
+
+
+def team_season_ratings(
+    records: Sequence[TeamGameRecord], *, phases: Collection[str] = DEFAULT_PHASES
+) -> dict[str, Any]:
+    """The ``team_season_ratings.json`` payload for ``records`` in ``phases``."""
+
+    require_numpy()
+    rows = [
+        row
+        for row in records
+        if row.season is not None and row.teamId and game_phase(row.gameId, row.gameType) in phases
+    ]
+    if not rows:
+        return {
+            "generatedAt": datetime.now(UTC).isoformat(),
+            "phases": sorted(phases),
+            "possessionFormula": POSSESSION_FORMULA,
+            "seasons": [],
+            "teams": [],
+        }
+    index = {(row.gameId, row.teamId): position for position, row in enumerate(rows)}
+    opponents = np.array(
+        [index.get((row.gameId, row.opponentTeamId), -1) for row in rows], dtype=np.int64
+    )
+    joined = opponents >= 0
+
+    team_ids, team_codes = np.unique(
+        np.array([row.teamId for row in rows], dtype=str), return_inverse=True
+    )
+    seasons = np.array([row.season for row in rows], dtype=np.int64)
+    season_values, season_codes = np.unique(seasons, return_inverse=True)
+    group_keys, groups = np.unique(
+        team_codes * len(season_values) + season_codes, return_inverse=True
+    )
+    group_count = len(group_keys)
+
+    def group_sum(values: Any, mask: Any = None) -> Any:
+        weights = values if mask is None else np.where(mask, values, 0.0)
+        return np.bincount(groups, weights=weights, minlength=group_count)
+
+    minutes = _column(rows, "numMinutes")
+    minutes = np.where(minutes > 0, minutes, REGULATION_MINUTES)
+    sums = {"minutes": group_sum(minutes, joined)}
+    for name, column in COMPONENTS.items():
+        values = _column(rows, column)
+        sums[name] = group_sum(values, joined)
+        opponent_values = np.where(joined, values[np.maximum(opponents, 0)], 0.0)
+        sums[f"opp{name}"] = group_sum(opponent_values)
+    wins = np.array([row.win for row in rows], dtype=np.float64)
+    games = np.bincount(groups, minlength=group_count)
+    won = np.bincount(groups, weights=wins, minlength=group_count)
+    rated = np.bincount(groups, weights=joined.astype(np.float64), minlength=group_count)
+    ratings = rate_components(sums)
+
+    names: dict[int, str] = {}
+    for position, group in enumerate(groups.tolist()):
+        names.setdefault(group, rows[position].team)
+
+    group_teams = team_ids[group_keys // len(season_values)]
+    group_seasons = season_values[group_keys % len(season_values)]
+    order = sorted(
+        range(group_count), key=lambda group: (int(group_seasons[group]), str(group_teams[group]))
+    )
+    teams = []
+    for group in order:
+        season = int(group_seasons[group])
+        teams.append(
+            {
+                "teamId": str(group_teams[group]),
+                "team": names[group],
+                "season": season,
+                "seasonLabel": format_season_label(season),
+                "games": int(games[group]),
+                "wins": int(won[group]),
+                "losses": int(games[group] - won[group]),
+                "ratedGames": int(rated[group]),
+                **_rounded(ratings, group),
+            }
+        )
+
+    season_index = group_keys % len(season_values)
+    league_sums = {
+        name: np.bincount(season_index, weights=values, minlength=len(season_values))
+        for name, values in sums.items()
+    }
+    league = rate_components(league_sums)
+    return {
+        "generatedAt": datetime.now(UTC).isoformat(),
+        "phases": sorted(phases),
+        "possessionFormula": POSSESSION_FORMULA,
+        "seasons": [
+            {
+                "season": int(season),
+                "seasonLabel": format_season_label(int(season)),
+                "teams": int(np.count_nonzero(season_index == position)),
+                **_rounded(league, position),
+            }
+            for position, season in enumerate(season_values.tolist())
+        ],
+        "teams": teams,
+    }
+
+
+def build_team_season_ratings(
+    records: Sequence[TeamGameRecord] | None = None,
+    *,
+    phases: Collection[str] = DEFAULT_PHASES,
+    output_path: Path = OUTPUT_PATH,
+) -> dict[str, Any]:
+    """Rate every team season and write the payload."""
+
+    if records is None:
+        if not TEAM_STATS_PATH.exists():
+            raise FileNotFoundError(
+                "TeamStatistics.zip is missing; cannot build team season ratings."
+            )
+        records = load_team_games()
+    payload = team_season_ratings(records, phases=phases)
+    write_json(output_path, payload)
+    return payload
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Build per-team-season ratings from TeamStatistics."
+    )
+    parser.add_argument(
+        "--phase",
+        action="append",
+        choices=PHASES,
+        help="Game phase to rate; repeat for several (default: regular).",
+    )
+    args = parser.parse_args(argv)
+    payload = build_team_season_ratings(phases=tuple(args.phase or DEFAULT_PHASES))
+    print(f"Rated {len(payload['teams']):,} team seasons across {len(payload['seasons'])} seasons")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Tests for the mergeable accumulators in :mod:`scripts.accumulators`."""
+
+from __future__ import annotations
+
+import pickle
+import sys
+from operator import itemgetter
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts.accumulators import Count, FirstSeen, Keyed, LastBy, Max, Mean, Record, Sum, TopK
+
+
+def _player_record() -> Record:
+    return Record(points=Sum(), games=Count(), name=FirstSeen(), best=Max(), last_team=LastBy())
+
+
+ROWS = [
+    ("1", "", 31.0, "2023-11-01", "BOS"),
+    ("2", "Two", 12.0, "2023-11-01", "NYK"),
+    ("1", "One", 55.0, "2024-01-05", "BOS"),
+    ("1", "Uno", 18.0, "2024-02-10", "MIA"),
+    ("2", "Dos", 40.0, "2024-03-03", "NYK"),
+]
+
+
+def _fold(rows) -> Keyed:
+    players = Keyed(_player_record)
+    for person_id, name, points, game_date, team in rows:
+        record = players[person_id]
+        record.update(points=points, games=True, name=name, best=points)
+        record["last_team"].update(game_date, team)
+    return players
+
+
+def test_topk_skips_nan() -> None:
+    top = TopK(3)
+    top.update(float("nan"), {"value": 1})
+    assert top.finalize() == []
+
+
+def test_topk_bounds_and_orders() -> None:
+    top = TopK(3)
+    for score in [1.0, 5.0, 3.0, 10.0, 7.5]:
+        top.update(score, {"score": score})
+
+    assert [item["score"] for item in top.finalize()] == [10.0, 7.5, 5.0]
+
+
+def test_topk_keeps_earliest_on_ties_across_merges() -> None:
+    serial = TopK(2)
+    for label in "abcd":
+        serial.update(1.0, label)
+
+    head, tail = TopK(2), TopK(2)
+    for label in "ab":
+        head.update(1.0, label)
+    for label in "cd":
+        tail.update(1.0, label)
+    head.merge(tail)
+
+    assert serial.finalize() == head.finalize() == ["a", "b"]
+    assert head == serial
+
+
+GAMES = [
+    {"gameId": "3", "gameDate": "2024-01-03", "personId": "1", "points": 40.0},
+    {"gameId": "2", "gameDate": "2024-01-02", "personId": "2", "points": 40.0},
+    {"gameId": "1", "gameDate": "2024-01-02", "personId": "3", "points": 40.0},
+    {"gameId": "3", "gameDate": "2024-01-03", "personId": "1", "points": 45.0},
+    {"gameId": "4", "gameDate": "2024-01-04", "personId": "4", "points": 12.0},
+    {"gameId": "2", "gameDate": "2024-01-02", "personId": "2", "points": 38.0},
+]
+
+
+def _games_top(rows) -> TopK:
+    top = TopK(
+        3, tiebreak=itemgetter("gameDate", "gameId"), identity=itemgetter("personId", "gameId")
+    )
+    for row in rows:
+        top.update(row["points"], row)
+    return top
+
+
+def test_topk_breaks_ties_by_date_then_id_and_deduplicates() -> None:
+    top = _games_top(GAMES)
+
+    assert [(row["personId"], row["points"]) for row in top.finalize()] == [
+        ("1", 45.0),
+        ("3", 40.0),
+        ("2", 40.0),
+    ]
+
+
+def test_topk_dedup_and_tiebreak_survive_merges() -> None:
+    expected = _games_top(GAMES)
+    for split in range(1, len(GAMES)):
+        merged = _games_top(GAMES[:split])
+        merged.merge(_games_top(GAMES[split:]))
+        assert merged.finalize() == expected.finalize()
+    assert pickle.loads(pickle.dumps(expected)) == expected
+
+
+def test_topk_ranks_on_multiple_keys() -> None:
+    top = TopK(2)
+    for key, label in [
+        ((30.0, 5.0), "a"),
+        ((30.0, 9.0), "b"),
+        ((28.0, 20.0), "c"),
+        ((float("nan"), 1.0), "d"),
+    ]:
+        top.update(key, label)
+
+    assert top.finalize() == ["b", "a"]
+
+
+def test_merged_partitions_match_a_single_pass() -> None:
+    expected = _fold(ROWS)
+    merged = _fold(ROWS[:2])
+    merged.merge(_fold(ROWS[2:]))
+
+    assert merged == expected
+    assert merged.finalize() == {
+        "1": {"points": 104.0, "games": 3, "name": "One", "best": 55.0, "last_team": "MIA"},
+        "2": {"points": 52.0, "games": 2, "name": "Two", "best": 40.0, "last_team": "NYK"},
+    }
+    assert pickle.loads(pickle.dumps(merged)) == expected
+
+
+def test_mean_skips_missing_values() -> None:
+    mean = Mean()
+    assert mean.finalize() is None
+    for value in (10.0, None, 20.0):
+        mean.update(value)
+    assert mean.finalize() == 15.0
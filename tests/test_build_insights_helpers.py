@@ -68,22 +68,6 @@ def test_to_bool_falsy(raw: str | None) -> None:
     assert build_insights._to_bool(raw) is False
 
 
-@pytest.mark.parametrize(
-    ("raw", "expected"),
-    [
-        ("2024-10-01", 2024),
-        ("2024-10-01 19:00:00", 2024),
-        ("", None),
-        (None, None),
-        ("not-a-date", None),
-    ],
-)
-def test_year_from_date(raw: str | None, expected: int | None) -> None:
-    """Year parsing should support date and datetime strings."""
-
-    assert build_insights._year_from_date(raw) == expected
-
-
 def test_decade_label() -> None:
     """Decade labels should round down to the nearest ten and append ``s``."""
 
@@ -91,21 +75,18 @@ def test_decade_label() -> None:
     assert build_insights._decade_label(2000) == "2000s"
 
 
-def test_push_top_skips_nan() -> None:
-    """``_push_top`` must ignore ``NaN`` keys to avoid polluting the heap."""
-
-    heap: list[tuple[float, dict[str, int]]] = []
-    build_insights._push_top(heap, float("nan"), {"value": 1}, size=3)
-    assert heap == []
-
-
-def test_push_top_bounds_and_orders() -> None:
-    """Ensure the heap keeps only the ``size`` largest entries in sorted order."""
 
-    heap: list[tuple[float, dict[str, int]]] = []
-    for score in [1.0, 5.0, 3.0, 10.0, 7.5]:
-        build_insights._push_top(heap, score, {"score": score}, size=3)
+@pytest.mark.parametrize(
+    ("record", "expected"),
+    [
+        ({"games": 2, "wins": 1, "listed": 2, "titles": 2}, True),
+        ({"games": 6, "wins": 4, "listed": 6, "titles": 0}, False),
+        ({"games": 6, "wins": 4}, True),
+        ({"games": 5, "wins": 2}, False),
+        ({"games": 0, "wins": 0}, False),
+    ],
+)
+def test_goat_won_title_prefers_games_csv_series(record: dict, expected: bool) -> None:
+    """Listed Finals series decide titles; the closeout count only covers unlisted games."""
 
-    assert len(heap) == 3
-    scores = [item["score"] for item in build_insights._sorted_heap(heap)]
-    assert scores == [10.0, 7.5, 5.0]
+    assert build_insights._goat_won_title(record) is expected
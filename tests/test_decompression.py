@@ -0,0 +1,123 @@
+"""Tests for the supervised decompressor streams."""
+
+from __future__ import annotations
+
+import io
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts.decompression import DecompressionError, ProducerStream, SupervisedStream
+
+
+def _python(code: str) -> list[str]:
+    return [sys.executable, "-c", code]
+
+
+def test_stream_overlaps_a_chatty_stderr() -> None:
+    # 1 MiB of stderr before any stdout would deadlock a reader that only drains stderr at the end.
+    code = (
+        "import sys\n"
+        "sys.stderr.write('x' * (1 << 20)); sys.stderr.flush()\n"
+        "for i in range(2000): sys.stdout.write(f'{i},row\\n')\n"
+    )
+    stream = SupervisedStream(_python(code), block_bytes=4096, queue_blocks=2, idle_timeout=30)
+    with io.TextIOWrapper(io.BufferedReader(stream), encoding="utf-8") as handle:
+        lines = handle.read().splitlines()
+
+    assert lines[0] == "0,row" and lines[-1] == "1999,row" and len(lines) == 2000
+    assert stream.stats.bytes_out == sum(len(line) + 1 for line in lines)
+    assert stream.stats.blocks >= 2
+    assert stream.stats.stderr_bytes == 1 << 20
+    assert stream.stats.finished is not None
+
+
+def test_nonzero_exit_reports_stderr_tail() -> None:
+    code = "import sys; sys.stdout.write('partial'); sys.stderr.write('Data Error'); sys.exit(2)"
+    stream = SupervisedStream(_python(code), idle_timeout=30)
+    with pytest.raises(DecompressionError, match="code 2") as error:
+        io.BufferedReader(stream).read()
+    assert "Data Error" in str(error.value)
+    stream.close()
+
+
+def test_idle_timeout_kills_a_stalled_process() -> None:
+    stream = SupervisedStream(_python("import time; time.sleep(30)"), idle_timeout=0.2)
+    started = time.monotonic()
+    with pytest.raises(DecompressionError, match="no output"):
+        stream.read()
+    assert time.monotonic() - started < 10
+    assert stream._process.poll() is not None
+    stream.close()
+
+
+def test_early_close_stops_the_process() -> None:
+    code = "import sys\nwhile True: sys.stdout.write('y' * 65536)\n"
+    stream = SupervisedStream(_python(code), block_bytes=65536, queue_blocks=1)
+    assert stream.read(10) == b"y" * 10
+    stream.close()
+    assert stream._process.poll() is not None
+
+
+def test_producer_stream_coalesces_small_writes() -> None:
+    def produce(write) -> None:
+        for i in range(2000):
+            write(f"{i},row\n".encode())
+
+    stream = ProducerStream(produce, name="fake", block_bytes=4096, queue_blocks=2, idle_timeout=30)
+    with io.TextIOWrapper(io.BufferedReader(stream), encoding="utf-8") as handle:
+        lines = handle.read().splitlines()
+
+    assert lines[0] == "0,row" and lines[-1] == "1999,row" and len(lines) == 2000
+    assert stream.stats.bytes_out == sum(len(line) + 1 for line in lines)
+    assert 2 <= stream.stats.blocks < 2000
+    assert stream.stats.finished is not None
+
+
+def test_producer_stream_splits_large_writes_into_blocks() -> None:
+    payload = bytes(range(256)) * 1000
+    queued: list[int] = []
+
+    class RecordingStream(ProducerStream):
+        def _put(self, item: object) -> None:
+            if isinstance(item, bytes):
+                queued.append(len(item))
+            super()._put(item)
+
+    def produce(write) -> None:
+        write(b"head")
+        write(payload)
+
+    stream = RecordingStream(produce, name="fake", block_bytes=4096, queue_blocks=2, idle_timeout=30)
+    with io.BufferedReader(stream) as handle:
+        assert handle.read() == b"head" + payload
+
+    # One write far larger than block_bytes still queues block-sized pieces.
+    assert max(queued) <= 4096
+    assert stream.stats.blocks == len(queued) == -(-(len(payload) + 4) // 4096)
+
+
+def test_producer_failure_surfaces_to_the_reader() -> None:
+    def produce(write) -> None:
+        write(b"partial")
+        raise ValueError("CRC mismatch")
+
+    stream = ProducerStream(produce, name="fake", block_bytes=4, idle_timeout=30)
+    with pytest.raises(DecompressionError, match="CRC mismatch"):
+        io.BufferedReader(stream).read()
+    stream.close()
+
+
+def test_early_close_unwinds_the_producer() -> None:
+    def produce(write) -> None:
+        while True:
+            write(b"y" * 65536)
+
+    stream = ProducerStream(produce, name="fake", block_bytes=65536, queue_blocks=1)
+    assert stream.read(10) == b"y" * 10
+    stream.close()
+    assert not stream._thread.is_alive()
@@ -0,0 +1,158 @@
+"""Tests for the shared season and game-phase dimensions."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts import build_insights, game_dimensions, games_table
+from scripts.game_dimensions import (
+    FINALS,
+    PLAY_IN,
+    PLAYOFFS,
+    REGULAR,
+    game_phase,
+    playoff_series,
+    season_date_bounds,
+    season_from_date,
+    series_won,
+)
+
+GAMES_CSV = """gameId,gameDate,gameType,gameLabel
+21900970,2020-03-11 19:30:00,Regular Season,
+21901231,2020-08-14 15:00:00,Regular Season,
+41900406,2020-10-11 19:30:00,Playoffs,NBA Finals
+42300201,2024-05-06 19:30:00,Playoffs,East Semifinals
+52300101,2024-04-16 19:00:00,Play-in Tournament,
+"""
+
+
+@pytest.fixture
+def games(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    path = tmp_path / "Games.csv"
+    path.write_text(GAMES_CSV, encoding="utf-8")
+    monkeypatch.setattr(game_dimensions, "GAMES_PATH", path)
+    monkeypatch.setattr(games_table, "CACHE_ROOT", tmp_path / "cache")
+    game_dimensions.reset_game_dimensions()
+    yield path
+    game_dimensions.reset_game_dimensions()
+
+
+SERIES_CSV = """gameId,gameDate,hometeamId,awayteamId,hometeamCity,hometeamName,awayteamCity,awayteamName,homeScore,awayScore,winner,gameType,gameLabel
+42200403,2023-06-07 20:30:00,2,1,Miami,Heat,Denver,Nuggets,94,109,1,Playoffs,NBA Finals
+42200401,2023-06-01 20:30:00,1,2,Denver,Nuggets,Miami,Heat,104,93,1,Playoffs,NBA Finals
+42200402,2023-06-04 20:00:00,1,2,Denver,Nuggets,Miami,Heat,108,111,2,Playoffs,NBA Finals
+42200404,2023-06-09 20:30:00,2,1,Miami,Heat,Denver,Nuggets,95,108,,Playoffs,NBA Finals
+42200405,2023-06-12 20:30:00,1,2,Denver,Nuggets,Miami,Heat,94,89,1,Playoffs,NBA Finals
+22200001,2022-10-18 19:30:00,1,2,Denver,Nuggets,Miami,Heat,100,90,1,Regular Season,
+42300201,2024-05-06 19:30:00,3,4,Boston,Celtics,Cleveland,Cavaliers,120,95,3,Playoffs,East Semifinals
+42300202,2024-05-09 19:30:00,3,4,Boston,Celtics,Cleveland,Cavaliers,94,118,4,Playoffs,East Semifinals
+42300203,2024-05-11 20:30:00,4,3,Cleveland,Cavaliers,Boston,Celtics,93,106,3,Playoffs,East Semifinals
+"""
+
+
+@pytest.fixture
+def series_games(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    path = tmp_path / "Games.csv"
+    path.write_text(SERIES_CSV, encoding="utf-8")
+    monkeypatch.setattr(game_dimensions, "GAMES_PATH", path)
+    monkeypatch.setattr(games_table, "CACHE_ROOT", tmp_path / "cache")
+    game_dimensions.reset_game_dimensions()
+    yield path
+    game_dimensions.reset_game_dimensions()
+
+
+@pytest.fixture
+def no_games(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(game_dimensions, "GAMES_PATH", tmp_path / "missing.csv")
+    game_dimensions.reset_game_dimensions()
+    yield
+    game_dimensions.reset_game_dimensions()
+
+
+def test_fallback_rules_without_games_csv(no_games: None) -> None:
+    assert season_from_date("2023-06-01 20:30:00") == 2022
+    assert season_from_date("2023-07-01") == 2023
+    assert season_from_date("") is None
+    assert season_from_date("not-a-date") is None
+
+    assert game_phase("22300001", "Regular Season") == REGULAR
+    assert game_phase("52300101", "Play-in Tournament") == PLAY_IN
+    assert game_phase("42300201", "Playoffs", "East Semifinals") == PLAYOFFS
+    assert game_phase("42300401", "Playoffs", "NBA Finals") == FINALS
+    assert game_phase("0042300401", "Playoffs") == FINALS
+    assert game_phase("", "Playoffs") == PLAYOFFS
+    assert game_phase("", "") is None
+    assert season_date_bounds({2023}) == ("2023-07-01", "2024-07-01")
+
+
+def test_games_csv_seasons_and_phases_take_precedence(games: Path) -> None:
+    assert season_from_date("2020-08-14 15:00:00") == 2019
+    assert season_from_date("2020-10-11 19:30:00") == 2019
+    assert season_from_date("2020-12-22 19:30:00") == 2020
+    assert season_from_date("2020-03-11") == 2019
+
+    assert game_phase("41900406") == FINALS
+    assert game_phase("42300201", "Regular Season") == PLAYOFFS
+    assert game_phase("52300101") == PLAY_IN
+    assert season_date_bounds({2019}) == ("2019-07-01", "2020-10-12")
+
+
+def test_playoff_series_are_rebuilt_from_games_csv(series_games: Path) -> None:
+    finals, semis = playoff_series()
+
+    assert (finals.season, finals.round, finals.finals) == (2022, 4, True)
+    assert finals.teams == ("1", "2")
+    assert finals.names == ("Denver Nuggets", "Miami Heat")
+    assert finals.wins == [4, 1]
+    assert finals.winner == "1"
+    assert finals.games == ["42200401", "42200402", "42200403", "42200404", "42200405"]
+    # The latest season's series stays open until someone reaches four wins.
+    assert (semis.round, semis.finals, semis.wins, semis.winner) == (2, False, [2, 1], None)
+
+    assert series_won("42200402", "1") is False
+    assert series_won("42200402", "0") is True
+    assert series_won("42200405", "1") is True
+    # Listed but undecided: known to Games.csv, never a series win.
+    assert series_won("42300201", "1") is False
+    assert series_won("22200001", "1") is None
+    assert series_won("42200401", "") is None
+
+
+IN_PROGRESS_FINALS_CSV = """gameId,gameDate,hometeamId,awayteamId,hometeamCity,hometeamName,awayteamCity,awayteamName,homeScore,awayScore,winner,gameType,gameLabel
+42300401,2024-06-06 20:30:00,3,5,Boston,Celtics,Dallas,Mavericks,107,89,3,Playoffs,NBA Finals
+42300402,2024-06-09 20:00:00,3,5,Boston,Celtics,Dallas,Mavericks,105,98,3,Playoffs,NBA Finals
+42300403,2024-06-12 20:30:00,5,3,Dallas,Mavericks,Boston,Celtics,99,106,3,Playoffs,NBA Finals
+42300404,2024-06-14 20:30:00,5,3,Dallas,Mavericks,Boston,Celtics,122,84,5,Playoffs,NBA Finals
+"""
+
+
+def test_an_in_progress_finals_is_listed_but_never_a_title(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "Games.csv"
+    path.write_text(IN_PROGRESS_FINALS_CSV, encoding="utf-8")
+    monkeypatch.setattr(game_dimensions, "GAMES_PATH", path)
+    monkeypatch.setattr(games_table, "CACHE_ROOT", tmp_path / "cache")
+    game_dimensions.reset_game_dimensions()
+    try:
+        (finals,) = playoff_series()
+        assert (finals.wins, finals.winner) == ([3, 1], None)
+
+        # A Boston player's Finals games so far: 3-1, a closeout by the wins heuristic.
+        builder = build_insights.GoatSystemBuilder()
+        for game_id, win in zip(finals.games, "1110", strict=True):
+            builder.consume(
+                builder.columns.from_mapping(
+                    {"personId": "7", "gameId": game_id, "gameDate": "2024-06-06", "win": win}
+                )
+            )
+        record = builder.career_totals["7"]["finalsSeasons"][2023].finalize()
+        assert (record["games"], record["wins"], record["listed"], record["titles"]) == (4, 3, 4, 0)
+        assert build_insights._goat_won_title(record) is False
+    finally:
+        game_dimensions.reset_game_dimensions()
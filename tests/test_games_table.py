@@ -0,0 +1,89 @@
+"""Tests for the shared typed ``Games.csv`` reader."""
+
+from __future__ import annotations
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts import build_insights
+from scripts.games_table import load_games, read_games, scan_games
+from scripts.phase1_pipeline import GamesAudit
+from scripts.player_stats_cache import content_checksum
+from scripts.table_cache import cache_path, forget_tables
+
+GAMES_CSV = """gameId,gameDate,hometeamCity,hometeamName,hometeamId,awayteamCity,awayteamName,awayteamId,homeScore,awayScore,winner,gameType,attendance,gameLabel
+42300401,2024-06-06 20:30:00,Boston,Celtics,3, Dallas ,Mavericks,5,107,89,3,Playoffs,19156,NBA Finals
+22300001,2023-10-24 19:30:00,Denver,Nuggets,1,Los Angeles,Lakers,6,119,107,1,Regular Season,,
+22300001,2023-10-24 19:30:00,Denver,Nuggets,1,Los Angeles,Lakers,6,119,107,1,Regular Season,,
+12300001,not a date,Miami,Heat,2,Boston,Celtics,3,,,,Preseason,0,
+"""
+
+
+def _games(tmp_path: Path) -> Path:
+    path = tmp_path / "Games.csv"
+    path.write_text(GAMES_CSV, encoding="utf-8")
+    return path
+
+
+def test_rows_parse_once_into_typed_records_and_cache(tmp_path: Path) -> None:
+    path = _games(tmp_path)
+    cache_root = tmp_path / "cache"
+
+    records = load_games(path, cache_root=cache_root)
+
+    finals = records[0]
+    assert finals.gameId == "42300401"
+    assert finals.start == datetime(2024, 6, 6, 20, 30)
+    assert finals.day == "2024-06-06"
+    assert (finals.awayteamCity, finals.homeScore, finals.attendance) == ("Dallas", 107, 19156)
+    assert records[3].start is None
+    assert records[3].homeScore is None
+    assert cache_path(content_checksum(path), cache_root).exists()
+
+    forget_tables()
+    assert load_games(path, cache_root=cache_root) == records == read_games(path)
+    assert load_games(path, cache_root=cache_root) is load_games(path, cache_root=cache_root)
+
+
+def test_one_scan_feeds_the_audit_and_the_historic_games(tmp_path: Path) -> None:
+    records = read_games(_games(tmp_path))
+    audit = GamesAudit()
+    historic = build_insights.HistoricGamesBuilder()
+
+    assert scan_games([audit, historic], records) == 4
+
+    summary = audit.summary()
+    assert summary["rowCount"] == 3
+    assert summary["duplicateIds"] == ["22300001"]
+    assert summary["invalidDateSamples"] == ["12300001"]
+    assert summary["seasonBreakdown"] == [("2023-24", 3)]
+    payload = historic.payload()
+    assert payload["totals"]["games"] == 4
+    assert payload["totals"]["firstGame"] == "2023-10-24T19:30:00"
+    assert payload["totals"]["latestGame"] == "2024-06-06T20:30:00"
+    assert payload["gamesByDecade"] == [{"decade": "2020s", "games": 3}]
+    assert payload["highestScoringGames"][0]["totalPoints"] == 226
+    assert payload["attendanceLeaders"][0]["gameId"] == "42300401"
+
+
+def test_a_replaced_file_is_reparsed_despite_a_stale_manifest(tmp_path: Path) -> None:
+    path = tmp_path / "Games.csv"
+    header, first, second = GAMES_CSV.splitlines()[:3]
+    path.write_text(f"{header}\n{first}\n", encoding="utf-8")
+    (tmp_path / "SHA256SUMS.txt").write_text(
+        f"{content_checksum(path)}  Games.csv\n", encoding="utf-8"
+    )
+    cache_root = tmp_path / "cache"
+    assert len(load_games(path, cache_root=cache_root)) == 1
+
+    path.write_text(f"{header}\n{first}\n{second}\n", encoding="utf-8")
+
+    assert [record.gameId for record in load_games(path, cache_root=cache_root)] == [
+        "42300401",
+        "22300001",
+    ]
+    forget_tables()
+    assert len(load_games(path, cache_root=cache_root)) == 2
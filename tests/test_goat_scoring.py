@@ -0,0 +1,316 @@
+"""Tests for the vectorized GOAT scoring stage."""
+
+from __future__ import annotations
+
+import json
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts import build_insights, goat_scoring
+from scripts.goat_scoring import (
+    COMPONENT_KEYS,
+    FEATURES,
+    SEASON_FEATURES,
+    BdiFeed,
+    GoatMatrix,
+    GoatWeights,
+    add_rank_bands,
+    bdi_ratios,
+    load_goat_matrix,
+    load_weightings,
+    rank_bands,
+    raw_components,
+    resample_features,
+    rescore_goat_system,
+    reweight_goat_scores,
+    save_goat_matrix,
+    score_goat_matrix,
+    score_players,
+    weight_arrays,
+)
+
+np = pytest.importorskip("numpy")
+
+
+def _features(**values: float) -> list[float]:
+    row = dict.fromkeys(FEATURES, 0.0)
+    row["draftNumber"] = math.nan
+    row.update(values)
+    return [row[name] for name in FEATURES]
+
+
+def _matrix() -> GoatMatrix:
+    return GoatMatrix.from_features(
+        ["1", "2", "3", "4"],
+        ["starone", "startwo", "benchguy", "prospect"],
+        [
+            _features(
+                games=100,
+                wins=60,
+                minutes=3500,
+                points=2800,
+                assists=700,
+                rebounds=800,
+                steals=100,
+                blocks=50,
+                playoffGames=20,
+                playoffWins=14,
+                finalsGames=6,
+                finalsWins=4,
+                championships=1,
+                positions=2,
+                teams=1,
+                draftNumber=1,
+            ),
+            _features(
+                games=90,
+                wins=40,
+                minutes=3000,
+                points=2000,
+                assists=300,
+                rebounds=900,
+                steals=60,
+                blocks=120,
+                teams=3,
+                international=1,
+                draftNumber=12,
+            ),
+            _features(
+                games=40,
+                wins=15,
+                minutes=400,
+                points=120,
+                assists=30,
+                rebounds=50,
+                positions=1,
+                teams=2,
+                draftNumber=45,
+            ),
+            _features(),
+        ],
+    )
+
+
+def _season(**values: float) -> list[float]:
+    return [values.get(name, 0.0) for name in SEASON_FEATURES]
+
+
+def _seasonal_matrix() -> GoatMatrix:
+    """Two seasons for player 1 (one a title), one for player 2, none for player 3."""
+
+    title_season = _season(
+        games=60, wins=45, finalsGames=6, finalsWins=4, championships=1, points=1800
+    )
+    quiet_season = _season(games=40, wins=15, points=600)
+    return GoatMatrix.from_features(
+        ["1", "2", "3"],
+        ["one", "two", "three"],
+        [
+            _features(
+                games=100, wins=60, finalsGames=6, finalsWins=4, championships=1, points=2400
+            ),
+            _features(games=82, wins=41, points=1500, championships=2, missingChampionships=2),
+            _features(games=10, wins=5, points=90),
+        ],
+        [[title_season, quiet_season], [_season(games=82, wins=41, points=1500)], []],
+        [0, 2, 0],
+    )
+
+
+def _empty_feed() -> BdiFeed:
+    return BdiFeed({}, dict.fromkeys(COMPONENT_KEYS, 0.0), {}, None)
+
+
+def test_raw_components_follow_the_career_formulas() -> None:
+    raw = raw_components(
+        np.array(
+            [
+                _features(
+                    games=10,
+                    wins=6,
+                    minutes=300,
+                    points=200,
+                    assists=50,
+                    rebounds=40,
+                    steals=5,
+                    blocks=5,
+                    playoffGames=4,
+                    playoffWins=4,
+                    finalsGames=4,
+                    finalsWins=4,
+                    championships=1,
+                    finalsMVPs=1,
+                    positions=1,
+                    teams=2,
+                    international=1,
+                    draftNumber=2,
+                )
+            ]
+        )
+    )[0]
+
+    production = (200 + 1.25 * 50 + 1.1 * 40 + 1.5 * 10) / 10
+    assert raw[0] == pytest.approx(production * (0.6 + 30))
+    assert raw[2] == 300 + 10 * 5.0
+    assert raw[3] == pytest.approx(40 + 2 * 12 + 5 * 18 + 4 * 12 + 1 * 14)
+    assert raw[4] == pytest.approx(55 + 6 * 0.08 + 4 * 0.35 + 2 * 6 + 30 + 12 + 50)
+    assert raw_components(np.array([_features()]))[0].tolist() == [0.0] * 5
+
+
+def test_scores_rank_tier_and_blend_with_the_bdi_feed() -> None:
+    matrix = _matrix()
+    feed = BdiFeed(
+        {"startwo": {"impact": 50.0}, "benchguy": {"impact": 100.0}},
+        {**dict.fromkeys(COMPONENT_KEYS, 0.0), "impact": 100.0},
+        {"benchguy": {"tier": " Cult Hero "}},
+        "2024-01-01",
+    )
+
+    scored = score_players(matrix, feed)
+
+    assert scored.ranks.tolist() == [1, 2, 3, 4]
+    assert scored.components[0].tolist() == [34.0, 26.0, 20.0, 12.0, 8.0]
+    assert scored.scores[0] == 100.0
+    assert scored.scores[3] == 0.0
+    # 0.65 of our (best-normalized) impact plus 0.35 of the BDI ratio.
+    ours = matrix.raw[2, 0] / matrix.raw[:, 0].max()
+    assert scored.components[2, 0] == round(34.0 * (0.65 * ours + 0.35 * 1.0), 2)
+    assert scored.tiers.tolist() == ["Pantheon", scored.tiers[1], "Cult Hero", "Reserve"]
+
+
+def test_weight_batches_score_like_single_weightings() -> None:
+    matrix = _matrix()
+    bdi = bdi_ratios(matrix.name_keys, _empty_feed())
+    budget, blend = weight_arrays()
+    flat = weight_arrays({**goat_scoring.COMPONENT_BUDGET, "impact": 80.0, "stage": 0.0})[0]
+
+    batch = score_goat_matrix(matrix.raw, bdi, np.stack([budget, flat]), np.stack([blend, blend]))
+
+    for index, weights in enumerate((budget, flat)):
+        single = score_goat_matrix(matrix.raw, bdi, weights, blend)
+        assert batch.scores[index].tolist() == single.scores.tolist()
+        assert batch.ranks[index].tolist() == single.ranks.tolist()
+        assert batch.tiers[index].tolist() == single.tiers.tolist()
+
+
+def test_persisted_matrix_rescoring_updates_the_payload(tmp_path: Path) -> None:
+    matrix = _matrix()
+    save_goat_matrix(matrix, matrix_root=tmp_path)
+    restored = load_goat_matrix(matrix_root=tmp_path)
+    assert restored is not None
+    assert restored.person_ids == matrix.person_ids
+    assert np.array_equal(restored.raw, matrix.raw, equal_nan=True)
+    seasonal = _seasonal_matrix()
+    save_goat_matrix(seasonal, matrix_root=tmp_path / "seasonal")
+    restored_seasons = load_goat_matrix(matrix_root=tmp_path / "seasonal")
+    assert restored_seasons is not None
+    assert np.array_equal(restored_seasons.seasons, seasonal.seasons)
+    assert restored_seasons.season_players.tolist() == [0, 0, 1]
+    assert restored_seasons.championship_overrides.tolist() == [0.0, 2.0, 0.0]
+
+    payload = {"players": [{"personId": "4", "rank": 1}, {"personId": "1", "rank": 2}]}
+    rescored = rescore_goat_system(payload, restored, _empty_feed())
+
+    assert [entry["personId"] for entry in rescored["players"]] == ["1", "4"]
+    assert rescored["players"][0]["goatScore"] == 100.0
+    assert rescored["players"][0]["tier"] == "Pantheon"
+    assert rescored["players"][1]["goatComponents"] == dict.fromkeys(COMPONENT_KEYS, 0.0)
+    assert load_goat_matrix(matrix_root=tmp_path / "missing") is None
+
+
+def test_reweighting_batches_report_rank_diffs(tmp_path: Path) -> None:
+    matrix = _matrix()
+    feed = _empty_feed()
+    weightings_path = tmp_path / "weightings.json"
+    weightings_path.write_text(
+        '{"weightings": [{"name": "all impact", "budget": {"impact": 100, "stage": 0, '
+        '"longevity": 0, "versatility": 0, "culture": 0}}, {"blend": {"culture": [1, 0]}}]}',
+        encoding="utf-8",
+    )
+    weightings = [GoatWeights(), *load_weightings(weightings_path)]
+
+    result = reweight_goat_scores(weightings, matrix=matrix, feed=feed)
+
+    published = score_players(matrix, feed)
+    assert result.names == ["published", "all impact", "weighting 2"]
+    assert result.scores[0].tolist() == published.scores.tolist()
+    assert result.ranks[0].tolist() == published.ranks.tolist()
+    assert not result.rank_diffs()[0].any()
+    assert result.scores[1, 0] == 100.0
+    assert result.ranks[2].tolist() == published.ranks.tolist()
+    for mover in result.movers(1):
+        row = result.person_ids.index(mover["personId"])
+        assert mover["change"] == published.ranks[row] - result.ranks[1, row] != 0
+
+    with pytest.raises(ValueError, match="clutch"):
+        reweight_goat_scores([GoatWeights("bad", {"clutch": 5.0})], matrix=matrix, feed=feed)
+
+
+def test_season_bootstrap_resums_drawn_seasons() -> None:
+    matrix = _seasonal_matrix()
+    column = {name: index for index, name in enumerate(FEATURES)}
+
+    features = resample_features(matrix, np.random.default_rng(3), 200)
+
+    assert features.shape == (200, 3, len(FEATURES))
+    # One season (or none) can only be redrawn as itself.
+    assert np.array_equal(
+        features[:, 1:],
+        np.broadcast_to(matrix.features[1:], (200, 2, len(FEATURES))),
+        equal_nan=True,
+    )
+    games = features[:, 0, column["games"]]
+    assert set(games.tolist()) == {80.0, 100.0, 120.0}
+    titles = features[:, 0, column["championships"]]
+    assert (titles == (games - 80) / 20).all()
+    assert (features[:, 0, column["missingChampionships"]] == 0).all()
+
+
+def test_rank_bands_are_ordered_and_independent_of_jobs() -> None:
+    matrix = _seasonal_matrix()
+    feed = _empty_feed()
+
+    bands = rank_bands(matrix, feed, 45, seed=7)
+
+    assert bands.shape == (3, 3)
+    assert (bands[:, 0] <= bands[:, 1]).all()
+    assert (bands[:, 1] <= bands[:, 2]).all()
+    assert bands.min() >= 1 and bands.max() <= 3
+    assert np.array_equal(rank_bands(matrix, feed, 45, jobs=2, seed=7), bands)
+    with pytest.raises(ValueError):
+        rank_bands(matrix, feed, 0)
+
+    payload = add_rank_bands({"players": [{"personId": "2"}]}, matrix, feed, 45, seed=7)
+    assert payload["players"][0]["rankBand"] == {
+        "p5": bands[1, 0],
+        "p50": bands[1, 1],
+        "p95": bands[1, 2],
+    }
+    assert payload["uncertainty"]["replicates"] == 45
+    rescored = rescore_goat_system(payload, matrix, feed)
+    assert "rankBand" not in rescored["players"][0]
+    assert "uncertainty" not in rescored
+
+
+def test_rescoring_cli_writes_the_same_bytes_as_the_insights_build(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    goat_system = tmp_path / "goat_system.json"
+    goat_system.write_text(
+        '{"players": [{"personId": "4", "name": "Zoë"}, {"personId": "1"}]}', encoding="utf-8"
+    )
+    monkeypatch.setattr(goat_scoring, "load_goat_matrix", lambda: _matrix())
+    monkeypatch.setattr(goat_scoring, "load_bdi_components", lambda: _empty_feed())
+
+    goat_scoring.main(["--goat-system", str(goat_system)])
+
+    written = goat_system.read_bytes()
+    assert written.endswith(b"}\n") and "Zoë".encode() in written
+    monkeypatch.setattr(build_insights, "PUBLIC_DATA_DIR", tmp_path / "insights")
+    build_insights._write_json("goat_system.json", json.loads(written), indent=None)
+    assert (tmp_path / "insights" / "goat_system.json").read_bytes() == written
@@ -0,0 +1,97 @@
+"""Tests for the rolling-window GOAT scores."""
+
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts.goat_metrics import RECENT_SEASON_START, compute_recent_goat_scores
+from scripts.goat_windows import STATS, SeasonTotalsAccumulator, build_window_payloads
+from scripts.player_stats_scan import scan_player_statistics
+
+np = pytest.importorskip("numpy")
+
+
+def _rows(count: int, seed: int = 5) -> list[dict[str, str]]:
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(count):
+        person = rng.randint(1, 30)
+        rows.append(
+            {
+                "personId": str(person),
+                "firstName": f"First{person}",
+                "lastName": "Player",
+                "gameDate": f"{rng.randint(2015, 2025)}-{rng.choice([1, 3, 11]):02d}-{rng.randint(1, 28):02d}",
+                "numMinutes": rng.choice(["0", "12.5", "30", "38", ""]),
+                "points": str(rng.randint(0, 45)),
+                "assists": str(rng.randint(0, 12)),
+                "reboundsTotal": str(rng.randint(0, 15)),
+                "steals": str(rng.randint(0, 4)),
+                "blocks": rng.choice(["0", "1", "3", ""]),
+                "win": rng.choice(["1", "0"]),
+                "plusMinusPoints": str(rng.randint(-20, 20)),
+            }
+        )
+    return rows
+
+
+def _totals(rows: list[dict[str, str]]):
+    accumulator = SeasonTotalsAccumulator()
+    scan_player_statistics([accumulator], rows)
+    return accumulator.totals()
+
+
+def test_prefix_windows_match_direct_season_sums() -> None:
+    totals = _totals(_rows(2000))
+
+    windows = totals.window_totals(3)
+    assert windows.shape == (len(totals.person_ids), totals.season_count - 2, len(STATS))
+    for start in range(windows.shape[1]):
+        assert np.allclose(windows[:, start], totals.values[:, start : start + 3].sum(axis=1))
+    with pytest.raises(ValueError):
+        totals.window_totals(0)
+
+
+def test_three_season_window_matches_the_recent_goat_scores() -> None:
+    rows = _rows(3000)
+    scored = _totals(rows).scores(3)
+    leaders = scored.leaderboard(start=RECENT_SEASON_START, limit=0)
+    pool = {entry["personId"] for entry in leaders}
+    recent = compute_recent_goat_scores(rows, pool)
+
+    assert leaders == scored.leaderboard(end_season=RECENT_SEASON_START + 2, limit=0)
+    assert [entry["rank"] for entry in leaders] == list(range(1, len(leaders) + 1))
+    for entry in leaders:
+        expected = recent[entry["personId"]]
+        assert entry["score"] == expected["score"]
+        assert entry["games"] == expected["games"]
+        assert entry["points"] == expected["points"]
+    assert [entry["score"] for entry in leaders] == sorted(
+        (entry["score"] for entry in leaders), reverse=True
+    )
+
+
+def test_payloads_list_window_leaders_and_player_peaks() -> None:
+    totals = _totals(_rows(1500, seed=9))
+    windows, peaks = build_window_payloads(totals, (1, 3), limit=5)
+
+    assert [span["span"] for span in windows["spans"]] == [1, 3]
+    single, triple = windows["spans"]
+    assert len(single["windows"]) == totals.season_count
+    assert triple["windows"][0]["label"] == "2014-15 to 2016-17"
+    assert all(len(window["leaders"]) <= 5 for window in single["windows"])
+
+    scored = totals.scores(3)
+    for person_id, entry in peaks["players"].items():
+        assert [peak["span"] for peak in entry["peaks"]] == [1, 3]
+        best = entry["peaks"][1]
+        row = scored.person_ids.index(person_id)
+        played = scored.ranks[row] > 0
+        assert best["score"] == scored.scores[row][played].max()
+        assert best["rank"] == scored.ranks[row, best["start"] - scored.starts[0]]
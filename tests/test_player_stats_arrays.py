@@ -0,0 +1,120 @@
+"""Tests for the NumPy group-by backend of the PlayerStatistics scan."""
+
+from __future__ import annotations
+
+import json
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts import build_insights, player_stats_arrays, player_stats_cache
+from scripts.history.build_player_careers import CareerAccumulator
+from scripts.player_stats_scan import scan_player_statistics
+from scripts.player_stats_state import Watermarked
+
+BUILDERS = (
+    build_insights.PlayerLeadersBuilder,
+    build_insights.PlayerSeasonInsightsBuilder,
+    build_insights.GoatSystemBuilder,
+)
+
+
+def _rows(count: int, seed: int = 7) -> list[dict[str, str]]:
+    """Player-game rows with blanks, ties, odd numbers and repeated games."""
+
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(count):
+        game_type = rng.choice(["Regular Season"] * 6 + ["Playoffs", "Play-in Tournament", ""])
+        month = rng.choice([1, 3, 5, 6, 10, 11, 12])
+        rows.append(
+            {
+                "personId": str(rng.randint(1, 40)) if rng.random() > 0.02 else "",
+                "firstName": rng.choice(["", "Al", "Bo"]),
+                "lastName": rng.choice(["Xu", "Yi", ""]),
+                "gameId": str(rng.randint(22000000, 22000150)),
+                "gameDate": f"{rng.randint(2016, 2023)}-{month:02d}-{rng.randint(1, 28):02d} 19:30:00"
+                if rng.random() > 0.01
+                else "",
+                "gameType": game_type,
+                "gameLabel": "NBA Finals" if game_type == "Playoffs" and rng.random() < 0.3 else "",
+                "playerteamCity": rng.choice(["Boston", "", "New York"]),
+                "playerteamName": rng.choice(["Celtics", "Knicks"]),
+                "opponentteamCity": "Miami",
+                "opponentteamName": "Heat",
+                "win": rng.choice(["1", "0", ""]),
+                "numMinutes": rng.choice(["34", "12.5", "", "0"]),
+                "points": rng.choice([str(rng.randint(0, 70)), "", "-0", "0.5"]),
+                "assists": str(rng.randint(0, 15)),
+                "reboundsTotal": str(rng.randint(0, 20)),
+                "steals": str(rng.randint(0, 11)),
+                "blocks": rng.choice(["1", "", "12"]),
+            }
+        )
+    return rows
+
+
+def _payload(builder) -> str:
+    payload = builder.payload()
+    payload.pop("generatedAt", None)
+    return json.dumps(payload)
+
+
+@pytest.mark.parametrize("builder_type", BUILDERS)
+def test_numpy_backend_matches_the_row_path(builder_type) -> None:
+    rows = _rows(3000)
+    by_rows = builder_type()
+    scan_player_statistics([by_rows], rows)
+    by_arrays = builder_type()
+    assert scan_player_statistics([by_arrays], rows, backend="numpy") == len(rows)
+
+    assert _payload(by_arrays) == _payload(by_rows)
+    assert vars(by_arrays) == vars(by_rows)
+
+
+def test_cached_columns_feed_frames_and_row_consumers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    rows = _rows(800, seed=11)
+    archive = tmp_path / "PlayerStatistics.7z"
+    archive.write_bytes(b"fake archive")
+    cache_root = tmp_path / "cache"
+    list(player_stats_cache.tee_into_cache(rows, player_stats_cache.archive_checksum(archive), cache_root=cache_root))
+    monkeypatch.setattr(player_stats_arrays, "load_shard_manifest", lambda *_args: None)
+    monkeypatch.setattr(
+        player_stats_arrays,
+        "load_player_statistics_cache",
+        lambda *_args: player_stats_cache.load_player_statistics_cache(
+            archive, cache_root=cache_root
+        ),
+    )
+
+    since = ("2019-01-01 00:00:00", "")
+    expected = [Watermarked(build_insights.GoatSystemBuilder(), since), CareerAccumulator()]
+    scan_player_statistics(expected, rows)
+    actual = [Watermarked(build_insights.GoatSystemBuilder(), since), CareerAccumulator()]
+    scan_player_statistics(actual, backend="numpy")
+
+    assert actual[0].watermark() == expected[0].watermark()
+    assert _payload(actual[0].consumer) == _payload(expected[0].consumer)
+    assert actual[1].players == expected[1].players
+    assert actual[1].season_sets == expected[1].season_sets
+
+
+def test_season_filters_match_the_row_path() -> None:
+    rows = _rows(1500, seed=3)
+    by_rows = build_insights.PlayerSeasonInsightsBuilder()
+    scan_player_statistics([by_rows], rows, seasons={2018, 2019}, game_types={"regular season"})
+    by_arrays = build_insights.PlayerSeasonInsightsBuilder()
+    scan_player_statistics(
+        [by_arrays], rows, seasons={2018, 2019}, game_types={"regular season"}, backend="numpy"
+    )
+
+    assert by_arrays.total_rows.finalize() == by_rows.total_rows.finalize() > 0
+    assert _payload(by_arrays) == _payload(by_rows)
@@ -0,0 +1,97 @@
+"""Tests for the seekable block-compressed PlayerStatistics store."""
+
+from __future__ import annotations
+
+import sys
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts import player_stats_blocks, player_stats_reader
+from scripts.player_stats_blocks import (
+    iter_block_rows,
+    load_block_index,
+    season_date_bounds,
+    write_player_statistics_blocks,
+)
+from scripts.player_stats_cache import archive_checksum
+
+HEADER = ["personId", "gameId", "gameDate", "gameType", "points"]
+ROWS = [
+    ["1", "22200001", "2022-10-18 19:30:00", "Regular Season", "31"],
+    ["2", "22200002", "2022-10-19 19:30:00", "Regular Season", "12"],
+    ["2", "42200401", "2023-06-01 20:30:00", "Playoffs", "28"],
+    ["1", "22300001", "2023-10-24 19:30:00", "Regular Season", "22"],
+    ["3", "52300101", "2024-04-16 19:00:00", "Play-in Tournament", "17"],
+    ["4", "", "", "Regular Season", "3"],
+    ["2", "22400001", "2024-10-22 19:30:00", "Regular Season", '40, "hot"'],
+]
+
+
+@pytest.fixture(params=["gzip", "xz"])
+def archive(tmp_path: Path, request: pytest.FixtureRequest) -> Path:
+    path = tmp_path / "PlayerStatistics.7z"
+    path.write_bytes(b"fake archive")
+    write_player_statistics_blocks(
+        HEADER, ROWS, archive_checksum(path), block_rows=2, codec=request.param, block_root=tmp_path / "blocks"
+    )
+    return path
+
+
+def test_blocks_round_trip_and_record_date_ranges(archive: Path) -> None:
+    index = load_block_index(archive, block_root=archive.parent / "blocks")
+    assert index is not None and index.rows == len(ROWS)
+    assert [block["rows"] for block in index.blocks] == [2, 2, 2, 1]
+    assert [(block["minGameDate"], block["maxGameDate"]) for block in index.blocks][:2] == [
+        ("2022-10-18 19:30:00", "2022-10-19 19:30:00"),
+        ("2023-06-01 20:30:00", "2023-10-24 19:30:00"),
+    ]
+    assert list(iter_block_rows(index, jobs=1)) == ROWS
+    assert list(iter_block_rows(index, jobs=2)) == ROWS
+
+
+def test_date_windows_skip_blocks(archive: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    index = load_block_index(archive, block_root=archive.parent / "blocks")
+    decoded = []
+    decode = player_stats_blocks.decode_block
+    monkeypatch.setattr(
+        player_stats_blocks,
+        "decode_block",
+        lambda path, codec, offset, length: (
+            decoded.append(offset) or decode(path, codec, offset, length)
+        ),
+    )
+
+    start, end = season_date_bounds({2023})
+    assert (start, end) == ("2023-07-01", "2024-07-01")
+    assert list(iter_block_rows(index, start=start, end=end, jobs=1)) == [ROWS[3], ROWS[4]]
+    assert decoded == [index.blocks[1]["offset"], index.blocks[2]["offset"]]
+
+
+def test_reader_prefers_blocks_over_the_archive(
+    archive: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def no_archive(_path: Path):
+        raise AssertionError("current blocks must replace the archive stream")
+
+    monkeypatch.setattr(player_stats_reader, "_open_archive_csv", no_archive)
+    monkeypatch.setattr(player_stats_reader, "load_player_statistics_cache", lambda *_args: None)
+    monkeypatch.setattr(player_stats_reader, "load_shard_manifest", lambda *_args: None)
+    monkeypatch.setattr(
+        player_stats_reader, "tee_values_into_cache", lambda _header, rows, *_a, **_k: rows
+    )
+    monkeypatch.setattr(
+        player_stats_reader,
+        "load_block_index",
+        partial(load_block_index, block_root=archive.parent / "blocks"),
+    )
+
+    with player_stats_reader.open_player_statistics(archive_path=archive) as (header, rows):
+        assert header == HEADER and [list(row) for row in rows] == ROWS
+    with player_stats_reader.open_player_statistics(
+        archive_path=archive, seasons={2022}, game_types={"playoffs"}
+    ) as (_, rows):
+        assert [list(row) for row in rows] == [ROWS[2]]
@@ -0,0 +1,170 @@
+"""Tests for the PlayerStatistics column cache."""
+
+from __future__ import annotations
+
+import hashlib
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts import player_stats_cache
+from scripts.player_stats_reader import Projection, joined_category
+
+ROWS = [
+    {
+        "personId": "2544",
+        "gameId": "22300001",
+        "gameDate": "2023-10-24 19:30:00",
+        "points": "21",
+        "numMinutes": "29.5",
+        "win": "1",
+        "plusMinusPoints": "-0",
+    },
+    {
+        "personId": "201939",
+        "gameId": "22300001",
+        "gameDate": "2023-10-24 19:30:00",
+        "points": "",
+        "numMinutes": "",
+        "win": "0",
+        "plusMinusPoints": "4",
+    },
+    {
+        "personId": "002",
+        "gameId": "22300002",
+        "gameDate": "2023-10-25 20:00:00",
+        "points": "7",
+        "numMinutes": "12.25",
+        "win": "1",
+        "plusMinusPoints": "1.0",
+    },
+]
+
+FAKE_SHA256 = hashlib.sha256(b"fake archive").hexdigest()
+
+
+def _archive(tmp_path: Path) -> Path:
+    archive = tmp_path / "PlayerStatistics.7z"
+    archive.write_bytes(b"fake archive")
+    (tmp_path / "SHA256SUMS.txt").write_text(f"{FAKE_SHA256}  PlayerStatistics.7z\n", encoding="utf-8")
+    return archive
+
+
+def test_round_trip_preserves_text_and_infers_types(tmp_path: Path) -> None:
+    archive = _archive(tmp_path)
+    cache_root = tmp_path / "cache"
+    checksum = player_stats_cache.archive_checksum(archive)
+    assert checksum == FAKE_SHA256
+
+    streamed = list(
+        player_stats_cache.tee_into_cache(
+            ROWS, checksum, archive_size=archive.stat().st_size, cache_root=cache_root
+        )
+    )
+    assert streamed == ROWS
+
+    with player_stats_cache.load_player_statistics_cache(archive, cache_root=cache_root) as cache:
+        assert list(cache.iter_rows()) == ROWS
+        assert cache.column_type("win") == "int"
+        assert cache.column_type("numMinutes") == "float"
+        # Leading zeros and "-0" cannot round-trip through int, so they stay text.
+        assert cache.column_type("personId") == "str"
+        assert cache.column_type("plusMinusPoints") == "str"
+        assert list(cache.column("win")) == [1, 0, 1]
+        assert list(cache.iter_rows(["gameId"])) == [{"gameId": row["gameId"]} for row in ROWS]
+
+
+def test_abandoned_stream_does_not_publish(tmp_path: Path) -> None:
+    archive = _archive(tmp_path)
+    cache_root = tmp_path / "cache"
+    stream = player_stats_cache.tee_into_cache(ROWS, FAKE_SHA256, cache_root=cache_root)
+    next(stream)
+    stream.close()
+
+    assert player_stats_cache.load_player_statistics_cache(archive, cache_root=cache_root) is None
+    assert not any(cache_root.iterdir())
+
+
+def test_cache_invalidated_when_archive_size_changes(tmp_path: Path) -> None:
+    archive = _archive(tmp_path)
+    cache_root = tmp_path / "cache"
+    list(
+        player_stats_cache.tee_into_cache(
+            ROWS, FAKE_SHA256, archive_size=archive.stat().st_size, cache_root=cache_root
+        )
+    )
+
+    archive.write_bytes(b"a refreshed, larger archive")
+    with pytest.warns(UserWarning, match="SHA256SUMS.txt lists"):
+        assert player_stats_cache.load_player_statistics_cache(archive, cache_root=cache_root) is None
+
+
+def test_typed_records_come_straight_from_the_cached_columns(tmp_path: Path) -> None:
+    archive = _archive(tmp_path)
+    cache_root = tmp_path / "cache"
+    rows = [
+        *ROWS,
+        {**ROWS[0], "personId": " 77 ", "points": "9007199254740993", "numMinutes": "3.0"},
+    ]
+    list(
+        player_stats_cache.tee_into_cache(
+            rows, FAKE_SHA256, archive_size=archive.stat().st_size, cache_root=cache_root
+        )
+    )
+    projection = Projection(
+        "CachedRow",
+        {
+            "personId": "category",
+            "gameId": "int",
+            "season": ("gameDate", lambda text: int(text[:4])),
+            "points": "int",
+            "pointsFloat": ("points", "float"),
+            "numMinutes": "float",
+            "minutesInt": ("numMinutes", "int"),
+            "win": "flag",
+            "winText": ("win", "str"),
+            "plusMinusPoints": "float",
+            "label": (("gameId", "personId"), joined_category),
+            "missing": "float",
+        },
+    )
+
+    with player_stats_cache.load_player_statistics_cache(archive, cache_root=cache_root) as cache:
+        reader = projection.reader(cache.header)
+        expected = [reader(values) for values in cache.iter_values()]
+        records = list(projection.cache_records(cache))
+
+    assert records == expected
+    assert records[3].personId == "77" and records[3].points == 9007199254740992
+    assert [record.minutesInt for record in records] == [29, None, 12, 3]
+
+
+def test_checksum_follows_the_file_and_hashes_each_version_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    archive = _archive(tmp_path)
+    cache_root = tmp_path / "cache"
+    list(
+        player_stats_cache.tee_into_cache(
+            ROWS, FAKE_SHA256, archive_size=archive.stat().st_size, cache_root=cache_root
+        )
+    )
+    hashed: list[Path] = []
+    hash_file = player_stats_cache._hash_file
+    monkeypatch.setattr(player_stats_cache, "_hash_file", lambda path: hashed.append(path) or hash_file(path))
+    player_stats_cache._hash_file_version.cache_clear()
+
+    assert [player_stats_cache.archive_checksum(archive) for _ in range(3)] == [FAKE_SHA256] * 3
+    assert len(hashed) == 1
+
+    # Same size, new bytes, stale SHA256SUMS.txt: the old columns are not read.
+    archive.write_bytes(b"fresh archive")
+    with pytest.warns(UserWarning, match="SHA256SUMS.txt lists"):
+        checksum = player_stats_cache.archive_checksum(archive)
+    assert checksum == hashlib.sha256(b"fresh archive").hexdigest()
+    assert len(hashed) == 2
+    with pytest.warns(UserWarning):
+        assert player_stats_cache.load_player_statistics_cache(archive, cache_root=cache_root) is None
@@ -0,0 +1,73 @@
+"""Tests for the per-player PlayerStatistics offset index."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts.history import build_player_careers
+from scripts.player_stats_cache import archive_checksum
+from scripts.player_stats_index import (
+    get_player_games,
+    load_player_game_index,
+    write_player_game_index,
+)
+from scripts.player_stats_reader import Projection
+
+HEADER = ["personId", "gameId", "gameDate", "gameType", "points", "numMinutes"]
+ROWS = [
+    ["7", "22300020", "2023-11-03 19:30:00", "Regular Season", "12", "30"],
+    ["3", "22300001", "2023-10-24 19:30:00", "Regular Season", "31", "36"],
+    ["7", "22300002", "2023-10-25 19:30:00", "Regular Season", "8", "21"],
+    ["", "22300003", "2023-10-25 19:30:00", "Regular Season", "0", "0"],
+    ["3", "42300101", "2024-04-21 15:30:00", "Playoffs", "40", "42"],
+    ["11", "22300002", "2023-10-25 19:30:00", "Regular Season", "19"],
+]
+
+
+@pytest.fixture
+def archive(tmp_path: Path) -> Path:
+    path = tmp_path / "PlayerStatistics.7z"
+    path.write_bytes(b"fake archive")
+    write_player_game_index(HEADER, ROWS, archive_checksum(path), index_root=tmp_path / "index")
+    return path
+
+
+def test_player_games_are_contiguous_and_date_ordered(archive: Path) -> None:
+    index_root = archive.parent / "index"
+    index = load_player_game_index(archive, index_root=index_root)
+    assert index is not None
+    assert index.rows == 5
+    assert sorted(index.players) == ["11", "3", "7"]
+
+    games = get_player_games("7", archive_path=archive, index_root=index_root)
+    assert [game["gameId"] for game in games] == ["22300002", "22300020"]
+    assert get_player_games("11", archive_path=archive, index_root=index_root) == [
+        dict(zip(HEADER, [*ROWS[5], ""], strict=True))
+    ]
+    assert get_player_games("404", archive_path=archive, index_root=index_root) == []
+
+    projection = Projection("Row", {"gameType": "str", "points": "float"})
+    assert get_player_games(" 3 ", projection, archive_path=archive, index_root=index_root) == [
+        ("Regular Season", 31.0),
+        ("Playoffs", 40.0),
+    ]
+
+
+def test_player_career_reads_one_player(archive: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    index = load_player_game_index(archive, index_root=archive.parent / "index")
+    monkeypatch.setattr(
+        build_player_careers,
+        "get_player_games",
+        lambda person_id, projection: index.records(person_id, projection),
+    )
+
+    career = build_player_careers.player_career("3")
+    assert career["regular"]["totals"]["points"] == 31
+    assert career["postseason"]["totals"]["games"] == 1
+    assert career["postseason"]["seasons"] == [2023]
+    assert build_player_careers.player_career("404") == {}
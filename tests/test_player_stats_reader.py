@@ -0,0 +1,234 @@
+"""Tests for the typed, column-projected PlayerStatistics reader."""
+
+from __future__ import annotations
+
+import csv
+import io
+import sys
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts import build_insights, player_stats_cache, player_stats_reader, player_stats_scan
+from scripts.history.build_player_careers import CareerAccumulator
+from scripts.player_stats_reader import Projection, joined_category
+
+ROWS = [
+    {
+        "personId": "1",
+        "firstName": "Test",
+        "lastName": "One",
+        "gameId": "22300001",
+        "gameDate": "2023-11-01 19:30:00",
+        "gameType": "Regular Season",
+        "points": "31",
+        "assists": "4",
+        "numMinutes": "34",
+        "win": "1",
+    },
+    {
+        "personId": "2",
+        "firstName": "Test",
+        "lastName": "Two",
+        "gameId": "22300001",
+        "gameDate": "2023-11-01 19:30:00",
+        "gameType": "Regular Season",
+        "points": "",
+        "assists": "9",
+        "numMinutes": "28.5",
+        "win": "0",
+    },
+    {
+        "personId": "1",
+        "firstName": "Test",
+        "lastName": "One",
+        "gameId": "42300401",
+        "gameDate": "2024-06-10 20:30:00",
+        "gameType": "Playoffs",
+        "points": "55",
+        "assists": "6",
+        "numMinutes": "44",
+        "win": "1",
+    },
+]
+
+
+def _csv_text(rows: list[dict[str, str]]) -> str:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(rows[0]))
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def test_projection_converts_and_defaults_missing_columns() -> None:
+    projection = Projection(
+        "Row",
+        {
+            "personId": "str",
+            "points": "float",
+            "win": "flag",
+            "year": ("gameDate", lambda raw: int(raw[:4]) if raw else None),
+            "steals": "float",
+        },
+    )
+    read = projection.reader(["gameDate", "personId", "points", "win"])
+
+    record = read(["2024-01-02 19:00:00", " 23 ", "31", "1"])
+    assert record == ("23", 31.0, True, 2024, None)
+    assert record.year == 2024
+    assert read(["2024-01-02", "7"]) == ("7", None, False, 2024, None)
+    assert projection.columns == ("personId", "points", "win", "gameDate", "steals")
+    assert (
+        projection.from_mapping(
+            {"personId": 23, "points": "31", "win": "1", "gameDate": "2024-01-02"}
+        )
+        == record
+    )
+
+
+def test_categories_are_interned_and_composite_fields_join_columns() -> None:
+    projection = Projection(
+        "Row",
+        {
+            "gameType": "category_lower",
+            "team": (("playerteamCity", "playerteamName"), joined_category),
+            "opponent": (("opponentteamCity", "opponentteamName"), joined_category),
+            "lastName": "category",
+        },
+    )
+    assert projection.columns == (
+        "gameType",
+        "playerteamCity",
+        "playerteamName",
+        "opponentteamCity",
+        "opponentteamName",
+        "lastName",
+    )
+    read = projection.reader(["playerteamName", "gameType", "playerteamCity", "opponentteamCity"])
+
+    first = read(["Lakers", " Playoffs", "Los Angeles ", "Boston"])
+    second = read(["".join(["Lak", "ers"]), " Playoffs", "Los Angeles ", "Boston"])
+    assert first == ("playoffs", "Los Angeles Lakers", "Boston", "")
+    assert first.team is second.team and first.gameType is second.gameType
+    assert projection.from_mapping({"playerteamName": "Lakers", "lastName": " James "}) == (
+        "",
+        "Lakers",
+        "",
+        "James",
+    )
+
+
+def test_projection_rejects_unknown_type() -> None:
+    with pytest.raises(ValueError):
+        Projection("Row", {"points": "decimal"})
+
+
+def test_scan_reads_archive_and_cache_into_typed_consumers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    archive = tmp_path / "PlayerStatistics.7z"
+    archive.write_bytes(b"fake archive")
+    cache_root = tmp_path / "cache"
+    streams: list[str] = []
+
+    @contextmanager
+    def fake_archive_csv(path: Path):
+        streams.append(path.name)
+        yield io.StringIO(_csv_text(ROWS), newline="")
+
+    monkeypatch.setattr(player_stats_reader, "_open_archive_csv", fake_archive_csv)
+    monkeypatch.setattr(
+        player_stats_reader,
+        "load_player_statistics_cache",
+        partial(player_stats_cache.load_player_statistics_cache, cache_root=cache_root),
+    )
+    monkeypatch.setattr(
+        player_stats_reader,
+        "tee_values_into_cache",
+        partial(player_stats_cache.tee_values_into_cache, cache_root=cache_root),
+    )
+    monkeypatch.setattr(
+        player_stats_scan,
+        "open_player_statistics",
+        partial(player_stats_reader.open_player_statistics, archive_path=archive),
+    )
+
+    @contextmanager
+    def cached_records(projections, **filters):
+        with player_stats_reader.open_cached_records(
+            projections, archive_path=archive, **filters
+        ) as records:
+            if records is not None:
+                streams.append("cache")
+            yield records
+
+    monkeypatch.setattr(player_stats_scan, "open_cached_records", cached_records)
+
+    expected_leaders = build_insights.PlayerLeadersBuilder()
+    expected_careers = CareerAccumulator()
+    player_stats_scan.scan_player_statistics([expected_leaders, expected_careers], ROWS)
+
+    for _ in range(2):  # first pass streams the archive, second reads the column cache
+        leaders = build_insights.PlayerLeadersBuilder()
+        careers = CareerAccumulator()
+        assert player_stats_scan.scan_player_statistics([leaders, careers]) == len(ROWS)
+        assert leaders.career_totals == expected_leaders.career_totals
+        assert leaders.points_highs == expected_leaders.points_highs
+        assert careers.players == expected_careers.players
+        assert careers.season_sets == expected_careers.season_sets
+
+    # The second pass builds typed records from the cached columns, without CSV text.
+    assert streams == ["PlayerStatistics.7z", "cache"]
+
+
+def test_parallel_scan_merges_worker_partials(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    archive = tmp_path / "PlayerStatistics.7z"
+    archive.write_bytes(b"fake archive")
+    rows = [
+        {
+            **ROWS[index % len(ROWS)],
+            "personId": str(index % 7),
+            "points": str(index),
+            "gameDate": f"20{10 + index % 12}-0{1 + index % 9}-15 19:30:00",
+            "playerteamCity": f"City{index % 3}",
+        }
+        for index in range(60)
+    ]
+    payload = _csv_text(rows).encode("utf-8")
+
+    @contextmanager
+    def fake_archive_bytes(path: Path):
+        yield io.BytesIO(payload)
+
+    monkeypatch.setattr(player_stats_reader, "_open_archive_bytes", fake_archive_bytes)
+    monkeypatch.setattr(player_stats_scan, "player_statistics_cache_available", lambda: False)
+    monkeypatch.setattr(
+        player_stats_scan,
+        "open_player_statistics_chunks",
+        partial(
+            player_stats_reader.open_player_statistics_chunks, chunk_bytes=256, archive_path=archive
+        ),
+    )
+
+    def builders() -> list:
+        return [
+            build_insights.PlayerLeadersBuilder(),
+            build_insights.PlayerSeasonInsightsBuilder(),
+            build_insights.GoatSystemBuilder(),
+            CareerAccumulator(),
+        ]
+
+    serial = builders()
+    player_stats_scan.scan_player_statistics(serial, rows)
+    parallel = builders()
+    assert player_stats_scan.scan_player_statistics(parallel, jobs=2) == len(rows)
+
+    for expected, merged in zip(serial, parallel, strict=True):
+        assert vars(merged) == vars(expected)
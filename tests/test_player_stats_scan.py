@@ -0,0 +1,95 @@
+"""Tests for the single-pass PlayerStatistics fan-out."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts import build_insights
+from scripts.goat_metrics import RecentGoatAccumulator, compute_recent_goat_scores
+from scripts.history.build_player_careers import CareerAccumulator
+from scripts.player_stats_scan import PlayerStatisticsScan, scan_player_statistics
+
+
+def _row(person_id: str, game_id: str, date: str, points: str, **overrides: str) -> dict[str, str]:
+    row = {
+        "personId": person_id,
+        "firstName": "Test",
+        "lastName": f"Player{person_id}",
+        "gameId": game_id,
+        "gameDate": date,
+        "gameType": "Regular Season",
+        "gameLabel": "",
+        "playerteamCity": "Boston",
+        "playerteamName": "Celtics",
+        "opponentteamCity": "New York",
+        "opponentteamName": "Knicks",
+        "win": "1",
+        "numMinutes": "34",
+        "points": points,
+        "assists": "10",
+        "reboundsTotal": "11",
+        "steals": "2",
+        "blocks": "1",
+        "plusMinusPoints": "6",
+    }
+    row.update(overrides)
+    return row
+
+
+ROWS = [
+    _row("1", "22300001", "2023-11-01 19:30:00", "31"),
+    _row("2", "22300001", "2023-11-01 19:30:00", "12", win="0"),
+    _row("1", "42300401", "2024-06-10 20:30:00", "55", gameType="Playoffs", gameLabel="NBA Finals"),
+    _row("3", "22300002", "2023-11-02 19:30:00", "8", numMinutes="0"),
+]
+
+
+class _CountingRows:
+    def __init__(self, rows: list[dict[str, str]]) -> None:
+        self.rows = rows
+        self.iterations = 0
+
+    def __iter__(self):
+        self.iterations += 1
+        yield from self.rows
+
+
+def test_scan_feeds_every_consumer_from_one_pass() -> None:
+    source = _CountingRows(ROWS)
+    scan = PlayerStatisticsScan()
+    leaders = scan.register(build_insights.PlayerLeadersBuilder())
+    careers = scan.register(CareerAccumulator())
+    recent = scan.register(RecentGoatAccumulator())
+
+    assert scan.run(source) == len(ROWS)
+    assert source.iterations == 1
+    assert leaders.total_rows.finalize() == len(ROWS)
+    assert careers.row_count.finalize() == len(ROWS)
+    assert careers.players["1"]["postseason"].points.finalize() == 55.0
+    assert set(recent.aggregates) == {"1", "2"}
+
+
+def test_shared_scan_matches_standalone_payloads() -> None:
+    shared = build_insights.PlayerSeasonInsightsBuilder()
+    shared_goat = build_insights.GoatSystemBuilder()
+    scan_player_statistics([shared, shared_goat], ROWS)
+
+    standalone = build_insights.PlayerSeasonInsightsBuilder()
+    scan_player_statistics([standalone], ROWS)
+
+    shared_payload = shared.payload()
+    standalone_payload = standalone.payload()
+    shared_payload.pop("generatedAt")
+    standalone_payload.pop("generatedAt")
+    assert shared_payload == standalone_payload
+    assert shared_goat.career_totals["1"]["finalsGames"].finalize() == 1
+
+
+def test_recent_accumulator_matches_compute_recent_scores() -> None:
+    accumulator = RecentGoatAccumulator()
+    scan_player_statistics([accumulator], ROWS)
+
+    assert accumulator.scores({"1", "2", "3"}) == compute_recent_goat_scores(ROWS, {"1", "2", "3"})
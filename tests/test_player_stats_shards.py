@@ -0,0 +1,114 @@
+"""Tests for the season/gameType shards of the PlayerStatistics table."""
+
+from __future__ import annotations
+
+import io
+import json
+import sys
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts import player_stats_reader, player_stats_shards
+from scripts.player_stats_cache import archive_checksum
+from scripts.player_stats_shards import ShardFilter, shard_season, write_player_statistics_shards
+
+HEADER = ["personId", "gameId", "gameDate", "gameType", "points"]
+ROWS = [
+    ["1", "22200001", "2022-10-18 19:30:00", "Regular Season", "31"],
+    ["2", "42200401", "2023-06-01 20:30:00", "Playoffs", "28"],
+    ["1", "22300001", "2023-10-24 19:30:00", "Regular Season", "22"],
+    ["3", "52300101", "2024-04-16 19:00:00", "Play-in Tournament", "17"],
+    ["2", "22400001", "2024-10-22 19:30:00", "Regular Season", "40"],
+    ["4", "", "", "Regular Season", "3"],
+]
+
+
+def _csv_text() -> str:
+    return "\n".join(",".join(row) for row in [HEADER, *ROWS]) + "\n"
+
+
+@pytest.fixture
+def archive(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "PlayerStatistics.7z"
+    path.write_bytes(b"fake archive")
+
+    @contextmanager
+    def fake_archive_csv(_path: Path):
+        yield io.StringIO(_csv_text(), newline="")
+
+    monkeypatch.setattr(player_stats_reader, "_open_archive_csv", fake_archive_csv)
+    monkeypatch.setattr(player_stats_reader, "load_player_statistics_cache", lambda *_args: None)
+    monkeypatch.setattr(
+        player_stats_reader, "tee_values_into_cache", lambda _header, rows, *_args, **_kwargs: rows
+    )
+    monkeypatch.setattr(
+        player_stats_reader,
+        "load_shard_manifest",
+        partial(player_stats_shards.load_shard_manifest, shard_root=tmp_path / "shards"),
+    )
+    return path
+
+
+def _read(archive: Path, **filters) -> list[list[str]]:
+    with player_stats_reader.open_player_statistics(archive_path=archive, **filters) as (_, rows):
+        return [list(row) for row in rows]
+
+
+def test_shard_season_uses_july_cutoff() -> None:
+    assert shard_season("2023-06-01 20:30:00") == 2022
+    assert shard_season("2023-07-01") == 2023
+    assert shard_season("") is None
+
+
+def test_filters_match_with_and_without_shards(
+    archive: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    streamed = _read(archive, seasons={2022, 2023}, game_types={"regular season"})
+    assert streamed == [ROWS[0], ROWS[2]]
+
+    directory = write_player_statistics_shards(
+        HEADER, ROWS, archive_checksum(archive), shard_root=archive.parent / "shards"
+    )
+    manifest = json.loads((directory / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["rows"] == len(ROWS)
+    assert [(entry["season"], entry["path"]) for entry in manifest["shards"]][:3] == [
+        (2022, "season=2022/playoffs.csv"),
+        (2022, "season=2022/regular-season.csv"),
+        (2023, "season=2023/play-in-tournament.csv"),
+    ]
+    assert manifest["shards"][-1]["path"] == "season=unknown/regular-season.csv"
+
+    def no_archive(_path: Path):
+        raise AssertionError("filtered reads must come from the shards")
+
+    monkeypatch.setattr(player_stats_reader, "_open_archive_csv", no_archive)
+    assert _read(archive, seasons={2022, 2023}, game_types={"regular season"}) == streamed
+    assert _read(archive, seasons={2024}) == [ROWS[4]]
+    assert _read(archive, game_types={"Playoffs", "Play-in Tournament"}) == [ROWS[1], ROWS[3]]
+
+
+def test_shard_filter_selects_manifest_entries() -> None:
+    manifest = {
+        "directory": "/shards",
+        "shards": [
+            {
+                "season": 2023,
+                "gameType": "Regular Season",
+                "path": "season=2023/regular-season.csv",
+            },
+            {
+                "season": 2024,
+                "gameType": "Regular Season",
+                "path": "season=2024/regular-season.csv",
+            },
+            {"season": 2024, "gameType": "Playoffs", "path": "season=2024/playoffs.csv"},
+        ],
+    }
+
+    selected = player_stats_shards.select_shards(manifest, ShardFilter({2024}, {"regular season"}))
+    assert selected == [Path("/shards/season=2024/regular-season.csv")]
@@ -0,0 +1,134 @@
+"""Tests for watermark-based incremental PlayerStatistics refreshes."""
+
+from __future__ import annotations
+
+import csv
+import io
+import sys
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts import build_insights, player_stats_reader, player_stats_scan
+from scripts.history.build_player_careers import CareerAccumulator
+from scripts.player_stats_scan import scan_player_statistics
+from scripts.player_stats_state import load_state, open_refresh
+
+BUILDERS = {
+    "player_leaders": build_insights.PlayerLeadersBuilder,
+    "player_season_insights": build_insights.PlayerSeasonInsightsBuilder,
+    "goat_system": build_insights.GoatSystemBuilder,
+    "player_careers": CareerAccumulator,
+}
+
+ROWS = [
+    {
+        "personId": str(index % 5),
+        "firstName": "Test",
+        "lastName": f"Player{index % 5}",
+        "gameId": f"{40 if index % 6 == 0 else 22}{index:06d}",
+        "gameDate": f"20{15 + index // 12}-{1 + index % 12:02d}-10 19:30:00",
+        "gameType": "Playoffs" if index % 6 == 0 else "Regular Season",
+        "playerteamCity": "Boston",
+        "playerteamName": f"Team{index % 3}",
+        "points": str(10 + index % 40),
+        "assists": str(index % 11),
+        "reboundsTotal": str(index % 13),
+        "numMinutes": "30",
+        "win": str(index % 2),
+    }
+    for index in range(48)
+]
+
+
+def _csv_text(rows: list[dict[str, str]]) -> str:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(rows[0]))
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def _refresh_all(rows, state_root: Path, *, incremental: bool) -> dict:
+    refreshes = {
+        name: open_refresh(name, factory, incremental=incremental, state_root=state_root)
+        for name, factory in BUILDERS.items()
+    }
+    scan_player_statistics([refresh.consumer for refresh in refreshes.values()], rows)
+    return {name: refresh.commit() for name, refresh in refreshes.items()}
+
+
+def test_incremental_refresh_matches_full_pass(tmp_path: Path) -> None:
+    expected = _refresh_all(ROWS, tmp_path / "full", incremental=False)
+
+    state_root = tmp_path / "state"
+    _refresh_all(
+        ROWS[:30], state_root, incremental=True
+    )  # no state yet: full pass, saves a baseline
+    _, watermark = load_state(
+        "player_leaders", build_insights.PlayerLeadersBuilder, state_root=state_root
+    )
+    assert watermark == (ROWS[29]["gameDate"], ROWS[29]["gameId"])
+
+    # The refreshed archive still holds every earlier row; only the newer ones are folded in.
+    refreshed = _refresh_all(ROWS, state_root, incremental=True)
+    for name, builder in refreshed.items():
+        assert vars(builder) == vars(expected[name]), name
+    assert refreshed["player_leaders"].total_rows.finalize() == len(ROWS)
+
+    _, watermark = load_state(
+        "player_leaders", build_insights.PlayerLeadersBuilder, state_root=state_root
+    )
+    assert watermark == (ROWS[-1]["gameDate"], ROWS[-1]["gameId"])
+
+
+def test_unusable_state_falls_back_to_full_pass(tmp_path: Path) -> None:
+    (tmp_path / "player_leaders.pickle").write_bytes(b"not a pickle")
+
+    refresh = open_refresh(
+        "player_leaders", build_insights.PlayerLeadersBuilder, incremental=True, state_root=tmp_path
+    )
+    assert refresh.base is None
+    scan_player_statistics([refresh.consumer], ROWS)
+    assert refresh.commit().total_rows.finalize() == len(ROWS)
+
+
+def test_parallel_refresh_through_worker_processes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    archive = tmp_path / "PlayerStatistics.7z"
+    archive.write_bytes(b"fake archive")
+    payload = _csv_text(ROWS).encode("utf-8")
+
+    @contextmanager
+    def fake_archive_bytes(path: Path):
+        yield io.BytesIO(payload)
+
+    monkeypatch.setattr(player_stats_reader, "_open_archive_bytes", fake_archive_bytes)
+    monkeypatch.setattr(player_stats_scan, "player_statistics_cache_available", lambda: False)
+    monkeypatch.setattr(
+        player_stats_scan,
+        "open_player_statistics_chunks",
+        partial(
+            player_stats_reader.open_player_statistics_chunks, chunk_bytes=256, archive_path=archive
+        ),
+    )
+    expected = _refresh_all(ROWS, tmp_path / "serial", incremental=False)
+
+    refreshes = {
+        name: open_refresh(name, factory, state_root=tmp_path / "parallel")
+        for name, factory in BUILDERS.items()
+    }
+    assert scan_player_statistics(
+        [refresh.consumer for refresh in refreshes.values()], jobs=2
+    ) == len(ROWS)
+    for name, refresh in refreshes.items():
+        assert vars(refresh.commit()) == vars(expected[name]), name
+    _, watermark = load_state(
+        "player_leaders", build_insights.PlayerLeadersBuilder, state_root=tmp_path / "parallel"
+    )
+    assert watermark == (ROWS[-1]["gameDate"], ROWS[-1]["gameId"])
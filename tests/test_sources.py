@@ -0,0 +1,144 @@
+"""Tests for the dataset source adapters."""
+
+from __future__ import annotations
+
+import gzip
+import io
+import lzma
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts import sources
+from scripts.decompression import ProducerStream
+from scripts.player_stats_reader import open_player_statistics
+from scripts.sources import SourceError, last_source_read, locate_source, open_source
+
+MEMBER = "TeamStatistics.csv"
+CSV = b"gameId,teamId,teamScore\n1,10,101\n1,20,99\n2,10,88\n"
+
+
+def _write_sources(root: Path) -> dict[str, Path]:
+    (root / "plain").mkdir()
+    paths = {
+        "csv": root / "plain" / MEMBER,
+        "csv.gz": root / "TeamStatistics.csv.gz",
+        "csv.xz": root / "TeamStatistics.csv.xz",
+        "zip": root / "TeamStatistics.zip",
+        "directory": root / "plain",
+        "sharded": root / "sharded",
+    }
+    paths["csv"].write_bytes(CSV)
+    paths["csv.gz"].write_bytes(gzip.compress(CSV))
+    paths["csv.xz"].write_bytes(lzma.compress(CSV))
+    with zipfile.ZipFile(paths["zip"], "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(MEMBER, CSV)
+    (root / "sharded" / "season=2023").mkdir(parents=True)
+    (root / "sharded" / "season=2023" / "part-0.csv").write_bytes(
+        b"gameId,teamId,teamScore\n1,10,101\n1,20,99\n"
+    )
+    (root / "sharded" / "season=2024").mkdir()
+    (root / "sharded" / "season=2024" / "part-0.csv").write_bytes(
+        b"gameId,teamId,teamScore\r\n2,10,88\n"
+    )
+    return paths
+
+
+def test_every_source_kind_yields_the_same_bytes(tmp_path: Path) -> None:
+    decoders = {}
+    for kind, path in _write_sources(tmp_path).items():
+        assert sources.source_kind(path, MEMBER) == kind
+        with open_source(path, MEMBER) as handle:
+            assert handle.read() == CSV, kind
+        read = last_source_read(MEMBER)
+        assert read is not None and read.path == path and read.kind == kind
+        decoders[kind] = read.decoder
+
+    assert decoders == {
+        "csv": "file",
+        "csv.gz": "gzip",
+        "csv.xz": "lzma",
+        "zip": "zipfile",
+        "directory": "file",
+        "sharded": "shards",
+    }
+
+
+def test_mismatched_shards_and_missing_members_raise(tmp_path: Path) -> None:
+    (tmp_path / "shards").mkdir()
+    (tmp_path / "shards" / "a.csv").write_bytes(b"gameId,teamId\n1,10\n")
+    (tmp_path / "shards" / "b.csv").write_bytes(b"gameId,points\n1,99\n")
+    with pytest.raises(SourceError, match="header"):
+        with open_source(tmp_path / "shards", MEMBER) as handle:
+            handle.read()
+
+    with zipfile.ZipFile(tmp_path / "Other.zip", "w") as archive:
+        archive.writestr("Other.csv", CSV)
+    with pytest.raises(SourceError, match="does not contain"):
+        with open_source(tmp_path / "Other.zip", MEMBER):
+            pass
+
+
+def test_locate_prefers_search_path_and_cheapest_input(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    hosts = tmp_path / "hosts"
+    hosts.mkdir()
+    (hosts / "TeamStatistics.zip").write_bytes(b"")
+    (hosts / "TeamStatistics.csv.gz").write_bytes(b"")
+    monkeypatch.setenv(sources.SEARCH_PATH_ENV, str(hosts))
+    assert locate_source("TeamStatistics") == hosts / "TeamStatistics.csv.gz"
+
+    (hosts / "TeamStatistics").mkdir()
+    assert locate_source("TeamStatistics") == hosts / "TeamStatistics"
+
+    monkeypatch.setenv(sources.SEARCH_PATH_ENV, str(tmp_path / "nowhere"))
+    fallback = tmp_path / "TeamStatistics.zip"
+    assert locate_source("TeamStatistics", fallback) == fallback
+
+
+def test_player_statistics_reads_an_extracted_copy(tmp_path: Path) -> None:
+    extracted = tmp_path / "PlayerStatistics"
+    extracted.mkdir()
+    (extracted / "PlayerStatistics.csv").write_text(
+        "personId,points\n1,30\n2,12\n", encoding="utf-8"
+    )
+
+    with open_player_statistics(use_cache=False, archive_path=extracted) as (header, rows):
+        assert header == ["personId", "points"]
+        assert [list(row) for row in rows] == [["1", "30"], ["2", "12"]]
+    assert last_source_read("PlayerStatistics.csv").kind == "directory"
+
+
+def test_py7zr_streams_and_extracts_a_member(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    py7zr = pytest.importorskip("py7zr")
+    archive = tmp_path / "TeamStatistics.7z"
+    with py7zr.SevenZipFile(archive, "w") as out:
+        out.writestr(b"not the member\n", "README.txt")
+        out.writestr(CSV, MEMBER)
+    monkeypatch.setattr(sources, "_seven_zip_binary", lambda: None)
+
+    if sources._py7zr_can_stream():
+        stream = ProducerStream(sources._py7zr_producer(archive, MEMBER), name="py7zr")
+        with io.BufferedReader(stream) as handle:
+            assert handle.read() == CSV
+        with open_source(archive, MEMBER) as handle:
+            assert handle.read() == CSV
+        assert last_source_read(MEMBER).decoder == "py7zr"
+
+    extract_member = sources.extract_member
+    monkeypatch.setattr(sources, "_py7zr_can_stream", lambda: False)
+    monkeypatch.setattr(
+        sources,
+        "extract_member",
+        lambda path, member: extract_member(path, member, extract_root=tmp_path / "extracted"),
+    )
+    with open_source(archive, MEMBER) as handle:
+        assert handle.read() == CSV
+    assert last_source_read(MEMBER).decoder == "py7zr-extract"
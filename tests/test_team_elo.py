@@ -0,0 +1,89 @@
+"""Tests for the chronological team Elo stage."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts.games_table import read_games
+from scripts.team_elo import (
+    HOME_ADVANTAGE,
+    INITIAL_RATING,
+    EloState,
+    build_team_elo,
+    update_ratings,
+    win_probability,
+)
+
+GAMES_CSV = """gameId,gameDate,hometeamCity,hometeamName,hometeamId,awayteamCity,awayteamName,awayteamId,homeScore,awayScore,winner,gameType,attendance,gameLabel
+22300002,2023-10-26 19:30:00,Miami,Heat,2,Boston,Celtics,3,100,104,3,Regular Season,,
+22300001,2023-10-24 19:30:00,Boston,Celtics,3,Miami,Heat,2,110,100,3,Regular Season,,
+12300001,2023-10-10 19:30:00,Boston,Celtics,3,Miami,Heat,2,130,80,3,Preseason,,
+42300101,2024-04-21 13:00:00,Boston,Celtics,3,Denver,Nuggets,1,95,99,1,Playoffs,,
+22300003,2023-10-30 19:30:00,Denver,Nuggets,1,Miami,Heat,2,,,,Regular Season,,
+22400001,2024-10-22 19:30:00,Boston,Celtics,3,Miami,Heat,2,120,101,3,Regular Season,,
+"""
+
+
+def _records(tmp_path: Path):
+    path = tmp_path / "Games.csv"
+    path.write_text(GAMES_CSV, encoding="utf-8")
+    return read_games(path)
+
+
+def test_games_are_rated_in_date_order_with_season_carryover(tmp_path: Path) -> None:
+    state = EloState()
+
+    # The preseason and the unplayed game are skipped.
+    assert update_ratings(state, _records(tmp_path)) == 4
+
+    opener, rematch, playoff, next_season = state.games
+    assert [game.gameId for game in state.games] == ["22300001", "22300002", "42300101", "22400001"]
+    assert (opener.homeRating, opener.awayRating) == (INITIAL_RATING, INITIAL_RATING)
+    assert opener.homeWinProbability == pytest.approx(win_probability(0, 0, HOME_ADVANTAGE))
+    assert rematch.awayRating > INITIAL_RATING > rematch.homeRating
+    assert playoff.phase == "playoffs"
+
+    boston = state.teams["3"]
+    before, after = boston.history[-2][2], boston.history[-1][2]
+    # Boston opens 2024-25 with a quarter of its edge regressed to the mean.
+    assert next_season.homeRating == pytest.approx(
+        INITIAL_RATING + 0.75 * (before - INITIAL_RATING)
+    )
+    assert after > next_season.homeRating
+    # Within a season ratings are zero-sum: whatever one side gains the other loses.
+    season_end = {team_id: team.history[-1][2] for team_id, team in state.teams.items()}
+    season_end["3"], season_end["2"] = boston.history[-2][2], state.teams["2"].history[-2][2]
+    assert sum(season_end.values()) == pytest.approx(3 * INITIAL_RATING)
+
+
+def test_incremental_refresh_matches_a_full_replay(tmp_path: Path) -> None:
+    records = _records(tmp_path)
+    latest = [record for record in records if record.gameId == "22400001"]
+    earlier = [record for record in records if record.gameId != "22400001"]
+    state_path = tmp_path / "state.pickle"
+    output_path = tmp_path / "team_elo.json"
+
+    _, rated = build_team_elo(earlier, state_path=state_path, output_path=output_path)
+    assert rated == 3
+    resumed, rated = build_team_elo(
+        records, incremental=True, state_path=state_path, output_path=output_path
+    )
+    assert rated == 1
+
+    full = EloState()
+    update_ratings(full, records)
+    assert resumed == full
+    assert update_ratings(resumed, latest) == 0
+
+    payload = json.loads(output_path.read_text(encoding="utf-8"))
+    assert payload["lastGame"] == "2024-10-22 19:30:00"
+    assert [game["gameId"] for game in payload["games"]][-1] == "22400001"
+    boston = next(team for team in payload["teams"] if team["teamId"] == "3")
+    assert boston["games"] == 4
+    assert boston["history"][-1]["rating"] == boston["rating"]
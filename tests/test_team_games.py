@@ -0,0 +1,81 @@
+"""Tests for the cached TeamStatistics team-game table."""
+
+from __future__ import annotations
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts import build_team_profiles
+from scripts.table_cache import forget_tables
+from scripts.team_games import group_team_games, load_team_games, read_team_games
+
+TEAM_STATISTICS_CSV = """gameId,gameDate,teamCity,teamName,teamId,opponentTeamCity,opponentTeamName,opponentTeamId,home,win,teamScore,opponentScore,assists,fieldGoalsMade,fieldGoalsAttempted,fieldGoalsPercentage,reboundsTotal,turnovers,benchPoints
+21901231,2020-08-14 15:00:00,Boston,Celtics,3,Miami,Heat,2,1,1,110,100,25,45,90,0.5,44,12,30
+21901231,2020-08-14 15:00:00,Miami,Heat,2,Boston,Celtics,3,0,0,100,110,20,36,80,0.45,40,,18
+22000001,2020-12-22 19:30:00,Boston,Celtics,3,Miami,Heat,2,0,0,95,101,22,4,10,0.4,41,14,
+,bad date,Boston,Celtics,3,Miami,Heat,2,1,1,90,80,,,,,,,
+"""
+
+
+def _team_statistics(tmp_path: Path) -> Path:
+    path = tmp_path / "TeamStatistics.csv"
+    path.write_text(TEAM_STATISTICS_CSV, encoding="utf-8")
+    return path
+
+
+def test_team_games_parse_into_typed_cached_rows(tmp_path: Path) -> None:
+    path = _team_statistics(tmp_path)
+    cache_root = tmp_path / "cache"
+
+    records = load_team_games(path, cache_root=cache_root)
+
+    bubble = records[0]
+    assert (bubble.teamId, bubble.team, bubble.opponent) == ("3", "Boston Celtics", "Miami Heat")
+    assert bubble.start == datetime(2020, 8, 14, 15)
+    # The season comes from the gameId, so the bubble stays in 2019-20.
+    assert (bubble.season, bubble.home, bubble.win) == (2019, True, True)
+    assert (bubble.teamScore, bubble.fieldGoalsPercentage, bubble.steals) == (110.0, 0.5, None)
+    assert records[1].turnovers is None
+    assert (records[3].start, records[3].season) == (None, None)
+
+    forget_tables()
+    assert load_team_games(path, cache_root=cache_root) == records == read_team_games(path)
+
+    seasons = group_team_games(records)
+    assert sorted(seasons, key=str) == [("2", 2019), ("3", 2019), ("3", 2020), ("3", None)]
+    assert len(group_team_games(records, by_season=False)[("3", None)]) == 3
+
+
+def test_team_profiles_aggregate_from_the_shared_table(tmp_path: Path) -> None:
+    records = read_team_games(_team_statistics(tmp_path))
+
+    aggregates, earliest, latest = build_team_profiles._aggregate_team_metrics(
+        {"3": "BOS", "2": "MIA"}, records
+    )
+
+    boston = aggregates["BOS"]
+    assert (boston.games.finalize(), boston.wins.finalize()) == (3, 2)
+    assert boston.points.finalize() == 295.0
+    assert boston.turnovers.finalize() == 26.0
+    assert boston.bench_points.finalize() == 30.0
+    assert aggregates["MIA"].turnovers.finalize() == 0.0
+    # Shooting percentages pool makes and attempts instead of averaging per-game rates.
+    data = {"teams": [{"abbreviation": "BOS"}]}
+    build_team_profiles._update_profiles(data, aggregates)
+    assert data["teams"][0]["metrics"]["fieldGoalPct"] == 0.49
+    assert (earliest, latest) == (datetime(2020, 8, 14, 15), datetime(2020, 12, 22, 19, 30))
+
+
+def test_a_rewritten_source_is_reloaded(tmp_path: Path) -> None:
+    path = _team_statistics(tmp_path)
+    cache_root = tmp_path / "cache"
+    assert len(load_team_games(path, cache_root=cache_root)) == 4
+
+    path.write_text("\n".join(TEAM_STATISTICS_CSV.splitlines()[:3]) + "\n", encoding="utf-8")
+
+    assert len(load_team_games(path, cache_root=cache_root)) == 2
+    forget_tables()
+    assert [record.teamId for record in load_team_games(path, cache_root=cache_root)] == ["3", "2"]
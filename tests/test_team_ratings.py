@@ -0,0 +1,107 @@
+"""Tests for the per-team-season ratings stage."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts.team_games import BOX_COLUMNS, IDENTITY_FIELDS, TeamGameRecord
+from scripts.team_ratings import build_team_season_ratings, team_season_ratings
+
+np = pytest.importorskip("numpy")
+
+
+def _game(game_id: str, team: str, opponent: str, win: bool, **box: float) -> TeamGameRecord:
+    identity = dict.fromkeys(IDENTITY_FIELDS, "")
+    identity.update(
+        teamId=team,
+        gameId=game_id,
+        start=None,
+        season=2023,
+        home=False,
+        win=win,
+        teamName=f"Team {team}",
+        opponentTeamId=opponent,
+    )
+    return TeamGameRecord(**identity, **{name: box.get(name) for name in BOX_COLUMNS})
+
+
+def _box(points: float, fgm: float, fga: float, orb: float, drb: float, tov: float) -> dict:
+    return {
+        "teamScore": points,
+        "fieldGoalsMade": fgm,
+        "fieldGoalsAttempted": fga,
+        "threePointersMade": 10.0,
+        "threePointersAttempted": 30.0,
+        "freeThrowsMade": 15.0,
+        "freeThrowsAttempted": 20.0,
+        "reboundsOffensive": orb,
+        "reboundsDefensive": drb,
+        "turnovers": tov,
+        "assists": 20.0,
+        "numMinutes": 240.0,
+    }
+
+
+def test_ratings_come_from_summed_components(tmp_path: Path) -> None:
+    records = [
+        _game("22300001", "1", "2", True, **_box(110, 40, 85, 10, 35, 12)),
+        _game("22300001", "2", "1", False, **_box(100, 38, 90, 12, 30, 14)),
+        # Overtime: 265 team minutes.
+        _game("22300002", "1", "2", False, **{**_box(120, 45, 95, 8, 33, 10), "numMinutes": 265.0}),
+        _game("22300002", "2", "1", True, **{**_box(125, 46, 92, 11, 34, 13), "numMinutes": 265.0}),
+        # No opponent row: counts in the record, not the ratings.
+        _game("22300003", "1", "3", True, **_box(99, 40, 80, 10, 30, 10)),
+        # Playoff games are left out by default.
+        _game("42300101", "1", "2", True, **_box(130, 50, 90, 10, 30, 10)),
+    ]
+
+    payload = team_season_ratings(records)
+
+    first, second = payload["teams"]
+    assert (first["teamId"], first["games"], first["wins"], first["ratedGames"]) == ("1", 3, 2, 2)
+    team = {"fga": 180, "fgm": 85, "fta": 40, "orb": 18, "drb": 68, "tov": 22}
+    opp = {"fga": 182, "fgm": 84, "fta": 40, "orb": 23, "drb": 64, "tov": 27}
+
+    def estimate(side: dict, other: dict) -> float:
+        orb_share = side["orb"] / (side["orb"] + other["drb"])
+        return (
+            side["fga"]
+            + 0.4 * side["fta"]
+            - 1.07 * orb_share * (side["fga"] - side["fgm"])
+            + side["tov"]
+        )
+
+    possessions = 0.5 * (estimate(team, opp) + estimate(opp, team))
+    assert first["possessions"] == round(possessions, 1)
+    assert first["pace"] == round(48 * possessions / (505 / 5), 2)
+    assert first["offensiveRating"] == round(100 * 230 / possessions, 2)
+    assert first["defensiveRating"] == round(100 * 225 / possessions, 2)
+    assert first["netRating"] == pytest.approx(
+        first["offensiveRating"] - first["defensiveRating"], abs=0.02
+    )
+    assert first["effectiveFieldGoalPct"] == round((85 + 0.5 * 20) / 180, 4)
+    assert first["trueShootingPct"] == round(230 / (2 * (180 + 0.44 * 40)), 4)
+    assert first["turnoverPct"] == round(22 / (180 + 0.44 * 40 + 22), 4)
+    assert first["offensiveReboundPct"] == round(18 / (18 + 64), 4)
+    assert first["defensiveReboundPct"] == round(68 / (68 + 23), 4)
+    # Both teams share the game possessions, so their net ratings cancel.
+    assert second["possessions"] == first["possessions"]
+    assert second["netRating"] == -first["netRating"]
+
+    (league,) = payload["seasons"]
+    assert (league["season"], league["teams"]) == (2023, 2)
+    # League rates are re-estimated from the pooled sums, not added up per team.
+    assert league["possessions"] == pytest.approx(2 * possessions, rel=1e-3)
+    assert league["netRating"] == 0.0
+
+    output_path = tmp_path / "team_season_ratings.json"
+    written = build_team_season_ratings(records, output_path=output_path)
+    text = output_path.read_text(encoding="utf-8")
+    assert text.endswith("}\n")
+    assert json.loads(text)["teams"] == written["teams"] == payload["teams"]